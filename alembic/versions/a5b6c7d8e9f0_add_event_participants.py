@@ -0,0 +1,93 @@
+"""move events.participants_ids into an event_participants table
+
+Revision ID: a5b6c7d8e9f0
+Revises: e4f5a6b7c8d9
+Create Date: 2026-10-18
+
+One row per (event, alumni) with real foreign keys, replacing the
+`participants_ids` ARRAY column. The backfill keeps each event's array
+order in `joined_at` (the arrays were append-only, so order == join order),
+drops duplicate entries, and drops ids that no longer match an alumni row.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+revision: str = "a5b6c7d8e9f0"
+down_revision: str | None = "e4f5a6b7c8d9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_participants",
+        sa.Column(
+            "event_id",
+            sa.String(),
+            sa.ForeignKey("events.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "alumni_id",
+            sa.String(),
+            sa.ForeignKey("alumni.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "joined_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_event_participants_alumni_id_event_id",
+        "event_participants",
+        ["alumni_id", "event_id"],
+    )
+
+    op.execute(
+        """
+        INSERT INTO event_participants (event_id, alumni_id, joined_at)
+        SELECT e.id, p.alumni_id, now() + p.ord * interval '1 microsecond'
+        FROM events e
+        CROSS JOIN LATERAL unnest(e.participants_ids)
+            WITH ORDINALITY AS p(alumni_id, ord)
+        WHERE EXISTS (SELECT 1 FROM alumni a WHERE a.id = p.alumni_id)
+        ON CONFLICT (event_id, alumni_id) DO NOTHING
+        """
+    )
+
+    op.drop_column("events", "participants_ids")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "events",
+        sa.Column(
+            "participants_ids",
+            sa.ARRAY(sa.String()),
+            server_default="{}",
+            nullable=False,
+        ),
+    )
+    op.execute(
+        """
+        UPDATE events e
+        SET participants_ids = p.ids
+        FROM (
+            SELECT event_id, array_agg(alumni_id ORDER BY joined_at) AS ids
+            FROM event_participants
+            GROUP BY event_id
+        ) p
+        WHERE p.event_id = e.id
+        """
+    )
+    op.drop_index(
+        "ix_event_participants_alumni_id_event_id", table_name="event_participants"
+    )
+    op.drop_table("event_participants")
@@ -0,0 +1,73 @@
+"""add cover_hash / avatar_hash
+
+Revision ID: b6c7d8e9f0a1
+Revises: a5b6c7d8e9f0
+Create Date: 2026-10-18
+
+SHA-256 of each stored image, used as the ETag of the binary image
+endpoints so a conditional GET never reads the image column. Existing rows
+are hashed here in batches; the decoding mirrors app.core.images at the
+time of writing (data: URL or bare base64, raw text for anything else).
+"""
+import base64
+import binascii
+from collections.abc import Sequence
+import hashlib
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+revision: str = "b6c7d8e9f0a1"
+down_revision: str | None = "a5b6c7d8e9f0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TARGETS = (
+    ("events", "cover", "cover_hash"),
+    ("projects", "cover", "cover_hash"),
+    ("alumni", "avatar", "avatar_hash"),
+)
+_BATCH = 200
+
+
+def _hash(value: str) -> str:
+    raw = value.encode()
+    if not value.startswith(("http://", "https://")):
+        payload = value.partition(",")[2] if value.startswith("data:") else value
+        try:
+            raw = base64.b64decode("".join(payload.split()), validate=True)
+        except (binascii.Error, ValueError):
+            pass
+    return hashlib.sha256(raw).hexdigest()
+
+
+def upgrade() -> None:
+    for table, _source, target in _TARGETS:
+        op.add_column(table, sa.Column(target, sa.String(64), nullable=True))
+
+    conn = op.get_bind()
+    for table, source, target in _TARGETS:
+        last_id = ""
+        while True:
+            rows = conn.execute(
+                sa.text(
+                    f"SELECT id, {source} FROM {table} "
+                    f"WHERE {source} IS NOT NULL AND {source} != '' AND id > :last "
+                    f"ORDER BY id LIMIT :batch"
+                ),
+                {"last": last_id, "batch": _BATCH},
+            ).all()
+            if not rows:
+                break
+            conn.execute(
+                sa.text(f"UPDATE {table} SET {target} = :digest WHERE id = :id"),
+                [{"id": row_id, "digest": _hash(value)} for row_id, value in rows],
+            )
+            last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    for table, _source, target in _TARGETS:
+        op.drop_column(table, target)
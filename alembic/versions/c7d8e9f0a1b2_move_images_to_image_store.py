@@ -0,0 +1,160 @@
+"""move cover/avatar blobs into the content-addressed image store
+
+Revision ID: c7d8e9f0a1b2
+Revises: b6c7d8e9f0a1
+Create Date: 2026-10-18
+
+Writes every existing events.cover / projects.cover / alumni.avatar into
+the image store configured by IMAGE_STORE_* (run the upgrade with the
+same environment as the app), records its digest and upload kind in
+`*_hash` / `*_type`, then drops the blob columns. Identical images are
+stored once.
+
+Downgrade reads the images back from the store into re-added columns, so
+the store must still be there.
+
+How an upload string is split into bytes and kind is copied below rather
+than imported from app.core.images, so the result doesn't change with
+later app code.
+"""
+import base64
+import binascii
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.core.image_store import get_image_store
+
+
+revision: str = "c7d8e9f0a1b2"
+down_revision: str | None = "b6c7d8e9f0a1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, blob column, digest column, kind column)
+_TARGETS = (
+    ("events", "cover", "cover_hash", "cover_type"),
+    ("projects", "cover", "cover_hash", "cover_type"),
+    ("alumni", "avatar", "avatar_hash", "avatar_type"),
+)
+_BATCH = 200
+
+_INLINE_BASE64 = "base64"
+_TEXT = "text/plain"
+_DATA_URL_PREFIX = "data:"
+_IMAGE_CONTENT_TYPES = frozenset({"image/png", "image/jpeg", "image/gif", "image/webp"})
+_MAGIC = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+
+def _sniff(data: bytes) -> str:
+    for magic, content_type in _MAGIC:
+        if data.startswith(magic):
+            return content_type
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "application/octet-stream"
+
+
+def _split(value: str) -> tuple[bytes, str]:
+    """(bytes to store, kind) for an uploaded image string."""
+    if value.startswith(("http://", "https://")):
+        return value.encode(), _TEXT
+    kind = _INLINE_BASE64
+    payload = value
+    if value.startswith(_DATA_URL_PREFIX):
+        header, sep, payload = value.partition(",")
+        mime = header[len(_DATA_URL_PREFIX) : -len(";base64")]
+        if not sep or not header.endswith(";base64") or not mime:
+            return value.encode(), _TEXT
+        kind = mime
+    try:
+        data = base64.b64decode("".join(payload.split()), validate=True)
+    except (binascii.Error, ValueError):
+        return value.encode(), _TEXT
+    if kind != _INLINE_BASE64 and kind not in _IMAGE_CONTENT_TYPES:
+        kind = _sniff(data)
+    return data, kind
+
+
+def _store_image(value: str) -> tuple[str, str]:
+    data, kind = _split(value)
+    return get_image_store().put(data), kind
+
+
+def _load_image(digest: str, kind: str | None) -> str | None:
+    data = get_image_store().get(digest)
+    if data is None:
+        return None
+    if kind == _TEXT:
+        return data.decode()
+    encoded = base64.b64encode(data).decode()
+    if kind == _INLINE_BASE64:
+        return encoded
+    return f"{_DATA_URL_PREFIX}{kind};base64,{encoded}"
+
+
+def _batches(conn, query: str):
+    last_id = ""
+    while True:
+        rows = conn.execute(sa.text(query), {"last": last_id, "batch": _BATCH}).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    for table, blob, digest_col, kind_col in _TARGETS:
+        op.add_column(table, sa.Column(kind_col, sa.String(), nullable=True))
+        for rows in _batches(
+            conn,
+            f"SELECT id, {blob} FROM {table} "
+            f"WHERE {blob} IS NOT NULL AND {blob} != '' AND id > :last "
+            f"ORDER BY id LIMIT :batch",
+        ):
+            params = []
+            for row_id, value in rows:
+                digest, kind = _store_image(value)
+                params.append({"id": row_id, "digest": digest, "kind": kind})
+            conn.execute(
+                sa.text(
+                    f"UPDATE {table} SET {digest_col} = :digest, {kind_col} = :kind "
+                    f"WHERE id = :id"
+                ),
+                params,
+            )
+        # Empty strings never were images; leave no stale digest behind.
+        conn.execute(
+            sa.text(
+                f"UPDATE {table} SET {digest_col} = NULL "
+                f"WHERE {blob} IS NULL OR {blob} = ''"
+            )
+        )
+        op.drop_column(table, blob)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    for table, blob, digest_col, kind_col in _TARGETS:
+        op.add_column(table, sa.Column(blob, sa.String(), nullable=True))
+        for rows in _batches(
+            conn,
+            f"SELECT id, {digest_col}, {kind_col} FROM {table} "
+            f"WHERE {digest_col} IS NOT NULL AND id > :last "
+            f"ORDER BY id LIMIT :batch",
+        ):
+            conn.execute(
+                sa.text(f"UPDATE {table} SET {blob} = :value WHERE id = :id"),
+                [
+                    {"id": row_id, "value": _load_image(digest, kind)}
+                    for row_id, digest, kind in rows
+                ],
+            )
+        op.drop_column(table, kind_col)
@@ -0,0 +1,38 @@
+"""add cover_variants / avatar_variants
+
+Revision ID: d8e9f0a1b2c3
+Revises: c7d8e9f0a1b2
+Create Date: 2026-10-18
+
+{size: digest} of the resized WebP variants made when an image is
+written. Existing images have none until
+scripts/generate_image_variants.py is run; until then the endpoints
+serve the original for every size.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+revision: str = "d8e9f0a1b2c3"
+down_revision: str | None = "c7d8e9f0a1b2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_COLUMNS = (
+    ("events", "cover_variants"),
+    ("projects", "cover_variants"),
+    ("alumni", "avatar_variants"),
+)
+
+
+def upgrade() -> None:
+    for table, column in _COLUMNS:
+        op.add_column(table, sa.Column(column, sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.drop_column(table, column)
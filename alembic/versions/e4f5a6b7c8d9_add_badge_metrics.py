@@ -0,0 +1,48 @@
+"""add badge_metrics
+
+Revision ID: e4f5a6b7c8d9
+Revises: d7e8f9a0b1c2
+Create Date: 2026-10-18
+
+Per-alumni counters for badge evaluation. Rows start empty: every metric
+is computed on first read, or run scripts/rebuild_badge_metrics.py after
+upgrading to fill them up front.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+revision: str = "e4f5a6b7c8d9"
+down_revision: str | None = "d7e8f9a0b1c2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "badge_metrics",
+        sa.Column(
+            "alumni_id",
+            sa.String(),
+            sa.ForeignKey("alumni.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("events_attended", sa.Integer(), nullable=True),
+        sa.Column("max_attendees_on_owned", sa.Integer(), nullable=True),
+        sa.Column("cross_city_attendances", sa.Integer(), nullable=True),
+        sa.Column("distinct_cities_hosted", sa.Integer(), nullable=True),
+        sa.Column("badge_count", sa.Integer(), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("badge_metrics")
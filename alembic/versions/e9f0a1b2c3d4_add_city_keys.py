@@ -0,0 +1,93 @@
+"""add normalized country / city / city_key columns
+
+Revision ID: e9f0a1b2c3d4
+Revises: d8e9f0a1b2c3
+Create Date: 2026-10-18
+
+Stored, indexed forms of the free-text `location` on events and alumni,
+so city filters (nearby events, badges, Local Legend, the alumni map) are
+index lookups instead of per-row string parsing. The models keep them in
+sync on write; existing rows are filled here with a copy of the
+normalizer as it was then (app.core.locations.parse_location), so a later
+change to the app's aliases doesn't change what this migration writes.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+revision: str = "e9f0a1b2c3d4"
+down_revision: str | None = "d8e9f0a1b2c3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# table -> derived columns it stores (events don't need the un-aliased city)
+_TARGETS = {
+    "events": ("country", "city_key"),
+    "alumni": ("country", "city", "city_key"),
+}
+_BATCH = 500
+
+_CITY_ALIASES = {"kazan": "innopolis"}
+
+
+def _parse_location(location: str) -> dict[str, str | None]:
+    """{"country", "city", "city_key"} for a "Country, City" or bare "City" string."""
+    parts = [p.strip().lower() for p in location.split(",") if p.strip()]
+    if not parts:
+        return {"country": None, "city": None, "city_key": None}
+    city = parts[-1]
+    return {
+        "country": parts[0] if len(parts) > 1 else None,
+        "city": city,
+        "city_key": _CITY_ALIASES.get(city, city),
+    }
+
+
+def upgrade() -> None:
+    for table, columns in _TARGETS.items():
+        for column in columns:
+            op.add_column(table, sa.Column(column, sa.String(), nullable=True))
+
+    conn = op.get_bind()
+    for table, columns in _TARGETS.items():
+        last_id = ""
+        while True:
+            rows = conn.execute(
+                sa.text(
+                    f"SELECT id, location FROM {table} "
+                    f"WHERE location IS NOT NULL AND id > :last "
+                    f"ORDER BY id LIMIT :batch"
+                ),
+                {"last": last_id, "batch": _BATCH},
+            ).all()
+            if not rows:
+                break
+            params = []
+            for row_id, location in rows:
+                parsed = _parse_location(location)
+                params.append({"id": row_id, **{c: parsed[c] for c in columns}})
+            assignments = ", ".join(f"{c} = :{c}" for c in columns)
+            conn.execute(
+                sa.text(f"UPDATE {table} SET {assignments} WHERE id = :id"), params
+            )
+            last_id = rows[-1][0]
+
+    op.create_index("ix_events_city_key", "events", ["city_key"])
+    op.create_index("ix_alumni_city_key", "alumni", ["city_key"])
+    op.create_index(
+        "ix_alumni_show_location_country_city",
+        "alumni",
+        ["show_location", "country", "city"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_alumni_show_location_country_city", table_name="alumni")
+    op.drop_index("ix_alumni_city_key", table_name="alumni")
+    op.drop_index("ix_events_city_key", table_name="events")
+    for table, columns in _TARGETS.items():
+        for column in columns:
+            op.drop_column(table, column)
@@ -0,0 +1,37 @@
+"""add indexes for the nearby-events notification query
+
+Revision ID: f0a1b2c3d4e5
+Revises: e9f0a1b2c3d4
+Create Date: 2026-10-18
+
+`find_nearby_upcoming_events` reads approved events newest-first, per
+city and separately for online events. These indexes let each branch
+stop after the rows it returns instead of scanning the whole history.
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "f0a1b2c3d4e5"
+down_revision: str | None = "e9f0a1b2c3d4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_events_approved_city_key_datetime",
+        "events",
+        ["approved", "city_key", "datetime"],
+    )
+    op.create_index(
+        "ix_events_approved_is_online_datetime",
+        "events",
+        ["approved", "is_online", "datetime"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_approved_is_online_datetime", table_name="events")
+    op.drop_index("ix_events_approved_city_key_datetime", table_name="events")
@@ -5,11 +5,13 @@ from app.api.routes.admin import (
     badges_award,
     badges_list,
     badges_recompute_leaderboards,
+    badges_reevaluate,
     badges_revoke,
     ban,
     decline_event,
     delete_alumni,
     email_diagnostic,
+    jobs,
     list_all_events,
     list_all_projects,
     list_banned,
@@ -46,3 +48,5 @@ router.include_router(badges_list.router)
 router.include_router(badges_award.router)
 router.include_router(badges_revoke.router)
 router.include_router(badges_recompute_leaderboards.router)
+router.include_router(badges_reevaluate.router)
+router.include_router(jobs.router)
@@ -5,6 +5,7 @@ from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.events import Event
 from app.models.users import Admin, Alumni
+from app.services import badge_metrics, notifications, stream
 
 
 router = APIRouter()
@@ -32,34 +33,30 @@ async def approve_event(
         raise HTTPException(status_code=400, detail="Event is already approved")
 
     event.approved = True
+    badge_metrics.event_hosting_changed(db, event)
     db.commit()
+    notifications.event_approval_changed()
     db.refresh(event)
+    stream.event_approved(event)
 
     # Badge eval for the host (Founding Host, Host with the most, Rainmaker).
-    awarded_codes: list[str] = []
-    owner: Alumni | None = None
+    # Each award's Telegram DM is queued in the commit that stores it.
     try:
+        from app.services.badge_notifications import notify_badge_awards
         from app.services.badges import award_founding_host, evaluate_for_user
 
         owner = db.query(Alumni).filter(Alumni.id == event.owner_id).first()
         if owner is not None:
-            # Some badge strategies signal that no badge was earned with
-            # ``None``. Treat that exactly like an empty result so the
-            # Founding Host evaluation still runs.
-            new_rows = evaluate_for_user(db, owner, "event_approved") or []
-            awarded_codes.extend(r.badge.code for r in new_rows if r.badge)
+            evaluate_for_user(db, owner, "event_approved", notify=True)
             fh = award_founding_host(db, owner, event)
             if fh is not None:
+                notify_badge_awards(db, owner, ["founding_host"])
                 db.commit()
-                awarded_codes.append("founding_host")
+                stream.badges_awarded(owner.id, ["founding_host"])
     except Exception as eval_err:
         import logging
         logging.getLogger("iu_alumni").error(
             "badge eval failed on event_approved: %s", eval_err
         )
 
-    if owner is not None and awarded_codes:
-        from app.services.badge_notifications import notify_badge_awards
-        await notify_badge_awards(db, owner, awarded_codes)
-
     return event
@@ -5,7 +5,6 @@ from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.users import Admin, Alumni
-from app.services.badge_notifications import notify_badge_awards
 from app.services.badges import ManualAwardError, manual_award
 
 
@@ -48,15 +47,13 @@ async def admin_award_badge(
             body.badge_code,
             admin_id=current_user.id,
             metadata=body.metadata,
+            notify=True,
         )
     except ManualAwardError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
         ) from e
 
-    # Best-effort Telegram DM. Never blocks the response.
-    await notify_badge_awards(db, alumni, [body.badge_code])
-
     return {
         "id": row.id,
         "alumni_id": alumni.id,
@@ -3,6 +3,7 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.api.routes.admin.jobs import start_job
 from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.users import Admin, Alumni
@@ -12,7 +13,7 @@ from app.services.badges import compute_local_legend_winners
 router = APIRouter()
 
 
-@router.post("/badges/recompute-leaderboards", status_code=status.HTTP_200_OK)
+@router.post("/badges/recompute-leaderboards", status_code=status.HTTP_202_ACCEPTED)
 def admin_recompute_leaderboards(
     year: int | None = None,
     db: Session = Depends(get_db),
@@ -24,6 +25,9 @@ def admin_recompute_leaderboards(
     same computation the cron would have run without passing a param.
     Backfill mode: pass an explicit `year` to award winners for any
     historical year. Idempotent — safe to re-run.
+
+    Runs as a background job; poll `GET /admin/jobs/{job_id}` for
+    `{"year", "awarded"}`.
     """
     if not isinstance(current_user, Admin):
         raise HTTPException(
@@ -32,9 +36,12 @@ def admin_recompute_leaderboards(
         )
 
     target_year = year if year is not None else datetime.utcnow().year - 1
-    winners = compute_local_legend_winners(db, target_year)
 
-    return {
-        "year": target_year,
-        "awarded": len(winners),
-    }
+    def recompute(job_db: Session, _progress) -> dict:
+        winners = compute_local_legend_winners(job_db, target_year)
+        return {
+            "year": target_year,
+            "awarded": len(winners),
+        }
+
+    return start_job(db, "recompute-leaderboards", recompute, current_user)
@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.api.routes.admin.jobs import start_job
+from app.core.database import get_db
+from app.core.security import get_current_user
+from app.models.users import Admin, Alumni
+from app.services.badges import bulk_evaluate
+
+
+router = APIRouter()
+
+
+@router.post("/badges/reevaluate", status_code=status.HTTP_202_ACCEPTED)
+def admin_reevaluate_badges(
+    codes: list[str] | None = Query(default=None),
+    dry_run: bool = False,
+    db: Session = Depends(get_db),
+    current_user: Admin | Alumni = Depends(get_current_user),
+):
+    """Re-run badge rules for the whole alumni base.
+
+    Awards every alumnus who now qualifies and revokes revocable badges
+    whose criteria no longer hold. Limit the run with repeated `codes`
+    params; pass `dry_run=true` to see the per-badge diff without writing
+    anything.
+
+    Runs as a background job; poll `GET /admin/jobs/{job_id}` for the
+    report. While it runs, the job's progress is `{"message"}` with the
+    current step.
+    """
+    if not isinstance(current_user, Admin):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required",
+        )
+
+    def reevaluate(job_db: Session, progress) -> dict:
+        return bulk_evaluate(
+            job_db,
+            badge_codes=codes,
+            dry_run=dry_run,
+            progress=lambda message: progress({"message": message}),
+        )
+
+    return start_job(db, "reevaluate-badges", reevaluate, current_user)
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.principal_cache import invalidate_principal
 from app.core.security import get_current_user
 from app.models.users import Admin, Alumni
 
@@ -27,4 +28,5 @@ def ban_user(
     user.is_banned = True
     db.commit()
     db.refresh(user)
+    invalidate_principal(user.email)
     return {"message": "User banned successfully"}
@@ -5,6 +5,7 @@ from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.events import Event
 from app.models.users import Admin, Alumni
+from app.services import badge_metrics, notifications
 
 
 router = APIRouter()
@@ -32,6 +33,8 @@ async def decline_event(
         raise HTTPException(status_code=400, detail="Event is already declined")
 
     event.approved = False
+    badge_metrics.event_hosting_changed(db, event)
     db.commit()
+    notifications.event_approval_changed()
     db.refresh(event)
     return event
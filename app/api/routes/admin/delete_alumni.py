@@ -1,45 +1,51 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.api.routes.admin.jobs import start_job
 from app.core.database import get_db
+from app.core.principal_cache import invalidate_principal
 from app.core.security import get_current_user
+from app.models.badge import BadgeMetrics
 from app.models.email_verification import EmailVerification
-from app.models.events import Event
+from app.models.events import Event, EventParticipant
 from app.models.login_code import LoginCode
 from app.models.password_reset_token import PasswordResetToken
 from app.models.projects import Project
 from app.models.telegram_verify_token import TelegramVerifyToken
 from app.models.users import Admin, Alumni
+from app.services import badge_metrics
+from app.services.jobs import JobFailedError
 
 
 router = APIRouter()
 
 
-@router.delete("/alumni/{alumni_id}")
-def delete_alumni(
-    alumni_id: str,
-    db: Session = Depends(get_db),
-    current_user: Admin | Alumni = Depends(get_current_user),
-):
+def delete_alumni_data(db: Session, alumni_id: str) -> bool:
     """Permanently delete an alumnus and everything referencing them.
 
     `user_badges` cascades at the DB level already; every other table with
     an `alumni_id`/`owner_id` foreign key does not, so those rows are
     removed explicitly here, in the order that avoids constraint
     violations (owned content first, then auth-flow rows, then the alumni
-    itself). `participants_ids`/`contributors_ids` aren't real foreign
-    keys, so this alumnus's id is also stripped from other people's
-    events/projects rather than left dangling in those arrays.
-    """
-    if not isinstance(current_user, Admin):
-        raise HTTPException(
-            status_code=403, detail="You are not authorized to delete users"
-        )
+    itself). `event_participants` rows are deleted explicitly too, so the
+    result doesn't depend on the backend enforcing ON DELETE CASCADE.
+    `contributors_ids` isn't a real foreign key, so this alumnus's id is
+    also stripped from other people's projects rather than left dangling
+    in that array.
 
+    Returns False if there is no such alumnus.
+    """
     alumni = db.query(Alumni).filter(Alumni.id == alumni_id).first()
     if not alumni:
-        raise HTTPException(status_code=404, detail="User not found")
+        return False
 
+    owned = select(Event.id).where(Event.owner_id == alumni_id)
+    for event in db.query(Event).filter(Event.owner_id == alumni_id).all():
+        badge_metrics.event_deleted(db, event)
+    db.query(EventParticipant).filter(EventParticipant.event_id.in_(owned)).delete(
+        synchronize_session=False
+    )
     db.query(Event).filter(Event.owner_id == alumni_id).delete(synchronize_session=False)
     db.query(Project).filter(Project.owner_id == alumni_id).delete(synchronize_session=False)
 
@@ -56,20 +62,57 @@ def delete_alumni(
         TelegramVerifyToken.alumni_id == alumni_id
     ).delete(synchronize_session=False)
 
+    attended_hosts = db.scalars(
+        select(Event.owner_id)
+        .join(EventParticipant, EventParticipant.event_id == Event.id)
+        .where(EventParticipant.alumni_id == alumni_id)
+    ).all()
+    badge_metrics.invalidate(db, set(attended_hosts), ["max_attendees_on_owned"])
+    db.query(EventParticipant).filter(EventParticipant.alumni_id == alumni_id).delete(
+        synchronize_session=False
+    )
+
     # Filtered in Python, not `.any(alumni_id)` at the SQL level — confirmed
     # locally that comparator isn't portable to every backend this query
     # could run against, and a plain scan is simple enough for these tables.
-    for event in db.query(Event).all():
-        if alumni_id in event.participants_ids:
-            event.participants_ids = [pid for pid in event.participants_ids if pid != alumni_id]
-
     for project in db.query(Project).all():
         if alumni_id in project.contributors_ids:
             project.contributors_ids = [
                 pid for pid in project.contributors_ids if pid != alumni_id
             ]
 
+    db.query(BadgeMetrics).filter(BadgeMetrics.alumni_id == alumni_id).delete(
+        synchronize_session=False
+    )
+
+    email = alumni.email
     db.delete(alumni)
     db.commit()
+    invalidate_principal(email)
+    return True
+
+
+@router.delete("/alumni/{alumni_id}", status_code=status.HTTP_202_ACCEPTED)
+def delete_alumni(
+    alumni_id: str,
+    db: Session = Depends(get_db),
+    current_user: Admin | Alumni = Depends(get_current_user),
+):
+    """Delete an alumnus and everything referencing them (see `delete_alumni_data`).
+
+    The deletion runs as a background job; poll `GET /admin/jobs/{job_id}`.
+    """
+    if not isinstance(current_user, Admin):
+        raise HTTPException(
+            status_code=403, detail="You are not authorized to delete users"
+        )
+
+    if db.query(Alumni.id).filter(Alumni.id == alumni_id).first() is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    def delete(job_db: Session, _progress) -> dict:
+        if not delete_alumni_data(job_db, alumni_id):
+            raise JobFailedError("User not found")
+        return {"message": "User deleted successfully"}
 
-    return {"message": "User deleted successfully"}
+    return start_job(db, "delete-alumni", delete, current_user)
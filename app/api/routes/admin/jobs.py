@@ -0,0 +1,66 @@
+"""Background jobs for long admin operations.
+
+  GET /api/v1/admin/jobs/{job_id}   — status, progress and result of a job
+
+Routes that start a job (allowed-emails upload, leaderboard recompute,
+badge re-evaluation, alumni deletion) answer 202 with `start_job`'s
+body; the admin portal polls this route with the returned id until the
+status is `succeeded` or `failed`. See app/services/jobs.py.
+"""
+
+from collections.abc import Callable
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.security import get_current_user
+from app.models.jobs import Job
+from app.models.users import Admin, Alumni
+from app.services import jobs
+
+
+router = APIRouter()
+
+
+def start_job(
+    db: Session,
+    kind: str,
+    work: jobs.Work,
+    admin: Admin,
+    cleanup: Callable[[], None] | None = None,
+) -> dict:
+    """Submit `work` to the job runner; 503 when this process is at capacity.
+
+    `cleanup` is passed on to `JobRunner.submit`; it isn't called on a 503.
+    """
+    try:
+        job_id = jobs.runner.submit(
+            db, kind, work, created_by=admin.id, cleanup=cleanup
+        )
+    except jobs.JobQueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "30"},
+        ) from e
+    return {"job_id": job_id, "kind": kind, "status": jobs.QUEUED}
+
+
+@router.get("/jobs/{job_id}")
+def get_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: Admin | Alumni = Depends(get_current_user),
+):
+    """Status, progress and result of a background job."""
+    if not isinstance(current_user, Admin):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required",
+        )
+
+    job = db.get(Job, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return jobs.job_status(job)
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import load_images
 from app.core.security import get_current_user
 from app.models.projects import Project
 from app.models.users import Admin, Alumni
@@ -82,4 +84,5 @@ async def admin_list_projects(
         )
         projects = projects[:limit]
 
+    await run_in_threadpool(load_images, projects, "cover")
     return Paginated(items=projects, next_cursor=next_cursor)
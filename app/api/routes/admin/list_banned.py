@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import load_images
 from app.core.security import get_current_user
 from app.models.users import Admin, Alumni
 from app.schemas.user import Alumni as AlumniSchema
@@ -20,4 +21,5 @@ def list_banned(
             status_code=403, detail="You are not authorized to list banned users"
         )
     banned_users = db.query(Alumni).filter(Alumni.is_banned).all()
+    load_images(banned_users, "avatar")
     return banned_users
@@ -1,8 +1,10 @@
 """Admin approval endpoints for projects. Mirror of the event admin flow."""
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import load_images
 from app.core.security import get_current_user
 from app.models.projects import Project
 from app.models.users import Admin, Alumni
@@ -40,6 +42,7 @@ async def approve_project(
     project.approved = True
     db.commit()
     db.refresh(project)
+    await run_in_threadpool(load_images, [project], "cover")
     return project
 
 
@@ -58,6 +61,7 @@ async def decline_project(
     project.approved = False
     db.commit()
     db.refresh(project)
+    await run_in_threadpool(load_images, [project], "cover")
     return project
 
 
@@ -79,4 +83,5 @@ async def unapprove_project(
     project.approved = None
     db.commit()
     db.refresh(project)
+    await run_in_threadpool(load_images, [project], "cover")
     return project
@@ -5,6 +5,7 @@ from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.events import Event
 from app.models.users import Admin, Alumni
+from app.services import badge_metrics, notifications
 
 
 router = APIRouter()
@@ -29,6 +30,8 @@ async def unapprove_event(
 
     # Set event to pending state (None)
     event.approved = None
+    badge_metrics.event_hosting_changed(db, event)
     db.commit()
+    notifications.event_approval_changed()
     db.refresh(event)
     return {"message": "Event set to pending state", "event": event}
@@ -1,13 +1,24 @@
+import contextlib
 import logging
+import os
+import shutil
+import tempfile
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+from app.api.routes.admin.jobs import start_job
 from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.users import Admin, Alumni
-from app.services.email_hash_service import process_excel_file
+from app.services.email_hash_service import (
+    STREAMING_EXTENSIONS,
+    import_email_file,
+    process_excel_file,
+)
+from app.services.jobs import JobFailedError
 
 
 # Get logger for this module
@@ -16,16 +27,22 @@ logger = logging.getLogger("iu_alumni.admin.upload_allowed_emails")
 router = APIRouter()
 
 
-@router.post("/upload-allowed-emails")
+@router.post("/upload-allowed-emails", status_code=status.HTTP_202_ACCEPTED)
 async def upload_allowed_emails(
     file: UploadFile = File(...),
     current_user: Annotated[Alumni | Admin, Depends(get_current_user)] = None,
     db: Session = Depends(get_db),
 ):
     """
-    Upload an Excel file containing allowed email addresses.
+    Upload a CSV or Excel file containing allowed email addresses.
 
-    The first column of the Excel file should contain email addresses.
+    The first column of the file should contain email addresses; the first
+    row is a header. CSV and .xlsx uploads are streamed in chunks, so large
+    files don't have to fit in memory; legacy .xls files are still read
+    whole.
+
+    The import runs as a background job; poll `GET /admin/jobs/{job_id}`
+    for its progress (rows read so far) and the final counts.
     """
     logger.info(f"Upload allowed emails request received, file: {file.filename}")
 
@@ -39,28 +56,43 @@ async def upload_allowed_emails(
     logger.info("Admin authorized to upload allowed emails")
 
     # Check file extension
-    if not file.filename.endswith((".xlsx", ".xls")):
+    filename = file.filename or ""
+    if not filename.lower().endswith((*STREAMING_EXTENSIONS, ".xls")):
         logger.error(f"Invalid file format: {file.filename}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only Excel files (.xlsx, .xls) are supported",
+            detail="Only CSV and Excel files (.csv, .xlsx, .xls) are supported",
         )
 
     logger.info(f"File format valid: {file.filename}")
 
-    # Read file content
-    file_content = await file.read()
-    logger.info(f"File content read, size: {len(file_content)} bytes")
-
-    # Process the Excel file
-    result = process_excel_file(db, file_content)
-    logger.info(f"File processing result: {result}")
-
-    if not result["success"]:
-        logger.error(f"File processing failed: {result['message']}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail=result["message"]
+    # The request's spooled upload is closed once we answer, so the job
+    # gets its own copy on disk (copied in blocks, never whole in memory)
+    suffix = os.path.splitext(filename)[1].lower()
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as copy:
+        await run_in_threadpool(shutil.copyfileobj, file.file, copy)
+    logger.info(f"Upload saved for import: {copy.name}")
+
+    def import_upload(job_db: Session, progress) -> dict:
+        with open(copy.name, "rb") as f:
+            if suffix in STREAMING_EXTENSIONS:
+                result = import_email_file(job_db, f, filename, progress)
+            else:
+                result = process_excel_file(job_db, f.read())
+        logger.info(f"File processing result: {result}")
+        if not result["success"]:
+            raise JobFailedError(result["message"], result)
+        return result
+
+    def remove_copy() -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(copy.name)
+
+    # Removed once the job is over, also when it's cancelled before it runs.
+    try:
+        return start_job(
+            db, "upload-allowed-emails", import_upload, current_user, cleanup=remove_copy
         )
-
-    logger.info(f"File processing successful: {result['message']}")
-    return result
+    except Exception:
+        remove_copy()
+        raise
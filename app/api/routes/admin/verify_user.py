@@ -1,11 +1,12 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.principal_cache import invalidate_principal
 from app.core.security import get_current_user
 from app.models.users import Admin, Alumni
 from app.schemas.auth import AdminVerifyRequest
-from app.services.email_service import send_verification_success_email
+from app.services import outbox
 from app.services.verification_service import admin_verify_user
 
 
@@ -15,7 +16,6 @@ router = APIRouter()
 @router.post("/verify")
 async def verify_user(
     request: AdminVerifyRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: Admin | Alumni = Depends(get_current_user),
 ):
@@ -46,10 +46,16 @@ async def verify_user(
             # so the record stays consistent with the role.
             if request.role == "alumni_friend":
                 user.graduation_year = None
-            db.commit()
-            db.refresh(user)
-        background_tasks.add_task(
-            send_verification_success_email, user.email, user.first_name
+        # The confirmation email goes out through the outbox, committed
+        # with the role change.
+        outbox.email(
+            db,
+            "send_verification_success_email",
+            user.email,
+            first_name=user.first_name,
         )
+        db.commit()
+        db.refresh(user)
+        invalidate_principal(user.email)
 
     return {"message": message, "email": request.email, "role": user.role if user else None}
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.principal_cache import invalidate_principal
 from app.core.security import get_password_hash
 from app.models.password_reset_token import PasswordResetToken
 from app.schemas.auth import PasswordResetConfirmSchema
@@ -55,5 +56,6 @@ def password_reset_confirm(
     user.hashed_password = get_password_hash(request.new_password)
     reset_token.used = True
     db.commit()
+    invalidate_principal(user.email)
 
     return {"message": "Password updated successfully"}
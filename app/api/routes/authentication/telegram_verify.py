@@ -7,6 +7,7 @@ from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.principal_cache import invalidate_principal
 from app.core.security import get_current_user, get_random_token
 from app.models.telegram import TelegramUser
 from app.models.telegram_verify_token import TelegramVerifyToken
@@ -140,6 +141,7 @@ def telegram_verify_confirm(
     user.is_telegram_verified = True
     record.used = True
     db.commit()
+    invalidate_principal(user.email)
 
     alias = f"@{user.telegram_alias}" if user.telegram_alias else ""
     return HTMLResponse(
@@ -31,4 +31,7 @@ def get_my_badges(
         "badge_awarded",
     ):
         evaluate_for_user(db, current_user, trigger)
-    return list_my_badges(db, current_user)
+    badges = list_my_badges(db, current_user)
+    # Keep the metrics filled in while scoring for the next read.
+    db.commit()
+    return badges
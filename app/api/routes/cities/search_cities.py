@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, func
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.core.security import get_current_user
 from app.models.cities import City
 from app.models.users import Admin, Alumni
@@ -16,7 +16,7 @@ router = APIRouter()
 async def get_coordinates(
     city: str = Query(..., description="City name"),
     country: str = Query(..., description="Country name"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Alumni | Admin = Depends(get_current_user),
 ):
     """
@@ -27,15 +27,17 @@ async def get_coordinates(
     Matches the Dart coordinates() method functionality.
     """
     result = (
-        db.query(City.lat, City.lng)
-        .filter(
-            and_(
-                func.lower(City.city) == city.lower(),
-                func.lower(City.country) == country.lower(),
+        await db.execute(
+            select(City.lat, City.lng)
+            .where(
+                and_(
+                    func.lower(City.city) == city.lower(),
+                    func.lower(City.country) == country.lower(),
+                )
             )
+            .limit(1)
         )
-        .first()
-    )
+    ).first()
 
     if not result:
         return None
@@ -47,7 +49,7 @@ async def get_coordinates(
 async def search_cities(
     q: str = Query(..., description="Search query for city name", min_length=1),
     limit: int = Query(10, description="Maximum number of results", ge=1, le=10),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Alumni | Admin = Depends(get_current_user),
 ):
     """
@@ -65,11 +67,12 @@ async def search_cities(
     # Use PostgreSQL pattern matching for prefix search (like FTS MATCH with wildcard)
     # This mimics the SQLite FTS 'city MATCH ? || "*"' behavior
     cities = (
-        db.query(City.city, City.country, City.lat, City.lng)
-        .filter(func.lower(City.city).like(func.lower(f"{search_term}%")))
-        .limit(limit)
-        .all()
-    )
+        await db.execute(
+            select(City.city, City.country, City.lat, City.lng)
+            .where(func.lower(City.city).like(func.lower(f"{search_term}%")))
+            .limit(limit)
+        )
+    ).all()
 
     # Convert results to CityLocation objects
     city_locations = [
@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import save_image
 from app.core.security import get_current_user, get_random_token
 from app.models.events import Event
 from app.models.users import Admin, Alumni
 from app.schemas.event import CreateEventRequest, CreateEventResponse
+from app.services import badge_metrics
 from app.services.settings import get_event_settings
 
 
@@ -24,6 +27,7 @@ async def create_event(
     """Create a new event"""
     settings = get_event_settings(db)
     auto_approve = settings.get("auto_approve", True)
+    cover = await run_in_threadpool(save_image, "cover", event.cover)
 
     new_event = Event(
         id=get_random_token(),
@@ -35,10 +39,13 @@ async def create_event(
         datetime=event.datetime,
         cost=event.cost,
         is_online=event.is_online,
-        cover=event.cover,
+        **cover,
         approved=True if auto_approve else None,
     )
     db.add(new_event)
+    badge_metrics.participant_joined(db, new_event, current_user)
+    if new_event.approved:
+        badge_metrics.event_hosting_changed(db, new_event)
     db.commit()
     db.refresh(new_event)
 
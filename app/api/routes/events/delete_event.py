@@ -5,6 +5,7 @@ from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.events import Event
 from app.models.users import Admin, Alumni
+from app.services import badge_metrics
 from app.services.notification_service import NotificationService
 
 
@@ -57,6 +58,7 @@ async def delete_event(
                 await NotificationService.send_custom_notification(db, user.telegram_alias, message)
 
     # Delete the event
+    badge_metrics.event_deleted(db, event)
     db.query(Event).filter(Event.id == event_id).delete()
     db.commit()
 
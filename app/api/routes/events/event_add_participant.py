@@ -5,6 +5,7 @@ from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.events import Event
 from app.models.users import Admin, Alumni
+from app.services import badge_metrics, event_participation, stream
 from app.services.badges import evaluate_for_user
 from app.services.notification_service import NotificationService
 
@@ -47,26 +48,22 @@ async def add_participant(
             detail="You can only add yourself as a participant",
         )
 
-    # Check if participant is already added
-    if participant_id in event.participants_ids:
+    # One INSERT ... ON CONFLICT DO NOTHING; no change means already added
+    if not event_participation.join_event(db, event.id, participant_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You are already a participant in this event",
         )
 
-    new_participants_ids = [*event.participants_ids, participant_id]
-
-    event.participants_ids = new_participants_ids
+    badge_metrics.participant_joined(db, event, participant)
 
     # Commit changes
     try:
-        db.commit()
-        db.refresh(event)
-
         # Get the event owner for notification
         owner = db.query(Alumni).filter(Alumni.id == event.owner_id).first()
 
-        # Send notification if both owner and participant have telegram aliases
+        # Queue notifications if both owner and participant have telegram
+        # aliases; they go to the outbox and commit with the join.
         if owner and owner.telegram_alias and participant.telegram_alias:
             await NotificationService.send_join_notification(
                 db,
@@ -75,21 +72,19 @@ async def add_participant(
                 user_alias=participant.telegram_alias,
             )
 
+        db.commit()
+        db.refresh(event)
+        stream.participant_joined(event, participant_id)
+
         # Badge evaluation (failure-tolerant — never blocks the response).
-        awarded_codes: list[str] = []
         try:
-            new_rows = evaluate_for_user(db, participant, "event_attended")
-            awarded_codes = [r.badge.code for r in new_rows if r.badge]
+            evaluate_for_user(db, participant, "event_attended", notify=True)
         except Exception as eval_err:
             import logging
             logging.getLogger("iu_alumni").error(
                 "badge eval failed on event_attended: %s", eval_err
             )
 
-        if awarded_codes:
-            from app.services.badge_notifications import notify_badge_awards
-            await notify_badge_awards(db, participant, awarded_codes)
-
         return {"message": "Successfully joined the event"}
     except Exception as e:
         db.rollback()
@@ -5,6 +5,7 @@ from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.events import Event
 from app.models.users import Admin, Alumni
+from app.services import badge_metrics, event_participation
 
 
 router = APIRouter()
@@ -45,16 +46,14 @@ async def remove_participant(
             detail="You can only remove yourself as a participant",
         )
 
-    # Check if participant is not in the event
-    if participant_id not in event.participants_ids:
+    # One DELETE ... RETURNING; no row means they weren't a participant
+    if not event_participation.leave_event(db, event.id, participant_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You are not a participant in this event",
         )
 
-    new_participants_ids = [id for id in event.participants_ids if id != participant_id]
-
-    event.participants_ids = new_participants_ids
+    badge_metrics.participant_left(db, event, participant)
 
     # Commit changes
     try:
@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import (
+    ImageSize,
+    image_response,
+    load_image_variant,
+    pick_variant,
+)
 from app.core.security import get_current_user
 from app.models.events import Event
 from app.models.users import Admin, Alumni
@@ -17,6 +23,9 @@ _IMAGE_CACHE_SECONDS = 3600
 @router.get("/{event_id}/cover", response_model=CoverResponse)
 def get_event_cover(
     event_id: str,
+    size: ImageSize | None = Query(
+        None, description="Resized variant; the original upload when omitted"
+    ),
     db: Session = Depends(get_db),
     current_user: Alumni | Admin = Depends(get_current_user),
 ):
@@ -27,6 +36,40 @@ def get_event_cover(
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     return JSONResponse(
-        content={"cover": event.cover},
+        content={
+            "cover": load_image_variant(
+                event.cover_hash, event.cover_type, event.cover_variants, size
+            )
+        },
         headers={"Cache-Control": f"private, max-age={_IMAGE_CACHE_SECONDS}"},
     )
+
+
+@router.get("/{event_id}/cover/image", response_class=Response)
+def get_event_cover_image(
+    event_id: str,
+    request: Request,
+    size: ImageSize | None = Query(
+        None, description="Resized variant; the original upload when omitted"
+    ),
+    db: Session = Depends(get_db),
+    current_user: Alumni | Admin = Depends(get_current_user),
+):
+    """The cover as raw image bytes with a content-hash ETag.
+
+    A matching `If-None-Match` gets a 304 from the stored hash alone; the
+    cover itself is only read when the body is sent.
+    """
+    row = (
+        db.query(Event.cover_hash, Event.cover_type, Event.cover_variants)
+        .filter(Event.id == event_id)
+        .first()
+    )
+    if row is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    if row.cover_hash is None:
+        raise HTTPException(status_code=404, detail="Event has no cover")
+    digest, kind = pick_variant(
+        row.cover_hash, row.cover_type, row.cover_variants, size
+    )
+    return image_response(request, digest, kind, _IMAGE_CACHE_SECONDS)
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import load_images
 from app.core.security import get_current_user
 from app.models.events import Event
 from app.models.users import Admin, Alumni
@@ -33,4 +35,5 @@ async def get_event(
     # For now, we return all events since authentication is optional
     # You may want to add logic here to check if user is owner/admin
 
+    await run_in_threadpool(load_images, [event], "cover")
     return event
@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.images import load_images
 from app.core.security import get_current_user
-from app.models.events import Event
+from app.models.events import Event, EventParticipant
 from app.models.users import Admin, Alumni
 from app.schemas.user import Alumni as AlumniResponse
 
@@ -14,16 +17,25 @@ router = APIRouter()
 @router.get("/{event_id}/participants", response_model=list[AlumniResponse])
 async def list_event_participants(
     event_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Alumni | Admin = Depends(get_current_user),
 ):
-    """List all participants of an event"""
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
+    """List all participants of an event.
+
+    `avatar` is the thumbnail variant (a small WebP) where there is one,
+    not the original upload.
+    """
+    if await db.scalar(select(Event.id).where(Event.id == event_id)) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
         )
 
-    participants = db.query(Alumni).filter(Alumni.id.in_(event.participants_ids)).all()
-
+    result = await db.execute(
+        select(Alumni)
+        .join(EventParticipant, EventParticipant.alumni_id == Alumni.id)
+        .where(EventParticipant.event_id == event_id)
+        .order_by(EventParticipant.joined_at)
+    )
+    participants = result.scalars().all()
+    await run_in_threadpool(load_images, participants, "avatar", "thumbnail")
     return participants
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session, defer
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.core.security import get_current_user
 from app.models.events import Event
 from app.models.users import Admin, Alumni
@@ -23,26 +23,29 @@ async def list_events(
     search: str | None = Query(None, description="Search by event title"),
     cursor: str | None = Query(None, description="Pagination cursor from previous response"),
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Alumni | Admin = Depends(get_current_user),
 ):
     """List all approved events with optional title search and cursor-based pagination."""
-    query = db.query(Event).options(defer(Event.cover)).filter(Event.approved == True)
+    query = select(Event).where(Event.approved == True)
 
     if search:
-        query = query.filter(Event.title.ilike(f"%{search}%"))
+        query = query.where(Event.title.ilike(f"%{search}%"))
 
     if cursor:
         c = decode_cursor(cursor)
         cursor_dt = cursor_datetime(c["dt"])
-        query = query.filter(
+        query = query.where(
             or_(
                 Event.datetime < cursor_dt,
                 and_(Event.datetime == cursor_dt, Event.id > c["id"]),
             )
         )
 
-    events = query.order_by(Event.datetime.desc(), Event.id.asc()).limit(limit + 1).all()
+    result = await db.execute(
+        query.order_by(Event.datetime.desc(), Event.id.asc()).limit(limit + 1)
+    )
+    events = result.scalars().all()
 
     next_cursor = None
     if len(events) > limit:
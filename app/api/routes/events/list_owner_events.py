@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import load_images
 from app.core.security import get_current_user
 from app.models.events import Event
 from app.models.users import Admin, Alumni
@@ -28,6 +30,7 @@ async def list_owner_events(
         .limit(limit)
         .all()
     )
+    await run_in_threadpool(load_images, events, "cover")
     return events
 
 
@@ -48,4 +51,5 @@ async def list_owner_pending_events(
         .limit(limit)
         .all()
     )
+    await run_in_threadpool(load_images, events, "cover")
     return events
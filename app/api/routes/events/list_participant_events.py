@@ -1,11 +1,13 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import load_images
 from app.core.security import get_current_user
-from app.models.events import Event
+from app.models.events import Event, EventParticipant
 from app.models.users import Admin, Alumni
 from app.schemas.event import Event as EventResponse
 
@@ -32,7 +34,8 @@ async def list_participant_events(
     participant_query = (
         db.query(Event)
         .filter(Event.approved == True)
-        .filter(Event.participants_ids.any(participant_id))
+        .join(EventParticipant, EventParticipant.event_id == Event.id)
+        .filter(EventParticipant.alumni_id == participant_id)
     )
 
     if includeCreated:
@@ -54,4 +57,5 @@ async def list_participant_events(
         query = query.filter(Event.datetime >= datetime.now())
 
     events = query.order_by(Event.datetime.desc()).offset(skip).limit(limit).all()
+    await run_in_threadpool(load_images, events, "cover")
     return events
@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import assign_image, load_images, save_image
 from app.core.security import get_current_user
 from app.models.events import Event
 from app.models.users import Admin, Alumni
 from app.schemas.event import Event as EventResponse, UpdateEventRequest
+from app.services import badge_metrics
 from app.services.notification_service import NotificationService
 
 
@@ -58,6 +61,7 @@ async def update_event(
     if event_data.location is not None and event_data.location != old_location:
         event.location = event_data.location
         changes["location"] = event_data.location
+        badge_metrics.event_location_changed(db, event)
 
     if event_data.datetime is not None and event_data.datetime != old_datetime:
         event.datetime = event_data.datetime
@@ -72,7 +76,7 @@ async def update_event(
         changes["is_online"] = event_data.is_online
 
     if "cover" in event_data.model_fields_set:
-        event.cover = event_data.cover
+        assign_image(event, await run_in_threadpool(save_image, "cover", event_data.cover))
 
     # Commit changes
     db.commit()
@@ -106,4 +110,5 @@ async def update_event(
                 message = f"📝 Event '{event.title}' has been updated:\n" + "\n".join(change_lines)
                 await NotificationService.send_custom_notification(db, user.telegram_alias, message)
 
+    await run_in_threadpool(load_images, [event], "cover")
     return event
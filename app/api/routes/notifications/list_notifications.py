@@ -11,10 +11,6 @@ from app.services.notifications import find_nearby_upcoming_events, is_read, mar
 
 router = APIRouter()
 
-# Bounded by design — the ~24h-wide 7-day window practically never holds
-# more than a handful of events — so this is a safety cap, not real paging.
-MAX_ITEMS = 200
-
 
 @router.get("/", response_model=Paginated[NotificationItem])
 def list_notifications(
@@ -33,7 +29,7 @@ def list_notifications(
     if not isinstance(current_user, Alumni):
         return Paginated(items=[], next_cursor=None)
 
-    events = find_nearby_upcoming_events(db, current_user)[:MAX_ITEMS]
+    events = find_nearby_upcoming_events(db, current_user)
 
     items = [
         NotificationItem(
@@ -5,7 +5,7 @@ from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.users import Admin, Alumni
 from app.schemas.notification import UnreadCountResponse
-from app.services.notifications import find_nearby_upcoming_events, is_read
+from app.services.notifications import unread_count
 
 
 router = APIRouter()
@@ -19,11 +19,10 @@ def get_unread_count(
     """Count of currently-matching events not yet seen.
 
     Does not mark read — used to drive the bell icon's badge without opening
-    the list.
+    the list. One COUNT query, cached briefly per user (see
+    app/services/notifications.py).
     """
     if not isinstance(current_user, Alumni):
         return UnreadCountResponse(count=0)
 
-    events = find_nearby_upcoming_events(db, current_user)
-    count = sum(1 for e in events if not is_read(current_user, e))
-    return UnreadCountResponse(count=count)
+    return UnreadCountResponse(count=unread_count(db, current_user))
@@ -1,9 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.api.routes.profile.utils import build_profile_response
 from app.core.database import get_db
+from app.core.images import (
+    ImageSize,
+    image_response,
+    load_image_variant,
+    load_images,
+    pick_variant,
+)
 from app.core.security import get_current_user
 from app.models.users import Admin, Alumni
 from app.schemas.profile import AvatarResponse, ProfileResponse
@@ -17,6 +24,9 @@ _IMAGE_CACHE_SECONDS = 3600
 @router.get("/{user_id}/avatar", response_model=AvatarResponse)
 def get_avatar_by_id(
     user_id: str,
+    size: ImageSize | None = Query(
+        None, description="Resized variant; the original upload when omitted"
+    ),
     db: Session = Depends(get_db),
     current_user: Alumni | Admin = Depends(get_current_user),
 ):
@@ -27,11 +37,45 @@ def get_avatar_by_id(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return JSONResponse(
-        content={"avatar": user.avatar},
+        content={
+            "avatar": load_image_variant(
+                user.avatar_hash, user.avatar_type, user.avatar_variants, size
+            )
+        },
         headers={"Cache-Control": f"private, max-age={_IMAGE_CACHE_SECONDS}"},
     )
 
 
+@router.get("/{user_id}/avatar/image", response_class=Response)
+def get_avatar_image_by_id(
+    user_id: str,
+    request: Request,
+    size: ImageSize | None = Query(
+        None, description="Resized variant; the original upload when omitted"
+    ),
+    db: Session = Depends(get_db),
+    current_user: Alumni | Admin = Depends(get_current_user),
+):
+    """
+    Get the avatar as raw image bytes, with a content-hash ETag.
+
+    A matching `If-None-Match` gets a 304 without reading the avatar.
+    """
+    row = (
+        db.query(Alumni.avatar_hash, Alumni.avatar_type, Alumni.avatar_variants)
+        .filter(Alumni.id == user_id)
+        .first()
+    )
+    if row is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    if row.avatar_hash is None:
+        raise HTTPException(status_code=404, detail="User has no avatar")
+    digest, kind = pick_variant(
+        row.avatar_hash, row.avatar_type, row.avatar_variants, size
+    )
+    return image_response(request, digest, kind, _IMAGE_CACHE_SECONDS)
+
+
 @router.get("/{user_id}", response_model=ProfileResponse)
 def get_profile_by_id(
     user_id: str,
@@ -44,6 +88,7 @@ def get_profile_by_id(
     user = db.query(Alumni).filter(Alumni.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+    load_images([user], "avatar")
     return build_profile_response(user, current_user)
 
 
@@ -59,4 +104,5 @@ def get_profiles_by_ids(
     users = db.query(Alumni).filter(Alumni.id.in_(user_ids)).all()
     if not users:
         raise HTTPException(status_code=404, detail="Users not found")
+    load_images(users, "avatar")
     return [build_profile_response(user, current_user) for user in users]
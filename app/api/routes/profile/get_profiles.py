@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, or_
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.locations import parse_location
 from app.core.security import get_current_user
 from app.models.users import Admin, Alumni
 from app.schemas.pagination import Paginated, decode_cursor, encode_cursor
@@ -16,7 +17,7 @@ router = APIRouter()
 def get_profiles(
     search: str | None = Query(None, description="Search by name"),
     location: str | None = Query(
-        None, description="Filter by exact location string, e.g. 'Russia, Innopolis'"
+        None, description="Filter by map pin location, e.g. 'Russia, Innopolis'"
     ),
     cursor: str | None = Query(
         None, description="Pagination cursor from previous response"
@@ -29,8 +30,8 @@ def get_profiles(
     Get the list of all profiles. Supports name search, location filter, and cursor-based pagination.
 
     - **search**: trigram-indexed ILIKE search across first and last name
-    - **location**: exact match on the stored location string (e.g. 'Russia, Innopolis'),
-      useful for fetching alumni belonging to a specific map pin
+    - **location**: alumni on the map pin for this 'Country, City' string
+      (e.g. 'Russia, Innopolis'), matched on the stored country and city
     - **cursor** / **limit**: standard cursor pagination
     """
     query = db.query(Alumni)
@@ -47,10 +48,13 @@ def get_profiles(
         )
 
     if location:
-        # Keep city-detail lists aligned with /profile/map pin counts.
+        # Keep city-detail lists aligned with /profile/map pin counts, which
+        # group by the same columns (ix_alumni_show_location_country_city).
+        parsed = parse_location(location)
         query = query.filter(
-            func.lower(Alumni.location) == location.lower(),
             Alumni.show_location.is_(True),
+            Alumni.country == parsed.country,
+            Alumni.city == parsed.city,
             Alumni.is_verified.is_(True),
             Alumni.is_banned.is_(False),
         )
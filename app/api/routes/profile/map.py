@@ -24,38 +24,41 @@ def get_map_locations(
     included. Coordinates come from a JOIN with the cities table so the mobile
     client does not need to make one round-trip per city to look up lat/lng.
 
-    The location string is stored as ``"Country, City"`` (comma-space separated).
-    We split it with PostgreSQL's ``split_part()`` function to join against the
-    cities table, which is indexed on (city, country).
+    Alumni are counted per stored ``(country, city)`` — normalized from the
+    ``"Country, City"`` location string when it is written, see
+    ``app/core/locations.py`` — and only the per-city counts are joined to
+    the cities table, whose spelling is what the pins show.
 
     Indexes used:
-    - ``ix_alumni_show_location_location`` composite B-tree (leading filter)
-    - ``idx_city_name`` / ``idx_country`` B-tree on cities table (JOIN condition)
-    """
-    country_expr = func.split_part(Alumni.location, ", ", 1)
-    city_expr = func.split_part(Alumni.location, ", ", 2)
+    - ``ix_alumni_show_location_country_city`` composite B-tree (filter + GROUP BY)
 
-    rows = (
+    The per-city counts are few, so the case-insensitive JOIN with cities
+    is a single hash join rather than one lookup per alumnus.
+    """
+    counts = (
         db.query(
-            country_expr.label("country"),
-            city_expr.label("city"),
-            City.lat,
-            City.lng,
+            Alumni.country,
+            Alumni.city,
             func.count(Alumni.id).label("count"),
         )
-        .join(
-            City,
-            (func.lower(city_expr) == func.lower(City.city))
-            & (func.lower(country_expr) == func.lower(City.country)),
-        )
         .filter(
             Alumni.show_location.is_(True),
-            Alumni.location.isnot(None),
-            Alumni.location.like("%, %"),
+            Alumni.country.isnot(None),
+            Alumni.city.isnot(None),
             Alumni.is_verified.is_(True),
             Alumni.is_banned.is_(False),
         )
-        .group_by(country_expr, city_expr, City.lat, City.lng)
+        .group_by(Alumni.country, Alumni.city)
+        .subquery()
+    )
+
+    rows = (
+        db.query(City.country, City.city, City.lat, City.lng, counts.c.count)
+        .join(
+            counts,
+            (func.lower(City.city) == counts.c.city)
+            & (func.lower(City.country) == counts.c.country),
+        )
         .all()
     )
 
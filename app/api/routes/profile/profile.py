@@ -1,11 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.api.routes.profile.utils import build_profile_response
 from app.core.database import get_db
+from app.core.images import assign_image, load_images, save_image
+from app.core.principal_cache import invalidate_principal
 from app.core.security import get_current_user
 from app.models.users import Alumni
 from app.schemas.profile import ProfileResponse, ProfileUpdateRequest
+from app.services import badge_metrics
 
 
 router = APIRouter()
@@ -32,6 +36,7 @@ def get_profile(
         raise HTTPException(
             status_code=403, detail="Your account is not an alumni account"
         )
+    load_images([current_user], "avatar")
     return build_profile_response(current_user, current_user)
 
 
@@ -66,6 +71,8 @@ async def update_profile(
         current_user.graduation_year = profile_data.graduation_year
 
     if profile_data.location is not None:
+        if profile_data.location != current_user.location:
+            badge_metrics.home_location_changed(db, current_user.id)
         current_user.location = profile_data.location
 
     if profile_data.show_location is not None:
@@ -81,26 +88,24 @@ async def update_profile(
             current_user.is_telegram_verified = False
 
     if profile_data.avatar is not None:
-        current_user.avatar = profile_data.avatar or None
+        assign_image(
+            current_user,
+            await run_in_threadpool(save_image, "avatar", profile_data.avatar or None),
+        )
 
     db.commit()
     db.refresh(current_user)
+    invalidate_principal(current_user.email)
 
     # Badge eval (Pioneer, Innopolis OG, Profile Pro, Cross-city commuter).
-    awarded_codes: list[str] = []
     try:
         from app.services.badges import evaluate_for_user
-        new_rows = evaluate_for_user(db, current_user, "profile_updated")
-        awarded_codes = [r.badge.code for r in new_rows if r.badge]
+        evaluate_for_user(db, current_user, "profile_updated", notify=True)
     except Exception as eval_err:
         import logging
         logging.getLogger("iu_alumni").error(
             "badge eval failed on profile_updated: %s", eval_err
         )
 
-    if awarded_codes:
-        from app.services.badge_notifications import notify_badge_awards
-
-        await notify_badge_awards(db, current_user, awarded_codes)
-
+    await run_in_threadpool(load_images, [current_user], "avatar")
     return build_profile_response(current_user, current_user)
@@ -3,6 +3,7 @@ from app.schemas.profile import ProfileResponse
 
 
 def build_profile_response(user: Alumni, current_user: Alumni | Admin | None = None) -> ProfileResponse:
+    """`user`'s avatar must have been loaded with `load_images`."""
     is_following = False
     if isinstance(current_user, Alumni) and current_user.id != user.id:
         is_following = user in current_user.following
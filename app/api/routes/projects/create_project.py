@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import save_image
 from app.core.security import get_current_user, get_random_token
 from app.models.projects import Project
 from app.models.users import Admin, Alumni
@@ -53,13 +55,14 @@ async def create_project(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Fundraising goal is required and must be positive",
         )
+    cover = await run_in_threadpool(save_image, "cover", body.cover)
     project = Project(
         id=get_random_token(),
         owner_id=current_user.id,
         contributors_ids=[],
         title=body.title.strip(),
         description=body.description.strip(),
-        cover=body.cover,
+        **cover,
         donation_link=donation_link,
         goal_amount=goal_amount,
         raised_amount=0,
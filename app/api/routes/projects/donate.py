@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import load_images
 from app.core.security import get_current_user
 from app.models.projects import Project
 from app.models.users import Admin, Alumni
@@ -66,4 +68,5 @@ async def donate(
 
     db.commit()
     db.refresh(project)
+    await run_in_threadpool(load_images, [project], "cover")
     return project
@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import (
+    ImageSize,
+    image_response,
+    load_image_variant,
+    pick_variant,
+)
 from app.core.security import get_current_user
 from app.models.projects import Project
 from app.models.users import Admin, Alumni
@@ -17,6 +23,9 @@ _IMAGE_CACHE_SECONDS = 3600
 @router.get("/{project_id}/cover", response_model=CoverResponse)
 def get_project_cover(
     project_id: str,
+    size: ImageSize | None = Query(
+        None, description="Resized variant; the original upload when omitted"
+    ),
     db: Session = Depends(get_db),
     current_user: Alumni | Admin = Depends(get_current_user),
 ):
@@ -25,6 +34,36 @@ def get_project_cover(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return JSONResponse(
-        content={"cover": project.cover},
+        content={
+            "cover": load_image_variant(
+                project.cover_hash, project.cover_type, project.cover_variants, size
+            )
+        },
         headers={"Cache-Control": f"private, max-age={_IMAGE_CACHE_SECONDS}"},
     )
+
+
+@router.get("/{project_id}/cover/image", response_class=Response)
+def get_project_cover_image(
+    project_id: str,
+    request: Request,
+    size: ImageSize | None = Query(
+        None, description="Resized variant; the original upload when omitted"
+    ),
+    db: Session = Depends(get_db),
+    current_user: Alumni | Admin = Depends(get_current_user),
+):
+    """Binary cover with a content-hash ETag; 304s never read the blob."""
+    row = (
+        db.query(Project.cover_hash, Project.cover_type, Project.cover_variants)
+        .filter(Project.id == project_id)
+        .first()
+    )
+    if row is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if row.cover_hash is None:
+        raise HTTPException(status_code=404, detail="Project has no cover")
+    digest, kind = pick_variant(
+        row.cover_hash, row.cover_type, row.cover_variants, size
+    )
+    return image_response(request, digest, kind, _IMAGE_CACHE_SECONDS)
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import load_images
 from app.core.security import get_current_user
 from app.models.projects import Project
 from app.models.users import Admin, Alumni
@@ -19,7 +21,7 @@ async def list_my_contributed_projects(
     current_user: Admin | Alumni = Depends(get_current_user),
 ):
     """Approved projects the current user has contributed to."""
-    return (
+    projects = (
         db.query(Project)
         .filter(
             Project.approved.is_(True),
@@ -30,6 +32,8 @@ async def list_my_contributed_projects(
         .limit(limit)
         .all()
     )
+    await run_in_threadpool(load_images, projects, "cover")
+    return projects
 
 
 @router.get(
@@ -48,7 +52,7 @@ async def list_user_contributed_projects(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Alumni not found"
         )
-    return (
+    projects = (
         db.query(Project)
         .filter(
             Project.approved.is_(True),
@@ -59,3 +63,5 @@ async def list_user_contributed_projects(
         .limit(limit)
         .all()
     )
+    await run_in_threadpool(load_images, projects, "cover")
+    return projects
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import load_images
 from app.core.security import get_current_user
 from app.models.projects import Project
 from app.models.users import Admin, Alumni
@@ -19,7 +21,7 @@ async def list_owner_projects(
     current_user: Admin | Alumni = Depends(get_current_user),
 ):
     """The current user's projects — all statuses."""
-    return (
+    projects = (
         db.query(Project)
         .filter(Project.owner_id == current_user.id)
         .order_by(Project.created_at.desc())
@@ -27,3 +29,5 @@ async def list_owner_projects(
         .limit(limit)
         .all()
     )
+    await run_in_threadpool(load_images, projects, "cover")
+    return projects
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.images import load_images
 from app.core.security import get_current_user
 from app.models.projects import Project
 from app.models.users import Admin, Alumni
@@ -23,30 +25,29 @@ async def list_projects(
     search: str | None = Query(None, description="Search by project title"),
     cursor: str | None = Query(None, description="Pagination cursor from previous response"),
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Alumni | Admin = Depends(get_current_user),
 ):
     """Public list. Approved projects only, newest first, cursor-paginated."""
-    query = db.query(Project).filter(Project.approved.is_(True))
+    query = select(Project).where(Project.approved.is_(True))
 
     if search:
-        query = query.filter(Project.title.ilike(f"%{search}%"))
+        query = query.where(Project.title.ilike(f"%{search}%"))
 
     if cursor:
         c = decode_cursor(cursor)
         cursor_dt = cursor_datetime(c["dt"])
-        query = query.filter(
+        query = query.where(
             or_(
                 Project.created_at < cursor_dt,
                 and_(Project.created_at == cursor_dt, Project.id > c["id"]),
             )
         )
 
-    projects = (
-        query.order_by(Project.created_at.desc(), Project.id.asc())
-        .limit(limit + 1)
-        .all()
+    result = await db.execute(
+        query.order_by(Project.created_at.desc(), Project.id.asc()).limit(limit + 1)
     )
+    projects = result.scalars().all()
 
     next_cursor = None
     if len(projects) > limit:
@@ -54,4 +55,5 @@ async def list_projects(
         next_cursor = encode_cursor({"id": last.id, "dt": last.created_at.isoformat()})
         projects = projects[:limit]
 
+    await run_in_threadpool(load_images, projects, "cover")
     return Paginated(items=projects, next_cursor=next_cursor)
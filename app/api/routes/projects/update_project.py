@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.images import assign_image, load_images, save_image
 from app.core.security import get_current_user
 from app.models.projects import Project
 from app.models.users import Admin, Alumni
@@ -54,9 +56,12 @@ async def update_project(
             changed_content = True
     if body.cover is not None:
         # Empty string clears the cover; any other change counts too.
-        new_cover = body.cover or None
-        if new_cover != project.cover:
-            project.cover = new_cover
+        cover = await run_in_threadpool(save_image, "cover", body.cover or None)
+        if (cover["cover_hash"], cover["cover_type"]) != (
+            project.cover_hash,
+            project.cover_type,
+        ):
+            assign_image(project, cover)
             changed_content = True
     if body.donation_link is not None:
         new_link = str(body.donation_link)
@@ -96,4 +101,5 @@ async def update_project(
 
     db.commit()
     db.refresh(project)
+    await run_in_threadpool(load_images, [project], "cover")
     return project
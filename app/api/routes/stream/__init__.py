@@ -0,0 +1,7 @@
+from fastapi import APIRouter
+
+from . import stream
+
+
+router = APIRouter()
+router.include_router(stream.router)
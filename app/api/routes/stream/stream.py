@@ -0,0 +1,64 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.security import get_current_user
+from app.models.users import Admin, Alumni
+from app.services import stream as stream_service
+
+
+router = APIRouter()
+
+# Tells EventSource-style clients how long to wait before reconnecting.
+_RETRY_MS = 5000
+
+
+async def _frames(alumni_id: str, city_key: str | None) -> AsyncIterator[bytes]:
+    """SSE frames for one client until it goes away."""
+    # Subscribed here rather than in the route so the `finally` always
+    # runs for a subscription that exists.
+    subscription = stream_service.hub.subscribe(alumni_id, city_key)
+    try:
+        yield f"retry: {_RETRY_MS}\n\n".encode()
+        while True:
+            try:
+                envelope = await asyncio.wait_for(
+                    subscription.queue.get(), stream_service.STREAM_HEARTBEAT_SECONDS
+                )
+            except TimeoutError:
+                # Keeps proxies from closing an idle connection.
+                yield b": keep-alive\n\n"
+                continue
+            yield envelope.encode()
+    finally:
+        stream_service.hub.unsubscribe(subscription)
+
+
+@router.get("/stream")
+async def stream_updates(
+    db: Session = Depends(get_db),
+    current_user: Alumni | Admin = Depends(get_current_user),
+):
+    """Server-sent events for the current alumnus.
+
+    Emits `notification`, `event.participant_joined` and `badge.awarded`
+    events (see app/services/stream.py), with a keep-alive comment when
+    idle. Replaces polling `/notifications/unread-count` and `/badges/me`:
+    refetch those when an event arrives and after reconnecting.
+    """
+    if not isinstance(current_user, Alumni):
+        raise HTTPException(
+            status_code=403, detail="Your account is not an alumni account"
+        )
+    frames = _frames(current_user.id, current_user.city_key)
+    # The stream can stay open for hours; don't hold a pooled connection.
+    db.close()
+    return StreamingResponse(
+        frames,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -2,5 +2,8 @@
 
 from fastapi import APIRouter
 
+from . import webhook
+
 
 router = APIRouter(prefix="/telegram", tags=["telegram"])
+router.include_router(webhook.router)
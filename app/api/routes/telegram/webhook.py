@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Header, HTTPException, Request, status
+
+from app.services import telegram_webhook
+
+
+router = APIRouter()
+
+
+@router.post("/webhook")
+async def telegram_webhook_update(
+    request: Request,
+    x_telegram_bot_api_secret_token: str | None = Header(default=None),
+):
+    """Receive one bot update from Telegram (webhook mode only).
+
+    Acknowledged as soon as it's queued; the handler runs afterwards. See
+    app/services/telegram_webhook.py.
+    """
+    if telegram_webhook.TELEGRAM_UPDATES_MODE != telegram_webhook.WEBHOOK:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not telegram_webhook.secret_matches(x_telegram_bot_api_secret_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid secret token")
+
+    try:
+        update = await request.json()
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Body must be a JSON update"
+        ) from None
+    if not isinstance(update, dict):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Body must be a JSON update"
+        )
+
+    outcome = await telegram_webhook.ingress.accept(update)
+    if outcome in (telegram_webhook.BUSY, telegram_webhook.UNAVAILABLE):
+        # Telegram retries non-2xx answers later.
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Try again later"
+        )
+    return {"ok": True}
@@ -2,19 +2,59 @@ import os
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from app.core.db_pool import engine_options, register_pool_gauges
+
 
 load_dotenv(override=True)
 
 SQLALCHEMY_DATABASE_URL = os.getenv("SQLALCHEMY_DATABASE_URL")
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+# Pool size, overflow, timeouts and statement_timeout come from the
+# environment; see app/core/db_pool.py.
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options(SQLALCHEMY_DATABASE_URL))
+register_pool_gauges(engine, "sync")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# Async drivers for the backends we run on. The sync URL stays the single
+# source of truth; the async one is derived from it unless overridden.
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def _async_database_url(url: str) -> URL:
+    """Swap the sync driver in `url` for its asyncio counterpart."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise RuntimeError(f"No async driver configured for database backend '{backend}'")
+    return parsed.set(drivername=_ASYNC_DRIVERS[backend])
+
+
+ASYNC_SQLALCHEMY_DATABASE_URL = os.getenv(
+    "ASYNC_SQLALCHEMY_DATABASE_URL"
+) or _async_database_url(SQLALCHEMY_DATABASE_URL)
+
+# Used by `async def` read endpoints so their queries don't block the event
+# loop. Write paths and services (badges, notifications, ...) stay on the
+# sync SessionLocal.
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    **engine_options(ASYNC_SQLALCHEMY_DATABASE_URL, is_async=True),
+)
+register_pool_gauges(async_engine.sync_engine, "async")
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def get_db():
     db = SessionLocal()
@@ -22,3 +62,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
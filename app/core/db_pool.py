@@ -0,0 +1,135 @@
+"""Connection pool settings and pool metrics for the database engines.
+
+Everything is driven by environment variables so the pool can be sized to
+the Postgres box without a code change:
+
+    DB_POOL_SIZE              persistent connections per engine   (default 5)
+    DB_MAX_OVERFLOW           extra connections under burst        (default 10)
+    DB_POOL_TIMEOUT           seconds to wait for a free connection (default 30)
+    DB_POOL_RECYCLE           seconds before a connection is replaced (default 1800)
+    DB_POOL_PRE_PING          test connections on checkout         (default true)
+    DB_STATEMENT_TIMEOUT_MS   server-side statement_timeout, 0 = off (default 30000)
+
+The sync and async engines each get their own pool with these settings, so
+the worst case per process is 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+connections — keep that times the replica count under Postgres'
+max_connections.
+
+SQLite (tests, local tooling) ignores all of this: its pools don't take
+size/overflow arguments and it has no statement_timeout.
+"""
+from __future__ import annotations
+
+import os
+import time
+from typing import Any
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import exc
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = _env_bool("DB_POOL_PRE_PING", True)
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+
+
+pool_checkout_wait_seconds = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool",
+    ["engine"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+pool_checkout_timeouts = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after DB_POOL_TIMEOUT (pool exhausted)",
+    ["engine"],
+)
+pool_connections_in_use = Gauge(
+    "db_pool_connections_in_use",
+    "Connections currently checked out of the pool",
+    ["engine"],
+)
+pool_overflow = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond DB_POOL_SIZE (negative while the pool warms up)",
+    ["engine"],
+)
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout and counts the ones that hit the pool timeout.
+
+    `_do_get` is where QueuePool blocks when every connection is in use, so
+    timing it measures exactly the queueing a request sees.
+    """
+
+    metrics_label = "sync"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            pool_checkout_timeouts.labels(engine=self.metrics_label).inc()
+            raise
+        finally:
+            pool_checkout_wait_seconds.labels(engine=self.metrics_label).observe(
+                time.perf_counter() - started
+            )
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    metrics_label = "sync"
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+def engine_options(url: str | URL, *, is_async: bool = False) -> dict[str, Any]:
+    """Keyword arguments for create_engine / create_async_engine."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "postgresql":
+        return {}
+
+    options: dict[str, Any] = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    if DB_STATEMENT_TIMEOUT_MS > 0:
+        # Set once per connection, so it applies to every statement of every
+        # session that borrows it. asyncpg and libpq spell it differently.
+        if is_async:
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+            }
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+            }
+    return options
+
+
+def register_pool_gauges(engine, label: str) -> None:
+    """Expose a pool's live occupancy as gauges, read at scrape time."""
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return
+    pool_connections_in_use.labels(engine=label).set_function(pool.checkedout)
+    pool_overflow.labels(engine=label).set_function(pool.overflow)
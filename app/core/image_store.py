@@ -0,0 +1,138 @@
+"""Content-addressed storage for uploaded images.
+
+Covers and avatars used to live inline in their rows as base64 text, so
+every query that loaded an event, project or alumnus dragged the image
+along. Now the row keeps only the SHA-256 of the bytes (`cover_hash`,
+`avatar_hash`) and the bytes live here, keyed by that hash. Identical
+uploads therefore share one object, and writing an object that already
+exists is a no-op.
+
+Objects are immutable and never overwritten, so they can be cached
+forever and writes need no locking. Nothing deletes them when a row stops
+referencing one (another row may share it); orphans from rolled-back
+writes or replaced images are harmless and can be swept offline.
+
+Configured by environment variables:
+    IMAGE_STORE_BACKEND        "filesystem" (default) or "s3"
+    IMAGE_STORE_PATH           filesystem root (default ./data/images)
+    IMAGE_STORE_S3_BUCKET      bucket name, required for "s3"
+    IMAGE_STORE_S3_PREFIX      key prefix (default "images/")
+    IMAGE_STORE_S3_ENDPOINT_URL  for S3-compatible services (MinIO, ...)
+
+The S3 backend needs `boto3`, which is only imported when it's selected;
+credentials come from the usual AWS_* environment variables.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+import hashlib
+import os
+from pathlib import Path
+import re
+import tempfile
+from typing import Protocol
+
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def digest_of(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _check(digest: str) -> str:
+    # Digests become file paths / object keys; never let anything else through.
+    if not _DIGEST_RE.match(digest):
+        raise ValueError(f"not a sha256 hex digest: {digest!r}")
+    return digest
+
+
+class ImageStore(Protocol):
+    def put(self, data: bytes) -> str:
+        """Store `data` (if not already stored) and return its digest."""
+
+    def get(self, digest: str) -> bytes | None:
+        """The bytes stored under `digest`, or None if there are none."""
+
+
+class FilesystemImageStore:
+    """Objects at <root>/<d[0:2]>/<d[2:4]>/<digest>."""
+
+    def __init__(self, root: str | os.PathLike[str]):
+        self.root = Path(root)
+
+    def _path(self, digest: str) -> Path:
+        digest = _check(digest)
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def put(self, data: bytes) -> str:
+        digest = digest_of(data)
+        path = self._path(digest)
+        if path.exists():
+            return digest
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a reader never sees a partial file and two
+        # concurrent writers of the same image both succeed.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return digest
+
+    def get(self, digest: str) -> bytes | None:
+        try:
+            return self._path(digest).read_bytes()
+        except FileNotFoundError:
+            return None
+
+
+class S3ImageStore:
+    """Objects at s3://<bucket>/<prefix><digest>."""
+
+    def __init__(self, bucket: str, prefix: str = "images/", endpoint_url: str | None = None):
+        import boto3  # optional dependency, only needed for this backend
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self._client = boto3.client("s3", endpoint_url=endpoint_url or None)
+
+    def _key(self, digest: str) -> str:
+        return f"{self.prefix}{_check(digest)}"
+
+    def put(self, data: bytes) -> str:
+        digest = digest_of(data)
+        key = self._key(digest)
+        try:
+            self._client.head_object(Bucket=self.bucket, Key=key)
+        except self._client.exceptions.ClientError:
+            self._client.put_object(Bucket=self.bucket, Key=key, Body=data)
+        return digest
+
+    def get(self, digest: str) -> bytes | None:
+        try:
+            obj = self._client.get_object(Bucket=self.bucket, Key=self._key(digest))
+        except self._client.exceptions.NoSuchKey:
+            return None
+        return obj["Body"].read()
+
+
+@lru_cache(maxsize=1)
+def get_image_store() -> ImageStore:
+    """The process-wide store selected by IMAGE_STORE_BACKEND."""
+    backend = os.getenv("IMAGE_STORE_BACKEND", "filesystem").strip().lower()
+    if backend == "s3":
+        bucket = os.getenv("IMAGE_STORE_S3_BUCKET")
+        if not bucket:
+            raise RuntimeError("IMAGE_STORE_S3_BUCKET is required for the s3 image store")
+        return S3ImageStore(
+            bucket,
+            prefix=os.getenv("IMAGE_STORE_S3_PREFIX", "images/"),
+            endpoint_url=os.getenv("IMAGE_STORE_S3_ENDPOINT_URL"),
+        )
+    if backend != "filesystem":
+        raise RuntimeError(f"unknown IMAGE_STORE_BACKEND {backend!r}")
+    return FilesystemImageStore(os.getenv("IMAGE_STORE_PATH", "data/images"))
@@ -0,0 +1,311 @@
+"""Image columns (event/project covers, avatars) backed by the image store.
+
+Clients upload images as strings: a `data:<mime>;base64,...` URL, bare
+base64, or occasionally a plain http(s) URL. The rows don't keep that
+string. `store_image` puts the bytes into the content-addressed store
+(app/core/image_store.py) and returns `(digest, kind)` for the row's
+`*_hash` / `*_type` columns; `load_image` rebuilds the original string
+for the JSON API. `kind` is one of:
+
+    "<mime>"       uploaded as a data: URL; one of `IMAGE_CONTENT_TYPES`,
+                   else the type sniffed from the bytes
+    "base64"       uploaded as bare base64; Content-Type is sniffed
+    "text/plain"   anything else (usually a URL), stored verbatim
+
+Both touch the store (a disk read or an S3 request), so neither happens
+behind an attribute access. Writes go through `save_image`, which returns
+the row's column values; reads go through `load_images`, after which
+`stored_image(...)` properties such as `event.cover` return the string
+for the response schemas without further I/O. Both block, so async
+routes call them via `run_in_threadpool`. List queries don't carry the
+image at all.
+
+Every inline image also gets resized, recompressed WebP variants
+(`VARIANT_SIZES`) when it is written, so a 48px avatar in a participant
+list doesn't cost a multi-megabyte download. Their digests go in the
+row's `*_variants` JSON column and the binary endpoints pick one with
+`?size=`.
+
+The binary endpoints serve from the API's origin, so they only ever send
+an `IMAGE_CONTENT_TYPES` type (or application/octet-stream) with
+`nosniff`, and never redirect to a stored URL.
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+from collections.abc import Iterable
+import io
+import logging
+from typing import Any, Literal
+
+from fastapi import HTTPException, Request, Response
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from app.core.image_store import get_image_store
+
+
+logger = logging.getLogger("iu_alumni")
+
+INLINE_BASE64 = "base64"
+TEXT = "text/plain"
+
+_DATA_URL_PREFIX = "data:"
+_UNKNOWN_CONTENT_TYPE = "application/octet-stream"
+
+# Raster types a browser renders as an image and nothing else. Anything
+# else a client claims (text/html, image/svg+xml, ...) is not trusted.
+IMAGE_CONTENT_TYPES = frozenset({"image/png", "image/jpeg", "image/gif", "image/webp"})
+
+ImageSize = Literal["thumbnail", "card", "full"]
+
+# Longest edge in pixels; images are only ever scaled down. thumbnail is
+# sized for avatars/list rows at 2-3x density, card for feed cards.
+VARIANT_SIZES: dict[str, int] = {"thumbnail": 160, "card": 720, "full": 1920}
+VARIANT_CONTENT_TYPE = "image/webp"
+_VARIANT_QUALITY = 80
+# libwebp effort (0-6). 2 is ~2.5x faster to encode than the default 4 for
+# files within a few percent of the size.
+_VARIANT_METHOD = 2
+# Uploads beyond this many pixels are not decoded (decompression bombs).
+_MAX_SOURCE_PIXELS = 50_000_000
+
+# Leading bytes -> Content-Type, for bare base64 without a data: header.
+_MAGIC = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+
+class ImageNotLoadedError(RuntimeError):
+    """A `stored_image` property was read without `load_images` first."""
+
+
+def _sniff(data: bytes) -> str:
+    for magic, content_type in _MAGIC:
+        if data.startswith(magic):
+            return content_type
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return _UNKNOWN_CONTENT_TYPE
+
+
+def _content_type(data: bytes, kind: str | None) -> str:
+    """The Content-Type to serve `data` with; `kind` only if it's allowed."""
+    return kind if kind in IMAGE_CONTENT_TYPES else _sniff(data)
+
+
+def _is_remote(value: str) -> bool:
+    return value.startswith(("http://", "https://"))
+
+
+def _split(value: str) -> tuple[bytes, str]:
+    """(bytes to store, kind) for an uploaded image string."""
+    if _is_remote(value):
+        return value.encode(), TEXT
+    kind = INLINE_BASE64
+    payload = value
+    if value.startswith(_DATA_URL_PREFIX):
+        header, sep, payload = value.partition(",")
+        mime = header[len(_DATA_URL_PREFIX) : -len(";base64")]
+        if not sep or not header.endswith(";base64") or not mime:
+            return value.encode(), TEXT
+        kind = mime
+    try:
+        data = base64.b64decode("".join(payload.split()), validate=True)
+    except (binascii.Error, ValueError):
+        return value.encode(), TEXT
+    if kind != INLINE_BASE64:
+        kind = _content_type(data, kind)
+    return data, kind
+
+
+def decode_image(value: str) -> tuple[bytes, str] | None:
+    """(bytes, content_type) for an inline image string, None if it isn't one."""
+    data, kind = _split(value)
+    if kind == TEXT:
+        return None
+    return data, _content_type(data, kind)
+
+
+def store_image(value: str | None) -> tuple[str | None, str | None]:
+    """Put an uploaded image string into the store; returns (digest, kind)."""
+    if not value:
+        return None, None
+    data, kind = _split(value)
+    return get_image_store().put(data), kind
+
+
+def load_image(digest: str | None, kind: str | None) -> str | None:
+    """The image string as uploaded (modulo whitespace in the base64)."""
+    if digest is None:
+        return None
+    data = get_image_store().get(digest)
+    if data is None:
+        logger.warning("image %s missing from the image store", digest)
+        return None
+    if kind == TEXT:
+        return data.decode()
+    encoded = base64.b64encode(data).decode()
+    if kind == INLINE_BASE64:
+        return encoded
+    return f"{_DATA_URL_PREFIX}{kind};base64,{encoded}"
+
+
+def make_variants(data: bytes) -> dict[str, str] | None:
+    """Store a resized WebP of `data` per `VARIANT_SIZES`; {size: digest}.
+
+    None when Pillow can't read `data` as a raster image; the original is
+    then the only version there is.
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            if source.width * source.height > _MAX_SOURCE_PIXELS:
+                logger.warning(
+                    "image too large for variants: %sx%s", source.width, source.height
+                )
+                return None
+            # JPEGs can be decoded straight at 1/2..1/8 scale, which is
+            # most of the cost for a phone photo.
+            scale = max(VARIANT_SIZES.values()) / max(source.size)
+            if scale < 1:
+                source.draft(
+                    "RGB", (round(source.width * scale), round(source.height * scale))
+                )
+            image = ImageOps.exif_transpose(source)
+            has_alpha = "A" in image.getbands() or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha else "RGB")
+    except (UnidentifiedImageError, OSError, ValueError, Image.DecompressionBombError):
+        return None
+
+    store = get_image_store()
+    variants = {}
+    # Largest first, each one scaled down from the previous.
+    for size, edge in sorted(VARIANT_SIZES.items(), key=lambda kv: -kv[1]):
+        image = image.copy()
+        image.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+        buf = io.BytesIO()
+        image.save(buf, "WEBP", quality=_VARIANT_QUALITY, method=_VARIANT_METHOD)
+        variants[size] = store.put(buf.getvalue())
+    return variants
+
+
+def save_image(name: str, value: str | None) -> dict[str, Any]:
+    """Store `value` and its variants; the values for the `name_*` columns.
+
+    `name` is the property's name ("cover", "avatar"). Pass the result as
+    keyword arguments to the model, or `assign_image` it to an existing
+    row.
+    """
+    digest, kind = store_image(value)
+    decoded = decode_image(value) if digest is not None else None
+    return {
+        f"{name}_hash": digest,
+        f"{name}_type": kind,
+        f"{name}_variants": make_variants(decoded[0]) if decoded else None,
+    }
+
+
+def assign_image(row: object, columns: dict[str, Any]) -> None:
+    """Set the columns returned by `save_image` on `row`."""
+    for column, value in columns.items():
+        setattr(row, column, value)
+
+
+def load_images(
+    rows: Iterable[object], name: str, size: ImageSize | None = None
+) -> None:
+    """Fetch the `name` image of each of `rows` for its `stored_image` property.
+
+    With `size`, the property returns that variant instead of the original
+    (see `load_image_variant`).
+    """
+    for row in rows:
+        digest = getattr(row, f"{name}_hash")
+        loaded = row.__dict__.setdefault("_loaded_images", {})
+        loaded[name] = (
+            digest,
+            load_image_variant(
+                digest,
+                getattr(row, f"{name}_type"),
+                getattr(row, f"{name}_variants"),
+                size,
+            ),
+        )
+
+
+def stored_image(name: str) -> property:
+    """A read-only model property for an image loaded by `load_images`.
+
+    Raises `ImageNotLoadedError` rather than reading the store itself
+    when the row's image wasn't loaded (or has changed since).
+    """
+    hash_attr = f"{name}_hash"
+
+    def fget(self) -> str | None:
+        digest = getattr(self, hash_attr)
+        if digest is None:
+            return None
+        loaded = self.__dict__.get("_loaded_images", {}).get(name)
+        if loaded is None or loaded[0] != digest:
+            raise ImageNotLoadedError(f"{type(self).__name__}.{name} was not loaded")
+        return loaded[1]
+
+    return property(fget)
+
+
+def pick_variant(
+    digest: str, kind: str | None, variants: dict[str, str] | None, size: ImageSize | None
+) -> tuple[str, str | None]:
+    """(digest, kind) to serve for `?size=`; the original if there's no such variant."""
+    if size is not None and variants and size in variants:
+        return variants[size], VARIANT_CONTENT_TYPE
+    return digest, kind
+
+
+def load_image_variant(
+    digest: str | None, kind: str | None, variants: dict[str, str] | None, size: ImageSize | None
+) -> str | None:
+    """Like `load_image`, for the `size` variant (a WebP data: URL) if there is one."""
+    if digest is None:
+        return None
+    return load_image(*pick_variant(digest, kind, variants, size))
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    # If-None-Match uses the weak comparison, so a W/ prefix still matches.
+    return "*" in candidates or any(c.removeprefix("W/") == etag for c in candidates)
+
+
+def image_response(
+    request: Request,
+    digest: str,
+    kind: str | None,
+    cache_seconds: int,
+) -> Response:
+    """Serve a stored image as bytes, or 304 if the client's copy is current.
+
+    `digest`/`kind` come from the row's `*_hash`/`*_type` columns; the
+    image itself is only fetched from the store when a body is sent.
+    Images stored as a URL are 404 here (the JSON routes return the URL).
+    """
+    if kind == TEXT:
+        raise HTTPException(status_code=404, detail="Image is not stored inline")
+    etag = f'"{digest}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={cache_seconds}",
+        "X-Content-Type-Options": "nosniff",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    data = get_image_store().get(digest)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+    return Response(content=data, media_type=_content_type(data, kind), headers=headers)
@@ -0,0 +1,170 @@
+"""Leader election between replicas with a Postgres advisory lock.
+
+Some background work must run in exactly one process: only one client
+may call getUpdates for the bot, so Telegram long polling can't run in
+every API replica. `LeaderElection(name).run(work, stop)` keeps trying to
+take the session-level advisory lock derived from `name`; the replica
+that gets it runs `work` and the others wait. The lock belongs to a
+dedicated connection (outside the pool), so Postgres releases it the
+moment the leader's process or connection dies, and another replica
+takes over on its next try:
+
+    follower  pg_try_advisory_lock every LEADER_RETRY_SECONDS
+    leader    runs `work`; checks its connection every LEADER_CHECK_SECONDS
+              and stops `work` as soon as the check fails, since by then
+              the lock may already be someone else's
+
+Failover therefore takes up to LEADER_RETRY_SECONDS after the old
+leader's connection is gone (immediately on a clean exit or crash; after
+TCP keepalive on a network split, which is when the leader's own check
+stops it too).
+
+On SQLite (tests, local runs) there are no advisory locks and only one
+process, so the caller is always the leader.
+
+Configured by environment variables:
+    LEADER_RETRY_SECONDS   how often followers try for the lock (default 5)
+    LEADER_CHECK_SECONDS   how often the leader checks its connection (default 5)
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import contextlib
+import hashlib
+import os
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import NullPool
+
+from app.core.logging import app_logger
+
+
+LEADER_RETRY_SECONDS = float(os.getenv("LEADER_RETRY_SECONDS", "5"))
+LEADER_CHECK_SECONDS = float(os.getenv("LEADER_CHECK_SECONDS", "5"))
+
+leader_status = Gauge(
+    "leader", "1 while this process holds the named leadership", ["name"]
+)
+leader_elections = Counter(
+    "leader_elections_total", "Times this process became leader", ["name"]
+)
+
+Work = Callable[[asyncio.Event], Awaitable[None]]
+
+
+def lock_key(name: str) -> int:
+    """A stable signed 64-bit advisory lock key for `name`."""
+    return int.from_bytes(hashlib.sha256(name.encode()).digest()[:8], "big", signed=True)
+
+
+class LeaderElection:
+    """Leadership for one named piece of work. See the module docstring."""
+
+    def __init__(self, name: str, database_url: str | None = None):
+        """`database_url` defaults to SQLALCHEMY_DATABASE_URL."""
+        self.name = name
+        self.key = lock_key(name)
+        self._url = database_url or os.getenv("SQLALCHEMY_DATABASE_URL", "")
+        self._engine: Engine | None = None
+        self._conn: Connection | None = None
+        self.is_leader = False
+
+    # ── lock primitives (blocking; run in a thread) ─────────────────────────
+
+    def _uses_advisory_locks(self) -> bool:
+        return self._url.startswith("postgresql")
+
+    def _try_acquire(self) -> bool:
+        if not self._uses_advisory_locks():
+            return True
+        if self._engine is None:
+            # Its own connection, so the lock lives exactly as long as it.
+            self._engine = create_engine(self._url, poolclass=NullPool)
+        conn = None
+        try:
+            conn = self._engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+            if conn.execute(text("SELECT pg_try_advisory_lock(:k)"), {"k": self.key}).scalar():
+                self._conn = conn
+                return True
+        except Exception as e:
+            app_logger.warning(f"Leader election '{self.name}': cannot take the lock: {e}")
+        if conn is not None:
+            with contextlib.suppress(Exception):
+                conn.close()
+        return False
+
+    def _still_held(self) -> bool:
+        if not self._uses_advisory_locks():
+            return True
+        if self._conn is None:
+            return False
+        try:
+            self._conn.execute(text("SELECT 1"))
+        except Exception as e:
+            app_logger.error(f"Leader election '{self.name}': lost connection: {e}")
+            return False
+        return True
+
+    def _release(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        with contextlib.suppress(Exception):
+            conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": self.key})
+        with contextlib.suppress(Exception):
+            conn.close()
+
+    # ── loop ────────────────────────────────────────────────────────────────
+
+    async def run(self, work: Work, stop: asyncio.Event) -> None:
+        """Run `work(work_stop)` whenever this process is leader, until `stop`.
+
+        `work` should return soon after `work_stop` is set; it is also
+        cancelled when leadership is lost or on shutdown.
+        """
+        while not stop.is_set():
+            if not await asyncio.to_thread(self._try_acquire):
+                await _wait(stop, LEADER_RETRY_SECONDS)
+                continue
+
+            self.is_leader = True
+            leader_status.labels(self.name).set(1)
+            leader_elections.labels(self.name).inc()
+            app_logger.info(f"Leader for '{self.name}'")
+            work_stop = asyncio.Event()
+            task = asyncio.create_task(work(work_stop))
+            try:
+                while not stop.is_set() and not task.done():
+                    tick = asyncio.ensure_future(_wait(stop, LEADER_CHECK_SECONDS))
+                    await asyncio.wait([task, tick], return_when=asyncio.FIRST_COMPLETED)
+                    tick.cancel()
+                    if task.done() or stop.is_set():
+                        break
+                    if not await asyncio.to_thread(self._still_held):
+                        app_logger.error(f"Lost leadership for '{self.name}'")
+                        break
+            finally:
+                work_stop.set()
+                task.cancel()
+                (outcome,) = await asyncio.gather(task, return_exceptions=True)
+                if isinstance(outcome, Exception):
+                    app_logger.error(f"Leader work '{self.name}' failed: {outcome}")
+                await asyncio.to_thread(self._release)
+                self.is_leader = False
+                leader_status.labels(self.name).set(0)
+            if not stop.is_set():
+                # Work ended or leadership was lost: give others a turn.
+                await _wait(stop, LEADER_RETRY_SECONDS)
+
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+
+
+async def _wait(stop: asyncio.Event, seconds: float) -> None:
+    """Sleep for `seconds`, returning early if `stop` is set."""
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(stop.wait(), seconds)
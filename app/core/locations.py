@@ -0,0 +1,49 @@
+"""Normalized city/country keys derived from free-text location strings.
+
+Profiles store their location as "Country, City" (picked from the cities
+search); events store whatever the host typed, usually just a city. Every
+city-based feature — "events near you", cross-city and per-city badges,
+Local Legend, the alumni map — used to re-parse those strings per row at
+query time, so none of them could use an index. Instead the models derive
+these columns whenever `location` is assigned (see `Event` / `Alumni`),
+and queries filter on the stored columns:
+
+    country    lowercased first part, when there are at least two parts
+    city       lowercased last part, as written
+    city_key   `city` with aliases applied: the key two locations are
+               "the same city" by
+
+Innopolis and Kazan share a key: alumni in one routinely attend events in
+the other, and they're a short commute apart. The map still shows them as
+separate pins, which is why `city` is kept alongside `city_key`.
+"""
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+# Cities treated as interchangeable for matching, mapped to one key.
+CITY_ALIASES: dict[str, str] = {
+    "kazan": "innopolis",
+}
+
+
+class ParsedLocation(NamedTuple):
+    country: str | None
+    city: str | None
+    city_key: str | None
+
+
+_EMPTY = ParsedLocation(None, None, None)
+
+
+def parse_location(location: str | None) -> ParsedLocation:
+    """Split a "Country, City" (or bare "City") string into normalized keys."""
+    if not location:
+        return _EMPTY
+    parts = [p.strip().lower() for p in location.split(",") if p.strip()]
+    if not parts:
+        return _EMPTY
+    city = parts[-1]
+    country = parts[0] if len(parts) > 1 else None
+    return ParsedLocation(country, city, CITY_ALIASES.get(city, city))
@@ -0,0 +1,144 @@
+"""In-process cache of authenticated principals, keyed by token subject.
+
+`get_current_user` runs on every authenticated request, and without this
+every call pays a round-trip to look the user up by email. The cache keeps
+a column snapshot of each recently-seen Alumni/Admin for a short TTL and
+re-attaches it to the request's Session with `merge(load=False)`, so the
+route gets a normal persistent instance (lazy relationships, commit and
+refresh all work) without a SELECT.
+
+Staleness is bounded two ways:
+- explicit invalidation — every code path that changes a field the API
+  reads off `current_user` (ban/unban, verify/unverify, profile edits,
+  delete, notification cursor, ...) calls `invalidate_principal(email)`
+  after committing;
+- the TTL, which also covers other replicas, since the cache is
+  per-process.
+
+Configured by environment variables:
+    PRINCIPAL_CACHE_TTL_SECONDS  (default 30; 0 disables the cache)
+    PRINCIPAL_CACHE_MAX_SIZE     (default 1024 entries, LRU-evicted)
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+import os
+import threading
+import time
+from typing import Any
+
+from prometheus_client import Counter
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.models.users import Admin, Alumni
+
+
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+PRINCIPAL_CACHE_MAX_SIZE = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", "1024"))
+
+_MODELS: dict[str, type] = {"alumni": Alumni, "admin": Admin}
+
+principal_cache_hits = Counter(
+    "principal_cache_hits_total",
+    "Authenticated requests whose user was served from the principal cache",
+)
+principal_cache_misses = Counter(
+    "principal_cache_misses_total",
+    "Authenticated requests whose user had to be loaded from the database",
+)
+
+
+class PrincipalCache:
+    """Thread-safe TTL + LRU map of (user_type, email) -> column snapshot.
+
+    Sync routes run in Starlette's threadpool, so every access goes through
+    a lock; the critical sections are dict operations only.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_size > 0
+
+    def get(self, user_type: str, email: str) -> dict[str, Any] | None:
+        key = (user_type, email)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, snapshot = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return snapshot
+
+    def put(self, user_type: str, email: str, snapshot: dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        key = (user_type, email)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, email: str) -> None:
+        with self._lock:
+            for user_type in _MODELS:
+                self._entries.pop((user_type, email), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of entries, including ones past their TTL not yet evicted."""
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_TTL_SECONDS, PRINCIPAL_CACHE_MAX_SIZE)
+
+
+def _snapshot(user: Alumni | Admin) -> dict[str, Any]:
+    return {
+        attr.key: getattr(user, attr.key)
+        for attr in inspect(type(user)).column_attrs
+    }
+
+
+def load_principal(db: Session, user_type: str, email: str) -> Alumni | Admin | None:
+    """Return the user for a token subject, from the cache when possible.
+
+    Unknown `user_type` values return None, like a missing user.
+    """
+    model = _MODELS.get(user_type)
+    if model is None:
+        return None
+
+    snapshot = principal_cache.get(user_type, email)
+    if snapshot is not None:
+        principal_cache_hits.inc()
+        instance = model(**snapshot)
+        make_transient_to_detached(instance)
+        return db.merge(instance, load=False)
+
+    principal_cache_misses.inc()
+    user = db.query(model).filter(model.email == email).first()
+    if user is not None:
+        principal_cache.put(user_type, email, _snapshot(user))
+    return user
+
+
+def invalidate_principal(email: str | None) -> None:
+    """Drop any cached principal for `email`. Call after committing a change."""
+    if email:
+        principal_cache.invalidate(email)
@@ -13,7 +13,7 @@ from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.models.users import Admin, Alumni
+from app.core.principal_cache import load_principal
 
 
 # Configure password hashing
@@ -65,6 +65,9 @@ def get_current_user(
 ):
     """
     Get the current user from the JWT token.
+
+    Raises 401 for an invalid token, an unknown user_type, or a subject
+    that no longer exists.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -83,13 +86,9 @@ def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    if user_type == "alumni":
-        user = db.query(Alumni).filter(Alumni.email == email).first()
-    elif user_type == "admin":
-        user = db.query(Admin).filter(Admin.email == email).first()
-    else:
-        raise credentials_exception
-
+    # Served from the principal cache on hot paths; see
+    # app/core/principal_cache.py for TTL and invalidation rules.
+    user = load_principal(db, user_type, email)
     if user is None:
         raise credentials_exception
 
@@ -1,5 +1,4 @@
 import asyncio
-import contextlib
 from contextlib import asynccontextmanager
 import os
 
@@ -16,11 +15,15 @@ from app.api.routes.events import router as events_router
 from app.api.routes.notifications import router as notifications_router
 from app.api.routes.profile import router as profile_router
 from app.api.routes.projects import router as projects_router
+from app.api.routes.stream import router as stream_router
 from app.api.routes.telegram import router as telegram_router
-from app.core.database import SessionLocal
+from app.core.database import SessionLocal, async_engine
+from app.core.leader import LeaderElection
 from app.core.logging import app_logger, setup_logging
 from app.core.security import get_password_hash, get_random_token
 from app.models.users import Admin
+from app.services import jobs, outbox, telegram_webhook
+from app.services.telegram_bot import telegram_service
 from app.services.telegram_polling import start_polling
 
 
@@ -48,17 +51,58 @@ async def lifespan(app: FastAPI):
     finally:
         db.close()
 
-    # Start Telegram long-polling in the background
+    # One pooled Bot API client for the process; see services/telegram_bot.py
+    await telegram_service.start()
+
+    # Bot updates arrive by long polling (one replica) or by webhook (any
+    # number of replicas); see services/telegram_webhook.py
+    # Only one replica may poll: the one holding the advisory lock (see
+    # core/leader.py); the others take over if it goes away.
     stop_polling = asyncio.Event()
-    polling_task = asyncio.create_task(start_polling(stop_polling))
+    polling_task = None
+    if telegram_webhook.TELEGRAM_UPDATES_MODE == telegram_webhook.POLLING:
+        polling_task = asyncio.create_task(
+            LeaderElection("telegram-polling").run(start_polling, stop_polling)
+        )
+    elif telegram_webhook.TELEGRAM_UPDATES_MODE == telegram_webhook.WEBHOOK:
+        await telegram_webhook.ingress.start()
+
+    # Deliver queued notifications; see services/outbox.py
+    stop_outbox = asyncio.Event()
+    outbox_task = (
+        asyncio.create_task(outbox.run_worker(SessionLocal, stop_outbox))
+        if outbox.OUTBOX_WORKER_ENABLED
+        else None
+    )
+
+    # Long admin operations run as background jobs; the heartbeat keeps
+    # ours alive and fails those whose process died. See services/jobs.py
+    stop_jobs = asyncio.Event()
+    jobs_heartbeat_task = asyncio.create_task(jobs.runner.run_heartbeat(stop_jobs))
 
     yield  # Server is running and handling requests here
 
-    # Shutdown: stop the polling loop gracefully
+    # Shutdown: stop the polling loop gracefully (the election cancels the
+    # in-flight getUpdates and releases the lock)
     stop_polling.set()
-    polling_task.cancel()
-    with contextlib.suppress(asyncio.CancelledError):
+    if polling_task is not None:
         await polling_task
+    await telegram_webhook.ingress.stop()
+
+    # Let the outbox worker finish its batch; anything claimed but not
+    # recorded is retried after its lease by another worker.
+    stop_outbox.set()
+    if outbox_task is not None:
+        await outbox_task
+
+    # Queued jobs are cancelled (and marked failed); running ones finish
+    # before the process exits
+    stop_jobs.set()
+    await jobs_heartbeat_task
+    jobs.runner.shutdown()
+
+    await telegram_service.aclose()
+    await async_engine.dispose()
 
 
 # Environment-based documentation control
@@ -121,6 +165,7 @@ api_v1.include_router(cities_router, prefix="/cities", tags=["Cities"])
 api_v1.include_router(badges_router, prefix="/badges", tags=["Badges"])
 api_v1.include_router(projects_router, prefix="/projects", tags=["Projects"])
 api_v1.include_router(notifications_router, prefix="/notifications", tags=["Notifications"])
+api_v1.include_router(stream_router, tags=["Stream"])
 app.include_router(api_v1)
 app.include_router(telegram_router, tags=["Telegram"])
 
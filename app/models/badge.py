@@ -1,4 +1,11 @@
-from sqlalchemy import Column, DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -42,3 +49,28 @@ class UserBadge(Base):
     awarded_by = Column(String, nullable=True)
 
     badge = relationship("Badge", back_populates="awards")
+
+
+class BadgeMetrics(Base):
+    """Per-alumni counters the badge strategies compare against thresholds.
+
+    Maintained incrementally by the write paths (see
+    app/services/badge_metrics.py). A NULL column means "not known" — it is
+    computed from the source tables on first read and stored, so a metric
+    that is awkward to update in place (e.g. a max after a leave) is simply
+    reset to NULL.
+    """
+
+    __tablename__ = "badge_metrics"
+
+    alumni_id = Column(
+        String, ForeignKey("alumni.id", ondelete="CASCADE"), primary_key=True
+    )
+    events_attended = Column(Integer, nullable=True)
+    max_attendees_on_owned = Column(Integer, nullable=True)
+    cross_city_attendances = Column(Integer, nullable=True)
+    distinct_cities_hosted = Column(Integer, nullable=True)
+    badge_count = Column(Integer, nullable=True)
+    updated_at = Column(
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    )
@@ -1,5 +1,7 @@
+from datetime import datetime
+
 from sqlalchemy import (
-    ARRAY,
+    JSON,
     Boolean,
     Column,
     DateTime,
@@ -8,24 +10,88 @@ from sqlalchemy import (
     Index,
     String,
 )
+from sqlalchemy.ext.associationproxy import association_proxy
+from sqlalchemy.orm import relationship, validates
+from sqlalchemy.sql import func
 
 from app.core.database import Base
+from app.core.images import stored_image
+from app.core.locations import parse_location
+
+
+class EventParticipant(Base):
+    """One alumnus attending one event.
+
+    The primary key (event_id, alumni_id) serves "who attends this event"
+    and makes a double join impossible; the alumni_id index serves "which
+    events does this alumnus attend" (profile lists, badge counts).
+    """
+
+    __tablename__ = "event_participants"
+    __table_args__ = (
+        Index("ix_event_participants_alumni_id_event_id", "alumni_id", "event_id"),
+    )
+
+    event_id = Column(
+        String, ForeignKey("events.id", ondelete="CASCADE"), primary_key=True
+    )
+    alumni_id = Column(
+        String, ForeignKey("alumni.id", ondelete="CASCADE"), primary_key=True
+    )
+    joined_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, server_default=func.now()
+    )
 
 
 class Event(Base):
     __tablename__ = "events"
     __table_args__ = (
         Index("ix_events_approved_datetime", "approved", "datetime"),
+        # "Events near you" (app/services/notifications.py): newest-first
+        # per city, and for online events.
+        Index("ix_events_approved_city_key_datetime", "approved", "city_key", "datetime"),
+        Index("ix_events_approved_is_online_datetime", "approved", "is_online", "datetime"),
     )
 
     id = Column(String, primary_key=True)
     owner_id = Column(String, ForeignKey("alumni.id"), nullable=False, index=True)
-    participants_ids = Column(ARRAY(String), nullable=False)
     title = Column(String, nullable=False)
     description = Column(String, nullable=False)
     location = Column(String, nullable=False)
+    # Derived from `location` on assignment, see app/core/locations.py.
+    country = Column(String, nullable=True)
+    city_key = Column(String, nullable=True, index=True)
     datetime = Column(DateTime, nullable=False, index=True)
     cost = Column(Float, nullable=False)
     is_online = Column(Boolean, nullable=False)
-    cover = Column(String, nullable=True)
+    # The cover lives in the image store; the row keeps its digest (also
+    # the binary endpoint's ETag), upload kind and resized variants'
+    # digests. See app/core/images.py.
+    cover_hash = Column(String(64), nullable=True)
+    cover_type = Column(String, nullable=True)
+    cover_variants = Column(JSON(none_as_null=True), nullable=True)
+    cover = stored_image("cover")
     approved = Column(Boolean, nullable=True, default=None, index=True)
+
+    # Loaded with one extra IN query per batch of events (also under the
+    # async session, where lazy loads aren't allowed).
+    participations = relationship(
+        EventParticipant,
+        order_by=EventParticipant.joined_at,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+    )
+    # List-like view of the participant ids in join order, kept so
+    # `Event(participants_ids=[...])`, `x in event.participants_ids` and the
+    # API schemas work as they did when this was an ARRAY column.
+    participants_ids = association_proxy(
+        "participations",
+        "alumni_id",
+        creator=lambda alumni_id: EventParticipant(alumni_id=alumni_id),
+    )
+
+    @validates("location")
+    def _derive_city(self, _key, value):
+        self.country, _city, self.city_key = parse_location(value)
+        return value
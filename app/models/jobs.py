@@ -0,0 +1,34 @@
+"""Background jobs: long admin operations run off the request path."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Index, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.core.database import Base
+
+
+class Job(Base):
+    """One admin operation handed to the job runner, and how it went.
+
+    See app/services/jobs.py for how jobs are submitted and run.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # The runner's sweep: unfinished jobs whose heartbeat stopped.
+        Index("ix_jobs_status_updated_at", "status", "updated_at"),
+    )
+
+    id = Column(String, primary_key=True)
+    kind = Column(String(64), nullable=False)  # e.g. upload-allowed-emails
+    status = Column(String(16), nullable=False, default="queued")  # queued|running|succeeded|failed
+    progress = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
+    result = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
+    error = Column(Text, nullable=True)
+    created_by = Column(String, nullable=True)  # admin id
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    # Bumped by the process running the job; see `JOB_STALE_SECONDS`.
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,34 @@
+"""Notification outbox: messages to deliver, written with the change that caused them."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.core.database import Base
+
+
+class OutboxMessage(Base):
+    """One Telegram message or email waiting to be (or already) delivered.
+
+    See app/services/outbox.py for how rows are written and claimed.
+    """
+
+    __tablename__ = "notification_outbox"
+    __table_args__ = (
+        # The worker's claim query: due pending rows, oldest first.
+        Index("ix_notification_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    channel = Column(String(16), nullable=False)  # telegram|email
+    recipient = Column(String(255), nullable=False)  # chat id or email address
+    payload = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+    status = Column(String(16), nullable=False, default="pending")  # pending|sent|failed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(Text, nullable=True)
+    # Set by writers that must not queue the same message twice (reminders).
+    dedupe_key = Column(String(255), nullable=True, unique=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
@@ -1,5 +1,6 @@
 from sqlalchemy import (
     ARRAY,
+    JSON,
     BigInteger,
     Boolean,
     Column,
@@ -11,6 +12,7 @@ from sqlalchemy import (
 from sqlalchemy.sql import func
 
 from app.core.database import Base
+from app.core.images import stored_image
 
 
 class Project(Base):
@@ -36,7 +38,11 @@ class Project(Base):
     contributors_ids = Column(ARRAY(String), nullable=False)
     title = Column(String, nullable=False)
     description = Column(String, nullable=False)
-    cover = Column(String, nullable=True)
+    # Stored in the image store, see app/core/images.py.
+    cover_hash = Column(String(64), nullable=True)
+    cover_type = Column(String, nullable=True)
+    cover_variants = Column(JSON(none_as_null=True), nullable=True)
+    cover = stored_image("cover")
     # Optional payment link (bank / Tinkoff / YooKassa / etc.). Free-text
     # so we don't tie ourselves to a specific provider — the client just
     # opens whatever URL the owner supplies.
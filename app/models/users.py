@@ -1,7 +1,19 @@
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, String, Table
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    String,
+    Table,
+)
+from sqlalchemy.orm import relationship, validates
 
 from app.core.database import Base
+from app.core.images import stored_image
+from app.core.locations import parse_location
 
 
 alumni_follows = Table(
@@ -34,6 +46,10 @@ ALUMNI_ROLES = (ALUMNI_ROLE_ALUMNI, ALUMNI_ROLE_FRIEND)
 
 class Alumni(Base):
     __tablename__ = "alumni"
+    __table_args__ = (
+        # The alumni map groups visible profiles by (country, city).
+        Index("ix_alumni_show_location_country_city", "show_location", "country", "city"),
+    )
 
     id = Column(String, primary_key=True)
     email = Column(String, unique=True, index=True, nullable=False)
@@ -51,11 +67,19 @@ class Alumni(Base):
         server_default=ALUMNI_ROLE_ALUMNI,
     )
     location = Column(String)
+    # Derived from `location` on assignment, see app/core/locations.py.
+    country = Column(String, nullable=True)
+    city = Column(String, nullable=True)
+    city_key = Column(String, nullable=True, index=True)
     biography = Column(String)
     show_location = Column(Boolean, default=False)
     telegram_alias = Column(String)
     is_telegram_verified = Column(Boolean, default=False, nullable=False)
-    avatar = Column(String)
+    # Stored in the image store, see app/core/images.py.
+    avatar_hash = Column(String(64), nullable=True)
+    avatar_type = Column(String, nullable=True)
+    avatar_variants = Column(JSON(none_as_null=True), nullable=True)
+    avatar = stored_image("avatar")
     is_verified = Column(Boolean, default=False, index=True)
     is_banned = Column(Boolean, default=False, index=True)
     # Cursor for the notifications panel: an event is "unread" until this
@@ -86,6 +110,11 @@ class Alumni(Base):
         foreign_keys=[alumni_follows.c.follower_id, alumni_follows.c.followed_id],
     )
 
+    @validates("location")
+    def _derive_city(self, _key, value):
+        self.country, self.city, self.city_key = parse_location(value)
+        return value
+
     @property
     def followers_count(self) -> int:
         return len(self.followers) if self.followers is not None else 0
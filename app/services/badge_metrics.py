@@ -0,0 +1,208 @@
+"""Incremental maintenance of the per-alumni `badge_metrics` row.
+
+Badge strategies compare a handful of counts against thresholds. Rather
+than recompute them from the events table on every evaluation, each write
+path that changes one of them calls a hook here, in the same transaction as
+the domain change:
+
+    participant_joined(db, event, alumni)   join, incl. the owner on create
+    participant_left(db, event, alumni)     leave
+    event_hosting_changed(db, event)        approve / decline / unapprove
+    event_location_changed(db, event)       edit of event.location
+    event_deleted(db, event)                before deleting the row
+    home_location_changed(db, alumni_id)    profile location edit
+    badge_count_changed(db, alumni_id, n)   award / revoke
+
+Counters that can be adjusted exactly (attendance, cross-city attendance,
+badge count, a new max) are updated in place with a single UPDATE, so
+concurrent writers never lose an increment. Anything that would need a
+rescan to adjust (a max after a leave, a distinct count) is reset to NULL
+and recomputed lazily by `app.services.badges._metric` the next time it is
+read — which only scans that one alumni's rows.
+
+NULL also absorbs increments (NULL + 1 is NULL), so an alumni without a row
+or with an unknown metric never ends up with a half-counted value.
+
+`rebuild_badge_metrics` recomputes rows from scratch; see
+scripts/rebuild_badge_metrics.py.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import logging
+
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.orm import Session
+
+from app.models.badge import BadgeMetrics
+from app.models.events import Event, EventParticipant
+from app.models.users import Alumni
+
+
+logger = logging.getLogger("iu_alumni")
+
+METRIC_COLUMNS = (
+    "events_attended",
+    "max_attendees_on_owned",
+    "cross_city_attendances",
+    "distinct_cities_hosted",
+    "badge_count",
+)
+
+
+def _same_city(event: Event, alumni: Alumni) -> bool | None:
+    """Mirror of the cross-city rule in badges._cross_city_attendances.
+
+    Returns None when the event doesn't count either way (no home city,
+    or an event without a location).
+    """
+    if not alumni.city_key or not event.city_key:
+        return None
+    return event.city_key == alumni.city_key
+
+
+def _add(db: Session, alumni_ids: Iterable[str], column: str, delta: int) -> None:
+    ids = list(alumni_ids)
+    if not ids or delta == 0:
+        return
+    col = getattr(BadgeMetrics, column)
+    db.execute(
+        update(BadgeMetrics)
+        .where(BadgeMetrics.alumni_id.in_(ids))
+        .values({column: col + delta})
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+def invalidate(
+    db: Session, alumni_ids: Iterable[str], columns: Iterable[str] = METRIC_COLUMNS
+) -> None:
+    """Reset metrics to unknown so they are recomputed on next read."""
+    ids = list(alumni_ids)
+    if not ids:
+        return
+    db.execute(
+        update(BadgeMetrics)
+        .where(BadgeMetrics.alumni_id.in_(ids))
+        .values(dict.fromkeys(columns))
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+# ─────────────────────────── hooks ─────────────────────────────────────────
+
+
+def participant_joined(db: Session, event: Event, alumni: Alumni) -> None:
+    """Call after `alumni` was added to `event_participants`."""
+    _add(db, [alumni.id], "events_attended", 1)
+    if _same_city(event, alumni) is False:
+        _add(db, [alumni.id], "cross_city_attendances", 1)
+
+    # Counted in the UPDATE itself: the join was a bare INSERT, so
+    # `event.participations` may not include it yet.
+    attendees = (
+        select(func.count())
+        .where(EventParticipant.event_id == event.id)
+        .scalar_subquery()
+    )
+    col = BadgeMetrics.max_attendees_on_owned
+    db.execute(
+        update(BadgeMetrics)
+        .where(BadgeMetrics.alumni_id == event.owner_id)
+        .values(max_attendees_on_owned=case((col < attendees, attendees), else_=col))
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+def participant_left(db: Session, event: Event, alumni: Alumni) -> None:
+    """Call after `alumni` was removed from `event_participants`."""
+    _add(db, [alumni.id], "events_attended", -1)
+    if _same_city(event, alumni) is False:
+        _add(db, [alumni.id], "cross_city_attendances", -1)
+    invalidate(db, [event.owner_id], ["max_attendees_on_owned"])
+
+
+def event_hosting_changed(db: Session, event: Event) -> None:
+    """Call when an event's approval state changes."""
+    invalidate(db, [event.owner_id], ["distinct_cities_hosted"])
+
+
+def event_location_changed(db: Session, event: Event) -> None:
+    """Call when an event's location changes."""
+    invalidate(db, event.participants_ids or [], ["cross_city_attendances"])
+    invalidate(db, [event.owner_id], ["distinct_cities_hosted"])
+
+
+def event_deleted(db: Session, event: Event) -> None:
+    """Call before deleting `event`."""
+    participants = list(event.participants_ids or [])
+    _add(db, participants, "events_attended", -1)
+    invalidate(db, participants, ["cross_city_attendances"])
+    invalidate(
+        db, [event.owner_id], ["max_attendees_on_owned", "distinct_cities_hosted"]
+    )
+
+
+def home_location_changed(db: Session, alumni_id: str) -> None:
+    """Call when an alumnus edits their profile location."""
+    invalidate(db, [alumni_id], ["cross_city_attendances"])
+
+
+def badge_count_changed(db: Session, alumni_id: str, delta: int) -> None:
+    """Call after awarding (+1) or revoking (-n) badges."""
+    _add(db, [alumni_id], "badge_count", delta)
+
+
+# ─────────────────────────── rebuild ───────────────────────────────────────
+
+
+def rebuild_badge_metrics(
+    db: Session,
+    alumni_ids: Iterable[str] | None = None,
+    batch_size: int = 500,
+    progress: Callable[[int, int], None] | None = None,
+) -> int:
+    """Recompute `badge_metrics` rows from the source tables.
+
+    Rebuilds every alumnus when `alumni_ids` is None. Commits per batch so
+    a long run holds no long transaction. Returns the number of rows
+    written.
+    """
+    from app.services.badges import compute_metric
+
+    query = db.query(Alumni).order_by(Alumni.id)
+    if alumni_ids is not None:
+        query = query.filter(Alumni.id.in_(list(alumni_ids)))
+    total = query.count()
+
+    done = 0
+    last_id: str | None = None
+    while True:
+        page = query
+        if last_id is not None:
+            page = page.filter(Alumni.id > last_id)
+        batch = page.limit(batch_size).all()
+        if not batch:
+            break
+
+        ids = [a.id for a in batch]
+        db.execute(
+            delete(BadgeMetrics)
+            .where(BadgeMetrics.alumni_id.in_(ids))
+            .execution_options(synchronize_session="fetch")
+        )
+        for alumni in batch:
+            db.add(
+                BadgeMetrics(
+                    alumni_id=alumni.id,
+                    **{c: compute_metric(db, alumni, c) for c in METRIC_COLUMNS},
+                )
+            )
+        db.commit()
+
+        done += len(batch)
+        last_id = ids[-1]
+        if progress is not None:
+            progress(done, total)
+        logger.info("badge metrics rebuilt for %s/%s alumni", done, total)
+    return done
@@ -1,8 +1,15 @@
 """Telegram notification helper for badge awards.
 
 One entry point — `notify_badge_awards` — that any code path emitting new
-badges can await. Failure-tolerant: any error inside is logged and
-swallowed so a Telegram outage never breaks the enclosing request.
+badges calls before the commit that stores them. It only looks up the
+chat and writes the message to the outbox (services/outbox.py) in that
+same transaction, so the DM exists exactly when the awards do and the
+request never waits on Telegram. Failure-tolerant: the lookups and the
+write run in a SAVEPOINT, and any error inside is logged and swallowed
+so a notification problem never costs the awards.
+
+`evaluate_for_user(..., notify=True)` and `manual_award(..., notify=True)`
+in services/badges.py call it for the routes.
 """
 from __future__ import annotations
 
@@ -12,13 +19,13 @@ from app.core.logging import app_logger
 from app.models.badge import Badge
 from app.models.telegram import TelegramUser
 from app.models.users import Alumni
-from app.services.telegram_bot import telegram_service
+from app.services import outbox
 
 
-async def notify_badge_awards(
+def notify_badge_awards(
     db: Session, alumni: Alumni, badge_codes: list[str]
 ) -> None:
-    """Send a single DM listing the freshly-earned badges.
+    """Queue a single DM listing the freshly-earned badges; the caller commits.
 
     No-op unless the user has a verified Telegram alias AND we know their
     chat_id (i.e. they've DM'd the bot at least once). Multiple codes in
@@ -30,22 +37,22 @@ async def notify_badge_awards(
         return
 
     try:
-        tg_user = (
-            db.query(TelegramUser)
-            .filter(TelegramUser.alias == alumni.telegram_alias)
-            .first()
-        )
-        if tg_user is None:
-            return
+        with db.begin_nested():
+            tg_user = (
+                db.query(TelegramUser)
+                .filter(TelegramUser.alias == alumni.telegram_alias)
+                .first()
+            )
+            if tg_user is None:
+                return
 
-        badges = (
-            db.query(Badge).filter(Badge.code.in_(badge_codes)).all()
-        )
-        if not badges:
-            return
+            badges = (
+                db.query(Badge).filter(Badge.code.in_(badge_codes)).all()
+            )
+            if not badges:
+                return
 
-        text = _format_message(badges)
-        await telegram_service.send_message(chat_id=tg_user.chat_id, text=text)
+            outbox.telegram(db, tg_user.chat_id, _format_message(badges))
     except Exception as e:
         app_logger.error(
             "badge notify failed for alumni=%s codes=%s: %s",
@@ -8,21 +8,33 @@ Public entry points:
     evaluate_for_user(db, alumni, trigger) -> list[UserBadge]
     list_my_badges(db, alumni) -> dict   # for /profile/me/badges
     list_for_user(db, alumni_id) -> dict # public view
+    bulk_evaluate(db, ...) -> dict       # whole-base re-run, see below
+
+Counts the strategies compare against are read from the per-alumni
+`badge_metrics` row (see app/services/badge_metrics.py); the `_*_count`
+helpers below are the from-scratch definitions used to fill a metric the
+first time it is read and by the rebuild command.
 """
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime
 import logging
-from typing import Any
+import time
+from typing import Any, NamedTuple
 import uuid
 
-from sqlalchemy import func
+from sqlalchemy import Select, and_, case, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.models.badge import Badge, UserBadge
-from app.models.events import Event
+from app.models.badge import Badge, BadgeMetrics, UserBadge
+from app.models.events import Event, EventParticipant
 from app.models.users import Alumni
+from app.services import badge_metrics, stream
+from app.services.badge_notifications import notify_badge_awards
 
 
 logger = logging.getLogger("iu_alumni")
@@ -33,51 +45,75 @@ logger = logging.getLogger("iu_alumni")
 
 def _events_attended_count(db: Session, alumni_id: str) -> int:
     return (
-        db.query(func.count(Event.id))
-        .filter(Event.participants_ids.any(alumni_id))
+        db.query(func.count(EventParticipant.event_id))
+        .filter(EventParticipant.alumni_id == alumni_id)
         .scalar()
         or 0
     )
 
 
-def _owned_events(db: Session, alumni_id: str) -> list[Event]:
-    return db.query(Event).filter(Event.owner_id == alumni_id).all()
-
-
-def _distinct_cities_hosted(db: Session, alumni_id: str) -> int:
+def _hosting_stats(db: Session, alumni_id: str) -> dict[str, int]:
+    """max_attendees_on_owned + distinct_cities_hosted from one query."""
+    attendees = (
+        select(func.count())
+        .where(EventParticipant.event_id == Event.id)
+        .correlate(Event)
+        .scalar_subquery()
+    )
     rows = (
-        db.query(func.lower(func.trim(Event.location)))
-        .filter(Event.owner_id == alumni_id, Event.approved.is_(True))
-        .distinct()
+        db.query(attendees, Event.city_key, Event.approved)
+        .filter(Event.owner_id == alumni_id)
         .all()
     )
-    return len({r[0] for r in rows if r[0]})
+    cities = {city for _n, city, approved in rows if approved is True and city}
+    return {
+        "max_attendees_on_owned": max((n for n, _city, _approved in rows), default=0),
+        "distinct_cities_hosted": len(cities),
+    }
+
+
+def _participation_stats(db: Session, alumni: Alumni) -> dict[str, int]:
+    """events_attended + cross_city_attendances from one aggregate query."""
+    home = alumni.city_key
+    if home:
+        cross_city = case(
+            (and_(Event.city_key.isnot(None), Event.city_key != home), 1),
+            else_=0,
+        )
+    else:
+        cross_city = literal(0)
+    attended, cross = (
+        db.query(func.count(Event.id), func.coalesce(func.sum(cross_city), 0))
+        .join(EventParticipant, EventParticipant.event_id == Event.id)
+        .filter(EventParticipant.alumni_id == alumni.id)
+        .one()
+    )
+    return {
+        "events_attended": attended or 0,
+        "cross_city_attendances": int(cross or 0),
+    }
+
+
+def _distinct_cities_hosted(db: Session, alumni_id: str) -> int:
+    return _hosting_stats(db, alumni_id)["distinct_cities_hosted"]
 
 
 def _max_attendees_on_owned(db: Session, alumni_id: str) -> int:
-    owned = _owned_events(db, alumni_id)
-    return max((len(e.participants_ids or []) for e in owned), default=0)
+    return _hosting_stats(db, alumni_id)["max_attendees_on_owned"]
 
 
 def _cross_city_attendances(db: Session, alumni: Alumni) -> int:
-    if not alumni.location:
+    if not alumni.city_key:
         return 0
-    home = alumni.location.strip().lower()
-    rows = (
-        db.query(Event.location)
-        .filter(Event.participants_ids.any(alumni.id))
-        .all()
-    )
-    return sum(
-        1 for (loc,) in rows if loc and loc.strip().lower() != home
-    )
+    return _participation_stats(db, alumni)["cross_city_attendances"]
 
 
 def _profile_fields_complete(alumni: Alumni, fields: list[str]) -> tuple[int, int]:
     """Returns (filled, total) — number of listed fields that are non-empty."""
     filled = 0
     for f in fields:
-        v = getattr(alumni, f, None)
+        # Images are judged by their digest so the image store isn't read.
+        v = getattr(alumni, f"{f}_hash", None) or getattr(alumni, f, None)
         if v not in (None, ""):
             filled += 1
     return filled, len(fields)
@@ -92,13 +128,177 @@ def _badge_count(db: Session, alumni_id: str) -> int:
     )
 
 
+# Metric column -> from-scratch computation. Looked up by name at call time
+# so tests can monkeypatch the helpers.
+_METRIC_SOURCES = {
+    "events_attended": lambda db, alumni: _events_attended_count(db, alumni.id),
+    "max_attendees_on_owned": lambda db, alumni: _max_attendees_on_owned(db, alumni.id),
+    "cross_city_attendances": lambda db, alumni: _cross_city_attendances(db, alumni),
+    "distinct_cities_hosted": lambda db, alumni: _distinct_cities_hosted(db, alumni.id),
+    "badge_count": lambda db, alumni: _badge_count(db, alumni.id),
+}
+
+
+def compute_metric(db: Session, alumni: Alumni, metric: str) -> int:
+    """From-scratch value of a `badge_metrics` column for `alumni`."""
+    return _METRIC_SOURCES[metric](db, alumni)
+
+
+def _dialect_insert(db: Session):
+    return sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+
+
+def _metrics_row(db: Session, alumni: Alumni, *, lock: bool = False) -> BadgeMetrics:
+    """The alumni's `badge_metrics` row, created (all unknown) if missing.
+
+    With `lock`, the row is re-read with SELECT ... FOR UPDATE and stays
+    locked until the transaction ends.
+    """
+    get_options = {"with_for_update": True, "populate_existing": True} if lock else {}
+    row = db.get(BadgeMetrics, alumni.id, **get_options)
+    if row is None:
+        # Concurrent first requests for the same alumni may both get here;
+        # whichever inserts second keeps the first one's row.
+        db.execute(
+            _dialect_insert(db)(BadgeMetrics)
+            .values(alumni_id=alumni.id)
+            .on_conflict_do_nothing()
+        )
+        row = db.get(BadgeMetrics, alumni.id, **get_options)
+    return row
+
+
+def _metric(
+    db: Session, alumni: Alumni, metric: str, inputs: dict[str, Any] | None = None
+) -> int:
+    """Stored value of `metric`, computing and storing it if still unknown.
+
+    Reads the row held by `inputs` when given; otherwise looks it up. The
+    row is locked before computing; see `_progress_inputs`.
+    """
+    row = inputs["metrics"] if inputs is not None else _metrics_row(db, alumni)
+    value = getattr(row, metric)
+    if value is None:
+        row = _metrics_row(db, alumni, lock=True)
+        value = getattr(row, metric)
+        if value is None:
+            value = compute_metric(db, alumni, metric)
+            setattr(row, metric, value)
+            db.flush()
+    return value
+
+
+# ─────────────────────────── batched progress inputs ──────────────────────
+
+
+# Metrics that share a source query are filled together.
+_METRIC_GROUPS = (
+    (("events_attended", "cross_city_attendances"), _participation_stats),
+    (
+        ("max_attendees_on_owned", "distinct_cities_hosted"),
+        lambda db, alumni: _hosting_stats(db, alumni.id),
+    ),
+)
+
+
+def _required_metric(badge: Badge) -> str | None:
+    """The `badge_metrics` column a badge's strategy compares, if any."""
+    params = badge.params or {}
+    if badge.strategy == "count_threshold" and params.get("metric") in (
+        "events_attended",
+        "max_attendees_on_owned",
+        "cross_city_attendances",
+    ):
+        return params["metric"]
+    if (
+        badge.strategy == "distinct_count"
+        and params.get("metric") == "distinct_cities_hosted"
+    ):
+        return "distinct_cities_hosted"
+    if badge.strategy == "badge_count":
+        return "badge_count"
+    return None
+
+
+def _progress_inputs(
+    db: Session,
+    alumni: Alumni,
+    badges: list[Badge],
+) -> dict[str, Any]:
+    """Fetch everything `badges` need to be scored, in a fixed number of queries.
+
+    Warms the alumni's `badge_metrics` row (one SELECT), fills any metric
+    the badges need that is still unknown with one aggregate query per
+    source group, and counts awards for every first-N badge in a single
+    GROUP BY.
+
+    Filling locks the row first. The hooks' `NULL + 1` leaves an unknown
+    metric unknown, so a join committed between our count and our write
+    would otherwise be lost for good. Under the lock a concurrent join
+    either committed before we count, or waits and then increments the
+    value we stored.
+
+    The fill runs in a SAVEPOINT, so a failure undoes only the fill; the
+    caller's transaction is never committed or rolled back here. The
+    values (and the lock) last until the caller commits or closes it.
+
+    The returned mapping is passed to `_strategy_progress` / `_should_award`
+    so the per-badge loop doesn't hit the database. Query count therefore
+    depends on which strategies are in the catalog, not on its size.
+    """
+    needed = {m for b in badges if (m := _required_metric(b)) is not None}
+    row = _metrics_row(db, alumni) if needed else None
+    if row is not None and any(getattr(row, m) is None for m in needed):
+        with db.begin_nested():
+            row = _metrics_row(db, alumni, lock=True)
+            if "badge_count" in needed and row.badge_count is None:
+                row.badge_count = _badge_count(db, alumni.id)
+            for group, source in _METRIC_GROUPS:
+                if not any(m in needed and getattr(row, m) is None for m in group):
+                    continue
+                for m, value in source(db, alumni).items():
+                    if getattr(row, m) is None:
+                        setattr(row, m, value)
+
+    first_n_ids = [b.id for b in badges if b.strategy == "first_n"]
+    first_n_awarded: dict[str, int] = {}
+    if first_n_ids:
+        first_n_awarded = dict(
+            db.query(UserBadge.badge_id, func.count(UserBadge.id))
+            .filter(UserBadge.badge_id.in_(first_n_ids))
+            .group_by(UserBadge.badge_id)
+            .all()
+        )
+    return {"metrics": row, "first_n_awarded": first_n_awarded}
+
+
+def _first_n_awarded(
+    db: Session, badge: Badge, inputs: dict[str, Any] | None
+) -> int:
+    if inputs is not None:
+        return inputs["first_n_awarded"].get(badge.id, 0)
+    return (
+        db.query(func.count(UserBadge.id))
+        .filter(UserBadge.badge_id == badge.id)
+        .scalar()
+        or 0
+    )
+
+
 # ─────────────────────────── strategies ────────────────────────────────────
 
 
 def _strategy_progress(
-    db: Session, alumni: Alumni, badge: Badge
+    db: Session,
+    alumni: Alumni,
+    badge: Badge,
+    inputs: dict[str, Any] | None = None,
 ) -> tuple[int, int, str]:
-    """Returns (progress, threshold, metric_label) for the locked card UI."""
+    """Returns (progress, threshold, metric_label) for the locked card UI.
+
+    `inputs` comes from `_progress_inputs`; without it, counts are looked
+    up per badge.
+    """
     params = badge.params or {}
     strat = badge.strategy
 
@@ -107,19 +307,19 @@ def _strategy_progress(
         threshold = int(params.get("threshold", 1))
         if metric == "events_attended":
             return (
-                _events_attended_count(db, alumni.id),
+                _metric(db, alumni, "events_attended", inputs),
                 threshold,
                 "alumni events attended",
             )
         if metric == "max_attendees_on_owned":
             return (
-                _max_attendees_on_owned(db, alumni.id),
+                _metric(db, alumni, "max_attendees_on_owned", inputs),
                 threshold,
                 "attendees on biggest hosted event",
             )
         if metric == "cross_city_attendances":
             return (
-                _cross_city_attendances(db, alumni),
+                _metric(db, alumni, "cross_city_attendances", inputs),
                 threshold,
                 "events attended outside home city",
             )
@@ -128,7 +328,7 @@ def _strategy_progress(
         threshold = int(params.get("threshold", 1))
         if params.get("metric") == "distinct_cities_hosted":
             return (
-                _distinct_cities_hosted(db, alumni.id),
+                _metric(db, alumni, "distinct_cities_hosted", inputs),
                 threshold,
                 "distinct cities hosted in",
             )
@@ -149,16 +349,11 @@ def _strategy_progress(
 
     if strat == "badge_count":
         threshold = int(params.get("threshold", 10))
-        return _badge_count(db, alumni.id), threshold, "badges earned"
+        return _metric(db, alumni, "badge_count", inputs), threshold, "badges earned"
 
     if strat == "first_n":
         n = int(params.get("n", 1))
-        awarded_so_far = (
-            db.query(func.count(UserBadge.id))
-            .filter(UserBadge.badge_id == badge.id)
-            .scalar()
-            or 0
-        )
+        awarded_so_far = _first_n_awarded(db, badge, inputs)
         # "Progress" here means how close the user is to qualifying — for
         # Pioneer that's just "has show_location been flipped." Once flipped,
         # they qualify if there's still room (awarded_so_far < n).
@@ -179,18 +374,21 @@ def _strategy_progress(
 
 
 def _should_award(
-    db: Session, alumni: Alumni, badge: Badge
+    db: Session,
+    alumni: Alumni,
+    badge: Badge,
+    inputs: dict[str, Any] | None = None,
 ) -> tuple[bool, dict[str, Any]]:
     """Returns (should_award, extra_metadata). Pure read of current state."""
     params = badge.params or {}
     strat = badge.strategy
 
     if strat == "count_threshold":
-        progress, threshold, _ = _strategy_progress(db, alumni, badge)
+        progress, threshold, _ = _strategy_progress(db, alumni, badge, inputs)
         return progress >= threshold, {}
 
     if strat == "distinct_count":
-        progress, threshold, _ = _strategy_progress(db, alumni, badge)
+        progress, threshold, _ = _strategy_progress(db, alumni, badge, inputs)
         return progress >= threshold, {}
 
     if strat == "year_range":
@@ -208,19 +406,14 @@ def _should_award(
 
     if strat == "badge_count":
         threshold = int(params.get("threshold", 10))
-        return _badge_count(db, alumni.id) >= threshold, {}
+        return _metric(db, alumni, "badge_count", inputs) >= threshold, {}
 
     if strat == "first_n":
         n = int(params.get("n", 1))
         if not (getattr(alumni, "show_location", False) and alumni.location):
             return False, {}
         # Atomic gate: count under lock when we actually insert.
-        awarded_so_far = (
-            db.query(func.count(UserBadge.id))
-            .filter(UserBadge.badge_id == badge.id)
-            .scalar()
-            or 0
-        )
+        awarded_so_far = _first_n_awarded(db, badge, inputs)
         return awarded_so_far < n, {}
 
     if strat == "per_city_first":
@@ -252,12 +445,15 @@ def _award(
         extra=extra or {},
         awarded_by=awarded_by,
     )
-    db.add(row)
     try:
-        db.flush()
+        # A SAVEPOINT, so a duplicate only undoes this row and not the
+        # caller's other pending awards.
+        with db.begin_nested():
+            db.add(row)
+            db.flush()
     except IntegrityError:
-        db.rollback()
         return None
+    badge_metrics.badge_count_changed(db, alumni_id, 1)
     return row
 
 
@@ -307,6 +503,7 @@ def revoke_ineligible(db: Session, alumni: Alumni) -> list[str]:
                 should_keep, _extra = _should_award(db, alumni, b)
                 if not should_keep:
                     db.delete(ub)
+                    badge_metrics.badge_count_changed(db, alumni.id, -1)
                     # Flush so subsequent checks in this round (e.g. Badge
                     # Collector's count query) see the deletion.
                     db.flush()
@@ -322,13 +519,22 @@ def revoke_ineligible(db: Session, alumni: Alumni) -> list[str]:
 
 
 def evaluate_for_user(
-    db: Session, alumni: Alumni, trigger: str, context: dict | None = None
+    db: Session,
+    alumni: Alumni,
+    trigger: str,
+    context: dict | None = None,
+    *,
+    notify: bool = False,
 ) -> list[UserBadge]:
     """Evaluate every badge whose trigger_metrics include `trigger`.
 
     Failure-tolerant: each badge's eval is wrapped so one bad strategy
     doesn't block the others or the calling request.
 
+    New awards, the chained Badge Collector included, are committed once
+    by the top-level call. With `notify`, the Telegram DM listing them is
+    queued in the outbox in that same commit.
+
     Recursion guard: if `trigger == "badge_awarded"` (set by us after every
     award to chain Badge Collector), we skip awarding Badge Collector itself
     from inside a Badge Collector awarding to avoid an infinite loop.
@@ -336,15 +542,30 @@ def evaluate_for_user(
     if context is None:
         context = {}
 
-    badges = (
-        db.query(Badge).filter(Badge.trigger_metrics.contains([trigger])).all()
-    )
+    # The catalog is a dozen rows; filtering triggers in Python keeps this
+    # off the Postgres-only ARRAY containment operator.
+    badges = [
+        b for b in db.query(Badge).all() if trigger in (b.trigger_metrics or [])
+    ]
     already = {
         ub.badge_id
         for ub in db.query(UserBadge.badge_id)
         .filter(UserBadge.alumni_id == alumni.id)
         .all()
     }
+    try:
+        # A SAVEPOINT, so a failed prefetch doesn't take the caller's
+        # pending changes down with it.
+        with db.begin_nested():
+            inputs = _progress_inputs(
+                db,
+                alumni,
+                [b for b in badges if b.id not in already or b.strategy == "per_city_first"],
+            )
+    except Exception as e:
+        # Fall back to per-badge lookups inside the guarded loop below.
+        logger.error("badge progress prefetch failed: %s", e)
+        inputs = None
 
     newly_awarded: list[UserBadge] = []
     for b in badges:
@@ -358,7 +579,7 @@ def evaluate_for_user(
         if b.code == "badge_collector" and context.get("from_badge_awarded"):
             continue
         try:
-            should, extra = _should_award(db, alumni, b)
+            should, extra = _should_award(db, alumni, b, inputs)
             if should:
                 row = _award(db, alumni.id, b, extra)
                 if row is not None:
@@ -367,18 +588,26 @@ def evaluate_for_user(
             logger.error("badge eval failed for %s: %s", b.code, e)
 
     if newly_awarded:
-        db.commit()
-        # Chain into Badge Collector evaluation.
+        # Chain into Badge Collector evaluation; the awards above are
+        # flushed, so its badge count sees them.
         try:
-            chained = evaluate_for_user(
-                db,
-                alumni,
-                "badge_awarded",
-                context={"from_badge_awarded": True},
-            )
+            with db.begin_nested():
+                chained = evaluate_for_user(
+                    db,
+                    alumni,
+                    "badge_awarded",
+                    context={"from_badge_awarded": True},
+                )
             newly_awarded.extend(chained)
         except Exception as e:
             logger.error("badge_awarded cascade failed: %s", e)
+        # Once per top-level call, covering the chained awards too.
+        if not context.get("from_badge_awarded"):
+            codes = [r.badge.code for r in newly_awarded if r.badge]
+            if notify:
+                notify_badge_awards(db, alumni, codes)
+            db.commit()
+            stream.badges_awarded(alumni.id, codes)
 
     return newly_awarded
 
@@ -388,22 +617,22 @@ def award_founding_host(
 ) -> UserBadge | None:
     """Per-city first hook — call when an event is approved.
 
-    Awards "Founding Host" with metadata={"city": <event.location lowercased>}
-    if no earlier approved event exists in that city.
+    Awards "Founding Host" with metadata={"city": <event.city_key>} if no
+    earlier approved event exists in that city.
     """
-    if not event.location:
+    city = event.city_key
+    if not city:
         return None
     badge = db.query(Badge).filter(Badge.code == "founding_host").first()
     if not badge:
         return None
-    city = event.location.strip().lower()
 
     # Is there an earlier approved event in this city by anyone (incl. self)?
     earlier = (
         db.query(Event)
         .filter(
             Event.approved.is_(True),
-            func.lower(func.trim(Event.location)) == city,
+            Event.city_key == city,
             Event.datetime < event.datetime,
         )
         .first()
@@ -417,7 +646,8 @@ def award_founding_host(
 def list_my_badges(db: Session, alumni: Alumni) -> dict[str, Any]:
     """Shape: {earned: [...], locked: [...], newly_earned: [...]}.
 
-    Computes progress on locked badges from current data; no progress table.
+    Progress on locked badges comes from `_progress_inputs`, so the number
+    of queries doesn't grow with the catalog.
     """
     catalog = db.query(Badge).all()
     awards = (
@@ -426,6 +656,9 @@ def list_my_badges(db: Session, alumni: Alumni) -> dict[str, Any]:
     earned_index: dict[str, list[UserBadge]] = {}
     for a in awards:
         earned_index.setdefault(a.badge_id, []).append(a)
+    inputs = _progress_inputs(
+        db, alumni, [b for b in catalog if b.id not in earned_index]
+    )
 
     earned: list[dict] = []
     locked: list[dict] = []
@@ -458,7 +691,7 @@ def list_my_badges(db: Session, alumni: Alumni) -> dict[str, Any]:
                     )
                     seen_to_mark.append(ub)
         else:
-            progress, threshold, metric = _strategy_progress(db, alumni, b)
+            progress, threshold, metric = _strategy_progress(db, alumni, b, inputs)
             locked.append(
                 {
                     "code": b.code,
@@ -533,11 +766,14 @@ def manual_award(
     badge_code: str,
     admin_id: str,
     metadata: dict | None = None,
+    *,
+    notify: bool = False,
 ) -> UserBadge:
     """Insert a UserBadge row for the given code on behalf of an admin.
 
     Raises ManualAwardError if the badge doesn't exist or the row is a
-    duplicate (idempotent uniqueness constraint hit).
+    duplicate (idempotent uniqueness constraint hit). With `notify`, the
+    Telegram DM is queued in the same commit as the award.
     """
     badge = db.query(Badge).filter(Badge.code == badge_code).first()
     if badge is None:
@@ -548,6 +784,8 @@ def manual_award(
         raise ManualAwardError(
             f"badge '{badge_code}' already awarded to this user with the same metadata"
         )
+    if notify:
+        notify_badge_awards(db, alumni, [badge_code])
     db.commit()
     return row
 
@@ -580,6 +818,7 @@ def manual_revoke(
         )
     for r in rows:
         db.delete(r)
+    badge_metrics.badge_count_changed(db, alumni.id, -len(rows))
     db.commit()
     return badge
 
@@ -587,77 +826,394 @@ def manual_revoke(
 # ─────────────────────────── leaderboard (Local Legend) ────────────────────
 
 
+def _local_legend_ranking(db: Session, year: int) -> list[tuple[str, str]]:
+    """(city, alumni_id) of every city's top attendee in `year`, in one query.
+
+    Tallies approved attendances per normalized city and alumni, then
+    `row_number()` over each city ordered by count desc, earliest
+    attendance, alumni id.
+    """
+    alumni_id = EventParticipant.alumni_id
+    city = Event.city_key
+    tallies = (
+        select(
+            city.label("city"),
+            alumni_id.label("alumni_id"),
+            func.count().label("attended"),
+            func.min(Event.datetime).label("first_at"),
+        )
+        .select_from(Event)
+        .join(EventParticipant, EventParticipant.event_id == Event.id)
+        .join(Alumni, Alumni.id == alumni_id)
+        .where(
+            Event.approved.is_(True),
+            Event.datetime >= datetime(year, 1, 1),
+            Event.datetime < datetime(year + 1, 1, 1),
+            city.isnot(None),
+        )
+        .group_by(city, alumni_id)
+        .subquery()
+    )
+    ranked = select(
+        tallies.c.city,
+        tallies.c.alumni_id,
+        func.row_number()
+        .over(
+            partition_by=tallies.c.city,
+            order_by=(
+                tallies.c.attended.desc(),
+                tallies.c.first_at.asc(),
+                tallies.c.alumni_id.asc(),
+            ),
+        )
+        .label("place"),
+    ).subquery()
+    return [
+        (c, a)
+        for c, a in db.execute(
+            select(ranked.c.city, ranked.c.alumni_id)
+            .where(ranked.c.place == 1)
+            .order_by(ranked.c.city)
+        )
+    ]
+
+
+def _insert_awards(db: Session, rows: list[dict[str, Any]]) -> list[str]:
+    """Insert UserBadge rows in one statement, skipping existing awards.
+
+    Duplicates are decided by the `(alumni_id, badge_id, extra)` unique
+    constraint. Returns the ids of the rows actually inserted.
+    """
+    if not rows:
+        return []
+    stmt = (
+        _dialect_insert(db)(UserBadge)
+        .values(rows)
+        .on_conflict_do_nothing()
+        .returning(UserBadge.id)
+    )
+    return list(db.scalars(stmt))
+
+
 def compute_local_legend_winners(
     db: Session, year: int
 ) -> list[UserBadge]:
     """Compute Local Legend winners for the given year.
 
-    For each city (normalized `event.location` lowercased + trimmed)
-    that had approved events in the year, find the alumni with the
+    For each city (`event.city_key`) that had approved events in the year, find the alumni with the
     highest attendance count. Ties broken deterministically by the
     earliest `event.datetime` among that alumni's attended events in
-    that city.
+    that city, then by alumni id. The ranking is a single SQL query
+    (`_local_legend_ranking`) and the winners are inserted in one batch.
 
     Idempotent: relies on the `(alumni_id, badge_id, extra)` unique
     constraint to avoid double-awards on re-run.
-
-    Future improvement: introduce an FK from `events.city_id` to the
-    `cities` table so this is a clean SQL join instead of Python-side
-    grouping on a lower/trim of a free-text column.
     """
     badge = db.query(Badge).filter(Badge.code == "local_legend").first()
     if badge is None:
         logger.warning("compute_local_legend_winners: Local Legend badge not seeded")
         return []
 
-    year_start = datetime(year, 1, 1)
-    year_end = datetime(year + 1, 1, 1)
-    events = (
-        db.query(Event)
-        .filter(
-            Event.approved.is_(True),
-            Event.datetime >= year_start,
-            Event.datetime < year_end,
-            Event.location.isnot(None),
+    now = datetime.utcnow()
+    inserted = _insert_awards(
+        db,
+        [
+            {
+                "id": str(uuid.uuid4()),
+                "alumni_id": winner_id,
+                "badge_id": badge.id,
+                "awarded_at": now,
+                "extra": {"city": city, "year": year},
+            }
+            for city, winner_id in _local_legend_ranking(db, year)
+        ],
+    )
+    if not inserted:
+        return []
+
+    winners = db.query(UserBadge).filter(UserBadge.id.in_(inserted)).all()
+    badge_metrics.invalidate(db, {w.alumni_id for w in winners}, ["badge_count"])
+    db.commit()
+    return winners
+
+
+# ─────────────────────────── bulk re-evaluation ────────────────────────────
+
+
+# Strategies the bulk evaluator leaves alone: first-N and per-city-first
+# depend on the order things happened in, leaderboard has its own yearly
+# job, and manual badges are an admin decision.
+_BULK_SKIPPED_STRATEGIES = {"first_n", "per_city_first", "leaderboard", "manual"}
+
+
+def _bulk_participation_stats() -> Select:
+    """(alumni_id, events_attended, cross_city_attendances) for everyone.
+
+    One pass over `event_participants` joined to `events`; cross-city
+    uses the same rule as `_participation_stats`.
+    """
+    cross_city = case(
+        (
+            and_(
+                Alumni.city_key.isnot(None),
+                Event.city_key.isnot(None),
+                Event.city_key != Alumni.city_key,
+            ),
+            1,
+        ),
+        else_=0,
+    )
+    return (
+        select(
+            EventParticipant.alumni_id,
+            func.count().label("events_attended"),
+            func.sum(cross_city).label("cross_city_attendances"),
         )
-        .order_by(Event.datetime.asc())
-        .all()
+        .join(Event, Event.id == EventParticipant.event_id)
+        .join(Alumni, Alumni.id == EventParticipant.alumni_id)
+        .group_by(EventParticipant.alumni_id)
     )
 
-    # Group: city → alumni_id → (count, earliest_datetime).
-    per_city: dict[str, dict[str, tuple[int, datetime]]] = {}
-    for e in events:
-        city = (e.location or "").strip().lower()
-        if not city:
+
+def _bulk_hosting_stats() -> Select:
+    """(alumni_id, max_attendees_on_owned, distinct_cities_hosted) for every host."""
+    attendees = (
+        select(EventParticipant.event_id, func.count().label("attendees"))
+        .group_by(EventParticipant.event_id)
+        .subquery()
+    )
+    city = Event.city_key
+    return (
+        select(
+            Event.owner_id.label("alumni_id"),
+            func.max(func.coalesce(attendees.c.attendees, 0)).label(
+                "max_attendees_on_owned"
+            ),
+            func.count(
+                func.distinct(
+                    case((Event.approved.is_(True), city), else_=None)
+                )
+            ).label("distinct_cities_hosted"),
+        )
+        .outerjoin(attendees, attendees.c.event_id == Event.id)
+        .group_by(Event.owner_id)
+    )
+
+
+def _bulk_metrics(db: Session, needed: set[str]) -> dict[str, dict[str, int]]:
+    """Map each metric in `needed` to {alumni_id: value}.
+
+    Alumni missing from a mapping have a value of 0.
+    """
+    out: dict[str, dict[str, int]] = {m: {} for m in needed}
+    for query, columns in (
+        (_bulk_participation_stats, ("events_attended", "cross_city_attendances")),
+        (_bulk_hosting_stats, ("max_attendees_on_owned", "distinct_cities_hosted")),
+    ):
+        wanted = [c for c in columns if c in needed]
+        if not wanted:
             continue
-        for alumni_id in (e.participants_ids or []):
-            bucket = per_city.setdefault(city, {})
-            if alumni_id in bucket:
-                count, earliest = bucket[alumni_id]
-                bucket[alumni_id] = (count + 1, min(earliest, e.datetime))
-            else:
-                bucket[alumni_id] = (1, e.datetime)
-
-    winners: list[UserBadge] = []
-    for city, tally in per_city.items():
-        if not tally:
+        for row in db.execute(query()).mappings():
+            for c in wanted:
+                out[c][row["alumni_id"]] = int(row[c] or 0)
+    return out
+
+
+def _bulk_year_range(db: Session, lo: int, hi: int) -> set[str]:
+    # Parsed in Python rather than cast in SQL so free-text years are
+    # judged exactly like `_should_award` does.
+    qualifying = set()
+    for alumni_id, year in db.execute(
+        select(Alumni.id, Alumni.graduation_year).where(
+            Alumni.graduation_year.isnot(None)
+        )
+    ):
+        try:
+            if lo <= int(year) <= hi:
+                qualifying.add(alumni_id)
+        except ValueError:
             continue
-        # Highest count → earliest first-attendance → alumni_id, as a
-        # single min() over a tuple that inverts count so more is better.
-        winner_id, _ = min(
-            tally.items(),
-            key=lambda kv: (-kv[1][0], kv[1][1], kv[0]),
+    return qualifying
+
+
+def _bulk_profile_complete(db: Session, fields: list[str]) -> set[str]:
+    table = Alumni.__table__
+    columns = [table.c.get(f, table.c.get(f"{f}_hash")) for f in fields]
+    if not fields or any(c is None for c in columns):
+        return set()
+    filled = [and_(c.isnot(None), c != "") for c in columns]
+    return set(db.scalars(select(Alumni.id).where(*filled)))
+
+
+class _BadgeDiff(NamedTuple):
+    """What `bulk_evaluate` writes for one badge; `entry` is its report row."""
+
+    badge: Badge
+    entry: dict[str, Any]
+    to_award: list[str]
+    to_revoke: list[str]
+
+
+def bulk_evaluate(
+    db: Session,
+    badge_codes: list[str] | None = None,
+    dry_run: bool = False,
+    batch_size: int = 5000,
+    progress: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """Re-run badge rules for every alumnus at once.
+
+    Instead of `evaluate_for_user` per alumnus, each metric is computed
+    for the whole base with one aggregate query, the qualifying set for
+    every badge is diffed against its current holders, and the
+    difference is inserted / deleted in batches of `batch_size`, one
+    commit per batch. Revocation follows the same rules as
+    `revoke_ineligible`; `_BULK_SKIPPED_STRATEGIES` are reported but not
+    touched. Badge Collector style (`badge_count`) badges are decided last,
+    on the counts the other changes will leave behind.
+
+    `dry_run` computes and reports the diff without writing. No Telegram
+    notifications are sent — newly awarded badges still show up as
+    "newly earned" in the app.
+
+    Returns a report: per-badge qualifying / awarded / revoked counts,
+    totals and elapsed time.
+    """
+    started = time.perf_counter()
+
+    def report(message: str) -> None:
+        logger.info("bulk badge evaluation: %s", message)
+        if progress is not None:
+            progress(message)
+
+    query = db.query(Badge).order_by(Badge.code)
+    if badge_codes:
+        query = query.filter(Badge.code.in_(badge_codes))
+    catalog = query.all()
+    # badge_count badges depend on the outcome of the others.
+    catalog.sort(key=lambda b: b.strategy == "badge_count")
+
+    needed = {
+        m
+        for b in catalog
+        if (m := _required_metric(b)) is not None and m != "badge_count"
+    }
+    report(f"computing {', '.join(sorted(needed)) or 'no'} metrics")
+    metrics = _bulk_metrics(db, needed)
+
+    holders: dict[str, set[str]] = {b.id: set() for b in catalog}
+    for alumni_id, badge_id in db.execute(
+        select(UserBadge.alumni_id, UserBadge.badge_id).where(
+            UserBadge.badge_id.in_(list(holders))
         )
+    ):
+        holders[badge_id].add(alumni_id)
+
+    # Running per-alumni badge totals, adjusted as the diff is planned.
+    badge_totals: dict[str, int] = dict(
+        db.execute(
+            select(UserBadge.alumni_id, func.count(UserBadge.id)).group_by(
+                UserBadge.alumni_id
+            )
+        ).all()
+    )
+
+    results: list[dict[str, Any]] = []
+    plan: list[_BadgeDiff] = []
+    for badge in catalog:
+        params = badge.params or {}
+        entry: dict[str, Any] = {"code": badge.code, "strategy": badge.strategy}
+        results.append(entry)
+        if badge.strategy in _BULK_SKIPPED_STRATEGIES:
+            entry["skipped"] = True
+            continue
 
-        row = _award(
-            db,
-            winner_id,
-            badge,
-            extra={"city": city, "year": year},
+        metric = _required_metric(badge)
+        if metric == "badge_count":
+            threshold = int(params.get("threshold", 10))
+            qualifying = {a for a, n in badge_totals.items() if n >= threshold}
+        elif metric is not None:
+            threshold = int(params.get("threshold", 1))
+            qualifying = {a for a, n in metrics[metric].items() if n >= threshold}
+        elif badge.strategy == "year_range":
+            qualifying = _bulk_year_range(
+                db, int(params.get("min", 0)), int(params.get("max", 0))
+            )
+        elif badge.strategy == "profile_completeness":
+            qualifying = _bulk_profile_complete(db, params.get("fields", []))
+        else:
+            entry["skipped"] = True
+            continue
+
+        current = holders[badge.id]
+        to_award = sorted(qualifying - current)
+        to_revoke = (
+            sorted(current - qualifying)
+            if badge.strategy not in _NON_REVOCABLE_STRATEGIES
+            else []
+        )
+        for a in to_award:
+            badge_totals[a] = badge_totals.get(a, 0) + 1
+        for a in to_revoke:
+            badge_totals[a] -= 1
+        entry.update(
+            qualifying=len(qualifying), awarded=len(to_award), revoked=len(to_revoke)
+        )
+        plan.append(_BadgeDiff(badge, entry, to_award, to_revoke))
+        report(
+            f"{badge.code}: {len(qualifying)} qualify, "
+            f"+{len(to_award)} / -{len(to_revoke)}"
         )
-        if row is not None:
-            winners.append(row)
 
-    if winners:
-        db.commit()
-    return winners
+    if not dry_run:
+        total = sum(len(d.to_award) + len(d.to_revoke) for d in plan)
+        done = 0
+        for badge, entry, to_award, to_revoke in plan:
+            for i in range(0, len(to_award), batch_size):
+                batch = to_award[i : i + batch_size]
+                now = datetime.utcnow()
+                # `holders` was read before the run; a per-user evaluation
+                # (a join, an approval) may have awarded some of these since.
+                inserted = _insert_awards(
+                    db,
+                    [
+                        {
+                            "id": str(uuid.uuid4()),
+                            "alumni_id": a,
+                            "badge_id": badge.id,
+                            "awarded_at": now,
+                            "extra": {},
+                        }
+                        for a in batch
+                    ],
+                )
+                entry["awarded"] -= len(batch) - len(inserted)
+                badge_metrics.invalidate(db, batch, ["badge_count"])
+                db.commit()
+                done += len(batch)
+                report(f"{badge.code}: written {done}/{total}")
+            for i in range(0, len(to_revoke), batch_size):
+                batch = to_revoke[i : i + batch_size]
+                db.execute(
+                    delete(UserBadge).where(
+                        UserBadge.badge_id == badge.id, UserBadge.alumni_id.in_(batch)
+                    )
+                )
+                badge_metrics.invalidate(db, batch, ["badge_count"])
+                db.commit()
+                done += len(batch)
+                report(f"{badge.code}: written {done}/{total}")
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "dry_run": dry_run,
+        "badges": results,
+        "awarded": sum(r.get("awarded", 0) for r in results),
+        "revoked": sum(r.get("revoked", 0) for r in results),
+        "elapsed_seconds": round(elapsed, 3),
+    }
+    report(
+        f"done in {elapsed:.1f}s: +{summary['awarded']} / -{summary['revoked']}"
+        + (" (dry run)" if dry_run else "")
+    )
+    return summary
@@ -1,9 +1,15 @@
+from collections.abc import Callable, Iterable, Iterator
 import hashlib
 import hmac
+from io import BytesIO
 import logging
 import os
+from typing import BinaryIO
 
+import openpyxl
 import pandas as pd
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.core.security import get_random_token
@@ -16,6 +22,13 @@ logger = logging.getLogger("iu_alumni.email_hash_service")
 # Get secret key from environment
 EMAIL_HASH_SECRET = os.getenv("EMAIL_HASH_SECRET")
 
+# Rows per INSERT when importing an allowed-emails upload; streamed
+# uploads are also read, hashed and committed this many rows at a time
+ALLOWED_EMAILS_CHUNK_SIZE = int(os.getenv("ALLOWED_EMAILS_CHUNK_SIZE", "5000"))
+
+# Upload formats `import_email_file` reads row by row
+STREAMING_EXTENSIONS = (".csv", ".xlsx")
+
 
 def _check_email_hash_secret():
     """Check if EMAIL_HASH_SECRET is configured."""
@@ -75,6 +88,67 @@ def is_email_allowed(db: Session, email: str) -> bool:
         return False
 
 
+def normalize_emails(values: pd.Series) -> tuple[pd.Series, int]:
+    """Normalize a column of raw cells the way `hash_email` does.
+
+    Returns the normalized emails (in-file duplicates kept) and the number
+    of invalid cells: blanks, NaN and anything without an "@", which can
+    never match a registration email.
+    """
+    cells = values.dropna().astype(str).str.strip().str.lower()
+    cells = cells[cells != ""]
+    valid = cells[cells.str.contains("@", regex=False)]
+    return valid, len(values) - len(valid)
+
+
+def hash_emails(emails: Iterable[str]) -> list[str]:
+    """`hash_email` for many already-normalized emails, without the per-call overhead."""
+    if not _check_email_hash_secret():
+        raise ValueError("EMAIL_HASH_SECRET not configured")
+    key = EMAIL_HASH_SECRET.encode("utf-8")
+    return [hmac.digest(key, email.encode("utf-8"), "sha256").hex() for email in emails]
+
+
+def import_emails(db: Session, values: pd.Series) -> dict:
+    """Add a column of emails to the allowed list; the caller commits.
+
+    The column is normalized and deduplicated in pandas, hashed in one
+    pass and inserted in chunks of ALLOWED_EMAILS_CHUNK_SIZE with
+    INSERT ... ON CONFLICT DO NOTHING, so hashes already in the table are
+    skipped by the database rather than looked up one by one. Returns the
+    counts of `added`, `duplicate` (repeated in the file or already
+    allowed) and `invalid` cells.
+    """
+    emails, invalid = normalize_emails(values)
+    unique = emails.drop_duplicates()
+    hashes = hash_emails(unique)
+
+    dialect_insert = (
+        sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    )
+    # A Core insert: the ORM's bulk-insert bookkeeping costs as much as the
+    # database work here.
+    stmt = (
+        dialect_insert(AllowedEmail.__table__)
+        .on_conflict_do_nothing(index_elements=[AllowedEmail.hashed_email])
+        .returning(AllowedEmail.id)
+    )
+    added = 0
+    for start in range(0, len(hashes), ALLOWED_EMAILS_CHUNK_SIZE):
+        rows = [
+            {"id": get_random_token(), "hashed_email": hashed}
+            for hashed in hashes[start : start + ALLOWED_EMAILS_CHUNK_SIZE]
+        ]
+        added += len(db.execute(stmt, rows).all())
+
+    return {
+        "total": len(emails),
+        "added": added,
+        "duplicate": len(emails) - added,
+        "invalid": invalid,
+    }
+
+
 def process_excel_file(db: Session, file_content: bytes) -> dict:
     """Process an Excel file containing email addresses."""
     if not _check_email_hash_secret():
@@ -89,7 +163,7 @@ def process_excel_file(db: Session, file_content: bytes) -> dict:
         )
 
         # Read Excel file
-        emails_df = pd.read_excel(file_content)
+        emails_df = pd.read_excel(BytesIO(file_content))
 
         logger.info(f"Excel file loaded, shape: {emails_df.shape}")
 
@@ -101,48 +175,119 @@ def process_excel_file(db: Session, file_content: bytes) -> dict:
                 "message": "Excel file appears to be empty or has no columns",
             }
 
-        # Get the first column, which should contain emails
-        emails = emails_df.iloc[:, 0].tolist()
-        logger.info(f"Extracted {len(emails)} email entries from first column")
-
-        # Filter out any non-string values or empty strings
-        emails = [
-            str(email).strip() for email in emails if email and str(email).strip()
-        ]
-        logger.info(f"After filtering, {len(emails)} valid emails remain")
-
-        # Hash and store emails
-        added_count = 0
-        for email in emails:
-            logger.debug("Processing email entry")
-            hashed_email = hash_email(email)
-
-            # Check if this hashed email already exists
-            existing = (
-                db.query(AllowedEmail)
-                .filter(AllowedEmail.hashed_email == hashed_email)
-                .first()
-            )
-            if not existing:
-                logger.debug("Adding new allowed email")
-                new_allowed_email = AllowedEmail(
-                    id=get_random_token(), hashed_email=hashed_email
-                )
-                db.add(new_allowed_email)
-                added_count += 1
-            else:
-                logger.debug("Email already exists in allowed list")
+        # The first column should contain emails
+        counts = import_emails(db, emails_df.iloc[:, 0])
 
         db.commit()
         logger.info(
-            f"Commit successful. Added {added_count} new entries out of {len(emails)} total"
+            f"Commit successful. Added {counts['added']} new entries out of "
+            f"{counts['total']} total ({counts['duplicate']} duplicate, "
+            f"{counts['invalid']} invalid)"
         )
 
         return {
             "success": True,
-            "message": f"Successfully processed {len(emails)} emails. Added {added_count} new entries.",
+            "message": f"Successfully processed {counts['total']} emails. Added {counts['added']} new entries.",
+            **counts,
         }
     except Exception as e:
         logger.error(f"Error processing file: {e!s}")
         db.rollback()
         return {"success": False, "message": f"Error processing file: {e!s}"}
+
+
+def read_email_chunks(
+    file: BinaryIO, filename: str, chunk_size: int | None = None
+) -> Iterator[pd.Series]:
+    """The first column of a .csv or .xlsx upload, `chunk_size` rows at a time.
+
+    Like `pd.read_excel`, the first row is taken as a header and skipped.
+    CSV is parsed by pandas in chunks; XLSX is read with openpyxl in
+    read-only mode, which streams the sheet XML instead of building the
+    workbook (only its shared-string table is held in memory).
+    """
+    chunk_size = chunk_size or ALLOWED_EMAILS_CHUNK_SIZE
+    file.seek(0)
+    if filename.lower().endswith(".csv"):
+        with pd.read_csv(
+            file,
+            usecols=[0],
+            dtype=str,
+            encoding="utf-8-sig",
+            chunksize=chunk_size,
+        ) as reader:
+            for chunk in reader:
+                yield chunk.iloc[:, 0]
+        return
+
+    workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        cells: list = []
+        for (cell,) in sheet.iter_rows(min_row=2, max_col=1, values_only=True):
+            cells.append(cell)
+            if len(cells) == chunk_size:
+                yield pd.Series(cells, dtype=object)
+                cells = []
+        if cells:
+            yield pd.Series(cells, dtype=object)
+    finally:
+        workbook.close()
+
+
+def import_email_file(
+    db: Session,
+    file: BinaryIO,
+    filename: str,
+    progress: Callable[[dict], None] | None = None,
+) -> dict:
+    """Stream a .csv or .xlsx upload into the allowed list.
+
+    Each chunk from `read_email_chunks` is imported and committed before
+    the next is read, so memory stays flat however long the file is.
+    After every chunk `progress` (if given) gets the running counts, with
+    `rows` for the data rows read so far. If a chunk fails, the chunks
+    before it stay committed; uploading the file again finishes the job,
+    since known emails are skipped.
+
+    Returns the same shape as `process_excel_file`.
+    """
+    if not _check_email_hash_secret():
+        return {
+            "success": False,
+            "message": "EMAIL_HASH_SECRET not configured",
+        }
+
+    counts = {"rows": 0, "total": 0, "added": 0, "duplicate": 0, "invalid": 0}
+    try:
+        logger.info(f"Starting to stream {filename}")
+        for chunk in read_email_chunks(file, filename):
+            chunk_counts = import_emails(db, chunk)
+            db.commit()
+            counts["rows"] += len(chunk)
+            for key, value in chunk_counts.items():
+                counts[key] += value
+            logger.info(
+                f"{filename}: {counts['rows']} rows read, {counts['added']} added"
+            )
+            if progress is not None:
+                progress(dict(counts))
+    except Exception as e:
+        logger.error(f"Error processing file after {counts['rows']} rows: {e!s}")
+        db.rollback()
+        return {
+            "success": False,
+            "message": f"Error processing file: {e!s}",
+            **counts,
+        }
+
+    logger.info(
+        f"Import of {filename} finished. Added {counts['added']} new entries out of "
+        f"{counts['total']} total ({counts['duplicate']} duplicate, "
+        f"{counts['invalid']} invalid)"
+    )
+    return {
+        "success": True,
+        "message": f"Successfully processed {counts['total']} emails. Added {counts['added']} new entries.",
+        **counts,
+    }
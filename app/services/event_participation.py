@@ -0,0 +1,46 @@
+"""Atomic join/leave for `event_participants`.
+
+Each operation is a single statement that reports whether it changed
+anything, so two simultaneous joins on the same event can't overwrite
+each other and a double-submitted join can't add the alumnus twice: the
+(event_id, alumni_id) primary key is the uniqueness guard, no row is read
+first and nothing is locked beyond the one row written.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.events import EventParticipant
+
+
+def join_event(db: Session, event_id: str, alumni_id: str) -> bool:
+    """Add `alumni_id` to the event. False if they were already in it."""
+    dialect_insert = (
+        sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    )
+    stmt = (
+        dialect_insert(EventParticipant)
+        .values(event_id=event_id, alumni_id=alumni_id, joined_at=datetime.utcnow())
+        .on_conflict_do_nothing()
+        .returning(EventParticipant.event_id)
+    )
+    return db.execute(stmt).first() is not None
+
+
+def leave_event(db: Session, event_id: str, alumni_id: str) -> bool:
+    """Remove `alumni_id` from the event. False if they weren't in it."""
+    stmt = (
+        delete(EventParticipant)
+        .where(
+            EventParticipant.event_id == event_id,
+            EventParticipant.alumni_id == alumni_id,
+        )
+        .returning(EventParticipant.event_id)
+        .execution_options(synchronize_session=False)
+    )
+    return db.execute(stmt).first() is not None
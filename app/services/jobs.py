@@ -0,0 +1,360 @@
+"""Background jobs for long admin operations.
+
+Uploading the allowed-emails list, recomputing leaderboards and deleting
+an alumnus can take long enough to tie up a server worker and a database
+connection and to hit the proxy's timeout. Their routes now validate the
+request, then hand the work to this process's job runner and answer 202
+with the job's id:
+
+    job_id = jobs.runner.submit(db, "recompute-leaderboards", work, created_by=admin.id)
+
+`work(db, progress)` runs on one of JOB_WORKERS threads with its own
+session; it may call `progress({...})` to publish how far it got, and
+returns a JSON-able result (or raises `JobFailedError` with one). The
+`jobs` row carries status, progress, result and error, so
+`GET /admin/jobs/{id}` can answer from any replica.
+
+At most JOB_WORKERS jobs run at once and JOB_QUEUE_SIZE more wait; beyond
+that `submit` raises `JobQueueFullError` (the routes answer 503), which is
+the throttle on heavy admin work.
+
+Jobs live in the memory of the process that accepted them. While it runs,
+`run_heartbeat` bumps `updated_at` on its unfinished jobs every
+JOB_HEARTBEAT_SECONDS; a queued or running job whose heartbeat has been
+silent for JOB_STALE_SECONDS (its process died or was redeployed) is
+marked failed by whichever replica sweeps next, and stays failed even if
+its work does finish later. Re-submitting is safe for
+all current job kinds: uploads skip known emails, recomputes are
+idempotent and a second delete reports the user as gone.
+
+Configured by environment variables:
+    JOB_WORKERS             jobs run at once per process (default 2)
+    JOB_QUEUE_SIZE          jobs waiting per process before 503 (default 20)
+    JOB_HEARTBEAT_SECONDS   heartbeat and sweep interval (default 30)
+    JOB_STALE_SECONDS       silence after which a job is failed (default 300)
+    JOB_RETENTION_DAYS      finished jobs older than this are deleted (default 30)
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextlib
+from datetime import datetime, timedelta
+import logging
+import os
+import threading
+from typing import Any
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session
+
+from app.core.security import get_random_token
+from app.models.jobs import Job
+
+
+logger = logging.getLogger("iu_alumni")
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "20"))
+JOB_HEARTBEAT_SECONDS = float(os.getenv("JOB_HEARTBEAT_SECONDS", "30"))
+JOB_STALE_SECONDS = float(os.getenv("JOB_STALE_SECONDS", "300"))
+JOB_RETENTION_DAYS = float(os.getenv("JOB_RETENTION_DAYS", "30"))
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+UNFINISHED = (QUEUED, RUNNING)
+
+jobs_finished = Counter(
+    "jobs_finished_total", "Background jobs finished, by kind and status", ["kind", "status"]
+)
+jobs_active = Gauge("jobs_active", "Background jobs queued or running in this process")
+
+Progress = Callable[[dict[str, Any]], None]
+Work = Callable[[Session, Progress], Any]
+SessionFactory = Callable[[], Session]
+
+
+class JobQueueFullError(RuntimeError):
+    """This process already has as many jobs as it takes."""
+
+
+class JobFailedError(Exception):
+    """Raised by a job's work to fail it with a message and a partial result."""
+
+    def __init__(self, message: str, result: Any = None):
+        """`result` is stored on the job next to the message."""
+        super().__init__(message)
+        self.result = result
+
+
+def _default_session_factory() -> Session:
+    from app.core.database import SessionLocal
+
+    return SessionLocal()
+
+
+def job_status(job: Job) -> dict[str, Any]:
+    """The API representation of `job`."""
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "progress": job.progress,
+        "result": job.result,
+        "error": job.error,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    }
+
+
+class JobRunner:
+    """A thread pool for job work, bounded by `workers` + `queue_size`."""
+
+    def __init__(
+        self,
+        session_factory: SessionFactory = _default_session_factory,
+        workers: int = JOB_WORKERS,
+        queue_size: int = JOB_QUEUE_SIZE,
+    ):
+        """The pool's threads start with the first job."""
+        self.session_factory = session_factory
+        self.workers = workers
+        self.queue_size = queue_size
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: dict[str, Future] = {}
+        self._slots = 0
+        self._lock = threading.Lock()
+
+    # ── submitting ──────────────────────────────────────────────────────────
+
+    def submit(
+        self,
+        db: Session,
+        kind: str,
+        work: Work,
+        *,
+        created_by: str | None = None,
+        cleanup: Callable[[], None] | None = None,
+    ) -> str:
+        """Record a queued job in `db` (committing it), schedule `work`, return its id.
+
+        `cleanup` runs once the job is over, whether it finished or was
+        cancelled before it started (e.g. to delete a file the work reads).
+
+        Raises `JobQueueFullError` without recording anything when this
+        process already has `workers + queue_size` unfinished jobs; then
+        `cleanup` is not called.
+        """
+        with self._lock:
+            if self._slots >= self.workers + self.queue_size:
+                raise JobQueueFullError("Too many background jobs; try again later")
+            # Taken before committing, so concurrent submits can't overshoot.
+            self._slots += 1
+        job_id = get_random_token()
+        try:
+            now = datetime.utcnow()
+            db.add(
+                Job(
+                    id=job_id,
+                    kind=kind,
+                    status=QUEUED,
+                    created_by=created_by,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+            db.commit()
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="job"
+                    )
+                future = self._executor.submit(self._run, job_id, kind, work)
+                self._futures[job_id] = future
+        except BaseException:
+            with self._lock:
+                self._slots -= 1
+            raise
+        jobs_active.inc()
+        future.add_done_callback(lambda f: self._done(job_id, kind, f, cleanup))
+        logger.info(f"Job {job_id} ({kind}) queued")
+        return job_id
+
+    def __len__(self) -> int:
+        """Unfinished jobs in this process."""
+        return self._slots
+
+    # ── running ─────────────────────────────────────────────────────────────
+
+    def _update(self, job_id: str, *, if_status: str | None = None, **values: Any) -> bool:
+        """Set `values` on the job; only while its status is `if_status`, if given.
+
+        False when nothing was updated.
+        """
+        where = [Job.id == job_id]
+        if if_status is not None:
+            where.append(Job.status == if_status)
+        db = self.session_factory()
+        try:
+            updated = db.execute(
+                update(Job).where(*where).values(updated_at=datetime.utcnow(), **values)
+            ).rowcount
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception(f"Could not update job {job_id}")
+            return False
+        finally:
+            db.close()
+        return updated > 0
+
+    def _run(self, job_id: str, kind: str, work: Work) -> None:
+        self._update(job_id, status=RUNNING, started_at=datetime.utcnow())
+        logger.info(f"Job {job_id} ({kind}) started")
+
+        def progress(values: dict[str, Any]) -> None:
+            self._update(job_id, progress=values)
+
+        db = self.session_factory()
+        try:
+            result = work(db, progress)
+        except JobFailedError as e:
+            db.rollback()
+            outcome = {"status": FAILED, "error": str(e), "result": e.result}
+        except Exception as e:
+            db.rollback()
+            logger.exception(f"Job {job_id} ({kind}) crashed")
+            outcome = {"status": FAILED, "error": f"{type(e).__name__}: {e}"}
+        else:
+            outcome = {"status": SUCCEEDED, "result": result}
+        finally:
+            db.close()
+        # Another replica's heartbeat may have failed the job as stale
+        # meanwhile; that verdict stands.
+        if not self._update(
+            job_id, if_status=RUNNING, finished_at=datetime.utcnow(), **outcome
+        ):
+            logger.warning(f"Job {job_id} ({kind}) was no longer running; outcome dropped")
+            return
+        jobs_finished.labels(kind, outcome["status"]).inc()
+        logger.info(f"Job {job_id} ({kind}) {outcome['status']}")
+
+    def _done(
+        self,
+        job_id: str,
+        kind: str,
+        future: Future,
+        cleanup: Callable[[], None] | None = None,
+    ) -> None:
+        with self._lock:
+            self._futures.pop(job_id, None)
+            self._slots -= 1
+        jobs_active.dec()
+        if future.cancelled() and self._update(
+            job_id,
+            if_status=QUEUED,
+            status=FAILED,
+            error="Cancelled: the server shut down before the job started",
+            finished_at=datetime.utcnow(),
+        ):
+            jobs_finished.labels(kind, FAILED).inc()
+        if cleanup is not None:
+            try:
+                cleanup()
+            except Exception:
+                logger.exception(f"Cleanup of job {job_id} ({kind}) failed")
+
+    # ── lifecycle ───────────────────────────────────────────────────────────
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until every current job has finished; False on timeout."""
+        with self._lock:
+            futures = list(self._futures.values())
+        done = threading.Event()
+        remaining = len(futures)
+        if not remaining:
+            return True
+        lock = threading.Lock()
+
+        def finished(_future: Future) -> None:
+            nonlocal remaining
+            with lock:
+                remaining -= 1
+                if remaining == 0:
+                    done.set()
+
+        for future in futures:
+            future.add_done_callback(finished)
+        return done.wait(timeout)
+
+    def shutdown(self) -> None:
+        """Cancel queued jobs; running ones finish before the process exits."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def heartbeat(self, now: datetime | None = None) -> int:
+        """Refresh this process's unfinished jobs, then fail stale ones anywhere.
+
+        Also deletes finished jobs past JOB_RETENTION_DAYS. Returns how
+        many jobs were failed as stale.
+        """
+        now = now or datetime.utcnow()
+        with self._lock:
+            ours = list(self._futures)
+        db = self.session_factory()
+        try:
+            if ours:
+                db.execute(
+                    update(Job)
+                    .where(Job.id.in_(ours), Job.status.in_(UNFINISHED))
+                    .values(updated_at=now)
+                )
+            stale = db.execute(
+                update(Job)
+                .where(
+                    Job.status.in_(UNFINISHED),
+                    Job.updated_at < now - timedelta(seconds=JOB_STALE_SECONDS),
+                )
+                .values(
+                    status=FAILED,
+                    error="Interrupted: the process running this job stopped",
+                    finished_at=now,
+                    updated_at=now,
+                )
+            ).rowcount
+            db.execute(
+                delete(Job).where(
+                    Job.status.in_((SUCCEEDED, FAILED)),
+                    Job.finished_at < now - timedelta(days=JOB_RETENTION_DAYS),
+                )
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        if stale:
+            logger.warning(f"Marked {stale} interrupted job(s) as failed")
+        return stale
+
+    async def run_heartbeat(self, stop: asyncio.Event) -> None:
+        """Call `heartbeat` every JOB_HEARTBEAT_SECONDS until `stop`."""
+        while not stop.is_set():
+            try:
+                await asyncio.to_thread(self.heartbeat)
+            except Exception:
+                logger.exception("Job heartbeat failed")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), JOB_HEARTBEAT_SECONDS)
+
+
+runner = JobRunner()
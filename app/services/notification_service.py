@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from app.core.logging import app_logger
 from app.models.telegram import TelegramUser
+from app.services import outbox
 from app.services.telegram_bot import telegram_service
 
 
@@ -76,6 +77,10 @@ Here's what you can do:
     ) -> dict:
         """Notify user and owner when user joins event.
 
+        The messages go to the outbox (services/outbox.py) without
+        committing: call this before committing the join so both land
+        together. "ok" means they were queued, not delivered.
+
         Args:
             db: Database session
             event_name: Name of the event
@@ -110,14 +115,16 @@ Here's what you can do:
                     "missing": missing,
                 }
 
-            # Send messages
-            await telegram_service.send_message(
-                chat_id=user.chat_id,
-                text=f"You successfully joined this event: {event_name}",
+            # Written to the outbox in the caller's transaction
+            outbox.telegram(
+                db,
+                user.chat_id,
+                f"You successfully joined this event: {event_name}",
             )
-            await telegram_service.send_message(
-                chat_id=owner.chat_id,
-                text=f"@{user_alias} joined your event {event_name}!",
+            outbox.telegram(
+                db,
+                owner.chat_id,
+                f"@{user_alias} joined your event {event_name}!",
             )
 
             return {"status": "ok"}
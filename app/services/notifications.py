@@ -1,9 +1,9 @@
 """Finds "upcoming event near you" matches for a user, computed live.
 
 An in-person event is "near" a user if it happens in the same city as the
-user's profile location, with Innopolis and Kazan treated as one city
-(alumni in one routinely attend events in the other, and they're a short
-commute apart). Online events are near everyone, regardless of location.
+user's profile location — the same stored `city_key`, which treats
+Innopolis and Kazan as one city (see app/core/locations.py). Online events
+are near everyone, regardless of location.
 
 Unlike a materialized per-(user, event) notification table, read/unread
 state here is tracked with a single per-user cursor
@@ -16,10 +16,10 @@ This is a persistent history, not a transient popup: once an event enters
 the window (becomes <= 7 days + ENTRY_BUFFER away), it stays part of the
 result forever — including after the event has actually happened. There's
 no time-based upper cutoff that removes old matches; the response is
-bounded only by MAX_ITEMS in the list endpoint. This does mean the
-underlying query scans every approved event that has ever entered the
-window, growing over the app's lifetime — acceptable at this data scale,
-but worth knowing if event volume grows much larger.
+bounded only by MAX_ITEMS. The query walks the (approved, city_key,
+datetime) and (approved, is_online, datetime) indexes newest-first and
+stops after MAX_ITEMS matches, so its cost follows the number of matches
+returned, not the size of the event history.
 
 ENTRY_BUFFER exists only so an event's first appearance isn't sensitive to
 time-of-day: without it, an event scheduled for exactly "7 days and a few
@@ -38,36 +38,81 @@ and is the accepted cost of not needing a table or background job.
 Public entry points:
     find_nearby_upcoming_events(db, alumni) -> list[Event]
     is_read(alumni, event) -> bool
+    unread_count(db, alumni) -> int          (cached count_unread)
     mark_seen(db, alumni) -> None
+    event_approval_changed() -> None
 """
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
+import os
+import threading
+import time
 
+from sqlalchemy import Select, exists, func, select, union_all
 from sqlalchemy.orm import Session
 
-from app.models.events import Event
+from app.core.principal_cache import invalidate_principal
+from app.models.events import Event, EventParticipant
 from app.models.users import Alumni
 
 
-# Cities treated as interchangeable for "near me" matching.
-_CITY_ALIASES: dict[str, str] = {
-    "kazan": "innopolis",
-}
-
 NOTICE_LEAD_TIME = timedelta(days=7)
 ENTRY_BUFFER = timedelta(hours=12)
-
-
-def _city_bucket(location: str | None) -> str | None:
-    """Extract and normalize the city part of a "Country, City" string."""
-    if not location:
-        return None
-    parts = [p.strip() for p in location.split(",") if p.strip()]
-    if not parts:
-        return None
-    city = parts[-1].lower()
-    return _CITY_ALIASES.get(city, city)
+# Bounded by design — the ~24h-wide 7-day window practically never holds
+# more than a handful of events — so this is a safety cap, not real paging.
+MAX_ITEMS = 200
+
+# The bell icon polls the unread count; a short per-process cache absorbs
+# that. mark_seen and event approvals invalidate it, the TTL bounds
+# everything else (joins, edits, other replicas). 0 disables it.
+UNREAD_COUNT_CACHE_TTL_SECONDS = float(os.getenv("UNREAD_COUNT_CACHE_TTL_SECONDS", "15"))
+UNREAD_COUNT_CACHE_MAX_SIZE = int(os.getenv("UNREAD_COUNT_CACHE_MAX_SIZE", "4096"))
+
+
+class UnreadCountCache:
+    """Thread-safe TTL + LRU map of alumni id -> unread count."""
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, alumni_id: str) -> int | None:
+        with self._lock:
+            entry = self._entries.get(alumni_id)
+            if entry is None:
+                return None
+            expires_at, count = entry
+            if expires_at <= time.monotonic():
+                del self._entries[alumni_id]
+                return None
+            self._entries.move_to_end(alumni_id)
+            return count
+
+    def put(self, alumni_id: str, count: int) -> None:
+        if self.ttl_seconds <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[alumni_id] = (time.monotonic() + self.ttl_seconds, count)
+            self._entries.move_to_end(alumni_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, alumni_id: str) -> None:
+        with self._lock:
+            self._entries.pop(alumni_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+unread_count_cache = UnreadCountCache(
+    UNREAD_COUNT_CACHE_TTL_SECONDS, UNREAD_COUNT_CACHE_MAX_SIZE
+)
 
 
 def _window_entry_time(event: Event) -> datetime:
@@ -75,8 +120,38 @@ def _window_entry_time(event: Event) -> datetime:
     return event.datetime - NOTICE_LEAD_TIME - ENTRY_BUFFER
 
 
+def in_window(event: Event, now: datetime | None = None) -> bool:
+    """Whether `event` is close enough to be one of the matches (~7 days out)."""
+    return _window_entry_time(event) <= (now or datetime.utcnow())
+
+
+def _matching(alumni: Alumni, *conditions) -> list[Select]:
+    """SELECT Event.id per way an approved event can be near `alumni`.
+
+    Online and same-city events are disjoint branches rather than one OR,
+    so each can range-scan its own (approved, ..., datetime) index.
+    """
+    common = (
+        Event.approved == True,
+        Event.owner_id != alumni.id,
+        ~exists().where(
+            EventParticipant.event_id == Event.id,
+            EventParticipant.alumni_id == alumni.id,
+        ),
+        *conditions,
+    )
+    branches = [select(Event.id).where(*common, Event.is_online == True)]
+    if alumni.city_key:
+        branches.append(
+            select(Event.id).where(
+                *common, Event.is_online == False, Event.city_key == alumni.city_key
+            )
+        )
+    return branches
+
+
 def find_nearby_upcoming_events(
-    db: Session, alumni: Alumni, now: datetime | None = None
+    db: Session, alumni: Alumni, now: datetime | None = None, limit: int = MAX_ITEMS
 ) -> list[Event]:
     """Approved events near `alumni`, most recently-relevant first.
 
@@ -86,28 +161,52 @@ def find_nearby_upcoming_events(
 
     Excludes the event's own owner/participants (they already know about
     it). Online events match regardless of the alumnus's profile city;
-    in-person events only match alumni in the same city.
+    in-person events only match alumni in the same city. At most `limit`
+    events are returned.
     """
     now = now or datetime.utcnow()
-
-    events = (
-        db.query(Event)
-        .filter(
-            Event.approved == True,
-            Event.datetime <= now + NOTICE_LEAD_TIME + ENTRY_BUFFER,
+    # Each branch is one backward index scan that stops after `limit` rows
+    # survive the exclusions.
+    newest = [
+        branch.order_by(Event.datetime.desc()).limit(limit).subquery()
+        for branch in _matching(
+            alumni, Event.datetime <= now + NOTICE_LEAD_TIME + ENTRY_BUFFER
         )
+    ]
+    ids = union_all(*(select(b.c.id) for b in newest))
+    return (
+        db.query(Event)
+        .filter(Event.id.in_(ids))
         .order_by(Event.datetime.desc())
+        .limit(limit)
         .all()
     )
 
-    my_bucket = _city_bucket(alumni.location)
-    matches = []
-    for event in events:
-        if alumni.id == event.owner_id or alumni.id in (event.participants_ids or []):
-            continue
-        if event.is_online or (my_bucket and _city_bucket(event.location) == my_bucket):
-            matches.append(event)
-    return matches
+
+def count_unread(db: Session, alumni: Alumni, now: datetime | None = None) -> int:
+    """How many of `alumni`'s matches `is_read` would call unread, in one COUNT.
+
+    An event is unread when it entered the window after the cursor, i.e.
+    `seen_at < datetime - NOTICE_LEAD_TIME - ENTRY_BUFFER`; rearranged so
+    both bounds are on Event.datetime and stay index ranges.
+    """
+    now = now or datetime.utcnow()
+    conditions = [Event.datetime <= now + NOTICE_LEAD_TIME + ENTRY_BUFFER]
+    if alumni.notifications_seen_at is not None:
+        conditions.append(
+            Event.datetime > alumni.notifications_seen_at + NOTICE_LEAD_TIME + ENTRY_BUFFER
+        )
+    matches = union_all(*_matching(alumni, *conditions)).subquery()
+    return db.scalar(select(func.count()).select_from(matches)) or 0
+
+
+def unread_count(db: Session, alumni: Alumni) -> int:
+    """`count_unread`, cached per alumnus for UNREAD_COUNT_CACHE_TTL_SECONDS."""
+    cached = unread_count_cache.get(alumni.id)
+    if cached is None:
+        cached = count_unread(db, alumni)
+        unread_count_cache.put(alumni.id, cached)
+    return cached
 
 
 def is_read(alumni: Alumni, event: Event) -> bool:
@@ -123,3 +222,14 @@ def mark_seen(db: Session, alumni: Alumni, now: datetime | None = None) -> None:
     """Advances the read cursor — call after listing notifications."""
     alumni.notifications_seen_at = now or datetime.utcnow()
     db.commit()
+    invalidate_principal(alumni.email)
+    unread_count_cache.invalidate(alumni.id)
+
+
+def event_approval_changed() -> None:
+    """Call after committing an approve/unapprove/decline of an event.
+
+    Working out whose counts the event affects would cost a query over
+    alumni; approvals are rare enough to just drop every cached count.
+    """
+    unread_count_cache.clear()
@@ -0,0 +1,388 @@
+"""Durable delivery for Telegram messages and emails.
+
+A notification that is sent in-process is lost if the process dies
+between the domain change and the send (deploys, crashes), and nothing
+records that it went out. Instead, code that causes a notification writes
+a row to `notification_outbox` in the same transaction as the change:
+
+    outbox.telegram(db, chat_id, text)
+    outbox.email(db, "send_verification_success_email", email, first_name=...)
+    db.commit()
+
+so the message exists exactly when the change does. `run_worker` (started
+in the app lifespan; scripts call `drain`) delivers due rows in batches:
+
+    claim    SELECT ... FOR UPDATE SKIP LOCKED the oldest due pending
+             rows, bump `attempts` and push `next_attempt_at` out by a
+             lease, commit. Concurrent workers (other replicas, the
+             reminder script) skip locked rows, so each row goes to one
+             worker, and a row whose worker died becomes due again once
+             the lease runs out.
+    deliver  outside any transaction, concurrently; Telegram sends still
+             go through the bot's rate limiter, one request per attempt,
+             so a delivery stays well within its lease.
+    record   sent -> `sent`; failure -> retried after an exponential
+             backoff, or `failed` once attempts run out or the error is
+             permanent (e.g. the user blocked the bot).
+
+Before each claim the worker refreshes `outbox_pending` / `outbox_due`
+(the queue depth per channel); `outbox_delivery_latency_seconds` is the
+time from enqueue to sent, retries and backoff included.
+
+That is at-least-once delivery: a worker that dies after sending but
+before recording will have the message sent again after the lease.
+
+`dedupe_key` lets writers that may run twice (the hourly reminder job)
+queue a message at most once; it also records what was sent.
+
+Configured by environment variables:
+    OUTBOX_WORKER_ENABLED     run the worker in the app process (default true)
+    OUTBOX_BATCH_SIZE         rows claimed per batch (default 50)
+    OUTBOX_POLL_SECONDS       idle wait between claims (default 2)
+    OUTBOX_LEASE_SECONDS      how long a claimed row stays with its worker (default 300)
+    OUTBOX_MAX_ATTEMPTS       attempts before a row is marked failed (default 8)
+    OUTBOX_BACKOFF_SECONDS    first retry delay; doubles, capped at an hour (default 30)
+    OUTBOX_RETENTION_DAYS     sent rows older than this are deleted (default 14)
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import contextlib
+from datetime import datetime, timedelta
+import logging
+import os
+from typing import Any, NamedTuple
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.outbox import OutboxMessage
+from app.services.telegram_bot import TelegramAPIError, telegram_service
+
+
+logger = logging.getLogger("iu_alumni")
+
+OUTBOX_WORKER_ENABLED = os.getenv("OUTBOX_WORKER_ENABLED", "true").lower() in ("1", "true", "yes")
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "50"))
+OUTBOX_POLL_SECONDS = float(os.getenv("OUTBOX_POLL_SECONDS", "2"))
+OUTBOX_LEASE_SECONDS = float(os.getenv("OUTBOX_LEASE_SECONDS", "300"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "8"))
+OUTBOX_BACKOFF_SECONDS = float(os.getenv("OUTBOX_BACKOFF_SECONDS", "30"))
+OUTBOX_RETENTION_DAYS = float(os.getenv("OUTBOX_RETENTION_DAYS", "14"))
+
+TELEGRAM = "telegram"
+EMAIL = "email"
+
+PENDING = "pending"
+SENT = "sent"
+FAILED = "failed"
+
+outbox_deliveries = Counter(
+    "outbox_deliveries_total",
+    "Outbox delivery attempts by channel and outcome (sent, retry, failed)",
+    ["channel", "outcome"],
+)
+outbox_pending = Gauge(
+    "outbox_pending", "Pending outbox rows, due now or later, by channel", ["channel"]
+)
+outbox_due = Gauge("outbox_due", "Pending outbox rows due now, by channel", ["channel"])
+outbox_delivery_latency_seconds = Histogram(
+    "outbox_delivery_latency_seconds",
+    "Time from enqueueing a message to sending it",
+    ["channel"],
+    buckets=(1, 5, 15, 60, 300, 900, 3600, 4 * 3600, 24 * 3600),
+)
+
+SessionFactory = Callable[[], Session]
+
+
+# ─────────────────────────── writing ───────────────────────────────────────
+
+
+def enqueue(
+    db: Session,
+    channel: str,
+    recipient: str | int,
+    payload: dict[str, Any],
+    *,
+    dedupe_key: str | None = None,
+) -> bool:
+    """Add a message in `db`'s current transaction; the caller commits.
+
+    Returns False if a message with `dedupe_key` was already queued.
+    """
+    values = {
+        "channel": channel,
+        "recipient": str(recipient),
+        "payload": payload,
+        "status": PENDING,
+        "attempts": 0,
+        "next_attempt_at": datetime.utcnow(),
+        "dedupe_key": dedupe_key,
+        "created_at": datetime.utcnow(),
+    }
+    dialect_insert = (
+        sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    )
+    stmt = (
+        dialect_insert(OutboxMessage)
+        .values(values)
+        .on_conflict_do_nothing()
+        .returning(OutboxMessage.id)
+    )
+    return db.execute(stmt).first() is not None
+
+
+def telegram(
+    db: Session,
+    chat_id: int,
+    text: str,
+    *,
+    dedupe_key: str | None = None,
+    **kwargs: Any,
+) -> bool:
+    """Queue a Bot API `sendMessage`; `kwargs` are passed to `send_message`."""
+    return enqueue(
+        db, TELEGRAM, chat_id, {"text": text, **kwargs}, dedupe_key=dedupe_key
+    )
+
+
+def email(
+    db: Session,
+    template: str,
+    to: str,
+    *,
+    dedupe_key: str | None = None,
+    **kwargs: Any,
+) -> bool:
+    """Queue `email_service.<template>(to, **kwargs)`, e.g. "send_verification_success_email"."""
+    if not template.startswith("send_"):
+        raise ValueError(f"Not an email_service sender: {template}")
+    return enqueue(
+        db, EMAIL, to, {"template": template, "kwargs": kwargs}, dedupe_key=dedupe_key
+    )
+
+
+# ─────────────────────────── delivering ────────────────────────────────────
+
+
+class Claimed(NamedTuple):
+    id: int
+    channel: str
+    recipient: str
+    payload: dict[str, Any]
+    attempts: int
+    created_at: datetime
+
+
+class PermanentDeliveryError(Exception):
+    """Delivery can never succeed; don't retry."""
+
+
+async def _send_telegram(recipient: str, payload: dict[str, Any]) -> None:
+    # One request per attempt: the outbox does the retrying, and a send
+    # retried in here could outlive the lease and go out twice.
+    try:
+        await telegram_service.send_message(
+            chat_id=int(recipient), max_attempts=1, **payload
+        )
+    except TelegramAPIError as e:
+        if not e.retryable:
+            raise PermanentDeliveryError(str(e)) from e
+        raise
+
+
+async def _send_email(recipient: str, payload: dict[str, Any]) -> None:
+    from app.services import email_service
+
+    sender = getattr(email_service, payload["template"], None)
+    if sender is None or not payload["template"].startswith("send_"):
+        raise PermanentDeliveryError(f"Unknown email template {payload['template']}")
+    # email_service senders log and return False instead of raising.
+    if not await sender(recipient, **payload.get("kwargs", {})):
+        raise RuntimeError(f"{payload['template']} failed")
+
+
+SENDERS: dict[str, Callable[[str, dict[str, Any]], Awaitable[None]]] = {
+    TELEGRAM: _send_telegram,
+    EMAIL: _send_email,
+}
+
+
+def _backoff(attempts: int) -> timedelta:
+    return timedelta(seconds=min(OUTBOX_BACKOFF_SECONDS * 2 ** (attempts - 1), 3600))
+
+
+def claim(db: Session, limit: int = OUTBOX_BATCH_SIZE, now: datetime | None = None) -> list[Claimed]:
+    """Lease up to `limit` due rows to this worker and commit."""
+    now = now or datetime.utcnow()
+    rows = db.scalars(
+        select(OutboxMessage)
+        .where(OutboxMessage.status == PENDING, OutboxMessage.next_attempt_at <= now)
+        .order_by(OutboxMessage.next_attempt_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    ).all()
+    claimed = []
+    for row in rows:
+        row.attempts += 1
+        row.next_attempt_at = now + timedelta(seconds=OUTBOX_LEASE_SECONDS)
+        claimed.append(
+            Claimed(
+                row.id,
+                row.channel,
+                row.recipient,
+                dict(row.payload),
+                row.attempts,
+                row.created_at,
+            )
+        )
+    db.commit()
+    return claimed
+
+
+def measure_depth(db: Session, now: datetime | None = None) -> None:
+    """Set `outbox_pending` and `outbox_due` from the pending rows."""
+    now = now or datetime.utcnow()
+    counts = dict.fromkeys(SENDERS, (0, 0))
+    rows = db.execute(
+        select(
+            OutboxMessage.channel,
+            func.count(),
+            func.sum(case((OutboxMessage.next_attempt_at <= now, 1), else_=0)),
+        )
+        .where(OutboxMessage.status == PENDING)
+        .group_by(OutboxMessage.channel)
+    )
+    for channel, pending, due in rows:
+        counts[channel] = (pending, due or 0)
+    for channel, (pending, due) in counts.items():
+        outbox_pending.labels(channel).set(pending)
+        outbox_due.labels(channel).set(due)
+
+
+def _measure_and_claim(db: Session, limit: int) -> list[Claimed]:
+    measure_depth(db)
+    return claim(db, limit)
+
+
+def record(
+    db: Session,
+    results: list[tuple[Claimed, Exception | None]],
+    now: datetime | None = None,
+) -> None:
+    """Store the outcome of each delivery and commit."""
+    now = now or datetime.utcnow()
+    for message, error in results:
+        where = (OutboxMessage.id == message.id, OutboxMessage.status == PENDING)
+        if error is None:
+            values = {"status": SENT, "sent_at": now, "last_error": None}
+            outcome = SENT
+            outbox_delivery_latency_seconds.labels(message.channel).observe(
+                max((now - message.created_at).total_seconds(), 0)
+            )
+        elif isinstance(error, PermanentDeliveryError) or message.attempts >= OUTBOX_MAX_ATTEMPTS:
+            values = {"status": FAILED, "last_error": str(error)[:2000]}
+            outcome = FAILED
+            logger.error(
+                "outbox %s #%s to %s failed for good: %s",
+                message.channel, message.id, message.recipient, error,
+            )
+        else:
+            values = {
+                "next_attempt_at": now + _backoff(message.attempts),
+                "last_error": str(error)[:2000],
+            }
+            outcome = "retry"
+        db.execute(update(OutboxMessage).where(*where).values(values))
+        outbox_deliveries.labels(message.channel, outcome).inc()
+    db.commit()
+
+
+async def _deliver(message: Claimed) -> Exception | None:
+    sender = SENDERS.get(message.channel)
+    try:
+        if sender is None:
+            raise PermanentDeliveryError(f"Unknown channel {message.channel}")
+        await sender(message.recipient, message.payload)
+    except Exception as e:
+        return e
+    return None
+
+
+def _in_session(session_factory: SessionFactory, fn, *args):
+    db = session_factory()
+    try:
+        return fn(db, *args)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def process_due(session_factory: SessionFactory, limit: int = OUTBOX_BATCH_SIZE) -> int:
+    """Claim, deliver and record one batch. Returns how many rows it handled.
+
+    The blocking database work runs in a thread so the event loop (and
+    the API requests on it) keeps going.
+    """
+    claimed = await asyncio.to_thread(
+        _in_session, session_factory, _measure_and_claim, limit
+    )
+    if not claimed:
+        return 0
+    errors = await asyncio.gather(*(_deliver(m) for m in claimed))
+    await asyncio.to_thread(
+        _in_session, session_factory, record, list(zip(claimed, errors, strict=True))
+    )
+    return len(claimed)
+
+
+async def drain(session_factory: SessionFactory, limit: int = OUTBOX_BATCH_SIZE) -> int:
+    """Deliver batches until nothing is due; for scripts. Returns rows handled."""
+    total = 0
+    while handled := await process_due(session_factory, limit):
+        total += handled
+    return total
+
+
+def purge_sent(db: Session, older_than: timedelta) -> int:
+    """Delete sent rows older than `older_than`; failed ones stay for inspection."""
+    result = db.execute(
+        delete(OutboxMessage).where(
+            OutboxMessage.status == SENT,
+            OutboxMessage.sent_at < datetime.utcnow() - older_than,
+        )
+    )
+    db.commit()
+    return result.rowcount
+
+
+async def run_worker(session_factory: SessionFactory, stop: asyncio.Event) -> None:
+    """Deliver due rows until `stop` is set; waits OUTBOX_POLL_SECONDS when idle."""
+    logger.info("Outbox worker started")
+    next_purge = datetime.utcnow()
+    while not stop.is_set():
+        try:
+            if datetime.utcnow() >= next_purge:
+                await asyncio.to_thread(
+                    _in_session,
+                    session_factory,
+                    purge_sent,
+                    timedelta(days=OUTBOX_RETENTION_DAYS),
+                )
+                next_purge = datetime.utcnow() + timedelta(hours=1)
+            handled = await process_due(session_factory)
+        except Exception:
+            logger.exception("Outbox batch failed")
+            handled = 0
+        if handled < OUTBOX_BATCH_SIZE:
+            # A full batch means more is probably due; otherwise wait.
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), OUTBOX_POLL_SECONDS)
+    logger.info("Outbox worker stopped")
@@ -0,0 +1,250 @@
+"""Live updates for connected clients, delivered over `GET /api/v1/stream`.
+
+Without this the app polls `/notifications/unread-count` and `/badges/me`
+to notice new matches and badges. Instead, the code paths that cause
+those changes publish a small message here, and every open stream it
+concerns gets it as a server-sent event:
+
+    notification              an event near the user, due within the
+                              notice window, was approved
+    event.participant_joined  someone joined an event the user hosts
+    badge.awarded             the user earned badges
+
+Messages are hints ("refetch"), not the data itself; a client that
+reconnects simply refetches, so nothing is replayed.
+
+Moving parts:
+    Envelope      a message plus its audience (alumni ids, a city, or
+                  everyone), JSON-serializable
+    StreamHub     this process's open streams; `deliver` hands an envelope
+                  to the matching ones
+    transport     how a published envelope reaches the hubs. The default
+                  delivers straight to this process's hub, which is all a
+                  single replica needs. With several replicas, a transport
+                  that sends `envelope.to_json()` with Postgres NOTIFY and
+                  has a LISTEN task in every replica call
+                  `hub.deliver(Envelope.from_json(...))` drops in via
+                  `set_transport` without touching publishers or the
+                  endpoint.
+
+Each stream has a bounded queue; when a client falls behind, the oldest
+queued message is dropped (and counted) rather than letting memory grow.
+
+Configured by environment variables:
+    STREAM_QUEUE_SIZE         messages buffered per connection (default 64)
+    STREAM_HEARTBEAT_SECONDS  idle time before a keep-alive comment (default 15)
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+import json
+import logging
+import os
+import threading
+from typing import Any
+
+from prometheus_client import Counter, Gauge
+
+from app.models.events import Event
+from app.services import notifications
+
+
+logger = logging.getLogger("iu_alumni")
+
+STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "64"))
+STREAM_HEARTBEAT_SECONDS = float(os.getenv("STREAM_HEARTBEAT_SECONDS", "15"))
+
+stream_connections = Gauge(
+    "stream_connections", "Open server-sent event streams in this process"
+)
+stream_messages_delivered = Counter(
+    "stream_messages_delivered_total", "Messages queued for an open stream"
+)
+stream_messages_dropped = Counter(
+    "stream_messages_dropped_total",
+    "Messages dropped because a stream's queue was full",
+)
+
+
+@dataclass(frozen=True)
+class Envelope:
+    """A message for every open stream in its audience.
+
+    `alumni_ids` limits it to those users (None means anyone), `city_key`
+    to users whose profile is in that city, and `exclude` removes users
+    from whatever is left.
+    """
+
+    event: str
+    data: dict[str, Any]
+    alumni_ids: tuple[str, ...] | None = None
+    city_key: str | None = None
+    exclude: tuple[str, ...] = ()
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "event": self.event,
+                "data": self.data,
+                "alumni_ids": self.alumni_ids,
+                "city_key": self.city_key,
+                "exclude": self.exclude,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> Envelope:
+        body = json.loads(raw)
+        ids = body.get("alumni_ids")
+        return cls(
+            event=body["event"],
+            data=body["data"],
+            alumni_ids=tuple(ids) if ids is not None else None,
+            city_key=body.get("city_key"),
+            exclude=tuple(body.get("exclude") or ()),
+        )
+
+    def encode(self) -> bytes:
+        """The SSE frame sent to the client."""
+        return f"event: {self.event}\ndata: {json.dumps(self.data)}\n\n".encode()
+
+
+@dataclass(eq=False)
+class Subscription:
+    """One open stream: who is listening and their pending messages."""
+
+    alumni_id: str
+    city_key: str | None
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue[Envelope] = field(
+        default_factory=lambda: asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+    )
+
+    def wants(self, envelope: Envelope) -> bool:
+        if envelope.alumni_ids is not None and self.alumni_id not in envelope.alumni_ids:
+            return False
+        if envelope.city_key is not None and envelope.city_key != self.city_key:
+            return False
+        return self.alumni_id not in envelope.exclude
+
+    def offer(self, envelope: Envelope) -> None:
+        """Queue `envelope`, dropping the oldest one if the queue is full.
+
+        Runs on the subscription's own event loop.
+        """
+        if self.queue.full():
+            self.queue.get_nowait()
+            stream_messages_dropped.inc()
+        self.queue.put_nowait(envelope)
+        stream_messages_delivered.inc()
+
+
+class StreamHub:
+    """The open streams of this process.
+
+    Publishers run both on the event loop (async routes) and in the
+    threadpool (sync routes), so the subscriber set is behind a lock and
+    messages reach each queue through its loop's `call_soon_threadsafe`.
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: set[Subscription] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, alumni_id: str, city_key: str | None) -> Subscription:
+        subscription = Subscription(alumni_id, city_key, asyncio.get_running_loop())
+        with self._lock:
+            self._subscriptions.add(subscription)
+        stream_connections.inc()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription not in self._subscriptions:
+                return
+            self._subscriptions.discard(subscription)
+        stream_connections.dec()
+
+    def deliver(self, envelope: Envelope) -> None:
+        with self._lock:
+            targets = [s for s in self._subscriptions if s.wants(envelope)]
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, envelope)
+            except RuntimeError:
+                # Loop already closed (shutdown); the stream is gone anyway.
+                self.unsubscribe(subscription)
+
+    def __len__(self) -> int:
+        """Number of open streams."""
+        return len(self._subscriptions)
+
+
+hub = StreamHub()
+
+Transport = Callable[[Envelope], None]
+_transport: Transport = hub.deliver
+
+
+def set_transport(transport: Transport) -> None:
+    """Route published envelopes through `transport` instead of straight to `hub`."""
+    global _transport
+    _transport = transport
+
+
+def publish(envelope: Envelope) -> None:
+    """Send `envelope` to its audience. Never raises into the caller."""
+    try:
+        _transport(envelope)
+    except Exception as e:
+        logger.error("stream publish failed for %s: %s", envelope.event, e)
+
+
+# ─────────────────────────── publishers ────────────────────────────────────
+
+
+def event_approved(event: Event, now: datetime | None = None) -> None:
+    """Tell the alumni this event is near (see services/notifications.py).
+
+    Only for events already in the notice window: a later one isn't in
+    their matches or unread count yet, so the hint would only cause a
+    refetch that finds nothing new.
+    """
+    if not event.is_online and not event.city_key:
+        return
+    if not notifications.in_window(event, now):
+        return
+    publish(
+        Envelope(
+            "notification",
+            {
+                "event_id": event.id,
+                "title": event.title,
+                "datetime": event.datetime.isoformat(),
+            },
+            city_key=None if event.is_online else event.city_key,
+            exclude=(event.owner_id, *(event.participants_ids or [])),
+        )
+    )
+
+
+def participant_joined(event: Event, alumni_id: str) -> None:
+    """Tell the host someone joined their event."""
+    if alumni_id == event.owner_id:
+        return
+    publish(
+        Envelope(
+            "event.participant_joined",
+            {"event_id": event.id, "alumni_id": alumni_id},
+            alumni_ids=(event.owner_id,),
+        )
+    )
+
+
+def badges_awarded(alumni_id: str, codes: Iterable[str]) -> None:
+    codes = sorted(set(codes))
+    if codes:
+        publish(Envelope("badge.awarded", {"codes": codes}, alumni_ids=(alumni_id,)))
@@ -1,13 +1,173 @@
-"""Telegram Bot API utilities for sending messages and managing bot interactions."""
+"""Telegram Bot API utilities for sending messages and managing bot interactions.
 
+All calls go through one long-lived `httpx.AsyncClient`, so reminders,
+badge and join notifications reuse pooled keep-alive connections instead
+of paying a TCP + TLS handshake per message. The app opens it in its
+lifespan (`await telegram_service.start()` / `aclose()`); scripts wrap
+their work in `async with telegram_service.session():`. Outside of those
+every call falls back to a throwaway client, as before.
+
+Every Bot API call with a `chat_id` also passes the rate limiter, which
+keeps this process under Telegram's limits with two token buckets: one
+for the whole bot and one per chat. A 429 pauses all sends for its
+`retry_after`, and connection errors and 5xx responses are retried with
+exponential backoff, so callers only see an error once retries run out.
+The limits are per process; with several replicas, divide them.
+
+Notifications that shouldn't hold up a request go through the outbox
+(app/services/outbox.py) rather than being sent from here directly.
+
+Configured by environment variables:
+    TELEGRAM_HTTP_MAX_CONNECTIONS    pool size (default 20)
+    TELEGRAM_HTTP_MAX_KEEPALIVE      idle connections kept (default 10)
+    TELEGRAM_HTTP_KEEPALIVE_EXPIRY   seconds an idle connection is kept (default 30)
+    TELEGRAM_HTTP_TIMEOUT            read/write/pool timeout, seconds (default 30)
+    TELEGRAM_HTTP_CONNECT_TIMEOUT    connect timeout, seconds (default 10)
+    TELEGRAM_HTTP2                   "true" to use HTTP/2 (needs the `h2` package)
+    TELEGRAM_GLOBAL_RATE             messages per second for the bot (default 30)
+    TELEGRAM_CHAT_RATE               messages per second per chat (default 1)
+    TELEGRAM_SEND_MAX_ATTEMPTS       tries per message, including the first (default 4)
+    TELEGRAM_SEND_BACKOFF            first retry delay, seconds; doubles (default 0.5)
+    TELEGRAM_MAX_RETRY_AFTER         longest 429 pause honoured, seconds (default 60)
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 import os
+import random
+import time
 from typing import Any
 
 import httpx
+from prometheus_client import Counter, Histogram
 
 from app.core.logging import app_logger
 
 
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, str(default)))
+
+
+TELEGRAM_GLOBAL_RATE = _env_float("TELEGRAM_GLOBAL_RATE", 30.0)
+TELEGRAM_CHAT_RATE = _env_float("TELEGRAM_CHAT_RATE", 1.0)
+TELEGRAM_SEND_MAX_ATTEMPTS = int(os.getenv("TELEGRAM_SEND_MAX_ATTEMPTS", "4"))
+TELEGRAM_SEND_BACKOFF = _env_float("TELEGRAM_SEND_BACKOFF", 0.5)
+TELEGRAM_MAX_RETRY_AFTER = _env_float("TELEGRAM_MAX_RETRY_AFTER", 60.0)
+
+# Failures where retrying can't double-send: the request never reached
+# Telegram, or the connection died before a response (typically a stale
+# keep-alive connection).
+_RETRYABLE_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+    httpx.RemoteProtocolError,
+)
+
+telegram_api_call_seconds = Histogram(
+    "telegram_api_call_seconds",
+    "Duration of one Bot API request",
+    ["method"],
+)
+telegram_send_retries = Counter(
+    "telegram_send_retries_total",
+    "Bot API requests retried after a 429, a 5xx or a connection failure",
+)
+
+
+class TelegramAPIError(RuntimeError):
+    """The Bot API answered ok=false (or with a non-JSON 5xx)."""
+
+    def __init__(
+        self,
+        description: str | None,
+        error_code: int | None = None,
+        retry_after: float | None = None,
+    ):
+        """Keep the fields the retry logic looks at."""
+        super().__init__(f"Telegram API error: {description}")
+        self.error_code = error_code
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self) -> bool:
+        return self.error_code == 429 or (self.error_code or 0) >= 500
+
+
+class TokenBucket:
+    """`rate` tokens per second, holding at most `burst`.
+
+    `reserve` always takes a token and returns how long to wait before
+    using it, so concurrent callers queue up behind each other instead of
+    all waking at once. Only touched from the event loop, so no lock.
+    """
+
+    def __init__(self, rate: float, burst: float, now: float | None = None):
+        """Start full."""
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic() if now is None else now
+
+    def reserve(self, now: float | None = None) -> float:
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def idle(self, now: float) -> bool:
+        """True once the bucket would be full again, i.e. it can be forgotten."""
+        return self.tokens + (now - self.updated) * self.rate >= self.burst
+
+
+class RateLimiter:
+    """Global and per-chat token buckets, plus a pause set by 429 replies."""
+
+    # Idle per-chat buckets are pruned once there are this many.
+    MAX_CHATS = 10_000
+
+    def __init__(self, global_rate: float, chat_rate: float):
+        """Buckets allow a one-second burst globally and one message per chat."""
+        self.chat_rate = chat_rate
+        self._global = TokenBucket(global_rate, max(global_rate, 1.0))
+        self._chats: dict[int, TokenBucket] = {}
+        self._paused_until = 0.0
+
+    def _chat(self, chat_id: int, now: float) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) >= self.MAX_CHATS:
+                self._chats = {k: b for k, b in self._chats.items() if not b.idle(now)}
+            bucket = self._chats[chat_id] = TokenBucket(self.chat_rate, 1.0, now)
+        return bucket
+
+    def pause(self, seconds: float) -> None:
+        """Hold every send for `seconds` (Telegram's `retry_after`)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self, chat_id: int | None) -> None:
+        """Wait until a message to `chat_id` may be sent."""
+        if chat_id is not None:
+            await _sleep(self._chat(chat_id, time.monotonic()).reserve())
+        await _sleep(self._global.reserve())
+        await _sleep(self._paused_until - time.monotonic())
+
+
+async def _sleep(seconds: float) -> None:
+    if seconds > 0:
+        await asyncio.sleep(seconds)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401 — optional, only needed for HTTP/2
+    except ImportError:
+        return False
+    return True
+
+
 class TelegramBotService:
     """Service for interacting with Telegram Bot API."""
 
@@ -19,13 +179,131 @@ class TelegramBotService:
         self.token = os.getenv("TELEGRAM_TOKEN", "")
         if not self.token:
             app_logger.warning("TELEGRAM_TOKEN not set in environment")
+        self._client: httpx.AsyncClient | None = None
+        self.limiter = RateLimiter(TELEGRAM_GLOBAL_RATE, TELEGRAM_CHAT_RATE)
 
     def _get_api_url(self, method: str) -> str:
         """Get the full API URL for a Telegram Bot API method."""
         return f"{self.BASE_URL}/bot{self.token}/{method}"
 
+    def _new_client(self) -> httpx.AsyncClient:
+        """An AsyncClient with the configured pool limits and timeouts."""
+        http2 = os.getenv("TELEGRAM_HTTP2", "").strip().lower() in ("1", "true", "yes")
+        if http2 and not _http2_available():
+            app_logger.warning("TELEGRAM_HTTP2 is set but h2 is not installed; using HTTP/1.1")
+            http2 = False
+        return httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=int(os.getenv("TELEGRAM_HTTP_MAX_CONNECTIONS", "20")),
+                max_keepalive_connections=int(os.getenv("TELEGRAM_HTTP_MAX_KEEPALIVE", "10")),
+                keepalive_expiry=_env_float("TELEGRAM_HTTP_KEEPALIVE_EXPIRY", 30.0),
+            ),
+            timeout=httpx.Timeout(
+                _env_float("TELEGRAM_HTTP_TIMEOUT", 30.0),
+                connect=_env_float("TELEGRAM_HTTP_CONNECT_TIMEOUT", 10.0),
+            ),
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient | None:
+        """The shared client, or None outside `start()` / `session()`."""
+        return self._client
+
+    async def start(self) -> None:
+        """Open the shared client. Call once from the running event loop."""
+        if self._client is None:
+            self._client = self._new_client()
+
+    async def aclose(self) -> None:
+        """Close the shared client."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["TelegramBotService"]:
+        """`start()` ... `aclose()` around a block, for scripts."""
+        await self.start()
+        try:
+            yield self
+        finally:
+            await self.aclose()
+
+    async def _post(self, method: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """One request; return its `result` or raise TelegramAPIError."""
+        started = time.perf_counter()
+        try:
+            if self._client is not None:
+                response = await self._client.post(self._get_api_url(method), json=payload)
+            else:
+                async with self._new_client() as client:
+                    response = await client.post(self._get_api_url(method), json=payload)
+        finally:
+            telegram_api_call_seconds.labels(method).observe(time.perf_counter() - started)
+        try:
+            data = response.json()
+        except ValueError:
+            raise TelegramAPIError(
+                f"HTTP {response.status_code}", error_code=response.status_code
+            ) from None
+        if not data.get("ok"):
+            raise TelegramAPIError(
+                data.get("description"),
+                error_code=data.get("error_code", response.status_code),
+                retry_after=(data.get("parameters") or {}).get("retry_after"),
+            )
+        return data.get("result", {})
+
+    async def _call(
+        self, method: str, payload: dict[str, Any], max_attempts: int | None = None
+    ) -> dict[str, Any]:
+        """POST a Bot API method within the rate limits and return its `result`.
+
+        Retries 429s (after `retry_after`), 5xx responses and connection
+        failures up to `max_attempts` tries (TELEGRAM_SEND_MAX_ATTEMPTS by
+        default); raises the last error.
+        """
+        max_attempts = max_attempts or TELEGRAM_SEND_MAX_ATTEMPTS
+        attempt = 1
+        while True:
+            await self.limiter.acquire(payload.get("chat_id"))
+            try:
+                return await self._post(method, payload)
+            except TelegramAPIError as e:
+                if e.retry_after is not None and e.retry_after <= TELEGRAM_MAX_RETRY_AFTER:
+                    # Even without a retry here, other sends must hold off.
+                    self.limiter.pause(e.retry_after)
+                if (
+                    not e.retryable
+                    or attempt >= max_attempts
+                    or (e.retry_after or 0) > TELEGRAM_MAX_RETRY_AFTER
+                ):
+                    app_logger.error(f"Telegram API error: {e}")
+                    raise
+                delay = 0.0 if e.retry_after is not None else self._backoff(attempt)
+            except _RETRYABLE_ERRORS as e:
+                if attempt >= max_attempts:
+                    raise
+                app_logger.warning(f"Telegram {method} failed ({e!r}), retrying")
+                delay = self._backoff(attempt)
+            telegram_send_retries.inc()
+            attempt += 1
+            await _sleep(delay)
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Exponential delay with full jitter before retry number `attempt`."""
+        return random.uniform(0, TELEGRAM_SEND_BACKOFF * 2 ** (attempt - 1))
+
     async def send_message(
-        self, chat_id: int, text: str, parse_mode: str = "HTML", **kwargs
+        self,
+        chat_id: int,
+        text: str,
+        parse_mode: str = "HTML",
+        *,
+        max_attempts: int | None = None,
+        **kwargs,
     ) -> dict[str, Any]:
         """Send a text message to a chat.
 
@@ -33,6 +311,7 @@ class TelegramBotService:
             chat_id: Chat ID to send to
             text: Message text
             parse_mode: Parse mode (HTML or Markdown)
+            max_attempts: Tries including the first (default TELEGRAM_SEND_MAX_ATTEMPTS)
             **kwargs: Additional parameters to pass to Telegram API
 
         Returns:
@@ -44,24 +323,11 @@ class TelegramBotService:
             "parse_mode": parse_mode,
             **kwargs,
         }
-
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self._get_api_url("sendMessage"),
-                    json=payload,
-                    timeout=30.0,
-                )
-                data = response.json()
-                if not data.get("ok"):
-                    app_logger.error(
-                        f"Telegram API error: {data.get('description', 'Unknown error')}"
-                    )
-                    raise RuntimeError(f"Telegram API error: {data.get('description')}")
-                return data.get("result", {})
-            except Exception as e:
-                app_logger.error(f"Error sending message to {chat_id}: {e}")
-                raise
+        try:
+            return await self._call("sendMessage", payload, max_attempts)
+        except Exception as e:
+            app_logger.error(f"Error sending message to {chat_id}: {e}")
+            raise
 
     async def send_poll(
         self,
@@ -91,25 +357,11 @@ class TelegramBotService:
             "allows_multiple_answers": allows_multiple_answers,
             "type": "regular",
         }
-
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self._get_api_url("sendPoll"),
-                    json=payload,
-                    timeout=30.0,
-                )
-                data = response.json()
-                if not data.get("ok"):
-                    app_logger.error(
-                        f"Telegram API error: {data.get('description', 'Unknown error')}"
-                    )
-                    raise RuntimeError(f"Telegram API error: {data.get('description')}")
-                return data.get("result", {})
-            except Exception as e:
-                app_logger.error(f"Error sending poll to {chat_id}: {e}")
-                raise
-
+        try:
+            return await self._call("sendPoll", payload)
+        except Exception as e:
+            app_logger.error(f"Error sending poll to {chat_id}: {e}")
+            raise
 
     async def send_login_code(
         self,
@@ -2,12 +2,30 @@
 
 Replaces the webhook approach by continuously calling getUpdates so the bot
 works without a publicly reachable endpoint.
+
+Updates are handed to an `UpdateDispatcher` rather than handled one by
+one: different chats are handled concurrently (up to
+TELEGRAM_UPDATE_CONCURRENCY at once), updates from the same chat still run
+in the order Telegram sent them, each handler gets its own Session, and
+the loop goes back to getUpdates while the previous batch is still being
+handled. At most TELEGRAM_UPDATE_BACKLOG updates are pending at a time;
+beyond that the loop waits before fetching more.
+
+Configured by environment variables:
+    TELEGRAM_UPDATE_CONCURRENCY   handlers running at once (default 16)
+    TELEGRAM_UPDATE_BACKLOG       updates accepted but not finished (default 200)
+    TELEGRAM_UPDATE_DRAIN_SECONDS how long shutdown waits for handlers (default 10)
 """
 
 import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+import os
+import time
 from typing import Any
 
 import httpx
+from prometheus_client import Counter, Gauge, Histogram
 from sqlalchemy.orm import Session
 
 from app.core.database import SessionLocal
@@ -18,6 +36,46 @@ from app.services.notification_service import NotificationService
 from app.services.telegram_bot import telegram_service
 
 
+TELEGRAM_UPDATE_CONCURRENCY = int(os.getenv("TELEGRAM_UPDATE_CONCURRENCY", "16"))
+TELEGRAM_UPDATE_BACKLOG = int(os.getenv("TELEGRAM_UPDATE_BACKLOG", "200"))
+TELEGRAM_UPDATE_DRAIN_SECONDS = float(os.getenv("TELEGRAM_UPDATE_DRAIN_SECONDS", "10"))
+
+# Update types `_handle_update` knows; asked for by getUpdates and setWebhook.
+ALLOWED_UPDATES = ["message", "poll_answer"]
+
+telegram_updates = Counter(
+    "telegram_updates_total", "Telegram updates received, by kind", ["kind"]
+)
+telegram_update_handler_seconds = Histogram(
+    "telegram_update_handler_seconds",
+    "Time spent handling one Telegram update, by kind",
+    ["kind"],
+)
+telegram_updates_in_flight = Gauge(
+    "telegram_updates_in_flight", "Telegram updates accepted but not yet handled"
+)
+
+UpdateHandler = Callable[[dict[str, Any], Session], Awaitable[None]]
+
+
+def _update_kind(update: dict[str, Any]) -> str:
+    for kind in ("message", "poll_answer"):
+        if kind in update:
+            return kind
+    return "other"
+
+
+def _chat_key(update: dict[str, Any]) -> int | None:
+    """The chat an update belongs to, for per-chat ordering."""
+    if "message" in update:
+        return update["message"].get("chat", {}).get("id")
+    if "poll_answer" in update:
+        # Poll answers come from the user's private chat with the bot,
+        # whose id is the user's id.
+        return update["poll_answer"].get("user", {}).get("id")
+    return None
+
+
 async def _handle_update(update: dict[str, Any], db: Session) -> None:
     """Dispatch a single Telegram update to the appropriate handler."""
     # Handle poll answers (feedback submission)
@@ -87,6 +145,108 @@ async def _handle_update(update: dict[str, Any], db: Session) -> None:
                 app_logger.error(f"Error sending mini app button: {e}")
 
 
+@asynccontextmanager
+async def _polling_client() -> AsyncIterator[httpx.AsyncClient]:
+    """The bot's shared client when the app has started it, else a private one."""
+    if telegram_service.client is not None:
+        yield telegram_service.client
+        return
+    async with httpx.AsyncClient() as client:
+        yield client
+
+
+class UpdateDispatcher:
+    """Runs update handlers concurrently across chats, in order within one.
+
+    `submit` returns once the update is accepted (waiting only while the
+    backlog is full); the handler runs in a task with its own Session.
+    Each chat's updates are chained: an update's task first waits for the
+    previous one from the same chat to finish.
+    """
+
+    def __init__(
+        self,
+        handler: UpdateHandler | None = None,
+        session_factory: Callable[[], Session] | None = None,
+        concurrency: int = TELEGRAM_UPDATE_CONCURRENCY,
+        backlog: int = TELEGRAM_UPDATE_BACKLOG,
+    ):
+        """Defaults: this module's `_handle_update` and `SessionLocal`."""
+        self._handler = handler or _handle_update
+        self._session_factory = session_factory or SessionLocal
+        self._running = asyncio.Semaphore(max(concurrency, 1))
+        self._backlog = asyncio.Semaphore(max(backlog, 1))
+        # Last accepted task per chat.
+        self._tails: dict[int, asyncio.Task] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, update: dict[str, Any]) -> None:
+        await self._backlog.acquire()
+        self._start(update)
+
+    async def try_submit(self, update: dict[str, Any]) -> bool:
+        """Like `submit`, but returns False instead of waiting when the backlog is full."""
+        if self._backlog.locked():
+            return False
+        await self._backlog.acquire()  # free slot: doesn't suspend
+        self._start(update)
+        return True
+
+    def _start(self, update: dict[str, Any]) -> None:
+        telegram_updates_in_flight.inc()
+        chat = _chat_key(update)
+        previous = self._tails.get(chat) if chat is not None else None
+        task = asyncio.create_task(self._run(update, previous))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if chat is not None:
+            self._tails[chat] = task
+            task.add_done_callback(lambda t: self._forget(chat, t))
+
+    def _forget(self, chat: int, task: asyncio.Task) -> None:
+        if self._tails.get(chat) is task:
+            del self._tails[chat]
+
+    async def _run(self, update: dict[str, Any], previous: asyncio.Task | None) -> None:
+        kind = _update_kind(update)
+        try:
+            if previous is not None:
+                # Its outcome doesn't matter, only that it's done.
+                await asyncio.wait([previous])
+            async with self._running:
+                started = time.perf_counter()
+                db = self._session_factory()
+                try:
+                    await self._handler(update, db)
+                except Exception as e:
+                    app_logger.error(f"Error handling update {update.get('update_id')}: {e}")
+                finally:
+                    db.close()
+                    telegram_updates.labels(kind).inc()
+                    telegram_update_handler_seconds.labels(kind).observe(
+                        time.perf_counter() - started
+                    )
+        finally:
+            telegram_updates_in_flight.dec()
+            self._backlog.release()
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """Wait for accepted updates; cancel whatever is left after `timeout`."""
+        tasks = set(self._tasks)
+        if not tasks:
+            return
+        _done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            app_logger.warning(f"Cancelled {len(pending)} Telegram updates on shutdown")
+            await asyncio.wait(pending)
+
+    def __len__(self) -> int:
+        """Updates accepted and not finished yet."""
+        return len(self._tasks)
+
+
 async def start_polling(stop_event: asyncio.Event) -> None:
     """Long-poll Telegram for updates until stop_event is set.
 
@@ -95,12 +255,13 @@ async def start_polling(stop_event: asyncio.Event) -> None:
     """
     offset: int | None = None
     api_url = telegram_service._get_api_url("getUpdates")
+    dispatcher = UpdateDispatcher()
 
     app_logger.info("Telegram polling started")
 
-    async with httpx.AsyncClient() as client:
+    async with _polling_client() as client:
         while not stop_event.is_set():
-            params: dict[str, Any] = {"timeout": 30, "allowed_updates": ["message", "poll_answer"]}
+            params: dict[str, Any] = {"timeout": 30, "allowed_updates": ALLOWED_UPDATES}
             if offset is not None:
                 params["offset"] = offset
 
@@ -126,14 +287,11 @@ async def start_polling(stop_event: asyncio.Event) -> None:
             if updates:
                 offset = updates[-1]["update_id"] + 1
 
-            db: Session = SessionLocal()
             try:
                 for update in updates:
-                    try:
-                        await _handle_update(update, db)
-                    except Exception as e:
-                        app_logger.error(f"Error handling update {update.get('update_id')}: {e}")
-            finally:
-                db.close()
+                    await dispatcher.submit(update)
+            except asyncio.CancelledError:
+                break
 
+    await dispatcher.drain(TELEGRAM_UPDATE_DRAIN_SECONDS)
     app_logger.info("Telegram polling stopped")
@@ -0,0 +1,166 @@
+"""Receiving bot updates through a webhook instead of long polling.
+
+Only one process may call getUpdates for a bot, so polling ties all bot
+traffic to a single replica. In webhook mode Telegram POSTs each update
+to `/telegram/webhook` on whichever replica the load balancer picks; the
+route checks the secret token, hands the update to this process's
+`UpdateDispatcher` (the same handlers, per-chat ordering and worker limit
+as polling) and acknowledges at once, before the handler runs.
+
+Telegram redelivers an update it didn't get a 2xx for, so updates are
+deduplicated by `update_id` over the last TELEGRAM_WEBHOOK_DEDUPE_SIZE
+seen by this process. A redelivery that lands on another replica isn't
+caught; the handlers are idempotent enough (re-registering a chat,
+re-sending a greeting) that this is acceptable. When the dispatcher's
+backlog is full the route answers 503 and Telegram retries later.
+
+Configured by environment variables:
+    TELEGRAM_UPDATES_MODE         "polling" (default), "webhook" or "off"
+                                  (e.g. for extra replicas while another
+                                  one polls)
+    TELEGRAM_WEBHOOK_SECRET       required in webhook mode; Telegram sends it
+                                  in X-Telegram-Bot-Api-Secret-Token
+    TELEGRAM_WEBHOOK_URL          public URL of the route; when set, the
+                                  webhook is registered with Telegram on
+                                  startup (setWebhook is idempotent)
+    TELEGRAM_WEBHOOK_DEDUPE_SIZE  update ids remembered (default 10000)
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+import hmac
+import os
+import threading
+from typing import Any
+
+from prometheus_client import Counter
+
+from app.core.logging import app_logger
+from app.services.telegram_bot import telegram_service
+from app.services.telegram_polling import (
+    ALLOWED_UPDATES,
+    TELEGRAM_UPDATE_DRAIN_SECONDS,
+    UpdateDispatcher,
+)
+
+
+POLLING = "polling"
+WEBHOOK = "webhook"
+OFF = "off"
+
+TELEGRAM_UPDATES_MODE = os.getenv("TELEGRAM_UPDATES_MODE", POLLING).strip().lower()
+TELEGRAM_WEBHOOK_SECRET = os.getenv("TELEGRAM_WEBHOOK_SECRET", "")
+TELEGRAM_WEBHOOK_URL = os.getenv("TELEGRAM_WEBHOOK_URL", "")
+TELEGRAM_WEBHOOK_DEDUPE_SIZE = int(os.getenv("TELEGRAM_WEBHOOK_DEDUPE_SIZE", "10000"))
+
+# Outcomes of `WebhookIngress.accept`.
+ACCEPTED = "accepted"
+DUPLICATE = "duplicate"
+BUSY = "busy"
+UNAVAILABLE = "unavailable"
+
+telegram_webhook_updates = Counter(
+    "telegram_webhook_updates_total",
+    "Updates POSTed to the Telegram webhook, by outcome",
+    ["outcome"],
+)
+
+
+class RecentUpdateIds:
+    """The last `max_size` update ids, oldest evicted first."""
+
+    def __init__(self, max_size: int = TELEGRAM_WEBHOOK_DEDUPE_SIZE):
+        """Start empty."""
+        self.max_size = max_size
+        self._ids: OrderedDict[int, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, update_id: int) -> bool:
+        """Remember `update_id`; False if it was already there."""
+        with self._lock:
+            if update_id in self._ids:
+                return False
+            self._ids[update_id] = None
+            if len(self._ids) > self.max_size:
+                self._ids.popitem(last=False)
+            return True
+
+    def discard(self, update_id: int) -> None:
+        with self._lock:
+            self._ids.pop(update_id, None)
+
+    def __len__(self) -> int:
+        """Number of remembered ids."""
+        return len(self._ids)
+
+
+def secret_matches(token: str | None) -> bool:
+    """Constant-time check of the webhook secret; never matches if none is set."""
+    if not TELEGRAM_WEBHOOK_SECRET or token is None:
+        return False
+    return hmac.compare_digest(token.encode(), TELEGRAM_WEBHOOK_SECRET.encode())
+
+
+class WebhookIngress:
+    """This process's dispatcher for webhook updates, with deduplication."""
+
+    def __init__(self) -> None:
+        """Idle until `start()`."""
+        self.dispatcher: UpdateDispatcher | None = None
+        self.recent = RecentUpdateIds()
+
+    async def start(self) -> None:
+        """Accept updates; register the webhook if TELEGRAM_WEBHOOK_URL is set."""
+        if not TELEGRAM_WEBHOOK_SECRET:
+            app_logger.error(
+                "TELEGRAM_UPDATES_MODE=webhook without TELEGRAM_WEBHOOK_SECRET; "
+                "every webhook request will be rejected"
+            )
+        self.dispatcher = UpdateDispatcher()
+        if TELEGRAM_WEBHOOK_URL:
+            try:
+                await register_webhook()
+            except Exception as e:
+                app_logger.error(f"setWebhook failed: {e}")
+        app_logger.info("Telegram webhook ingestion started")
+
+    async def stop(self) -> None:
+        """Stop accepting updates and wait for the accepted ones."""
+        dispatcher, self.dispatcher = self.dispatcher, None
+        if dispatcher is not None:
+            await dispatcher.drain(TELEGRAM_UPDATE_DRAIN_SECONDS)
+
+    async def accept(self, update: dict[str, Any]) -> str:
+        """Queue `update` for its handler; returns one of the outcome constants."""
+        dispatcher = self.dispatcher
+        if dispatcher is None:
+            outcome = UNAVAILABLE
+        else:
+            update_id = update.get("update_id")
+            if update_id is not None and not self.recent.add(update_id):
+                outcome = DUPLICATE
+            elif await dispatcher.try_submit(update):
+                outcome = ACCEPTED
+            else:
+                # Let Telegram's retry through once there's room.
+                if update_id is not None:
+                    self.recent.discard(update_id)
+                outcome = BUSY
+        telegram_webhook_updates.labels(outcome).inc()
+        return outcome
+
+
+ingress = WebhookIngress()
+
+
+async def register_webhook() -> None:
+    """Point the bot's webhook at TELEGRAM_WEBHOOK_URL with our secret."""
+    await telegram_service._call(
+        "setWebhook",
+        {
+            "url": TELEGRAM_WEBHOOK_URL,
+            "secret_token": TELEGRAM_WEBHOOK_SECRET,
+            "allowed_updates": ALLOWED_UPDATES,
+        },
+    )
+    app_logger.info("Telegram webhook registered")
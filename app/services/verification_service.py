@@ -7,6 +7,7 @@ import string
 
 from sqlalchemy.orm import Session
 
+from app.core.principal_cache import invalidate_principal
 from app.core.security import get_random_token
 from app.models.email_verification import EmailVerification
 from app.models.users import Alumni
@@ -103,6 +104,7 @@ def verify_by_token(db: Session, token: str) -> tuple[bool, str, Alumni | None]:
     record.verified_at = datetime.utcnow()
     record.verification_token = None  # invalidate
     db.commit()
+    invalidate_principal(alumni.email)
 
     return True, "Email verified successfully", alumni
 
@@ -178,6 +180,7 @@ def verify_code(db: Session, email: str, code: str) -> tuple[bool, str]:
     alumni.is_verified = True
     verification.verified_at = datetime.utcnow()
     db.commit()
+    invalidate_principal(alumni.email)
 
     return True, "Email verified successfully"
 
@@ -202,6 +205,7 @@ def admin_verify_user(db: Session, email: str) -> tuple[bool, str]:
         verification.verified_at = datetime.utcnow()
 
     db.commit()
+    invalidate_principal(email)
     return True, "User verified successfully"
 
 
@@ -272,4 +276,5 @@ def admin_unverify_user(db: Session, email: str) -> tuple[bool, str]:
         verification.verified_at = None
 
     db.commit()
+    invalidate_principal(email)
     return True, "User unverified successfully"
@@ -208,7 +208,7 @@ uploadEmailsForm.addEventListener("submit", async (e) => {
   const file = fileInput.files[0];
 
   if (!file) {
-    displayResult("Please select an Excel file", true);
+    displayResult("Please select a CSV or Excel file", true);
     return;
   }
 
@@ -233,12 +233,32 @@ uploadEmailsForm.addEventListener("submit", async (e) => {
       throw { response: { data } };
     }
 
-    displayResult(data);
+    displayResult(await waitForJob(data.job_id));
   } catch (error) {
     handleApiError(error);
   }
 });
 
+// Poll a background job until it finishes, showing its progress meanwhile
+async function waitForJob(jobId) {
+  for (;;) {
+    const response = await fetch(`${API_BASE_URL}/admin/jobs/${jobId}`, {
+      headers: { Authorization: `Bearer ${authToken}` },
+    });
+    const job = await response.json();
+
+    if (!response.ok || job.status === "failed") {
+      throw { response: { data: job } };
+    }
+    if (job.status === "succeeded") {
+      return job.result;
+    }
+
+    displayResult(job);
+    await new Promise((resolve) => setTimeout(resolve, 1000));
+  }
+}
+
 // ===== AUTHENTICATION HANDLERS =====
 
 // Verify Email Form
@@ -670,7 +690,7 @@ importAlumniForm.addEventListener("submit", async (e) => {
   const file = fileInput.files[0];
 
   if (!file) {
-    displayResult("Please select an Excel file", true);
+    displayResult("Please select a CSV or Excel file", true);
     return;
   }
 
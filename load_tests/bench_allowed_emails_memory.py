@@ -0,0 +1,147 @@
+"""Benchmark: peak memory of an allowed-emails upload, whole-file vs streamed.
+
+Writes synthetic .xlsx and .csv uploads of each --rows size, then imports
+each one in a fresh child process and reports how far the process' peak
+RSS rose above its RSS just before the import:
+
+    whole     what the route did before: the upload's bytes, parsed with
+              pandas in one go (`process_excel_file`; `pd.read_csv` for CSV)
+    streamed  `import_email_file`: chunks of ALLOWED_EMAILS_CHUNK_SIZE rows
+              from the file, each imported and committed before the next
+
+The database is a SQLite file in the temporary directory, so the
+imported rows don't count towards the process' memory.
+
+Usage:
+    python load_tests/bench_allowed_emails_memory.py
+    python load_tests/bench_allowed_emails_memory.py --rows 10000 1000000
+
+Peak RSS increase in MB, for 50k / 200k / 400k rows:
+
+             whole          streamed
+    .csv     26 / 81 / 158  12 / 11 / 11
+    .xlsx    26 / 94 / 187  14 / 29 / 48
+
+CSV stays flat. Streamed .xlsx still grows with the sheet, because
+read-only openpyxl loads the shared-string table (every distinct email)
+up front; the cells themselves are streamed.
+"""
+
+import argparse
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("SQLALCHEMY_DATABASE_URL", "sqlite://")
+os.environ.setdefault("EMAIL_HASH_SECRET", "bench-secret")
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger("bench_allowed_emails_memory")
+logging.getLogger("iu_alumni").setLevel(logging.WARNING)
+
+
+def _rss_kb() -> int:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def _write_files(directory: str, rows: int) -> tuple[str, str]:
+    import openpyxl
+
+    csv_path = os.path.join(directory, f"emails_{rows}.csv")
+    with open(csv_path, "w") as f:
+        f.write("email\n")
+        f.writelines(f"student.{i}@innopolis.university\n" for i in range(rows))
+
+    xlsx_path = os.path.join(directory, f"emails_{rows}.xlsx")
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(["email"])
+    for i in range(rows):
+        sheet.append([f"student.{i}@innopolis.university"])
+    workbook.save(xlsx_path)
+    return csv_path, xlsx_path
+
+
+def _child(mode: str, path: str, database: str) -> None:
+    """Import `path` into a fresh database; print the peak RSS increase in KB."""
+    from io import BytesIO
+
+    import pandas as pd
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from app.core.database import Base
+    from app.models.allowed_emails import AllowedEmail
+    from app.models.email_verification import EmailVerification  # noqa: F401
+    from app.services.email_hash_service import (
+        import_email_file,
+        import_emails,
+        process_excel_file,
+    )
+
+    engine = create_engine(f"sqlite:///{database}")
+    Base.metadata.create_all(engine, tables=[AllowedEmail.__table__])
+    db = Session(bind=engine)
+
+    baseline = _rss_kb()
+    if mode == "streamed":
+        with open(path, "rb") as f:
+            result = import_email_file(db, f, path)
+    else:
+        with open(path, "rb") as f:
+            content = f.read()
+        if path.endswith(".csv"):
+            result = import_emails(db, pd.read_csv(BytesIO(content)).iloc[:, 0])
+            db.commit()
+            result["success"] = True
+        else:
+            result = process_excel_file(db, content)
+    assert result["success"], result
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    sys.stdout.write(f"{max(peak - baseline, 0)}\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[50_000, 200_000, 400_000])
+    parser.add_argument("--child", nargs=3, metavar=("MODE", "PATH", "DB"))
+    args = parser.parse_args()
+
+    if args.child:
+        _child(*args.child)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        logger.info(f"{'rows':>8} {'file':>5} {'whole MB':>9} {'streamed MB':>12}")
+        for rows in args.rows:
+            for path in _write_files(directory, rows):
+                peaks = {}
+                for mode in ("whole", "streamed"):
+                    database = os.path.join(directory, f"{mode}.db")
+                    if os.path.exists(database):
+                        os.remove(database)
+                    out = subprocess.run(
+                        [sys.executable, __file__, "--child", mode, path, database],
+                        check=True,
+                        capture_output=True,
+                        text=True,
+                    ).stdout
+                    peaks[mode] = int(out.split()[-1]) / 1024
+                logger.info(
+                    f"{rows:>8} {os.path.splitext(path)[1]:>5} "
+                    f"{peaks['whole']:>9.0f} {peaks['streamed']:>12.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Benchmark: Local Legend ranking in SQL vs the old Python tally.
+
+Seeds a synthetic year of events inside a transaction, times the previous
+implementation (load every approved event, loop over participants in
+Python) against `_local_legend_ranking` (one grouped + windowed query),
+checks both pick the same winners, then rolls everything back.
+
+Usage:
+    python load_tests/bench_local_legend.py                        # in-memory SQLite
+    python load_tests/bench_local_legend.py --database-url postgresql+psycopg2://...
+
+Point --database-url at a scratch database, never production: the seed
+data is rolled back, but 50k inserts still load the server. The schema
+must already exist there (alembic upgrade head); SQLite gets it created.
+"""
+
+import argparse
+from datetime import datetime, timedelta
+import logging
+import os
+import random
+import sys
+import time
+import uuid
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("SQLALCHEMY_DATABASE_URL", "sqlite://")
+
+from sqlalchemy import JSON, create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.models.badge import Badge, UserBadge
+from app.models.email_verification import (
+    EmailVerification,  # noqa: F401 — needed for Alumni relationship resolution
+)
+from app.models.events import Event, EventParticipant
+from app.models.users import Alumni
+from app.services.badges import _local_legend_ranking
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger("bench_local_legend")
+
+
+def legacy_ranking(db: Session, year: int) -> list[tuple[str, str]]:
+    """The pre-SQL implementation's tally, minus the award step."""
+    events = (
+        db.query(Event)
+        .filter(
+            Event.approved.is_(True),
+            Event.datetime >= datetime(year, 1, 1),
+            Event.datetime < datetime(year + 1, 1, 1),
+            Event.location.isnot(None),
+        )
+        .order_by(Event.datetime.asc())
+        .all()
+    )
+    per_city: dict[str, dict[str, tuple[int, datetime]]] = {}
+    for e in events:
+        city = (e.location or "").strip().lower()
+        if not city:
+            continue
+        for alumni_id in e.participants_ids or []:
+            bucket = per_city.setdefault(city, {})
+            if alumni_id in bucket:
+                count, earliest = bucket[alumni_id]
+                bucket[alumni_id] = (count + 1, min(earliest, e.datetime))
+            else:
+                bucket[alumni_id] = (1, e.datetime)
+    return sorted(
+        (
+            city,
+            min(tally.items(), key=lambda kv: (-kv[1][0], kv[1][1], kv[0]))[0],
+        )
+        for city, tally in per_city.items()
+    )
+
+
+def _seed(db: Session, args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    alumni_ids = [f"bench-{i:06d}" for i in range(args.alumni)]
+    db.execute(
+        insert(Alumni),
+        [
+            {
+                "id": a,
+                "email": f"{a}@bench.invalid",
+                "first_name": "Bench",
+                "last_name": a,
+                "role": "alumni",
+                "is_telegram_verified": False,
+            }
+            for a in alumni_ids
+        ],
+    )
+    cities = [f"City {i}" for i in range(args.cities)]
+    start = datetime(args.year, 1, 1)
+    rows, participants = [], []
+    for _ in range(args.events):
+        city = rng.choice(cities)
+        event_id = uuid.uuid4().hex
+        participants.extend(
+            {"event_id": event_id, "alumni_id": a}
+            for a in rng.sample(alumni_ids, rng.randint(1, args.max_participants))
+        )
+        rows.append(
+            {
+                "id": event_id,
+                "owner_id": rng.choice(alumni_ids),
+                "title": "Bench",
+                "description": "",
+                # Vary case/whitespace like real input does.
+                "location": rng.choice((city, city.lower(), f" {city} ")),
+                "datetime": start + timedelta(minutes=rng.randrange(525_600)),
+                "cost": 0.0,
+                "is_online": False,
+                "approved": rng.random() < 0.9,
+            }
+        )
+    db.execute(insert(Event), rows)
+    db.execute(insert(EventParticipant), participants)
+    db.flush()
+
+
+def _best_of(repeats: int, fn) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database-url", default="sqlite://")
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--alumni", type=int, default=5_000)
+    parser.add_argument("--cities", type=int, default=40)
+    parser.add_argument("--max-participants", type=int, default=20)
+    parser.add_argument("--year", type=int, default=2025)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    if engine.dialect.name == "sqlite":
+        for table in (Badge.__table__, UserBadge.__table__):
+            for col in table.columns:
+                if col.type.__class__.__name__ in ("ARRAY", "JSONB"):
+                    col.type = JSON()
+        for table in (Alumni.__table__, Event.__table__, EventParticipant.__table__):
+            table.create(engine, checkfirst=True)
+
+    with engine.connect() as conn:
+        outer = conn.begin()
+        db = Session(bind=conn)
+        try:
+            started = time.perf_counter()
+            _seed(db, args)
+            logger.info(
+                "seeded %d events / %d alumni in %.1fs (%s)",
+                args.events,
+                args.alumni,
+                time.perf_counter() - started,
+                engine.dialect.name,
+            )
+
+            # The legacy tally reads ids through the `participations`
+            # relationship now, which costs one extra IN query per load.
+            legacy_s, legacy = _best_of(
+                args.repeats, lambda: (db.expunge_all(), legacy_ranking(db, args.year))[1]
+            )
+            sql_s, ranked = _best_of(
+                args.repeats, lambda: _local_legend_ranking(db, args.year)
+            )
+            if sorted(ranked) != legacy:
+                raise SystemExit("rankings differ between implementations")
+
+            logger.info("python tally : %8.1f ms", legacy_s * 1000)
+            logger.info("sql ranking  : %8.1f ms", sql_s * 1000)
+            logger.info("speed-up     : %8.1fx  (%d cities)", legacy_s / sql_s, len(ranked))
+        finally:
+            db.close()
+            outer.rollback()
+
+
+if __name__ == "__main__":
+    main()
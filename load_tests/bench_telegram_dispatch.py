@@ -0,0 +1,93 @@
+"""Benchmark: handling a getUpdates batch sequentially vs with UpdateDispatcher.
+
+Feeds the same synthetic batch (updates spread over a number of chats) to
+the old loop, which awaited each handler in turn, and to
+`UpdateDispatcher`. The handler just sleeps for --handler-ms, standing in
+for the Bot API round trips a real handler makes (`/leave_feedback` sends
+three polls in a row), so the numbers show scheduling, not Telegram.
+
+Usage:
+    python load_tests/bench_telegram_dispatch.py
+    python load_tests/bench_telegram_dispatch.py --updates 500 --chats 100 --handler-ms 150
+
+With the defaults (100 updates over 40 chats, 120 ms per update) the
+sequential loop takes ~12 s for the batch and the dispatcher ~1.2 s
+(bounded by the concurrency limit and by the busiest chat, whose updates
+still run one after another).
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from unittest.mock import MagicMock
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("SQLALCHEMY_DATABASE_URL", "sqlite://")
+
+from app.services.telegram_polling import UpdateDispatcher
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger("bench_telegram_dispatch")
+
+
+def _batch(args: argparse.Namespace) -> list[dict]:
+    rng = random.Random(args.seed)
+    return [
+        {
+            "update_id": i,
+            "message": {"text": "/start", "chat": {"id": rng.randrange(args.chats)}},
+        }
+        for i in range(args.updates)
+    ]
+
+
+async def _sequential(updates: list[dict], handler) -> float:
+    started = time.perf_counter()
+    db = MagicMock()
+    for update in updates:
+        await handler(update, db)
+    return time.perf_counter() - started
+
+
+async def _dispatched(updates: list[dict], handler, concurrency: int) -> float:
+    dispatcher = UpdateDispatcher(handler, MagicMock, concurrency=concurrency)
+    started = time.perf_counter()
+    for update in updates:
+        await dispatcher.submit(update)
+    await dispatcher.drain()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--updates", type=int, default=100)
+    parser.add_argument("--chats", type=int, default=40)
+    parser.add_argument("--handler-ms", type=float, default=120)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    async def handler(_update, _db):
+        await asyncio.sleep(args.handler_ms / 1000)
+
+    updates = _batch(args)
+    sequential = asyncio.run(_sequential(updates, handler))
+    dispatched = asyncio.run(_dispatched(updates, handler, args.concurrency))
+
+    logger.info(
+        "%d updates over %d chats, %.0f ms per handler, concurrency %d",
+        args.updates, args.chats, args.handler_ms, args.concurrency,
+    )
+    logger.info("sequential : %8.2f s  (%6.1f updates/s)", sequential, args.updates / sequential)
+    logger.info("dispatcher : %8.2f s  (%6.1f updates/s)", dispatched, args.updates / dispatched)
+    logger.info("speed-up   : %8.1fx", sequential / dispatched)
+
+
+if __name__ == "__main__":
+    main()
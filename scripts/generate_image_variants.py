@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Create the resized variants for covers/avatars stored before they existed.
+
+New uploads get their thumbnail/card/full variants at write time; rows
+written earlier have `*_variants` NULL and are served the original for
+every `?size=`. This fills them in. Safe to re-run: only rows still
+without variants are touched, and images Pillow can't read are skipped.
+
+Usage:
+    python scripts/generate_image_variants.py
+    python scripts/generate_image_variants.py --batch-size 50
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.image_store import get_image_store
+from app.core.images import TEXT, make_variants
+from app.models.email_verification import (
+    EmailVerification,  # noqa: F401 — needed for Alumni relationship resolution
+)
+from app.models.events import Event
+from app.models.projects import Project
+from app.models.users import Alumni
+
+
+load_dotenv(override=True)
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("generate_image_variants")
+
+_TARGETS = ((Event, "cover"), (Project, "cover"), (Alumni, "avatar"))
+
+
+def _session():
+    url = os.getenv("SQLALCHEMY_DATABASE_URL")
+    if not url:
+        raise RuntimeError("SQLALCHEMY_DATABASE_URL not set")
+    engine = create_engine(url)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+
+def backfill(db, model, column: str, batch_size: int) -> int:
+    digest_col = getattr(model, f"{column}_hash")
+    kind_col = getattr(model, f"{column}_type")
+    variants_col = getattr(model, f"{column}_variants")
+    store = get_image_store()
+
+    done = 0
+    last_id = ""
+    while True:
+        rows = (
+            db.query(model.id, digest_col)
+            .filter(
+                digest_col.isnot(None),
+                kind_col != TEXT,
+                variants_col.is_(None),
+                model.id > last_id,
+            )
+            .order_by(model.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return done
+        for row_id, digest in rows:
+            data = store.get(digest)
+            variants = make_variants(data) if data is not None else None
+            if variants is None:
+                logger.warning("%s %s: no variants (unreadable image)", model.__name__, row_id)
+                continue
+            db.query(model).filter(model.id == row_id).update(
+                {variants_col: variants}, synchronize_session=False
+            )
+            done += 1
+        db.commit()
+        last_id = rows[-1][0]
+        logger.info("%s.%s: %d rows done", model.__tablename__, column, done)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    db = _session()
+    try:
+        for model, column in _TARGETS:
+            backfill(db, model, column, args.batch_size)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Recompute the `badge_metrics` table from events and awarded badges.
+
+Incremental hooks keep the table current during normal operation; run this
+after the migration that creates it, after bulk data fixes, or whenever a
+counter is suspected to have drifted.
+
+Usage:
+    python scripts/rebuild_badge_metrics.py
+    python scripts/rebuild_badge_metrics.py --alumni-id abc --alumni-id def
+    python scripts/rebuild_badge_metrics.py --batch-size 1000
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.email_verification import (
+    EmailVerification,  # noqa: F401 — needed for Alumni relationship resolution
+)
+from app.services.badge_metrics import rebuild_badge_metrics
+
+
+load_dotenv(override=True)
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("badge_metrics_rebuild")
+
+
+def _session():
+    url = os.getenv("SQLALCHEMY_DATABASE_URL")
+    if not url:
+        raise RuntimeError("SQLALCHEMY_DATABASE_URL not set")
+    engine = create_engine(url)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--alumni-id",
+        action="append",
+        default=None,
+        help="Only rebuild this alumnus (repeatable; defaults to everyone)",
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    db = _session()
+    try:
+        rebuilt = rebuild_badge_metrics(
+            db, alumni_ids=args.alumni_id, batch_size=args.batch_size
+        )
+        logger.info("Badge metrics rebuild complete: %d alumni", rebuilt)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
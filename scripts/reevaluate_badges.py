@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Re-run badge rules for every alumnus in one set-based pass.
+
+Use after a catalog change (new badge, new threshold) or a data fix.
+Awards newly qualifying alumni and revokes revocable badges that no longer
+hold; see `bulk_evaluate` in app/services/badges.py for the details.
+
+Usage:
+    python scripts/reevaluate_badges.py --dry-run
+    python scripts/reevaluate_badges.py
+    python scripts/reevaluate_badges.py --badge networker --badge rainmaker
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.email_verification import (
+    EmailVerification,  # noqa: F401 — needed for Alumni relationship resolution
+)
+from app.services.badges import bulk_evaluate
+
+
+load_dotenv(override=True)
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("badge_reevaluate")
+
+
+def _session():
+    url = os.getenv("SQLALCHEMY_DATABASE_URL")
+    if not url:
+        raise RuntimeError("SQLALCHEMY_DATABASE_URL not set")
+    engine = create_engine(url)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--badge",
+        action="append",
+        default=None,
+        help="Badge code to re-evaluate (repeatable; defaults to the whole catalog)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would change without writing anything",
+    )
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    db = _session()
+    try:
+        summary = bulk_evaluate(
+            db,
+            badge_codes=args.badge,
+            dry_run=args.dry_run,
+            batch_size=args.batch_size,
+        )
+        for entry in summary["badges"]:
+            if entry.get("skipped"):
+                logger.info("%-24s skipped (%s)", entry["code"], entry["strategy"])
+            else:
+                logger.info(
+                    "%-24s qualifying=%d awarded=%d revoked=%d",
+                    entry["code"],
+                    entry["qualifying"],
+                    entry["awarded"],
+                    entry["revoked"],
+                )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -74,7 +74,6 @@ def _ensure_event(
         datetime=datetime.utcnow() - timedelta(days=days_ago),
         cost=0.0,
         is_online=False,
-        cover=None,
         approved=approved,
         participants_ids=participants_ids,
     )
@@ -9,6 +9,7 @@ Example crontab entry:
 
 import asyncio
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
 import os
 import sys
@@ -22,8 +23,10 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.models.events import Event
+from app.models.telegram import TelegramUser
 from app.models.users import Alumni
-from app.services.notification_service import NotificationService
+from app.services import outbox
+from app.services.telegram_bot import telegram_service
 
 
 # Load environment variables
@@ -36,15 +39,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def get_db_session():
-    """Create a database session"""
+@lru_cache(maxsize=1)
+def get_session_factory():
+    """Create the script's session factory (one engine per run)"""
     database_url = os.getenv("SQLALCHEMY_DATABASE_URL")
     if not database_url:
         raise ValueError("SQLALCHEMY_DATABASE_URL environment variable is not set")
 
     engine = create_engine(database_url)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    return SessionLocal()
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def get_db_session():
+    """Create a database session"""
+    return get_session_factory()()
 
 
 def send_reminders():
@@ -53,6 +61,22 @@ def send_reminders():
 
 
 async def _send_reminders_async():
+    queue_reminders()
+    # Deliver what's due now over the same pooled Bot API connections. The
+    # app's outbox workers deliver the same rows too, so whatever this run
+    # doesn't finish (or retries) still goes out.
+    async with telegram_service.session():
+        handled = await outbox.drain(get_session_factory())
+    logger.info(f"Delivered {handled} outbox messages")
+
+
+def queue_reminders():
+    """Write a reminder to the outbox for everyone in events starting in ~12 hours.
+
+    Each reminder has a dedupe key per (event, user), so overlapping or
+    repeated runs never queue one twice, and the outbox records what was
+    sent.
+    """
     db = get_db_session()
 
     try:
@@ -115,6 +139,15 @@ async def _send_reminders_async():
                     )
                     continue
 
+                tg_user = (
+                    db.query(TelegramUser)
+                    .filter(TelegramUser.alias == user.telegram_alias)
+                    .first()
+                )
+                if not tg_user:
+                    logger.info(f"{user.telegram_alias} has never messaged the bot")
+                    continue
+
                 # Format datetime for display
                 event_datetime_str = event.datetime.strftime("%Y-%m-%d %H:%M UTC")
 
@@ -124,16 +157,23 @@ async def _send_reminders_async():
                     f"📅 Time: {event_datetime_str}\n"
                     f"📍 Location: {location_text}"
                 )
-                await NotificationService.send_custom_notification(db, user.telegram_alias, message)
+                if outbox.telegram(
+                    db,
+                    tg_user.chat_id,
+                    message,
+                    dedupe_key=f"reminder:{event.id}:{user.id}",
+                ):
+                    logger.info(
+                        f"Queued reminder to {user.telegram_alias} for event '{event.title}'"
+                    )
 
-                logger.info(
-                    f"Sent reminder to {user.telegram_alias} for event '{event.title}'"
-                )
+            db.commit()
 
-        logger.info("Reminder sending completed")
+        logger.info("Reminder queueing completed")
 
     except Exception as e:
-        logger.error(f"Error sending reminders: {e}")
+        db.rollback()
+        logger.error(f"Error queueing reminders: {e}")
         raise
     finally:
         db.close()
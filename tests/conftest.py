@@ -1,6 +1,7 @@
 """Pytest configuration and shared fixtures for the test suite."""
 
 import os
+import tempfile
 
 
 # ---------------------------------------------------------------------------
@@ -13,6 +14,7 @@ _TEST_ENV = {
     "ADMIN_EMAIL": "admin@innopolis.university",
     "ADMIN_PASSWORD": "adminpassword123",
     "ENVIRONMENT": "TEST",
+    "IMAGE_STORE_PATH": tempfile.mkdtemp(prefix="iu-alumni-images-"),
 }
 for _key, _val in _TEST_ENV.items():
     os.environ[_key] = _val
@@ -54,16 +56,11 @@ def engine():
 def tables(engine):
     """Create all database tables with JSON instead of ARRAY for SQLite."""
     from app.models.badge import Badge, UserBadge
-    from app.models.events import Event
     from app.models.projects import Project
     from app.models.settings import Setting
     from app.models.telegram import Poll
 
     # Replace ARRAY with JSON for SQLite compatibility
-    for column in Event.__table__.columns:
-        if column.type.__class__.__name__ == "ARRAY":
-            column.type = JSON()
-
     for column in Project.__table__.columns:
         if column.type.__class__.__name__ == "ARRAY":
             column.type = JSON()
@@ -90,6 +87,25 @@ def tables(engine):
         table.drop(bind=engine, checkfirst=True)
 
 
+@pytest.fixture(autouse=True)
+def _clear_principal_cache():
+    """Each test builds its own users; never serve one test's user to another."""
+    from app.core.principal_cache import principal_cache
+
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_unread_count_cache():
+    from app.services.notifications import unread_count_cache
+
+    unread_count_cache.clear()
+    yield
+    unread_count_cache.clear()
+
+
 @pytest.fixture
 def db_session(engine, tables):
     """Create a test database session using a nested transaction."""
@@ -107,7 +123,35 @@ def db_session(engine, tables):
 
 
 @pytest.fixture
-def client(db_session):
+def job_runner(db_session, monkeypatch):
+    """Background jobs on the test's connection; call ``wait()`` before asserting."""
+    from app.services import jobs
+
+    runner = jobs.JobRunner(
+        sessionmaker(autocommit=False, autoflush=False, bind=db_session.bind), workers=1
+    )
+    monkeypatch.setattr(jobs, "runner", runner)
+    yield runner
+    runner.wait(10)
+    runner.shutdown()
+
+
+@pytest.fixture
+def async_db_session(db_session):
+    """An AsyncSession that proxies the test's sync ``db_session``.
+
+    Routes on ``get_async_db`` see exactly the rows a test seeded through
+    ``db_session`` (same connection, same rolled-back transaction). The
+    async API still goes through ``greenlet_spawn``; pysqlite simply never
+    yields control.
+    """
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    return AsyncSession(sync_session_class=lambda **_kwargs: db_session)
+
+
+@pytest.fixture
+def client(db_session, async_db_session):
     """Create a test client for FastAPI with overridden dependencies."""
     from fastapi import FastAPI
     from fastapi.routing import APIRouter
@@ -120,8 +164,9 @@ def client(db_session):
     from app.api.routes.notifications import router as notifications_router
     from app.api.routes.profile import router as profile_router
     from app.api.routes.projects import router as projects_router
+    from app.api.routes.stream import router as stream_router
     from app.api.routes.telegram import router as telegram_router
-    from app.core.database import get_db
+    from app.core.database import get_async_db, get_db
 
     app = FastAPI()
     api_v1 = APIRouter(prefix="/api/v1")
@@ -134,13 +179,18 @@ def client(db_session):
     api_v1.include_router(
         notifications_router, prefix="/notifications", tags=["Notifications"]
     )
+    api_v1.include_router(stream_router, tags=["Stream"])
     app.include_router(api_v1)
     app.include_router(telegram_router, tags=["Telegram"])
 
     def override_get_db():
         yield db_session
 
+    async def override_get_async_db():
+        yield async_db_session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
 
     with TestClient(app) as client:
         yield client
@@ -13,9 +13,10 @@ import uuid
 from fastapi import HTTPException
 import pytest
 
-from app.api.routes.admin.delete_alumni import delete_alumni
+from app.api.routes.admin.delete_alumni import delete_alumni, delete_alumni_data
 from app.models.email_verification import EmailVerification
 from app.models.events import Event
+from app.models.jobs import Job
 from app.models.login_code import LoginCode
 from app.models.password_reset_token import PasswordResetToken
 from app.models.projects import Project
@@ -53,7 +54,6 @@ def _event(owner_id: str, participants: list[str] | None = None) -> Event:
         datetime=_now(),
         cost=0.0,
         is_online=False,
-        cover=None,
         approved=True,
     )
 
@@ -65,7 +65,6 @@ def _project(owner_id: str, contributors: list[str] | None = None) -> Project:
         contributors_ids=contributors or [],
         title="Project",
         description="A project",
-        cover=None,
         approved=True,
     )
 
@@ -141,14 +140,29 @@ def test_missing_user_is_404(db_session):
 # ── deletion ─────────────────────────────────────────────────────────────────
 
 
-def test_delete_removes_the_account(db_session):
+def test_delete_runs_as_a_job(db_session, job_runner):
     victim = _alumni()
     db_session.add(victim)
     db_session.commit()
 
-    result = delete_alumni(alumni_id=victim.id, db=db_session, current_user=_admin())
+    victim_id = victim.id
+
+    accepted = delete_alumni(alumni_id=victim_id, db=db_session, current_user=_admin())
+    assert job_runner.wait(10)
+
+    db_session.expire_all()
+    job = db_session.get(Job, accepted["job_id"])
+    assert (job.kind, job.status) == ("delete-alumni", "succeeded")
+    assert job.result == {"message": "User deleted successfully"}
+    assert db_session.query(Alumni).filter_by(id=victim_id).first() is None
+
+
+def test_delete_removes_the_account(db_session):
+    victim = _alumni()
+    db_session.add(victim)
+    db_session.commit()
 
-    assert result["message"] == "User deleted successfully"
+    assert delete_alumni_data(db_session, victim.id) is True
     assert db_session.query(Alumni).filter_by(id=victim.id).first() is None
 
 
@@ -160,7 +174,7 @@ def test_delete_removes_owned_content(db_session):
     db_session.add(_project(victim.id))
     db_session.commit()
 
-    delete_alumni(alumni_id=victim.id, db=db_session, current_user=_admin())
+    delete_alumni_data(db_session, victim.id)
 
     assert db_session.query(Event).filter_by(owner_id=victim.id).count() == 0
     assert db_session.query(Project).filter_by(owner_id=victim.id).count() == 0
@@ -172,7 +186,7 @@ def test_delete_removes_auth_flow_rows(db_session):
     db_session.commit()
     _auth_rows(db_session, victim.id)
 
-    delete_alumni(alumni_id=victim.id, db=db_session, current_user=_admin())
+    delete_alumni_data(db_session, victim.id)
 
     # None of these tables cascade at the DB level, so leftovers would be
     # dangling rows pointing at an account that no longer exists.
@@ -191,7 +205,7 @@ def test_delete_strips_id_from_other_peoples_events(db_session):
     db_session.add(event)
     db_session.commit()
 
-    delete_alumni(alumni_id=victim.id, db=db_session, current_user=_admin())
+    delete_alumni_data(db_session, victim.id)
 
     db_session.refresh(event)
     # The other member's event survives, minus the deleted participant.
@@ -208,7 +222,7 @@ def test_delete_strips_id_from_other_peoples_projects(db_session):
     db_session.add(project)
     db_session.commit()
 
-    delete_alumni(alumni_id=victim.id, db=db_session, current_user=_admin())
+    delete_alumni_data(db_session, victim.id)
 
     db_session.refresh(project)
     assert db_session.query(Project).filter_by(id=project.id).first() is not None
@@ -226,7 +240,7 @@ def test_delete_leaves_unrelated_members_untouched(db_session):
     db_session.commit()
     _auth_rows(db_session, bystander.id)
 
-    delete_alumni(alumni_id=victim.id, db=db_session, current_user=_admin())
+    delete_alumni_data(db_session, victim.id)
 
     # Deleting one account must not touch anyone else's account, content or
     # auth-flow rows.
@@ -44,7 +44,6 @@ def _event(owner_id: str, *, approved: bool | None = None) -> Event:
         datetime=datetime.now(UTC).replace(tzinfo=None),
         cost=0.0,
         is_online=False,
-        cover=None,
         approved=approved,
     )
 
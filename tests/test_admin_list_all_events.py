@@ -47,7 +47,6 @@ def _event(owner_id: str, event_id: str, *, title: str = "Meetup", when=None) ->
         datetime=when or _now(),
         cost=0.0,
         is_online=False,
-        cover=None,
         approved=True,
     )
 
@@ -50,7 +50,6 @@ def _project(
         contributors_ids=[],
         title=title,
         description="A project",
-        cover=None,
         approved=approved,
         created_at=created or _now(),
     )
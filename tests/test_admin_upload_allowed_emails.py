@@ -1,17 +1,21 @@
 """Tests for uploading the allowed-emails list.
 
 This list gates who may register at all, so the route is admin-only and must
-reject anything that isn't a spreadsheet before handing bytes to the parser.
+reject anything that isn't a CSV or spreadsheet before handing it to the parser.
 """
 
 import io
+import tempfile
+import threading
 import uuid
 
 from fastapi import HTTPException, UploadFile
 import pytest
 
 from app.api.routes.admin.upload_allowed_emails import upload_allowed_emails
+from app.models.jobs import Job
 from app.models.users import Admin, Alumni
+from app.services.jobs import JobQueueFullError
 
 
 def _admin() -> Admin:
@@ -33,11 +37,18 @@ def _upload(filename: str, content: bytes = b"binary-xlsx") -> UploadFile:
     return UploadFile(filename=filename, file=io.BytesIO(content))
 
 
+ROUTE = "app.api.routes.admin.upload_allowed_emails"
+
+
+def _job(db_session, job_id: str) -> Job:
+    db_session.expire_all()
+    return db_session.get(Job, job_id)
+
+
 @pytest.mark.asyncio
 async def test_non_admin_cannot_upload(db_session, mocker):
-    process = mocker.patch(
-        "app.api.routes.admin.upload_allowed_emails.process_excel_file"
-    )
+    stream = mocker.patch(f"{ROUTE}.import_email_file")
+    process = mocker.patch(f"{ROUTE}.process_excel_file")
 
     with pytest.raises(HTTPException) as exc:
         await upload_allowed_emails(
@@ -46,15 +57,15 @@ async def test_non_admin_cannot_upload(db_session, mocker):
 
     assert exc.value.status_code == 403
     # Rejected before the file is even parsed.
+    stream.assert_not_called()
     process.assert_not_called()
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("filename", ["emails.csv", "emails.txt", "payload.exe", "emails"])
-async def test_rejects_non_excel_files(db_session, mocker, filename):
-    process = mocker.patch(
-        "app.api.routes.admin.upload_allowed_emails.process_excel_file"
-    )
+@pytest.mark.parametrize("filename", ["emails.txt", "payload.exe", "emails"])
+async def test_rejects_unsupported_files(db_session, mocker, filename):
+    stream = mocker.patch(f"{ROUTE}.import_email_file")
+    process = mocker.patch(f"{ROUTE}.process_excel_file")
 
     with pytest.raises(HTTPException) as exc:
         await upload_allowed_emails(
@@ -62,52 +73,110 @@ async def test_rejects_non_excel_files(db_session, mocker, filename):
         )
 
     assert exc.value.status_code == 400
+    stream.assert_not_called()
     process.assert_not_called()
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("filename", ["emails.xlsx", "emails.xls"])
-async def test_accepts_excel_extensions(db_session, mocker, filename):
-    mocker.patch(
-        "app.api.routes.admin.upload_allowed_emails.process_excel_file",
-        return_value={"success": True, "message": "3 emails imported"},
-    )
+@pytest.mark.parametrize("filename", ["emails.csv", "emails.xlsx", "EMAILS.XLSX"])
+async def test_streams_csv_and_xlsx_in_a_job(db_session, job_runner, mocker, filename):
+    seen = {}
 
-    result = await upload_allowed_emails(
-        file=_upload(filename), current_user=_admin(), db=db_session
-    )
+    def stream(_db, f, name, progress):
+        seen.update(content=f.read(), name=name, progress=progress)
+        return {"success": True, "message": "3 emails imported", "added": 3}
+
+    mocker.patch(f"{ROUTE}.import_email_file", side_effect=stream)
+    process = mocker.patch(f"{ROUTE}.process_excel_file")
 
-    assert result["success"] is True
+    accepted = await upload_allowed_emails(
+        file=_upload(filename, b"spreadsheet-bytes"), current_user=_admin(), db=db_session
+    )
+    assert accepted["status"] == "queued"
+    assert job_runner.wait(10)
+
+    job = _job(db_session, accepted["job_id"])
+    assert (job.kind, job.status) == ("upload-allowed-emails", "succeeded")
+    assert job.result["added"] == 3
+    # The job streams its own copy of the upload, which it then removes.
+    assert (seen["content"], seen["name"]) == (b"spreadsheet-bytes", filename)
+    assert callable(seen["progress"])
+    process.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_passes_file_bytes_to_the_parser(db_session, mocker):
+async def test_passes_xls_bytes_to_the_parser(db_session, job_runner, mocker):
     process = mocker.patch(
-        "app.api.routes.admin.upload_allowed_emails.process_excel_file",
+        f"{ROUTE}.process_excel_file",
         return_value={"success": True, "message": "ok"},
     )
 
     await upload_allowed_emails(
-        file=_upload("emails.xlsx", b"spreadsheet-bytes"),
+        file=_upload("emails.xls", b"spreadsheet-bytes"),
         current_user=_admin(),
         db=db_session,
     )
+    assert job_runner.wait(10)
 
     assert process.call_args.args[1] == b"spreadsheet-bytes"
 
 
 @pytest.mark.asyncio
-async def test_parser_failure_becomes_400(db_session, mocker):
+async def test_parser_failure_fails_the_job(db_session, job_runner, mocker):
     mocker.patch(
-        "app.api.routes.admin.upload_allowed_emails.process_excel_file",
+        f"{ROUTE}.import_email_file",
         return_value={"success": False, "message": "First column must contain emails"},
     )
 
+    accepted = await upload_allowed_emails(
+        file=_upload("emails.xlsx"), current_user=_admin(), db=db_session
+    )
+    assert job_runner.wait(10)
+
+    job = _job(db_session, accepted["job_id"])
+    assert job.status == "failed"
+    # The parser's reason is surfaced so the admin can fix the sheet.
+    assert job.error == "First column must contain emails"
+
+
+@pytest.mark.asyncio
+async def test_copy_is_removed_when_the_job_is_cancelled(
+    db_session, job_runner, mocker, monkeypatch, tmp_path
+):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    stream = mocker.patch(f"{ROUTE}.import_email_file")
+    started, release = threading.Event(), threading.Event()
+
+    def busy(_db, _progress):
+        started.set()
+        release.wait(10)
+
+    job_runner.submit(db_session, "test", busy)
+    assert started.wait(10)
+    accepted = await upload_allowed_emails(
+        file=_upload("emails.csv"), current_user=_admin(), db=db_session
+    )
+    assert len(list(tmp_path.iterdir())) == 1
+
+    job_runner.shutdown()
+    release.set()
+    assert job_runner.wait(10)
+
+    assert _job(db_session, accepted["job_id"]).status == "failed"
+    stream.assert_not_called()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_full_job_queue_is_503(db_session, mocker):
+    mocker.patch(
+        "app.services.jobs.runner.submit",
+        side_effect=JobQueueFullError("Too many background jobs; try again later"),
+    )
+
     with pytest.raises(HTTPException) as exc:
         await upload_allowed_emails(
-            file=_upload("emails.xlsx"), current_user=_admin(), db=db_session
+            file=_upload("emails.csv"), current_user=_admin(), db=db_session
         )
 
-    assert exc.value.status_code == 400
-    # The parser's reason is surfaced so the admin can fix the sheet.
-    assert exc.value.detail == "First column must contain emails"
+    assert exc.value.status_code == 503
@@ -105,7 +105,6 @@ class TestAdminVerifyRoleOverride:
         with pytest.raises(HTTPException) as exc:
             await admin_verify_user_route(
                 request=AdminVerifyRequest(email=alice.email),
-                background_tasks=_BgTasksStub(),
                 db=db_session,
                 current_user=alice,
             )
@@ -118,7 +117,6 @@ class TestAdminVerifyRoleOverride:
         db_session.commit()
         await admin_verify_user_route(
             request=AdminVerifyRequest(email=alice.email, role="alumni_friend"),
-            background_tasks=_BgTasksStub(),
             db=db_session,
             current_user=_admin(),
         )
@@ -133,7 +131,6 @@ class TestAdminVerifyRoleOverride:
         db_session.commit()
         await admin_verify_user_route(
             request=AdminVerifyRequest(email=alice.email),
-            background_tasks=_BgTasksStub(),
             db=db_session,
             current_user=_admin(),
         )
@@ -172,11 +169,3 @@ class TestProfileUpdateIgnoresFriendYear:
         )
         db_session.refresh(alice)
         assert alice.graduation_year == "2024"
-
-
-class _BgTasksStub:
-    """Stand-in for FastAPI's BackgroundTasks — we don't care about the
-    email side-effect in these tests."""
-
-    def add_task(self, *args, **kwargs):  # noqa: ARG002 — stub signature match
-        return None
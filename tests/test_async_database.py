@@ -0,0 +1,126 @@
+"""Tests for the async database layer and the read endpoints moved onto it."""
+
+from datetime import datetime
+
+from fastapi import HTTPException
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routes.cities.search_cities import get_coordinates, search_cities
+from app.api.routes.events.list_event_participants import list_event_participants
+from app.core.database import _async_database_url
+from app.models.cities import City
+from app.models.events import Event
+from app.models.users import Alumni
+
+
+def _alumni(alumni_id: str) -> Alumni:
+    return Alumni(
+        id=alumni_id,
+        email=f"{alumni_id}@innopolis.university",
+        first_name=alumni_id.title(),
+        last_name="Async",
+        graduation_year="2024",
+        show_location=False,
+        is_verified=True,
+        is_banned=False,
+    )
+
+
+@pytest.mark.parametrize(
+    ("sync_url", "async_url"),
+    [
+        (
+            "postgresql://u:p@postgres:5432/alumni",
+            "postgresql+asyncpg://u:p@postgres:5432/alumni",
+        ),
+        (
+            "postgresql+psycopg2://u:p@postgres/alumni",
+            "postgresql+asyncpg://u:p@postgres/alumni",
+        ),
+        ("sqlite:///:memory:", "sqlite+aiosqlite:///:memory:"),
+    ],
+)
+def test_async_url_swaps_driver_and_keeps_credentials(sync_url, async_url):
+    assert _async_database_url(sync_url) == make_url(async_url)
+
+
+def test_async_url_rejects_unknown_backend():
+    with pytest.raises(RuntimeError):
+        _async_database_url("mysql://u:p@db/alumni")
+
+
+@pytest.mark.asyncio
+async def test_real_async_engine_round_trip():
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(_async_database_url("sqlite:///:memory:"))
+    try:
+        async with AsyncSession(engine) as session:
+            assert await session.scalar(text("SELECT 1")) == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_list_event_participants(db_session, async_db_session):
+    owner, guest = _alumni("owner"), _alumni("guest")
+    db_session.add_all([owner, guest, _alumni("stranger")])
+    db_session.add(
+        Event(
+            id="async-event",
+            owner_id=owner.id,
+            participants_ids=[owner.id, guest.id],
+            title="Async meetup",
+            description="d",
+            location="Russia, Kazan",
+            datetime=datetime(2026, 5, 1, 18, 0),
+            cost=0,
+            is_online=False,
+            approved=True,
+        )
+    )
+    db_session.commit()
+
+    participants = await list_event_participants(
+        event_id="async-event", db=async_db_session, current_user=guest
+    )
+
+    assert sorted(p.id for p in participants) == ["guest", "owner"]
+
+
+@pytest.mark.asyncio
+async def test_list_event_participants_unknown_event(db_session, async_db_session):
+    user = _alumni("owner")
+    with pytest.raises(HTTPException) as exc_info:
+        await list_event_participants(
+            event_id="missing", db=async_db_session, current_user=user
+        )
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_search_cities_and_coordinates(db_session, async_db_session):
+    db_session.add_all(
+        [
+            City(city="Kazan", country="Russia", lat=55.79, lng=49.12),
+            City(city="Kaliningrad", country="Russia", lat=54.71, lng=20.51),
+            City(city="Innopolis", country="Russia", lat=55.75, lng=48.74),
+        ]
+    )
+    db_session.commit()
+    user = _alumni("searcher")
+
+    found = await search_cities(q="ka", limit=10, db=async_db_session, current_user=user)
+    coords = await get_coordinates(
+        city="kazan", country="russia", db=async_db_session, current_user=user
+    )
+    missing = await get_coordinates(
+        city="Atlantis", country="Nowhere", db=async_db_session, current_user=user
+    )
+
+    assert sorted(c.city for c in found.cities) == ["Kaliningrad", "Kazan"]
+    assert (coords.lat, coords.lng) == (55.79, 49.12)
+    assert missing is None
@@ -0,0 +1,302 @@
+"""Tests for the incremental `badge_metrics` table.
+
+Same SQLite setup as test_badges.py: badge tables get their JSONB/ARRAY
+columns swapped for JSON and are created by a local fixture, and the
+from-scratch helpers are monkey-patched where a test needs exact values.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+import uuid
+
+import pytest
+from sqlalchemy import JSON, update
+
+from app.models.badge import Badge, BadgeMetrics, UserBadge
+from app.models.email_verification import (
+    EmailVerification,  # noqa: F401 — needed for Alumni relationship resolution
+)
+from app.models.events import Event
+from app.models.users import Alumni
+from app.services import badge_metrics, badges as service
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_badge_columns_for_sqlite():
+    for col in Badge.__table__.columns:
+        if col.type.__class__.__name__ in ("JSONB", "ARRAY"):
+            col.type = JSON()
+    for col in UserBadge.__table__.columns:
+        if col.type.__class__.__name__ in ("JSONB",):
+            col.type = JSON()
+
+
+@pytest.fixture
+def db(db_session, engine):
+    Badge.__table__.create(bind=engine, checkfirst=True)
+    UserBadge.__table__.create(bind=engine, checkfirst=True)
+    yield db_session
+    db_session.expire_all()
+
+
+def _mk_alumni(db, **kwargs) -> Alumni:
+    defaults = {
+        "id": str(uuid.uuid4()),
+        "email": f"{uuid.uuid4().hex[:8]}@innopolis.university",
+        "first_name": "Test",
+        "last_name": "User",
+        "graduation_year": "2018",
+        "location": None,
+        "show_location": False,
+        "is_verified": True,
+        "is_banned": False,
+    }
+    defaults.update(kwargs)
+    a = Alumni(**defaults)
+    db.add(a)
+    db.flush()
+    return a
+
+
+def _mk_event(db, owner, participants, location="Kazan") -> Event:
+    e = Event(
+        id=str(uuid.uuid4()),
+        owner_id=owner.id,
+        participants_ids=[p.id for p in participants],
+        title="Meetup",
+        description="d",
+        location=location,
+        datetime=datetime(2026, 5, 1, 18, 0),
+        cost=0,
+        is_online=False,
+        approved=True,
+    )
+    db.add(e)
+    db.flush()
+    return e
+
+
+def _mk_badge(db, code="networker") -> Badge:
+    b = Badge(
+        id=str(uuid.uuid4()),
+        code=code,
+        name=code.title(),
+        description="",
+        tier="bronze",
+        icon_key="star",
+        strategy="count_threshold",
+        params={"metric": "events_attended", "threshold": 1},
+        trigger_metrics=[],
+    )
+    db.add(b)
+    db.flush()
+    return b
+
+
+def _seed(db, alumni, **values) -> BadgeMetrics:
+    row = BadgeMetrics(alumni_id=alumni.id, **values)
+    db.add(row)
+    db.flush()
+    return row
+
+
+class TestLazyRead:
+    def test_unknown_metric_is_computed_once_and_stored(self, db, monkeypatch):
+        calls = []
+
+        def fake_count(_db, alumni_id):
+            calls.append(alumni_id)
+            return 4
+
+        monkeypatch.setattr(service, "_events_attended_count", fake_count)
+        alumni = _mk_alumni(db)
+
+        assert service._metric(db, alumni, "events_attended") == 4
+        assert service._metric(db, alumni, "events_attended") == 4
+        assert len(calls) == 1
+        assert db.get(BadgeMetrics, alumni.id).events_attended == 4
+
+    def test_stored_value_wins_over_source_tables(self, db, monkeypatch):
+        monkeypatch.setattr(
+            service, "_events_attended_count", lambda *_: pytest.fail("rescanned")
+        )
+        alumni = _mk_alumni(db)
+        _seed(db, alumni, events_attended=7)
+
+        assert service._metric(db, alumni, "events_attended") == 7
+
+    def test_row_created_meanwhile_by_another_request_is_reused(self, db, monkeypatch):
+        alumni = _mk_alumni(db)
+        _seed(db, alumni, events_attended=7)
+        db.expunge_all()
+        # This request looked first and saw no row; the other one inserted it.
+        real_get = db.get
+        calls = []
+
+        def get(*args, **kwargs):
+            calls.append(args)
+            return None if len(calls) == 1 else real_get(*args, **kwargs)
+
+        monkeypatch.setattr(db, "get", get)
+
+        assert service._metrics_row(db, alumni).events_attended == 7
+
+    def test_fill_rereads_the_row_under_a_lock(self, db, monkeypatch):
+        monkeypatch.setattr(
+            service, "_events_attended_count", lambda *_: pytest.fail("recounted")
+        )
+        alumni = _mk_alumni(db)
+        _seed(db, alumni)
+        real_metrics_row = service._metrics_row
+
+        def metrics_row(db_, alumni_, *, lock=False):
+            if lock:
+                # Another request stored the value while we weren't holding the row.
+                db_.execute(
+                    update(BadgeMetrics)
+                    .where(BadgeMetrics.alumni_id == alumni_.id)
+                    .values(events_attended=5)
+                )
+            return real_metrics_row(db_, alumni_, lock=lock)
+
+        monkeypatch.setattr(service, "_metrics_row", metrics_row)
+
+        assert service._metric(db, alumni, "events_attended") == 5
+
+    def test_prefetch_leaves_the_callers_transaction_alone(self, db, monkeypatch):
+        alumni = _mk_alumni(db)
+        _mk_event(db, _mk_alumni(db), [alumni])
+        badge = _mk_badge(db)
+        monkeypatch.setattr(db, "commit", lambda: pytest.fail("committed"))
+        monkeypatch.setattr(db, "rollback", lambda: pytest.fail("rolled back"))
+
+        inputs = service._progress_inputs(db, alumni, [badge])
+        assert inputs["metrics"].events_attended == 1
+
+    def test_failed_prefetch_keeps_the_callers_pending_changes(
+        self, db, monkeypatch, caplog
+    ):
+        def broken(*_):
+            raise RuntimeError("stats down")
+
+        monkeypatch.setattr(
+            service, "_METRIC_GROUPS", ((("events_attended",), broken),)
+        )
+        monkeypatch.setattr(service, "_events_attended_count", broken)
+        alumni = _mk_alumni(db)
+        badge = _mk_badge(db)
+        badge.trigger_metrics = ["event_attended"]
+        db.flush()
+
+        assert service.evaluate_for_user(db, alumni, "event_attended") == []
+        assert "prefetch failed" in caplog.text
+        # Still flushed in the caller's transaction, not rolled back.
+        assert alumni in db
+        assert db.get(Alumni, alumni.id) is alumni
+
+
+class TestHooks:
+    def test_join_increments_known_counters(self, db):
+        owner = _mk_alumni(db)
+        guest = _mk_alumni(db, location="Moscow")
+        _seed(db, guest, events_attended=2, cross_city_attendances=0)
+        _seed(db, owner, max_attendees_on_owned=1)
+        event = _mk_event(db, owner, [owner, guest], location="Kazan")
+
+        badge_metrics.participant_joined(db, event, guest)
+
+        assert db.get(BadgeMetrics, guest.id).events_attended == 3
+        assert db.get(BadgeMetrics, guest.id).cross_city_attendances == 1
+        assert db.get(BadgeMetrics, owner.id).max_attendees_on_owned == 2
+
+    def test_join_in_home_city_is_not_cross_city(self, db):
+        owner = _mk_alumni(db)
+        guest = _mk_alumni(db, location=" kazan ")
+        _seed(db, guest, events_attended=0, cross_city_attendances=0)
+        event = _mk_event(db, owner, [owner, guest], location="Kazan")
+
+        badge_metrics.participant_joined(db, event, guest)
+
+        assert db.get(BadgeMetrics, guest.id).cross_city_attendances == 0
+
+    def test_unknown_stays_unknown_and_missing_row_is_noop(self, db):
+        owner = _mk_alumni(db)
+        guest = _mk_alumni(db)
+        _seed(db, guest)
+        event = _mk_event(db, owner, [owner, guest])
+
+        badge_metrics.participant_joined(db, event, guest)
+
+        assert db.get(BadgeMetrics, guest.id).events_attended is None
+        assert db.get(BadgeMetrics, owner.id) is None
+
+    def test_leave_decrements_and_resets_owner_max(self, db):
+        owner = _mk_alumni(db)
+        guest = _mk_alumni(db)
+        _seed(db, guest, events_attended=3)
+        _seed(db, owner, max_attendees_on_owned=5, distinct_cities_hosted=2)
+        event = _mk_event(db, owner, [owner])
+
+        badge_metrics.participant_left(db, event, guest)
+
+        assert db.get(BadgeMetrics, guest.id).events_attended == 2
+        owner_row = db.get(BadgeMetrics, owner.id)
+        assert owner_row.max_attendees_on_owned is None
+        assert owner_row.distinct_cities_hosted == 2
+
+    def test_event_deleted_updates_participants_and_owner(self, db):
+        owner = _mk_alumni(db)
+        guest = _mk_alumni(db)
+        _seed(db, guest, events_attended=1, cross_city_attendances=1)
+        _seed(db, owner, max_attendees_on_owned=2, distinct_cities_hosted=1)
+        event = _mk_event(db, owner, [owner, guest])
+
+        badge_metrics.event_deleted(db, event)
+
+        guest_row = db.get(BadgeMetrics, guest.id)
+        assert guest_row.events_attended == 0
+        assert guest_row.cross_city_attendances is None
+        owner_row = db.get(BadgeMetrics, owner.id)
+        assert owner_row.max_attendees_on_owned is None
+        assert owner_row.distinct_cities_hosted is None
+
+
+class TestBadgeCount:
+    def test_award_and_manual_revoke_track_badge_count(self, db):
+        alumni = _mk_alumni(db)
+        _seed(db, alumni, badge_count=0)
+        badge = _mk_badge(db)
+
+        assert service._award(db, alumni.id, badge) is not None
+        assert db.get(BadgeMetrics, alumni.id).badge_count == 1
+
+        service.manual_revoke(db, alumni, badge.code)
+        assert db.get(BadgeMetrics, alumni.id).badge_count == 0
+
+
+class TestRebuild:
+    def test_rebuild_recomputes_every_metric(self, db, monkeypatch):
+        monkeypatch.setattr(service, "_events_attended_count", lambda *_: 6)
+        monkeypatch.setattr(service, "_max_attendees_on_owned", lambda *_: 9)
+        monkeypatch.setattr(service, "_cross_city_attendances", lambda *_: 2)
+        monkeypatch.setattr(service, "_distinct_cities_hosted", lambda *_: 3)
+        stale = _mk_alumni(db)
+        fresh = _mk_alumni(db)
+        _seed(db, stale, events_attended=100)
+        seen = []
+
+        rebuilt = badge_metrics.rebuild_badge_metrics(
+            db, batch_size=1, progress=lambda done, total: seen.append((done, total))
+        )
+
+        assert rebuilt == 2
+        assert seen == [(1, 2), (2, 2)]
+        for alumni in (stale, fresh):
+            row = db.get(BadgeMetrics, alumni.id)
+            assert (
+                row.events_attended,
+                row.max_attendees_on_owned,
+                row.cross_city_attendances,
+                row.distinct_cities_hosted,
+                row.badge_count,
+            ) == (6, 9, 2, 3, 0)
@@ -1,8 +1,6 @@
-"""Tests for best-effort Telegram badge notifications."""
+"""Tests for queueing best-effort Telegram badge notifications."""
 
-from unittest.mock import AsyncMock, MagicMock
-
-import pytest
+from unittest.mock import MagicMock
 
 from app.models.users import Alumni
 from app.services.badge_notifications import notify_badge_awards
@@ -21,25 +19,23 @@ def _alumni(*, verified: bool = True, alias: str | None = "ada") -> Alumni:
     )
 
 
-@pytest.mark.asyncio
-async def test_notification_is_a_noop_without_awards_or_verified_alias():
+def test_notification_is_a_noop_without_awards_or_verified_alias():
     db = MagicMock()
 
-    await notify_badge_awards(db, _alumni(), [])
-    await notify_badge_awards(db, _alumni(verified=False), ["founding_host"])
-    await notify_badge_awards(db, _alumni(alias=None), ["founding_host"])
+    notify_badge_awards(db, _alumni(), [])
+    notify_badge_awards(db, _alumni(verified=False), ["founding_host"])
+    notify_badge_awards(db, _alumni(alias=None), ["founding_host"])
 
     db.query.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_notification_is_a_noop_when_bot_chat_or_badge_is_missing():
+def test_notification_is_a_noop_when_bot_chat_or_badge_is_missing():
     db = MagicMock()
     telegram_query = MagicMock()
     telegram_query.filter.return_value.first.return_value = None
     db.query.return_value = telegram_query
 
-    await notify_badge_awards(db, _alumni(), ["founding_host"])
+    notify_badge_awards(db, _alumni(), ["founding_host"])
 
     db.query.assert_called_once()
 
@@ -48,11 +44,10 @@ async def test_notification_is_a_noop_when_bot_chat_or_badge_is_missing():
     badge_query = MagicMock()
     badge_query.filter.return_value.all.return_value = []
     db.query.side_effect = [telegram_query, badge_query]
-    await notify_badge_awards(db, _alumni(), ["founding_host"])
+    notify_badge_awards(db, _alumni(), ["founding_host"])
 
 
-@pytest.mark.asyncio
-async def test_notification_sends_one_message_for_all_awards(mocker):
+def test_notification_sends_one_message_for_all_awards(mocker):
     db = MagicMock()
     telegram_query = MagicMock()
     telegram_query.filter.return_value.first.return_value = MagicMock(chat_id=42)
@@ -62,20 +57,20 @@ async def test_notification_sends_one_message_for_all_awards(mocker):
         MagicMock(name="Open Source Contributor"),
     ]
     db.query.side_effect = [telegram_query, badge_query]
-    send = mocker.patch(
-        "app.services.badge_notifications.telegram_service.send_message",
-        new_callable=AsyncMock,
-    )
+    queue = mocker.patch("app.services.badge_notifications.outbox.telegram")
 
-    await notify_badge_awards(db, _alumni(), ["founding_host", "open_source"])
+    notify_badge_awards(db, _alumni(), ["founding_host", "open_source"])
 
-    send.assert_awaited_once()
-    assert send.call_args.kwargs["chat_id"] == 42
-    assert "Founding Host" in send.call_args.kwargs["text"]
+    queue.assert_called_once()
+    _db, chat_id, text = queue.call_args.args
+    assert chat_id == 42
+    assert "Founding Host" in text
+    # Queued in the caller's transaction, which commits it with the awards.
+    db.begin_nested.assert_called_once()
+    db.commit.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_notification_swallows_telegram_failures(mocker):
+def test_notification_swallows_telegram_failures(mocker):
     db = MagicMock()
     telegram_query = MagicMock()
     telegram_query.filter.return_value.first.return_value = MagicMock(chat_id=42)
@@ -83,9 +78,12 @@ async def test_notification_swallows_telegram_failures(mocker):
     badge_query.filter.return_value.all.return_value = [MagicMock(name="Founding Host")]
     db.query.side_effect = [telegram_query, badge_query]
     mocker.patch(
-        "app.services.badge_notifications.telegram_service.send_message",
-        new_callable=AsyncMock,
-        side_effect=RuntimeError("Telegram unavailable"),
+        "app.services.badge_notifications.outbox.telegram",
+        side_effect=RuntimeError("database unavailable"),
     )
 
-    await notify_badge_awards(db, _alumni(), ["founding_host"])
+    notify_badge_awards(db, _alumni(), ["founding_host"])
+
+    # Only the SAVEPOINT is undone; the caller's awards are left alone.
+    db.begin_nested.return_value.__exit__.assert_called_once()
+    db.rollback.assert_not_called()
@@ -7,9 +7,8 @@ cron lives in another branch and is tracked separately.
 The badges tables use JSONB + Postgres ARRAY in production. The shared
 conftest excludes them from the in-memory SQLite schema, so this file
 builds a scoped fixture that swaps those types for plain `JSON` and
-creates the two tables locally. Strategies whose queries lean on the
-`ARRAY.any()` operator on the events table are exercised by
-monkey-patching the small integer helpers (`_events_attended_count`
+creates the two tables locally. Strategies whose counts come from the
+events tables are exercised by monkey-patching the small integer helpers (`_events_attended_count`
 etc.) — the strategy dispatch itself is what we care about here, not
 the SQL that Postgres runs for it.
 """
@@ -21,10 +20,13 @@ import uuid
 import pytest
 from sqlalchemy import JSON
 
+from app.core.images import save_image
 from app.models.badge import Badge, UserBadge
 from app.models.email_verification import (
     EmailVerification,  # noqa: F401 — needed for Alumni relationship resolution
 )
+from app.models.outbox import OutboxMessage
+from app.models.telegram import TelegramUser
 from app.models.users import Alumni
 from app.services import badges as service
 
@@ -54,6 +56,9 @@ def db(db_session, engine):
     """Rebuild the badges + user_badges tables per test so counts are clean."""
     Badge.__table__.create(bind=engine, checkfirst=True)
     UserBadge.__table__.create(bind=engine, checkfirst=True)
+    # Queries on the badge tables compiled by earlier modules still carry
+    # the ARRAY result processing.
+    engine.clear_compiled_cache()
     yield db_session
     # Best-effort cleanup — nested transaction in the shared fixture rolls
     # inserts back; we just make sure ORM state isn't holding references.
@@ -72,12 +77,12 @@ def _mk_alumni(db, **kwargs) -> Alumni:
         "biography": None,
         "show_location": False,
         "telegram_alias": None,
-        "avatar": None,
         "is_verified": True,
         "is_banned": False,
     }
+    avatar = kwargs.pop("avatar", None)
     defaults.update(kwargs)
-    a = Alumni(**defaults)
+    a = Alumni(**defaults, **save_image("avatar", avatar))
     db.add(a)
     db.flush()
     return a
@@ -291,7 +296,7 @@ class TestBadgeCount:
 class TestCountThreshold:
     """Networker / Rainmaker / Cross-city commuter share the strategy but
     differ in the metric helper. We stub each helper so the test doesn't
-    depend on the Postgres ARRAY operator used in production queries.
+    have to seed events and attendances for every threshold.
     """
 
     def test_networker_at_threshold_awards(self, db, monkeypatch):
@@ -361,6 +366,19 @@ class TestAwardIdempotency:
         # Unique constraint on (alumni_id, badge_id, extra) prevents duplicates.
         assert second is None
 
+    def test_duplicate_keeps_other_pending_awards(self, db):
+        alumni = _mk_alumni(db)
+        og = _mk_badge(db, "innopolis_og", "year_range", {"min": 2014, "max": 2019})
+        pro = _mk_badge(db, "profile_pro", "profile_completeness")
+        service._award(db, alumni.id, og)
+        db.commit()
+
+        pending = service._award(db, alumni.id, pro)
+        assert service._award(db, alumni.id, og) is None
+        assert pending in db
+        db.commit()
+        assert db.query(UserBadge).filter(UserBadge.alumni_id == alumni.id).count() == 2
+
     def test_extra_metadata_lets_repeats_through(self, db):
         """Local Legend / Founding Host repeat per city/year via the extra
         column — the unique constraint keys on it too."""
@@ -512,3 +530,55 @@ class TestRevokeIneligible:
             .all()
         }
         assert remaining_codes == {"host_with_the_most"}
+
+
+# ---------------------------------------------------------------------------
+# Telegram DMs
+# ---------------------------------------------------------------------------
+
+
+class TestNotify:
+    def test_dm_is_queued_in_the_commit_that_stores_the_awards(self, db, monkeypatch):
+        alumni = _mk_alumni(
+            db, graduation_year="2016", telegram_alias="ada", is_telegram_verified=True
+        )
+        db.add(TelegramUser(alias="ada", chat_id=42))
+        og = _mk_badge(db, "innopolis_og", "year_range", {"min": 2014, "max": 2019})
+        og.trigger_metrics = ["profile_updated"]
+        # Evaluated by the badge_awarded chain.
+        chained = _mk_badge(
+            db, "profile_pro", "profile_completeness", {"fields": ["graduation_year"]}
+        )
+        chained.trigger_metrics = ["badge_awarded"]
+        db.commit()
+
+        commits = []
+        real_commit = db.commit
+
+        def commit():
+            commits.append(db.query(OutboxMessage).count())
+            real_commit()
+
+        monkeypatch.setattr(db, "commit", commit)
+
+        rows = service.evaluate_for_user(db, alumni, "profile_updated", notify=True)
+
+        assert {r.badge.code for r in rows} == {"innopolis_og", "profile_pro"}
+        # One commit, with the DM for both awards (the chained one too) in it.
+        assert commits == [1]
+        (message,) = db.query(OutboxMessage).all()
+        assert message.recipient == "42"
+        assert "Innopolis Og" in message.payload["text"]
+        assert "Profile Pro" in message.payload["text"]
+
+    def test_no_dm_unless_asked(self, db):
+        alumni = _mk_alumni(
+            db, graduation_year="2016", telegram_alias="ada", is_telegram_verified=True
+        )
+        db.add(TelegramUser(alias="ada", chat_id=42))
+        og = _mk_badge(db, "innopolis_og", "year_range", {"min": 2014, "max": 2019})
+        og.trigger_metrics = ["profile_updated"]
+        db.commit()
+
+        assert service.evaluate_for_user(db, alumni, "profile_updated")
+        assert db.query(OutboxMessage).count() == 0
@@ -63,10 +63,8 @@ def _alumni(db) -> Alumni:
     return alumni
 
 
-# distinct_cities_hosted is the default metric because it filters on
-# Event.owner_id. The events_attended metrics go through
-# `Event.participants_ids.any(...)`, which is a Postgres ARRAY operator SQLite
-# cannot execute — the same limitation test_badges.py documents.
+# distinct_cities_hosted is the default metric: it only needs owned events,
+# so tests can set progress without seeding attendances.
 def _badge(db, code: str, *, strategy: str = "distinct_count", params=None) -> Badge:
     badge = Badge(
         id=str(uuid.uuid4()),
@@ -109,7 +107,6 @@ def _event(owner_id: str, location: str, *, approved: bool | None = True, when=N
         datetime=when or _now(),
         cost=0.0,
         is_online=False,
-        cover=None,
         approved=approved,
     )
 
@@ -186,6 +183,69 @@ def test_my_badges_with_empty_catalog(db):
     assert result == {"earned": [], "locked": [], "newly_earned": []}
 
 
+def _catalog_slice(db, suffix: str) -> None:
+    """One locked badge per strategy that scores from stored data."""
+    triggers = ["profile_updated", "event_attended", "event_approved", "badge_awarded"]
+    for strategy, params in (
+        ("count_threshold", {"metric": "events_attended", "threshold": 50}),
+        ("count_threshold", {"metric": "max_attendees_on_owned", "threshold": 50}),
+        ("count_threshold", {"metric": "cross_city_attendances", "threshold": 50}),
+        ("distinct_count", {"metric": "distinct_cities_hosted", "threshold": 50}),
+        ("badge_count", {"threshold": 50}),
+        ("first_n", {"n": 100}),
+        ("year_range", {"min": 2000, "max": 2001}),
+        ("leaderboard", {}),
+    ):
+        code = f"{strategy}_{suffix}_{uuid.uuid4().hex[:6]}"
+        badge = _badge(db, code, strategy=strategy, params=params)
+        badge.trigger_metrics = triggers
+    db.flush()
+
+
+def test_my_badges_query_count_does_not_grow_with_catalog(db, engine):
+    from sqlalchemy import event as sa_event
+
+    from app.api.routes.badges.my_badges import get_my_badges
+    from app.models.badge import BadgeMetrics
+
+    alumni = _alumni(db)
+    db.add(
+        BadgeMetrics(
+            alumni_id=alumni.id,
+            events_attended=1,
+            max_attendees_on_owned=1,
+            cross_city_attendances=0,
+            distinct_cities_hosted=0,
+            badge_count=0,
+        )
+    )
+    _catalog_slice(db, "a")
+
+    statements: list[str] = []
+
+    def count(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    def queries_for_request() -> tuple[int, dict]:
+        db.expire_all()
+        statements.clear()
+        sa_event.listen(engine, "before_cursor_execute", count)
+        try:
+            result = get_my_badges(current_user=alumni, db=db)
+        finally:
+            sa_event.remove(engine, "before_cursor_execute", count)
+        return len(statements), result
+
+    small, small_result = queries_for_request()
+    for i in range(4):
+        _catalog_slice(db, f"b{i}")
+    large, large_result = queries_for_request()
+
+    assert len(small_result["locked"]) == 8
+    assert len(large_result["locked"]) == 40
+    assert large == small
+
+
 # ── list_for_user (public view) ──────────────────────────────────────────────
 
 
@@ -0,0 +1,108 @@
+"""Tests for database pool configuration and pool metrics."""
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.core import db_pool
+from app.core.db_pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    engine_options,
+    pool_checkout_timeouts,
+    pool_checkout_wait_seconds,
+    register_pool_gauges,
+)
+
+
+def test_sqlite_gets_no_pool_options():
+    assert engine_options("sqlite:///:memory:") == {}
+    assert engine_options("sqlite+aiosqlite:///:memory:", is_async=True) == {}
+
+
+def test_postgres_sync_options_follow_settings(monkeypatch):
+    monkeypatch.setattr(db_pool, "DB_POOL_SIZE", 20)
+    monkeypatch.setattr(db_pool, "DB_MAX_OVERFLOW", 5)
+    monkeypatch.setattr(db_pool, "DB_POOL_TIMEOUT", 2.5)
+    monkeypatch.setattr(db_pool, "DB_POOL_RECYCLE", 600)
+    monkeypatch.setattr(db_pool, "DB_POOL_PRE_PING", False)
+    monkeypatch.setattr(db_pool, "DB_STATEMENT_TIMEOUT_MS", 5000)
+
+    options = engine_options("postgresql+psycopg2://u:p@db/alumni")
+
+    assert options == {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": 20,
+        "max_overflow": 5,
+        "pool_timeout": 2.5,
+        "pool_recycle": 600,
+        "pool_pre_ping": False,
+        "connect_args": {"options": "-c statement_timeout=5000"},
+    }
+
+
+def test_postgres_async_options_use_asyncpg_server_settings(monkeypatch):
+    monkeypatch.setattr(db_pool, "DB_STATEMENT_TIMEOUT_MS", 1500)
+
+    options = engine_options("postgresql+asyncpg://u:p@db/alumni", is_async=True)
+
+    assert options["poolclass"] is InstrumentedAsyncQueuePool
+    assert options["connect_args"] == {
+        "server_settings": {"statement_timeout": "1500"}
+    }
+
+
+def test_zero_statement_timeout_is_not_sent(monkeypatch):
+    monkeypatch.setattr(db_pool, "DB_STATEMENT_TIMEOUT_MS", 0)
+
+    assert "connect_args" not in engine_options("postgresql://u:p@db/alumni")
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("true", True), ("1", True), ("Yes", True), ("false", False), ("0", False)],
+)
+def test_env_bool(monkeypatch, raw, expected):
+    monkeypatch.setenv("DB_TEST_FLAG", raw)
+    assert db_pool._env_bool("DB_TEST_FLAG", not expected) is expected
+
+
+def test_env_bool_default(monkeypatch):
+    monkeypatch.delenv("DB_TEST_FLAG", raising=False)
+    assert db_pool._env_bool("DB_TEST_FLAG", True) is True
+
+
+def _sample(metric, suffix, label):
+    return next(
+        (
+            s.value
+            for s in metric.collect()[0].samples
+            if s.name.endswith(suffix) and s.labels.get("engine") == label
+        ),
+        0,
+    )
+
+
+def test_exhausted_pool_records_wait_and_timeout(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    register_pool_gauges(engine, "pool-test")
+    waits_before = _sample(pool_checkout_wait_seconds, "_count", "sync")
+    timeouts_before = _sample(pool_checkout_timeouts, "_total", "sync")
+
+    held = engine.connect()
+    try:
+        held.execute(text("SELECT 1"))
+        assert _sample(db_pool.pool_connections_in_use, "in_use", "pool-test") == 1
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+    finally:
+        held.close()
+        engine.dispose()
+
+    assert _sample(pool_checkout_wait_seconds, "_count", "sync") == waits_before + 2
+    assert _sample(pool_checkout_timeouts, "_total", "sync") == timeouts_before + 1
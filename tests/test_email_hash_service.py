@@ -1,17 +1,30 @@
 """Unit tests for email hash service."""
 
-from unittest.mock import MagicMock, patch
+from io import BytesIO
+from unittest.mock import patch
 
+import pandas as pd
 import pytest
 
+from app.models.allowed_emails import AllowedEmail
 from app.services.email_hash_service import (
     _check_email_hash_secret,
     hash_email,
+    hash_emails,
+    import_email_file,
+    import_emails,
     is_email_allowed,
     process_excel_file,
 )
 
 
+def _excel(emails: list) -> bytes:
+    """An .xlsx with `emails` under an "email" header."""
+    buffer = BytesIO()
+    pd.DataFrame({"email": emails}).to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+
 class TestEmailHashService:
     """Test cases for email hash service functions."""
 
@@ -85,24 +98,56 @@ class TestEmailHashService:
             result = is_email_allowed(db_session, "test@example.com")
             assert result is False
 
-    def test_process_excel_file_success(self, monkeypatch, db_session, mocker):
+    def test_process_excel_file_success(self, monkeypatch, db_session):
         """Test process_excel_file with valid data."""
         monkeypatch.setattr("app.services.email_hash_service.EMAIL_HASH_SECRET", "test_secret")
 
-        mock_df = MagicMock()
-        mock_df.shape = (2, 1)
-        mock_df.iloc.__getitem__.return_value.tolist.return_value = ["test1@example.com", "test2@example.com"]
-
-        mock_pd = mocker.patch("app.services.email_hash_service.pd")
-        mock_pd.read_excel.return_value = mock_df
+        content = _excel(["test1@example.com", "test2@example.com"])
+        result = process_excel_file(db_session, content)
 
-        mock_hash = mocker.patch("app.services.email_hash_service.hash_email")
-        mock_hash.side_effect = ["hash1", "hash2"]
+        assert result["success"] is True
+        assert "Successfully processed 2 emails" in result["message"]
+        assert result["added"] == 2
+        assert db_session.query(AllowedEmail).count() == 2
 
-        result = process_excel_file(db_session, b"fake_excel_data")
+    def test_process_excel_file_counts(self, monkeypatch, db_session):
+        """Duplicates in the file and in the table, and invalid cells, are counted."""
+        monkeypatch.setattr("app.services.email_hash_service.EMAIL_HASH_SECRET", "test_secret")
+        db_session.add(AllowedEmail(id="a", hashed_email=hash_email("old@example.com")))
+        db_session.commit()
+
+        content = _excel(
+            [
+                "new@example.com",
+                " New@Example.com ",
+                "OLD@example.com",
+                None,
+                "   ",
+                "not-an-email",
+            ]
+        )
+        result = process_excel_file(db_session, content)
 
         assert result["success"] is True
-        assert "Successfully processed 2 emails" in result["message"]
+        assert (result["total"], result["added"]) == (3, 1)
+        assert (result["duplicate"], result["invalid"]) == (2, 3)
+        assert is_email_allowed(db_session, "new@example.com")
+        assert db_session.query(AllowedEmail).count() == 2
+
+    def test_import_emails_chunks(self, monkeypatch, db_session):
+        """Every chunk is inserted and counted."""
+        monkeypatch.setattr("app.services.email_hash_service.EMAIL_HASH_SECRET", "test_secret")
+        monkeypatch.setattr("app.services.email_hash_service.ALLOWED_EMAILS_CHUNK_SIZE", 3)
+
+        emails = pd.Series([f"user{i}@example.com" for i in range(10)])
+        assert import_emails(db_session, emails)["added"] == 10
+        assert import_emails(db_session, emails)["added"] == 0
+
+    def test_hash_emails_matches_hash_email(self, monkeypatch):
+        """The batch hash agrees with the single-email one."""
+        monkeypatch.setattr("app.services.email_hash_service.EMAIL_HASH_SECRET", "test_secret")
+
+        assert hash_emails(["a@b.c", "d@e.f"]) == [hash_email("a@b.c"), hash_email("d@e.f")]
 
     def test_process_excel_file_no_secret(self, monkeypatch, db_session):
         """Test process_excel_file without secret."""
@@ -124,3 +169,40 @@ class TestEmailHashService:
 
         assert result["success"] is False
         assert "Invalid Excel" in result["message"]
+
+    def test_import_email_file_streams_csv(self, monkeypatch, db_session):
+        """A CSV is imported chunk by chunk, reporting progress after each."""
+        monkeypatch.setattr("app.services.email_hash_service.EMAIL_HASH_SECRET", "test_secret")
+        monkeypatch.setattr("app.services.email_hash_service.ALLOWED_EMAILS_CHUNK_SIZE", 2)
+        content = "\ufeffemail,name\na@x.com,A\n A@X.com ,A\n,none\nb@x.com,B\nc@x.com,C\n"
+
+        reports = []
+        result = import_email_file(
+            db_session, BytesIO(content.encode()), "emails.csv", reports.append
+        )
+
+        assert result["success"] is True
+        assert (result["added"], result["duplicate"], result["invalid"]) == (3, 1, 1)
+        assert [r["rows"] for r in reports] == [2, 4, 5]
+        assert is_email_allowed(db_session, "c@x.com")
+
+    def test_import_email_file_streams_xlsx(self, monkeypatch, db_session):
+        """An .xlsx is read with openpyxl's read-only reader."""
+        monkeypatch.setattr("app.services.email_hash_service.EMAIL_HASH_SECRET", "test_secret")
+        monkeypatch.setattr("app.services.email_hash_service.ALLOWED_EMAILS_CHUNK_SIZE", 2)
+
+        content = _excel([f"user{i}@example.com" for i in range(5)])
+        result = import_email_file(db_session, BytesIO(content), "emails.xlsx")
+
+        assert result["success"] is True
+        assert (result["rows"], result["added"]) == (5, 5)
+        assert db_session.query(AllowedEmail).count() == 5
+
+    def test_import_email_file_invalid(self, monkeypatch, db_session):
+        """A file that can't be parsed is reported, not raised."""
+        monkeypatch.setattr("app.services.email_hash_service.EMAIL_HASH_SECRET", "test_secret")
+
+        result = import_email_file(db_session, BytesIO(b"not a zip"), "emails.xlsx")
+
+        assert result["success"] is False
+        assert result["message"].startswith("Error processing file")
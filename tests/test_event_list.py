@@ -8,7 +8,7 @@ from app.models.users import Alumni
 
 
 @pytest.mark.asyncio
-async def test_list_events_empty(db_session):
+async def test_list_events_empty(db_session, async_db_session):
     user = Alumni(
         id="user123",
         email="user@innopolis.university",
@@ -20,7 +20,7 @@ async def test_list_events_empty(db_session):
     db_session.commit()
 
     result = await list_events(
-        db=db_session,
+        db=async_db_session,
         current_user=user,
         search=None,
         cursor=None,
@@ -32,7 +32,7 @@ async def test_list_events_empty(db_session):
 
 
 @pytest.mark.asyncio
-async def test_list_events_only_approved(db_session):
+async def test_list_events_only_approved(db_session, async_db_session):
     user = Alumni(
         id="user123",
         email="user@innopolis.university",
@@ -72,7 +72,7 @@ async def test_list_events_only_approved(db_session):
     db_session.commit()
 
     result = await list_events(
-        db=db_session,
+        db=async_db_session,
         current_user=user,
         search=None,
         cursor=None,
@@ -85,7 +85,7 @@ async def test_list_events_only_approved(db_session):
 
 
 @pytest.mark.asyncio
-async def test_list_events_search(db_session):
+async def test_list_events_search(db_session, async_db_session):
     user = Alumni(
         id="user123",
         email="user@innopolis.university",
@@ -125,7 +125,7 @@ async def test_list_events_search(db_session):
     db_session.commit()
 
     result = await list_events(
-        db=db_session,
+        db=async_db_session,
         current_user=user,
         search="Python",
         cursor=None,
@@ -138,7 +138,7 @@ async def test_list_events_search(db_session):
 
 
 @pytest.mark.asyncio
-async def test_list_events_pagination(db_session):
+async def test_list_events_pagination(db_session, async_db_session):
     user = Alumni(
         id="user123",
         email="user@innopolis.university",
@@ -165,7 +165,7 @@ async def test_list_events_pagination(db_session):
     db_session.commit()
 
     result = await list_events(
-        db=db_session,
+        db=async_db_session,
         current_user=user,
         search=None,
         cursor=None,
@@ -176,7 +176,7 @@ async def test_list_events_pagination(db_session):
     assert result.next_cursor is not None
 
     result2 = await list_events(
-        db=db_session,
+        db=async_db_session,
         current_user=user,
         search=None,
         cursor=result.next_cursor,
@@ -6,6 +6,7 @@ of production data.
 
 from datetime import datetime, timedelta
 
+from app.core.images import save_image
 from app.core.security import get_current_user
 from app.models.events import Event
 from app.models.users import Admin, Alumni
@@ -26,6 +27,7 @@ def test_large_covers_do_not_inflate_public_or_admin_event_lists(client, db_sess
     )
     db_session.add(owner)
     base_time = datetime(2026, 8, 1, 12, 0)
+    cover = save_image("cover", "A" * COVER_SIZE)
     db_session.add_all(
         [
             Event(
@@ -38,7 +40,7 @@ def test_large_covers_do_not_inflate_public_or_admin_event_lists(client, db_sess
                 datetime=base_time + timedelta(minutes=index),
                 cost=0,
                 is_online=False,
-                cover="A" * COVER_SIZE,
+                **cover,
                 approved=True,
             )
             for index in range(EVENT_COUNT)
@@ -5,7 +5,7 @@ import pytest
 
 from app.api.routes.events.event_add_participant import add_participant
 from app.api.routes.events.event_remove_participant import remove_participant
-from app.models.events import Event
+from app.models.events import Event, EventParticipant
 from app.models.users import Admin, Alumni
 
 
@@ -464,3 +464,42 @@ class TestEventParticipants:
 
         db_session.refresh(event)
         assert "user123" not in event.participants_ids
+
+    @pytest.mark.asyncio
+    async def test_join_and_leave_write_event_participants_rows(self, db_session, mocker):
+        mocker.patch(
+            "app.api.routes.events.event_add_participant.NotificationService.send_join_notification",
+            return_value=True
+        )
+        user = Alumni(
+            id="user123",
+            email="user@innopolis.university",
+            first_name="Test",
+            last_name="User",
+            graduation_year="2025"
+        )
+        db_session.add(user)
+
+        event = Event(
+            id="event123",
+            title="Test Event",
+            description="Description",
+            owner_id="owner123",
+            location="Room 101",
+            datetime=datetime(2025, 1, 1, 10, 0, 0),
+            cost=0.0,
+            is_online=False,
+            participants_ids=[],
+            approved=True
+        )
+        db_session.add(event)
+        db_session.commit()
+
+        await add_participant(event_id="event123", db=db_session, current_user=user)
+        row = db_session.get(EventParticipant, ("event123", "user123"))
+        assert row is not None
+        assert row.joined_at is not None
+
+        await remove_participant(event_id="event123", db=db_session, current_user=user)
+        db_session.expire_all()
+        assert db_session.get(EventParticipant, ("event123", "user123")) is None
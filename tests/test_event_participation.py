@@ -0,0 +1,111 @@
+"""Concurrency tests for the atomic join/leave in app/services/event_participation.py.
+
+The shared in-memory engine is a single connection, so these tests use a
+file-backed SQLite database where every worker thread gets its own
+connection and the writes genuinely race.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.models.email_verification import (
+    EmailVerification,  # noqa: F401 — needed for Alumni relationship resolution
+)
+from app.models.events import Event, EventParticipant
+from app.models.users import Alumni
+from app.services.event_participation import join_event, leave_event
+
+
+ALUMNI = 300
+WORKERS = 32
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'participation.db'}",
+        connect_args={"check_same_thread": False, "timeout": 60},
+    )
+    Base.metadata.create_all(
+        engine,
+        tables=[Alumni.__table__, Event.__table__, EventParticipant.__table__],
+    )
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Alumni),
+            [
+                {
+                    "id": f"alumni-{i}",
+                    "email": f"alumni-{i}@innopolis.university",
+                    "first_name": "Test",
+                    "last_name": "User",
+                    "role": "alumni",
+                    "is_telegram_verified": False,
+                }
+                for i in range(ALUMNI)
+            ],
+        )
+        conn.execute(
+            insert(Event).values(
+                id="event-1",
+                owner_id="alumni-0",
+                title="Popular meetup",
+                description="",
+                location="Innopolis",
+                datetime=datetime(2026, 5, 1, 18, 0),
+                cost=0.0,
+                is_online=False,
+                approved=True,
+            )
+        )
+    yield engine
+    engine.dispose()
+
+
+def _run(engine, op, alumni_id: str) -> bool:
+    with Session(engine) as db:
+        changed = op(db, "event-1", alumni_id)
+        db.commit()
+        return changed
+
+
+def _participants(engine) -> set[str]:
+    with Session(engine) as db:
+        return set(
+            db.scalars(
+                select(EventParticipant.alumni_id).where(
+                    EventParticipant.event_id == "event-1"
+                )
+            )
+        )
+
+
+def test_parallel_joins_are_never_lost(file_engine):
+    ids = [f"alumni-{i}" for i in range(ALUMNI)]
+    # Every alumnus joins twice at once: one of the pair must win, the
+    # other must see "already a participant".
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        results = list(pool.map(lambda a: _run(file_engine, join_event, a), ids * 2))
+
+    assert sum(results) == ALUMNI
+    assert _participants(file_engine) == set(ids)
+
+
+def test_parallel_leaves_each_report_one_change(file_engine):
+    ids = [f"alumni-{i}" for i in range(ALUMNI)]
+    for a in ids:
+        assert _run(file_engine, join_event, a) is True
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        results = list(pool.map(lambda a: _run(file_engine, leave_event, a), ids * 2))
+
+    assert sum(results) == ALUMNI
+    assert _participants(file_engine) == set()
+    with Session(file_engine) as db:
+        assert db.scalar(select(func.count()).select_from(EventParticipant)) == 0
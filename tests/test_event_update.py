@@ -4,6 +4,7 @@ from fastapi import HTTPException
 import pytest
 
 from app.api.routes.events.update_event import update_event
+from app.core.images import save_image
 from app.models.events import Event
 from app.models.users import Admin, Alumni
 from app.schemas.event import UpdateEventRequest
@@ -355,7 +356,7 @@ async def test_update_event_clears_cover(db_session):
         is_online=False,
         participants_ids=[],
         approved=True,
-        cover="https://example.com/image.jpg"
+        **save_image("cover", "https://example.com/image.jpg"),
     )
     db_session.add(event)
     db_session.commit()
@@ -0,0 +1,350 @@
+"""Image store, saving/loading model images and the binary cover/avatar endpoints."""
+
+import base64
+from datetime import datetime
+import hashlib
+import io
+
+from PIL import Image
+import pytest
+from sqlalchemy import event as sa_event
+
+from app.core.image_store import FilesystemImageStore, get_image_store
+from app.core.images import (
+    ImageNotLoadedError,
+    assign_image,
+    decode_image,
+    load_image,
+    load_images,
+    save_image,
+    store_image,
+)
+from app.core.security import get_current_user
+from app.models.email_verification import (
+    EmailVerification,  # noqa: F401 — needed for Alumni relationship resolution
+)
+from app.models.events import Event
+from app.models.projects import Project
+from app.models.users import Alumni
+
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+PNG_B64 = base64.b64encode(PNG).decode()
+JPEG = b"\xff\xd8\xff\xe0" + b"\x01" * 32
+
+
+def _owner(db_session) -> Alumni:
+    owner = Alumni(
+        id="img-owner",
+        email="img-owner@innopolis.university",
+        first_name="Image",
+        last_name="Owner",
+        graduation_year="2024",
+        **save_image("avatar", f"data:image/jpeg;base64,{base64.b64encode(JPEG).decode()}"),
+    )
+    db_session.add(owner)
+    return owner
+
+
+def _event(db_session, owner, cover) -> Event:
+    event = Event(
+        id="img-event",
+        owner_id=owner.id,
+        participants_ids=[],
+        title="Covered",
+        description="d",
+        location="Innopolis",
+        datetime=datetime(2026, 5, 1, 18, 0),
+        cost=0,
+        is_online=False,
+        approved=True,
+        **save_image("cover", cover),
+    )
+    db_session.add(event)
+    db_session.commit()
+    return event
+
+
+class TestDecode:
+    def test_data_url_and_bare_base64(self):
+        assert decode_image(f"data:image/png;base64,{PNG_B64}") == (PNG, "image/png")
+        assert decode_image(PNG_B64) == (PNG, "image/png")
+
+    def test_urls_and_garbage_are_not_inline_images(self):
+        assert decode_image("https://example.com/a.jpg") is None
+        assert decode_image("not base64!") is None
+
+    def test_store_round_trips_every_upload_form(self):
+        digest = hashlib.sha256(PNG).hexdigest()
+        for value in (
+            PNG_B64,
+            f"data:image/png;base64,{PNG_B64}",
+            "https://example.com/a.jpg",
+        ):
+            stored_digest, kind = store_image(value)
+            assert load_image(stored_digest, kind) == value
+        # Both inline forms of the same image share one object.
+        assert store_image(PNG_B64)[0] == store_image(f"data:image/x;base64,{PNG_B64}")[0]
+        assert store_image(PNG_B64)[0] == digest
+        assert store_image(None) == (None, None)
+        assert store_image("") == (None, None)
+
+    def test_claimed_type_must_be_an_image(self):
+        html = base64.b64encode(b"<script>alert(1)</script>").decode()
+        assert store_image(f"data:text/html;base64,{html}")[1] == "application/octet-stream"
+        # A known image under a type we don't serve is stored as what it is.
+        assert store_image(f"data:image/svg+xml;base64,{PNG_B64}")[1] == "image/png"
+        assert decode_image(f"data:text/html;base64,{PNG_B64}") == (PNG, "image/png")
+
+
+class TestFilesystemStore:
+    def test_content_addressed_and_deduplicated(self, tmp_path):
+        store = FilesystemImageStore(tmp_path)
+        digest = store.put(PNG)
+
+        assert digest == hashlib.sha256(PNG).hexdigest()
+        assert store.put(PNG) == digest
+        assert (tmp_path / digest[:2] / digest[2:4] / digest).read_bytes() == PNG
+        assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
+        assert store.get(digest) == PNG
+        assert store.get("0" * 64) is None
+
+    def test_rejects_non_digest_keys(self, tmp_path):
+        with pytest.raises(ValueError, match="sha256"):
+            FilesystemImageStore(tmp_path).get("../../etc/passwd")
+
+
+def test_model_keeps_only_the_digest_in_the_row(db_session):
+    owner = _owner(db_session)
+    event = _event(db_session, owner, PNG_B64)
+    assert event.cover_hash == hashlib.sha256(PNG).hexdigest()
+    assert event.cover_type == "base64"
+    assert "cover" not in Event.__table__.c
+    # Reading the property never goes to the store by itself.
+    with pytest.raises(ImageNotLoadedError, match=r"Event\.cover"):
+        _ = event.cover
+    load_images([event], "cover")
+    assert event.cover == PNG_B64
+
+    assign_image(event, save_image("cover", None))
+    assert event.cover_hash is None
+    assert event.cover is None
+    assert owner.avatar_hash == hashlib.sha256(JPEG).hexdigest()
+    assert owner.avatar_type == "image/jpeg"
+
+
+def test_event_cover_binary_and_304(client, db_session, engine):
+    owner = _owner(db_session)
+    _event(db_session, owner, PNG_B64)
+    client.app.dependency_overrides[get_current_user] = lambda: owner
+
+    first = client.get("/api/v1/events/img-event/cover/image")
+    assert first.status_code == 200
+    assert first.headers["content-type"] == "image/png"
+    assert first.headers["x-content-type-options"] == "nosniff"
+    assert first.content == PNG
+    etag = first.headers["etag"]
+    assert etag == f'"{hashlib.sha256(PNG).hexdigest()}"'
+
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    sa_event.listen(engine, "before_cursor_execute", record)
+    try:
+        again = client.get(
+            "/api/v1/events/img-event/cover/image", headers={"If-None-Match": etag}
+        )
+    finally:
+        sa_event.remove(engine, "before_cursor_execute", record)
+
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+    # Answered from the hash column alone.
+    assert len(statements) == 1
+    assert "events.cover_hash" in statements[0]
+
+
+def test_old_json_endpoint_still_served(client, db_session):
+    owner = _owner(db_session)
+    _event(db_session, owner, PNG_B64)
+    client.app.dependency_overrides[get_current_user] = lambda: owner
+
+    response = client.get("/api/v1/events/img-event/cover")
+    assert response.status_code == 200
+    assert response.json() == {"cover": PNG_B64}
+
+
+def test_missing_cover_and_remote_cover(client, db_session):
+    owner = _owner(db_session)
+    event = _event(db_session, owner, None)
+    client.app.dependency_overrides[get_current_user] = lambda: owner
+
+    assert client.get("/api/v1/events/img-event/cover/image").status_code == 404
+    assert client.get("/api/v1/events/nope/cover/image").status_code == 404
+
+    assign_image(event, save_image("cover", "https://example.com/cover.jpg"))
+    db_session.commit()
+    # No redirect to wherever the stored URL points.
+    response = client.get(
+        "/api/v1/events/img-event/cover/image", follow_redirects=False
+    )
+    assert response.status_code == 404
+
+
+def test_untrusted_stored_type_is_not_served(client, db_session):
+    owner = _owner(db_session)
+    event = _event(db_session, owner, PNG_B64)
+    client.app.dependency_overrides[get_current_user] = lambda: owner
+    # A row written before uploads' types were checked.
+    event.cover_type = "text/html"
+    db_session.commit()
+
+    response = client.get("/api/v1/events/img-event/cover/image")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.headers["x-content-type-options"] == "nosniff"
+
+
+def test_project_cover_and_avatar_binary(client, db_session):
+    owner = _owner(db_session)
+    db_session.add(
+        Project(
+            id="img-project",
+            owner_id=owner.id,
+            contributors_ids=[],
+            title="P",
+            description="d",
+            approved=True,
+            **save_image("cover", f"data:image/png;base64,{PNG_B64}"),
+        )
+    )
+    db_session.commit()
+    client.app.dependency_overrides[get_current_user] = lambda: owner
+
+    project = client.get("/api/v1/projects/img-project/cover/image")
+    assert (project.status_code, project.content) == (200, PNG)
+
+    avatar = client.get(f"/api/v1/profile/{owner.id}/avatar/image")
+    assert avatar.headers["content-type"] == "image/jpeg"
+    assert avatar.content == JPEG
+    cached = client.get(
+        f"/api/v1/profile/{owner.id}/avatar/image",
+        headers={"If-None-Match": f"W/{avatar.headers['etag']}"},
+    )
+    assert cached.status_code == 304
+
+
+def test_json_routes_load_images_before_responding(client, db_session):
+    owner = _owner(db_session)
+    _event(db_session, owner, PNG_B64)
+    client.app.dependency_overrides[get_current_user] = lambda: owner
+
+    assert client.get("/api/v1/events/img-event").json()["cover"] == PNG_B64
+    assert client.get("/api/v1/events/owner").json()[0]["cover"] == PNG_B64
+    me = client.get("/api/v1/profile/me").json()
+    assert me["avatar"] == f"data:image/jpeg;base64,{base64.b64encode(JPEG).decode()}"
+
+    updated = client.put("/api/v1/events/img-event", json={"cover": "https://example.com/c.jpg"})
+    assert updated.json()["cover"] == "https://example.com/c.jpg"
+
+
+def _png(width: int, height: int) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 30, 30)).save(buf, "PNG")
+    return buf.getvalue()
+
+
+class TestVariants:
+    def test_made_at_write_time_and_only_scaled_down(self, db_session):
+        owner = _owner(db_session)
+        event = _event(db_session, owner, base64.b64encode(_png(2400, 1200)).decode())
+
+        assert set(event.cover_variants) == {"thumbnail", "card", "full"}
+        store = get_image_store()
+        sizes = {
+            name: Image.open(io.BytesIO(store.get(digest))).size
+            for name, digest in event.cover_variants.items()
+        }
+        assert sizes == {
+            "thumbnail": (160, 80),
+            "card": (720, 360),
+            "full": (1920, 960),
+        }
+
+        assign_image(event, save_image("cover", base64.b64encode(_png(100, 50)).decode()))
+        small = {
+            Image.open(io.BytesIO(store.get(d))).size
+            for d in event.cover_variants.values()
+        }
+        assert small == {(100, 50)}
+
+    def test_no_variants_for_urls_or_unreadable_bytes(self, db_session):
+        owner = _owner(db_session)
+        event = _event(db_session, owner, "https://example.com/cover.jpg")
+        assert event.cover_variants is None
+        # The test JPEG header has no image data behind it.
+        assert owner.avatar_variants is None
+
+    def test_size_param_serves_webp_variant(self, client, db_session):
+        owner = _owner(db_session)
+        _event(db_session, owner, base64.b64encode(_png(1000, 1000)).decode())
+        client.app.dependency_overrides[get_current_user] = lambda: owner
+
+        original = client.get("/api/v1/events/img-event/cover/image")
+        thumb = client.get("/api/v1/events/img-event/cover/image?size=thumbnail")
+
+        assert thumb.status_code == 200
+        assert thumb.headers["content-type"] == "image/webp"
+        assert Image.open(io.BytesIO(thumb.content)).size == (160, 160)
+        assert len(thumb.content) < len(original.content)
+        assert thumb.headers["etag"] != original.headers["etag"]
+        assert (
+            client.get(
+                "/api/v1/events/img-event/cover/image?size=thumbnail",
+                headers={"If-None-Match": thumb.headers["etag"]},
+            ).status_code
+            == 304
+        )
+
+        as_json = client.get("/api/v1/events/img-event/cover?size=card").json()
+        assert as_json["cover"].startswith("data:image/webp;base64,")
+
+    def test_participant_list_carries_avatar_thumbnails(self, client, db_session):
+        owner = _owner(db_session)
+        _event(db_session, owner, None)
+        guest = Alumni(
+            id="img-guest",
+            email="img-guest@innopolis.university",
+            first_name="Image",
+            last_name="Guest",
+            graduation_year="2024",
+            **save_image("avatar", base64.b64encode(_png(800, 800)).decode()),
+        )
+        db_session.add(guest)
+        db_session.commit()
+        client.app.dependency_overrides[get_current_user] = lambda: owner
+        assert client.post("/api/v1/events/img-event/participants").status_code == 200
+        client.app.dependency_overrides[get_current_user] = lambda: guest
+        assert client.post("/api/v1/events/img-event/participants").status_code == 200
+
+        listed = client.get("/api/v1/events/img-event/participants").json()
+
+        avatars = {p["id"]: p["avatar"] for p in listed}
+        # No variants for the test JPEG: the original it is.
+        assert avatars[owner.id].startswith("data:image/jpeg;base64,")
+        thumb = base64.b64decode(avatars[guest.id].removeprefix("data:image/webp;base64,"))
+        assert Image.open(io.BytesIO(thumb)).size == (160, 160)
+
+    def test_size_falls_back_to_original_and_is_validated(self, client, db_session):
+        owner = _owner(db_session)
+        client.app.dependency_overrides[get_current_user] = lambda: owner
+        db_session.commit()
+
+        avatar = client.get(f"/api/v1/profile/{owner.id}/avatar/image?size=thumbnail")
+        assert avatar.headers["content-type"] == "image/jpeg"
+        assert avatar.content == JPEG
+        bad = client.get(f"/api/v1/profile/{owner.id}/avatar/image?size=huge")
+        assert bad.status_code == 422
@@ -0,0 +1,207 @@
+"""Background jobs: running, failing, throttling, heartbeats and the status route."""
+
+from datetime import datetime, timedelta
+import threading
+import uuid
+
+import pytest
+
+from app.core.security import get_current_user
+from app.models.email_verification import (
+    EmailVerification,  # noqa: F401 — needed for Alumni relationship resolution
+)
+from app.models.jobs import Job
+from app.models.users import Admin, Alumni
+from app.services import jobs
+
+
+def _job(db_session, job_id: str) -> Job:
+    db_session.expire_all()
+    return db_session.get(Job, job_id)
+
+
+def _blocking_work():
+    """Work that waits for `release`, setting `started` once it runs."""
+    started, release = threading.Event(), threading.Event()
+
+    def work(_db, _progress):
+        started.set()
+        release.wait(10)
+        return {}
+
+    return work, started, release
+
+
+def test_job_reports_progress_and_result(db_session, job_runner):
+    def work(_db, progress):
+        progress({"rows": 10})
+        return {"added": 7}
+
+    job_id = job_runner.submit(db_session, "test", work, created_by="admin-1")
+    assert job_runner.wait(10)
+
+    job = _job(db_session, job_id)
+    assert (job.status, job.progress, job.result) == ("succeeded", {"rows": 10}, {"added": 7})
+    assert job.created_by == "admin-1"
+    assert job.started_at is not None
+    assert job.finished_at is not None
+    assert len(job_runner) == 0
+
+
+def test_failed_jobs_keep_the_error(db_session, job_runner):
+    def refused(_db, _progress):
+        raise jobs.JobFailedError("Bad sheet", {"rows": 3})
+
+    def crashed(_db, _progress):
+        raise ValueError("boom")
+
+    refused_id = job_runner.submit(db_session, "test", refused)
+    assert job_runner.wait(10)
+    crashed_id = job_runner.submit(db_session, "test", crashed)
+    assert job_runner.wait(10)
+
+    refused_job = _job(db_session, refused_id)
+    assert (refused_job.status, refused_job.error) == ("failed", "Bad sheet")
+    assert refused_job.result == {"rows": 3}
+    crashed_job = _job(db_session, crashed_id)
+    assert (crashed_job.status, crashed_job.error) == ("failed", "ValueError: boom")
+
+
+def test_submit_is_refused_beyond_the_queue(db_session, job_runner):
+    job_runner.queue_size = 1
+    work, started, release = _blocking_work()
+
+    job_runner.submit(db_session, "test", work)
+    # Submit the next one only once the first runs, so the worker thread
+    # isn't using the test's connection at the same time.
+    assert started.wait(10)
+    job_runner.submit(db_session, "test", lambda _db, _progress: None)
+    with pytest.raises(jobs.JobQueueFullError, match="Too many"):
+        job_runner.submit(db_session, "test", lambda _db, _progress: None)
+
+    release.set()
+    assert job_runner.wait(10)
+    assert len(job_runner) == 0
+    assert db_session.query(Job).count() == 2
+
+
+def test_shutdown_cancels_queued_jobs(db_session, job_runner):
+    work, started, release = _blocking_work()
+    running_id = job_runner.submit(db_session, "test", work)
+    assert started.wait(10)
+    queued_id = job_runner.submit(db_session, "test", lambda _db, _progress: None)
+
+    job_runner.shutdown()
+    release.set()
+    assert job_runner.wait(10)
+
+    assert _job(db_session, running_id).status == "succeeded"
+    queued = _job(db_session, queued_id)
+    assert queued.status == "failed"
+    assert queued.error.startswith("Cancelled")
+
+
+def test_heartbeat_fails_stale_jobs_and_purges_old_ones(db_session, job_runner):
+    now = datetime.utcnow()
+    silent = now - timedelta(seconds=jobs.JOB_STALE_SECONDS + 1)
+    db_session.add_all([
+        Job(id="lost", kind="test", status="running", created_at=silent, updated_at=silent),
+        Job(id="fresh", kind="test", status="queued", created_at=now, updated_at=now),
+        Job(
+            id="old", kind="test", status="succeeded", created_at=silent,
+            finished_at=now - timedelta(days=jobs.JOB_RETENTION_DAYS + 1), updated_at=silent,
+        ),
+    ])
+    db_session.commit()
+
+    assert job_runner.heartbeat(now) == 1
+
+    assert _job(db_session, "lost").status == "failed"
+    assert _job(db_session, "fresh").status == "queued"
+    assert _job(db_session, "old") is None
+
+
+def test_stale_verdict_is_not_overwritten(db_session, job_runner):
+    work, started, release = _blocking_work()
+    job_id = job_runner.submit(db_session, "test", work)
+    assert started.wait(10)
+
+    # Another replica's sweep gave up on the job while it was still running.
+    db_session.query(Job).filter(Job.id == job_id).update(
+        {"status": "failed", "error": "Interrupted"}
+    )
+    db_session.commit()
+    release.set()
+    assert job_runner.wait(10)
+
+    job = _job(db_session, job_id)
+    assert (job.status, job.error, job.result) == ("failed", "Interrupted", None)
+
+
+def test_cleanup_runs_after_success_and_cancellation(db_session, job_runner):
+    cleaned = []
+    work, started, release = _blocking_work()
+    job_runner.submit(db_session, "test", work, cleanup=lambda: cleaned.append("ran"))
+    assert started.wait(10)
+    job_runner.submit(
+        db_session, "test", lambda _db, _progress: None,
+        cleanup=lambda: cleaned.append("cancelled"),
+    )
+
+    job_runner.shutdown()
+    release.set()
+    assert job_runner.wait(10)
+
+    assert sorted(cleaned) == ["cancelled", "ran"]
+
+
+def test_heartbeat_keeps_our_running_jobs_alive(db_session, job_runner):
+    work, started, release = _blocking_work()
+    job_id = job_runner.submit(db_session, "test", work)
+    assert started.wait(10)
+
+    # Long after the last progress update, but this process still runs it.
+    later = datetime.utcnow() + timedelta(seconds=jobs.JOB_STALE_SECONDS * 2)
+    job_runner.heartbeat(later)
+    assert job_runner.heartbeat(later + timedelta(seconds=1)) == 0
+
+    release.set()
+    assert job_runner.wait(10)
+    assert _job(db_session, job_id).status == "succeeded"
+
+
+# ── routes ───────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def admin(client):
+    admin = Admin(id=str(uuid.uuid4()), email="admin@innopolis.university")
+    client.app.dependency_overrides[get_current_user] = lambda: admin
+    return admin
+
+
+def test_recompute_leaderboards_returns_a_job(client, db_session, job_runner, admin, mocker):
+    mocker.patch(
+        "app.api.routes.admin.badges_recompute_leaderboards.compute_local_legend_winners",
+        return_value=["w1", "w2"],
+    )
+
+    response = client.post("/api/v1/admin/badges/recompute-leaderboards?year=2025")
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+    assert job_runner.wait(10)
+
+    body = client.get(f"/api/v1/admin/jobs/{job_id}").json()
+    assert (body["kind"], body["status"]) == ("recompute-leaderboards", "succeeded")
+    assert body["result"] == {"year": 2025, "awarded": 2}
+
+
+def test_job_status_requires_an_admin(client, db_session):
+    client.app.dependency_overrides[get_current_user] = lambda: Alumni(
+        id="a", email="a@innopolis.university"
+    )
+    assert client.get("/api/v1/admin/jobs/whatever").status_code == 403
+
+
+def test_unknown_job_is_404(client, admin):
+    assert client.get("/api/v1/admin/jobs/does-not-exist").status_code == 404
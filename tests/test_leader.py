@@ -0,0 +1,134 @@
+"""Advisory-lock leader election: who runs the work, and failover."""
+
+import asyncio
+
+import pytest
+
+from app.core import leader
+from app.core.leader import LeaderElection, lock_key
+
+
+@pytest.fixture(autouse=True)
+def _fast(monkeypatch):
+    monkeypatch.setattr(leader, "LEADER_RETRY_SECONDS", 0.01)
+    monkeypatch.setattr(leader, "LEADER_CHECK_SECONDS", 0.01)
+
+
+class _FakeLock:
+    """One advisory lock shared by several in-process "replicas"."""
+
+    def __init__(self):
+        self.holder = None
+        self.dead = set()
+
+    def attach(self, election: LeaderElection, monkeypatch) -> None:
+        def try_acquire():
+            if self.holder is None and election not in self.dead:
+                self.holder = election
+            return self.holder is election
+
+        def still_held():
+            if election in self.dead:
+                # Postgres drops a dead session's locks.
+                if self.holder is election:
+                    self.holder = None
+                return False
+            return self.holder is election
+
+        def release():
+            if self.holder is election:
+                self.holder = None
+
+        monkeypatch.setattr(election, "_try_acquire", try_acquire)
+        monkeypatch.setattr(election, "_still_held", still_held)
+        monkeypatch.setattr(election, "_release", release)
+
+
+def _worker(log: list, label: str):
+    async def work(work_stop: asyncio.Event):
+        log.append(("start", label))
+        try:
+            await work_stop.wait()
+        finally:
+            log.append(("stop", label))
+
+    return work
+
+
+def test_lock_key_is_stable_and_fits_bigint():
+    assert lock_key("telegram-polling") == lock_key("telegram-polling")
+    assert lock_key("telegram-polling") != lock_key("other")
+    assert -(2**63) <= lock_key("telegram-polling") < 2**63
+
+
+def test_sqlite_process_is_always_leader():
+    log = []
+
+    async def scenario():
+        election = LeaderElection("job", database_url="sqlite://")
+        stop = asyncio.Event()
+        runner = asyncio.create_task(election.run(_worker(log, "a"), stop))
+        await asyncio.sleep(0.05)
+        was_leader = election.is_leader
+        stop.set()
+        await runner
+        return was_leader, election.is_leader
+
+    assert asyncio.run(scenario()) == (True, False)
+    assert log == [("start", "a"), ("stop", "a")]
+
+
+def test_only_one_replica_runs_the_work_and_the_other_takes_over(monkeypatch):
+    log = []
+    lock = _FakeLock()
+
+    async def scenario():
+        a = LeaderElection("job", database_url="postgresql://fake")
+        b = LeaderElection("job", database_url="postgresql://fake")
+        lock.attach(a, monkeypatch)
+        lock.attach(b, monkeypatch)
+        stop = asyncio.Event()
+        runners = [
+            asyncio.create_task(a.run(_worker(log, "a"), stop)),
+        ]
+        await asyncio.sleep(0.05)
+        runners.append(asyncio.create_task(b.run(_worker(log, "b"), stop)))
+        await asyncio.sleep(0.05)
+        both = (a.is_leader, b.is_leader)
+
+        lock.dead.add(a)  # a's connection dies
+        await asyncio.sleep(0.1)
+        after = (a.is_leader, b.is_leader)
+
+        stop.set()
+        await asyncio.gather(*runners)
+        return both, after
+
+    both, after = asyncio.run(scenario())
+    assert both == (True, False)
+    assert after == (False, True)
+    assert log == [("start", "a"), ("stop", "a"), ("start", "b"), ("stop", "b")]
+
+
+def test_failed_work_releases_the_lock_and_is_retried(monkeypatch):
+    attempts = []
+    lock = _FakeLock()
+
+    async def flaky(_work_stop):
+        attempts.append(lock.holder is not None)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        await _work_stop.wait()
+
+    async def scenario():
+        election = LeaderElection("job", database_url="postgresql://fake")
+        lock.attach(election, monkeypatch)
+        stop = asyncio.Event()
+        runner = asyncio.create_task(election.run(flaky, stop))
+        await asyncio.sleep(0.1)
+        stop.set()
+        await runner
+
+    asyncio.run(scenario())
+    assert attempts == [True, True]
+    assert lock.holder is None
@@ -287,3 +287,22 @@ class TestComputeLocalLegend:
 
         assert len(winners) == 1
         assert winners[0].extra == {"city": "cairo", "year": 2025}
+
+    def test_participant_ids_without_an_alumni_row_are_ignored(self, db):
+        _seed_badge(db)
+        owner = _alumni(db)
+        alice = _alumni(db, "alice")
+
+        # A stale id with more attendances must not win (it can't hold a
+        # badge), so the top real attendee does.
+        for i in range(3):
+            _event(
+                db, owner.id, "Oslo", datetime(2025, 3, i + 1),
+                participants=["deleted-user"],
+            )
+        _event(db, owner.id, "Oslo", datetime(2025, 4, 1), participants=[alice.id])
+        db.commit()
+
+        winners = service.compute_local_legend_winners(db, 2025)
+
+        assert [w.alumni_id for w in winners] == [alice.id]
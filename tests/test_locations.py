@@ -0,0 +1,127 @@
+"""Normalized city keys: the parser, model derivation and the alumni map."""
+
+from datetime import datetime
+
+from app.core.locations import parse_location
+from app.core.security import get_current_user
+from app.models.cities import City
+from app.models.email_verification import (
+    EmailVerification,  # noqa: F401 — needed for Alumni relationship resolution
+)
+from app.models.events import Event
+from app.models.users import Alumni
+from app.services import badges
+
+
+def _alumni(id_, location, **kw):
+    return Alumni(
+        id=id_,
+        email=f"{id_}@innopolis.university",
+        first_name="Test",
+        last_name="User",
+        graduation_year="2025",
+        location=location,
+        is_verified=True,
+        is_banned=False,
+        **kw,
+    )
+
+
+class TestParse:
+    def test_country_and_city(self):
+        assert parse_location("Russia, Saint Petersburg") == (
+            "russia",
+            "saint petersburg",
+            "saint petersburg",
+        )
+        assert parse_location("  UAE ,  Dubai ") == ("uae", "dubai", "dubai")
+
+    def test_bare_city_has_no_country(self):
+        assert parse_location("Dubai") == (None, "dubai", "dubai")
+
+    def test_kazan_shares_innopolis_key(self):
+        assert parse_location("Russia, Kazan") == ("russia", "kazan", "innopolis")
+        assert parse_location("kazan").city_key == parse_location("Innopolis").city_key
+
+    def test_empty(self):
+        for value in (None, "", " , "):
+            assert parse_location(value) == (None, None, None)
+
+
+def test_columns_follow_location_writes(db_session):
+    alumni = _alumni("loc-a", "Russia, Kazan")
+    event = Event(
+        id="loc-e",
+        owner_id="loc-a",
+        title="t",
+        description="d",
+        location="Innopolis",
+        datetime=datetime(2026, 5, 1),
+        cost=0,
+        is_online=False,
+    )
+    db_session.add_all([alumni, event])
+    db_session.commit()
+    assert (alumni.country, alumni.city, alumni.city_key) == ("russia", "kazan", "innopolis")
+    assert (event.country, event.city_key) == (None, "innopolis")
+
+    alumni.location = None
+    event.location = "UAE, Dubai"
+    db_session.commit()
+    assert (alumni.country, alumni.city, alumni.city_key) == (None, None, None)
+    assert (event.country, event.city_key) == ("uae", "dubai")
+
+
+def test_cross_city_uses_city_key(db_session):
+    home = _alumni("loc-home", "Russia, Kazan")
+    db_session.add(home)
+    for i, location in enumerate(("Innopolis", "russia, innopolis", "Dubai")):
+        db_session.add(
+            Event(
+                id=f"loc-{i}",
+                owner_id=home.id,
+                participants_ids=[home.id],
+                title="t",
+                description="d",
+                location=location,
+                datetime=datetime(2026, 5, 1),
+                cost=0,
+                is_online=False,
+                approved=True,
+            )
+        )
+    db_session.commit()
+
+    assert badges._participation_stats(db_session, home) == {
+        "events_attended": 3,
+        "cross_city_attendances": 1,
+    }
+    assert badges._hosting_stats(db_session, home.id)["distinct_cities_hosted"] == 2
+
+
+def test_map_groups_by_stored_city(client, db_session):
+    db_session.add_all(
+        [
+            City(city="Innopolis", country="Russia", lat=55.75, lng=48.74),
+            City(city="Kazan", country="Russia", lat=55.79, lng=49.12),
+            _alumni("map-1", "Russia, Innopolis", show_location=True),
+            _alumni("map-2", "russia, innopolis ", show_location=True),
+            _alumni("map-3", "Russia, Kazan", show_location=True),
+            _alumni("map-4", "Russia, Kazan", show_location=False),
+            _alumni("map-5", "Atlantis, Nowhere", show_location=True),
+            _alumni("map-6", "Innopolis", show_location=True),
+        ]
+    )
+    db_session.commit()
+    client.app.dependency_overrides[get_current_user] = lambda: db_session.get(
+        Alumni, "map-1"
+    )
+
+    response = client.get("/api/v1/profile/map")
+
+    assert response.status_code == 200
+    pins = {
+        (p["country"], p["city"]): p["count"] for p in response.json()["locations"]
+    }
+    # Kazan keeps its own pin; the alias only applies to matching.
+    assert pins == {("Russia", "Innopolis"): 2, ("Russia", "Kazan"): 1}
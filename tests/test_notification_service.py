@@ -1,6 +1,6 @@
 """Unit tests for notification service."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -35,9 +35,10 @@ class TestNotificationService:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_send_join_notification_success(self, db_session, mocker):
+    async def test_send_join_notification_success(self, db_session):
         """Test successful send_join_notification."""
         # Create mock TelegramUser objects
+        from app.models.outbox import OutboxMessage
         from app.models.telegram import TelegramUser
         owner = TelegramUser(alias="owner_success", chat_id=111)
         user = TelegramUser(alias="user_success", chat_id=222)
@@ -46,25 +47,20 @@ class TestNotificationService:
         db_session.add(user)
         db_session.commit()
 
-        mock_telegram = mocker.patch("app.services.notification_service.telegram_service")
-        mock_telegram.send_message = AsyncMock()
-
         result = await NotificationService.send_join_notification(
             db_session, "Test Event", "owner_success", "user_success"
         )
 
         assert result == {"status": "ok"}
-        assert mock_telegram.send_message.call_count == 2
-        # Check message to user
-        mock_telegram.send_message.assert_any_call(
-            chat_id=222,
-            text="You successfully joined this event: Test Event"
-        )
-        # Check message to owner
-        mock_telegram.send_message.assert_any_call(
-            chat_id=111,
-            text="@user_success joined your event Test Event!"
-        )
+        # Both messages are in the outbox, not sent directly
+        queued = {
+            (m.channel, m.recipient, m.payload["text"])
+            for m in db_session.query(OutboxMessage).all()
+        }
+        assert queued == {
+            ("telegram", "222", "You successfully joined this event: Test Event"),
+            ("telegram", "111", "@user_success joined your event Test Event!"),
+        }
 
     @pytest.mark.asyncio
     async def test_send_join_notification_chat_id_none(self, db_session, mocker):
@@ -92,8 +88,8 @@ class TestNotificationService:
 
         mocker.patch.object(db_session, "query", side_effect=query_fn)
 
-        mock_telegram = mocker.patch("app.services.notification_service.telegram_service")
-        mock_telegram.send_message = AsyncMock(side_effect=Exception("Telegram error"))
+        mock_outbox = mocker.patch("app.services.notification_service.outbox")
+        mock_outbox.telegram = MagicMock(side_effect=Exception("Telegram error"))
 
         result = await NotificationService.send_join_notification(
             db_session, "Test Event", "owner_chat_none", "user_chat_none"
@@ -101,10 +97,8 @@ class TestNotificationService:
 
         assert result["status"] == "error"
         assert "Telegram error" in result["message"]
-        assert mock_telegram.send_message.call_count == 1
-        mock_telegram.send_message.assert_called_once_with(
-            chat_id=222,
-            text="You successfully joined this event: Test Event"
+        mock_outbox.telegram.assert_called_once_with(
+            db_session, 222, "You successfully joined this event: Test Event"
         )
 
     @pytest.mark.asyncio
@@ -148,8 +142,8 @@ class TestNotificationService:
         db_session.add(user)
         db_session.commit()
 
-        mock_telegram = mocker.patch("app.services.notification_service.telegram_service")
-        mock_telegram.send_message = AsyncMock(side_effect=Exception("Telegram error"))
+        mock_outbox = mocker.patch("app.services.notification_service.outbox")
+        mock_outbox.telegram = MagicMock(side_effect=Exception("Telegram error"))
 
         result = await NotificationService.send_join_notification(
             db_session, "Test Event", "owner_exception", "user_exception"
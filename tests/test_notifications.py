@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
 
+from sqlalchemy import event as sa_event
+
 from app.models.email_verification import (
     EmailVerification,  # noqa: F401 — registers relationship
 )
@@ -8,9 +10,12 @@ from app.models.users import Alumni
 from app.services.notifications import (
     ENTRY_BUFFER,
     NOTICE_LEAD_TIME,
+    count_unread,
+    event_approval_changed,
     find_nearby_upcoming_events,
     is_read,
     mark_seen,
+    unread_count,
 )
 
 
@@ -237,3 +242,91 @@ def test_mark_seen_persists(db_session):
     mark_seen(db_session, user)
 
     assert user.notifications_seen_at is not None
+
+
+def test_newest_matches_first_and_capped_in_sql(db_session):
+    owner = _alumni("owner", "Russia, Innopolis")
+    nearby = _alumni("nearby", "Russia, Kazan")
+    db_session.add_all([owner, nearby])
+    db_session.add_all(
+        [
+            _event("city_old", "owner", "Innopolis", days_from_now=-30),
+            _event("online_mid", "owner", "Germany, Berlin", days_from_now=-3, is_online=True),
+            _event("city_new", "owner", "Russia, Innopolis", days_from_now=2),
+            _event("joined", "owner", "Innopolis", days_from_now=1, participants_ids=["nearby"]),
+            _event("elsewhere", "owner", "Germany, Berlin", days_from_now=1),
+        ]
+    )
+    db_session.commit()
+
+    assert [e.id for e in find_nearby_upcoming_events(db_session, nearby)] == [
+        "city_new",
+        "online_mid",
+        "city_old",
+    ]
+    assert [e.id for e in find_nearby_upcoming_events(db_session, nearby, limit=2)] == [
+        "city_new",
+        "online_mid",
+    ]
+
+
+def _unread_by_list(db_session, alumni):
+    return sum(
+        1 for e in find_nearby_upcoming_events(db_session, alumni) if not is_read(alumni, e)
+    )
+
+
+def test_count_unread_agrees_with_is_read(db_session, engine):
+    owner = _alumni("owner", "Russia, Innopolis")
+    nearby = _alumni("nearby", "Russia, Kazan")
+    db_session.add_all([owner, nearby])
+    for i, days in enumerate((-40, -3, 0.5, 2, 6, 7.4, 9)):
+        db_session.add(_event(f"city{i}", "owner", "Innopolis", days_from_now=days))
+    db_session.add_all(
+        [
+            _event("online", "owner", "Germany, Berlin", days_from_now=3, is_online=True),
+            _event("joined", "owner", "Innopolis", days_from_now=3, participants_ids=["nearby"]),
+            _event("pending", "owner", "Innopolis", days_from_now=3, approved=None),
+        ]
+    )
+    db_session.commit()
+
+    for seen in (None, -30, 0, 4):
+        nearby.notifications_seen_at = (
+            None if seen is None else datetime.utcnow() - timedelta(days=seen)
+        )
+        assert count_unread(db_session, nearby) == _unread_by_list(db_session, nearby)
+
+    nearby.notifications_seen_at = None
+    statements = []
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    sa_event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert count_unread(db_session, nearby) == 7
+    finally:
+        sa_event.remove(engine, "before_cursor_execute", record)
+    assert len(statements) == 1
+    assert "count(*)" in statements[0]
+
+
+def test_unread_count_cache_invalidation(db_session):
+    owner = _alumni("owner", "Russia, Innopolis")
+    nearby = _alumni("nearby", "Russia, Innopolis")
+    db_session.add_all([owner, nearby])
+    pending = _event("evt1", "owner", "Innopolis", days_from_now=3, approved=None)
+    db_session.add(pending)
+    db_session.commit()
+    assert unread_count(db_session, nearby) == 0
+
+    pending.approved = True
+    db_session.commit()
+    # Cached until the approval is announced.
+    assert unread_count(db_session, nearby) == 0
+    event_approval_changed()
+    assert unread_count(db_session, nearby) == 1
+
+    mark_seen(db_session, nearby)
+    assert unread_count(db_session, nearby) == 0
@@ -0,0 +1,200 @@
+"""Notification outbox: writing, claiming, delivering and retrying."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+from prometheus_client import REGISTRY
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core.security import get_current_user
+from app.models.email_verification import (
+    EmailVerification,  # noqa: F401 — needed for Alumni relationship resolution
+)
+from app.models.events import Event
+from app.models.outbox import OutboxMessage
+from app.models.telegram import TelegramUser
+from app.models.users import Alumni
+from app.services import outbox
+from app.services.telegram_bot import TelegramAPIError
+
+
+@pytest.fixture
+def sessions(db_session):
+    """Worker sessions on the test's connection (and rolled-back transaction)."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=db_session.bind)
+
+
+@pytest.fixture
+def send(mocker):
+    return mocker.patch.object(
+        outbox.telegram_service, "send_message", new_callable=AsyncMock
+    )
+
+
+def _rows(db_session) -> list[OutboxMessage]:
+    db_session.expire_all()
+    return db_session.query(OutboxMessage).order_by(OutboxMessage.id).all()
+
+
+def test_dedupe_key_queues_once(db_session):
+    assert outbox.telegram(db_session, 1, "hi", dedupe_key="reminder:e:a")
+    assert not outbox.telegram(db_session, 1, "hi again", dedupe_key="reminder:e:a")
+    assert outbox.telegram(db_session, 1, "no key")
+    assert outbox.telegram(db_session, 1, "no key")
+    assert [r.payload["text"] for r in _rows(db_session)] == ["hi", "no key", "no key"]
+
+
+def test_email_requires_a_sender_name(db_session):
+    with pytest.raises(ValueError, match="Not an email_service sender"):
+        outbox.email(db_session, "fm", "a@b.c")
+
+
+def test_due_messages_are_delivered_once(db_session, sessions, send):
+    outbox.telegram(db_session, 42, "hello", parse_mode="Markdown")
+    db_session.commit()
+
+    assert asyncio.run(outbox.drain(sessions)) == 1
+    assert asyncio.run(outbox.drain(sessions)) == 0
+
+    # One request per attempt; the outbox schedules the retries.
+    send.assert_awaited_once_with(
+        chat_id=42, text="hello", parse_mode="Markdown", max_attempts=1
+    )
+    (row,) = _rows(db_session)
+    assert (row.status, row.attempts) == ("sent", 1)
+    assert row.sent_at is not None
+
+
+def test_worker_measures_queue_depth_and_latency(db_session, sessions, send):
+    outbox.telegram(db_session, 1, "due")
+    outbox.email(db_session, "send_verification_success_email", "a@b.c")
+    db_session.flush()
+    # Enqueued a minute ago; the second one is backing off.
+    rows = _rows(db_session)
+    rows[0].created_at = datetime.utcnow() - timedelta(seconds=60)
+    rows[1].next_attempt_at = datetime.utcnow() + timedelta(hours=1)
+    db_session.commit()
+
+    def sample(name, channel, **labels):
+        return REGISTRY.get_sample_value(name, {"channel": channel, **labels}) or 0
+
+    sent_before = sample("outbox_delivery_latency_seconds_count", "telegram")
+    quick_before = sample("outbox_delivery_latency_seconds_bucket", "telegram", le="15.0")
+
+    assert asyncio.run(outbox.process_due(sessions)) == 1
+
+    assert sample("outbox_pending", "telegram") == 1
+    assert sample("outbox_due", "telegram") == 1
+    assert sample("outbox_pending", "email") == 1
+    assert sample("outbox_due", "email") == 0
+    assert sample("outbox_delivery_latency_seconds_count", "telegram") == sent_before + 1
+    # Measured from created_at, not from the claim.
+    assert (
+        sample("outbox_delivery_latency_seconds_bucket", "telegram", le="15.0")
+        == quick_before
+    )
+
+
+def test_claim_leases_rows(db_session, sessions):
+    outbox.telegram(db_session, 1, "a")
+    db_session.commit()
+
+    first = outbox.claim(sessions())
+    assert [m.attempts for m in first] == [1]
+    # Leased to the first worker, so nobody else gets it until the lease ends.
+    assert outbox.claim(sessions()) == []
+    later = datetime.utcnow() + timedelta(seconds=outbox.OUTBOX_LEASE_SECONDS + 1)
+    assert [m.attempts for m in outbox.claim(sessions(), now=later)] == [2]
+
+
+def test_transient_failure_is_retried_with_backoff(db_session, sessions, send):
+    send.side_effect = TelegramAPIError("Bad Gateway", error_code=502)
+    outbox.telegram(db_session, 1, "a")
+    db_session.commit()
+
+    assert asyncio.run(outbox.process_due(sessions)) == 1
+    (row,) = _rows(db_session)
+    assert row.status == "pending"
+    assert row.last_error == "Telegram API error: Bad Gateway"
+    assert row.next_attempt_at > datetime.utcnow() + timedelta(
+        seconds=outbox.OUTBOX_BACKOFF_SECONDS - 5
+    )
+    # Not due yet.
+    assert asyncio.run(outbox.process_due(sessions)) == 0
+
+
+def test_permanent_failure_and_exhausted_attempts_fail(
+    db_session, sessions, send, monkeypatch
+):
+    monkeypatch.setattr(outbox, "OUTBOX_MAX_ATTEMPTS", 1)
+    send.side_effect = [
+        TelegramAPIError("Forbidden: bot was blocked by the user", error_code=403),
+        TelegramAPIError("Bad Gateway", error_code=502),
+    ]
+    outbox.telegram(db_session, 1, "blocked")
+    outbox.telegram(db_session, 2, "flaky")
+    db_session.commit()
+
+    asyncio.run(outbox.process_due(sessions))
+    assert [(r.status, r.attempts) for r in _rows(db_session)] == [
+        ("failed", 1),
+        ("failed", 1),
+    ]
+
+
+def test_email_channel_retries_when_sender_reports_failure(
+    db_session, sessions, mocker
+):
+    sender = mocker.patch(
+        "app.services.email_service.send_verification_success_email",
+        new_callable=AsyncMock,
+        return_value=False,
+    )
+    outbox.email(db_session, "send_verification_success_email", "a@b.c", first_name="A")
+    db_session.commit()
+
+    asyncio.run(outbox.process_due(sessions))
+    sender.assert_awaited_once_with("a@b.c", first_name="A")
+    (row,) = _rows(db_session)
+    assert (row.status, row.attempts) == ("pending", 1)
+
+
+def test_purge_sent_keeps_recent_and_failed(db_session, sessions):
+    old = datetime.utcnow() - timedelta(days=30)
+    for status, sent_at in (("sent", old), ("sent", datetime.utcnow()), ("failed", None)):
+        outbox.telegram(db_session, 1, status)
+        db_session.query(OutboxMessage).filter(OutboxMessage.status == "pending").update(
+            {"status": status, "sent_at": sent_at}
+        )
+    db_session.commit()
+
+    assert outbox.purge_sent(sessions(), timedelta(days=14)) == 1
+    assert [r.status for r in _rows(db_session)] == ["sent", "failed"]
+
+
+def test_join_writes_notifications_with_the_join(client, db_session):
+    host = Alumni(
+        id="host", email="host@innopolis.university", first_name="H", last_name="H",
+        telegram_alias="host_tg",
+    )
+    guest = Alumni(
+        id="guest", email="guest@innopolis.university", first_name="G", last_name="G",
+        telegram_alias="guest_tg",
+    )
+    event = Event(
+        id="evt", owner_id="host", participants_ids=[], title="Meetup",
+        description="", location="Innopolis", datetime=datetime(2030, 1, 1),
+        cost=0.0, is_online=False, approved=True,
+    )
+    db_session.add_all([
+        host, guest, event,
+        TelegramUser(alias="host_tg", chat_id=1),
+        TelegramUser(alias="guest_tg", chat_id=2),
+    ])
+    db_session.commit()
+    client.app.dependency_overrides[get_current_user] = lambda: guest
+
+    assert client.post("/api/v1/events/evt/participants").status_code == 200
+    assert sorted(r.recipient for r in _rows(db_session)) == ["1", "2"]
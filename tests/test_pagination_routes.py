@@ -58,7 +58,6 @@ def _project(owner_id: str, project_id: str, *, title="Project", approved=True,
         contributors_ids=[],
         title=title,
         description="A project",
-        cover=None,
         approved=approved,
         created_at=created or _now(),
     )
@@ -116,6 +115,21 @@ def test_profiles_location_filter_excludes_hidden_and_ineligible(db_session):
     assert ids == ["visible"]
 
 
+def test_profiles_location_filter_uses_the_map_pins_city(db_session):
+    db_session.add_all(
+        [
+            _alumni("innopolis", location="Russia, Innopolis"),
+            # Same city_key, but its own pin on the map.
+            _alumni("kazan", location="Russia, Kazan"),
+        ]
+    )
+    db_session.commit()
+
+    ids = [p.id for p in _profiles(db_session, location=" Russia ,Innopolis").items]
+
+    assert ids == ["innopolis"]
+
+
 def test_profiles_cursor_walks_every_row_exactly_once(db_session):
     db_session.add_all([_alumni(f"u{i}") for i in range(1, 6)])
     db_session.commit()
@@ -154,8 +168,8 @@ def test_profiles_filters_survive_pagination(db_session):
 # ── list_projects (public) ───────────────────────────────────────────────────
 
 
-async def _public_projects(db_session, **kwargs):
-    params = {"search": None, "cursor": None, "limit": 50, "db": db_session}
+async def _public_projects(async_db_session, **kwargs):
+    params = {"search": None, "cursor": None, "limit": 50, "db": async_db_session}
     params.update(kwargs)
     return await list_projects(**params)
 
@@ -169,7 +183,7 @@ def owner(db_session) -> Alumni:
 
 
 @pytest.mark.asyncio
-async def test_public_projects_hide_unapproved(db_session, owner):
+async def test_public_projects_hide_unapproved(db_session, async_db_session, owner):
     db_session.add_all(
         [
             _project(owner.id, "approved", approved=True),
@@ -179,14 +193,14 @@ async def test_public_projects_hide_unapproved(db_session, owner):
     )
     db_session.commit()
 
-    page = await _public_projects(db_session)
+    page = await _public_projects(async_db_session)
 
     # The public list must never leak projects awaiting moderation.
     assert [p.id for p in page.items] == ["approved"]
 
 
 @pytest.mark.asyncio
-async def test_public_projects_search_by_title(db_session, owner):
+async def test_public_projects_search_by_title(db_session, async_db_session, owner):
     db_session.add_all(
         [
             _project(owner.id, "p1", title="Alumni Portal"),
@@ -195,13 +209,13 @@ async def test_public_projects_search_by_title(db_session, owner):
     )
     db_session.commit()
 
-    page = await _public_projects(db_session, search="portal")
+    page = await _public_projects(async_db_session, search="portal")
 
     assert [p.id for p in page.items] == ["p1"]
 
 
 @pytest.mark.asyncio
-async def test_public_projects_cursor_walks_tied_timestamps_once(db_session, owner):
+async def test_public_projects_cursor_walks_tied_timestamps_once(db_session, async_db_session, owner):
     same = _now()
     db_session.add_all([_project(owner.id, f"p{i}", created=same) for i in range(5)])
     db_session.commit()
@@ -209,7 +223,7 @@ async def test_public_projects_cursor_walks_tied_timestamps_once(db_session, own
     seen: list[str] = []
     cursor = None
     for _ in range(10):
-        page = await _public_projects(db_session, limit=2, cursor=cursor)
+        page = await _public_projects(async_db_session, limit=2, cursor=cursor)
         seen.extend(p.id for p in page.items)
         cursor = page.next_cursor
         if cursor is None:
@@ -222,7 +236,7 @@ async def test_public_projects_cursor_walks_tied_timestamps_once(db_session, own
 
 
 @pytest.mark.asyncio
-async def test_public_projects_approval_filter_survives_pagination(db_session, owner):
+async def test_public_projects_approval_filter_survives_pagination(db_session, async_db_session, owner):
     base = _now()
     db_session.add_all(
         [
@@ -234,8 +248,8 @@ async def test_public_projects_approval_filter_survives_pagination(db_session, o
     )
     db_session.commit()
 
-    first = await _public_projects(db_session, limit=2)
-    second = await _public_projects(db_session, limit=2, cursor=first.next_cursor)
+    first = await _public_projects(async_db_session, limit=2)
+    second = await _public_projects(async_db_session, limit=2, cursor=first.next_cursor)
 
     assert [p.id for p in first.items] == ["a1", "a2"]
     assert [p.id for p in second.items] == ["a3"]
@@ -0,0 +1,176 @@
+"""Tests for the principal cache behind get_current_user."""
+
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+import pytest
+from sqlalchemy import event, update
+
+from app.core.images import load_images, save_image
+from app.core.principal_cache import (
+    PrincipalCache,
+    invalidate_principal,
+    principal_cache,
+    principal_cache_hits,
+    principal_cache_misses,
+)
+from app.core.security import create_access_token, get_current_user
+from app.models.users import Admin, Alumni
+
+
+def _creds(email: str, user_type: str = "alumni") -> HTTPAuthorizationCredentials:
+    token = create_access_token({"sub": email, "user_type": user_type})
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _alumni(db_session, **overrides) -> Alumni:
+    fields = {
+        "id": "cache-user",
+        "email": "cache-user@innopolis.university",
+        "first_name": "Cache",
+        "last_name": "User",
+        "graduation_year": "2024",
+    }
+    fields.update(overrides)
+    user = Alumni(**fields, **save_image("avatar", "A" * 1000))
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def _count_alumni_selects(engine):
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT") and "alumni" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_second_request_is_served_without_a_query(db_session, engine):
+    _alumni(db_session)
+    creds = _creds("cache-user@innopolis.university")
+    hits_before = principal_cache_hits._value.get()
+    misses_before = principal_cache_misses._value.get()
+
+    get_current_user(credentials=creds, db=db_session)
+    db_session.expunge_all()
+
+    statements, stop = _count_alumni_selects(engine)
+    try:
+        user = get_current_user(credentials=creds, db=db_session)
+    finally:
+        stop()
+
+    assert statements == []
+    assert user.id == "cache-user"
+    assert principal_cache_misses._value.get() == misses_before + 1
+    assert principal_cache_hits._value.get() == hits_before + 1
+
+
+def test_cached_principal_is_attached_to_the_request_session(db_session):
+    _alumni(db_session)
+    creds = _creds("cache-user@innopolis.university")
+    get_current_user(credentials=creds, db=db_session)
+    db_session.expunge_all()
+
+    user = get_current_user(credentials=creds, db=db_session)
+
+    assert user in db_session
+    # Excluded from the snapshot, lazily loaded through the session.
+    load_images([user], "avatar")
+    assert user.avatar == "A" * 1000
+    assert user.following == []
+
+    user.biography = "updated through a cached principal"
+    db_session.commit()
+    db_session.expunge_all()
+    stored = db_session.query(Alumni).filter(Alumni.id == "cache-user").one()
+    assert stored.biography == "updated through a cached principal"
+
+
+def test_invalidate_principal_forces_a_reload(db_session):
+    _alumni(db_session)
+    creds = _creds("cache-user@innopolis.university")
+    get_current_user(credentials=creds, db=db_session)
+
+    db_session.execute(
+        update(Alumni).where(Alumni.id == "cache-user").values(is_banned=True)
+    )
+    db_session.commit()
+    db_session.expunge_all()
+    assert get_current_user(credentials=creds, db=db_session).is_banned is False
+
+    invalidate_principal("cache-user@innopolis.university")
+    db_session.expunge_all()
+    assert get_current_user(credentials=creds, db=db_session).is_banned is True
+
+
+def test_ban_route_invalidates_cached_principal(db_session):
+    from app.api.routes.admin.ban import ban_user
+
+    _alumni(db_session)
+    admin = Admin(id="cache-admin", email="cache-admin@innopolis.university")
+    db_session.add(admin)
+    db_session.commit()
+    creds = _creds("cache-user@innopolis.university")
+    get_current_user(credentials=creds, db=db_session)
+
+    ban_user(user_id="cache-user", db=db_session, current_user=admin)
+
+    assert principal_cache.get("alumni", "cache-user@innopolis.university") is None
+
+
+def test_deleted_user_is_rejected_after_invalidation(db_session):
+    user = _alumni(db_session)
+    creds = _creds("cache-user@innopolis.university")
+    get_current_user(credentials=creds, db=db_session)
+
+    db_session.delete(user)
+    db_session.commit()
+    invalidate_principal("cache-user@innopolis.university")
+
+    with pytest.raises(HTTPException) as exc_info:
+        get_current_user(credentials=creds, db=db_session)
+    assert exc_info.value.status_code == 401
+
+
+def test_unknown_user_type_is_rejected(db_session):
+    _alumni(db_session)
+    with pytest.raises(HTTPException) as exc_info:
+        get_current_user(
+            credentials=_creds("cache-user@innopolis.university", "robot"),
+            db=db_session,
+        )
+    assert exc_info.value.status_code == 401
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    cache = PrincipalCache(ttl_seconds=10, max_size=10)
+    clock = [100.0]
+    monkeypatch.setattr("app.core.principal_cache.time.monotonic", lambda: clock[0])
+
+    cache.put("alumni", "a@x", {"id": "a"})
+    clock[0] = 109.0
+    assert cache.get("alumni", "a@x") == {"id": "a"}
+    clock[0] = 110.0
+    assert cache.get("alumni", "a@x") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PrincipalCache(ttl_seconds=60, max_size=2)
+    cache.put("alumni", "a@x", {"id": "a"})
+    cache.put("alumni", "b@x", {"id": "b"})
+    cache.get("alumni", "a@x")
+    cache.put("alumni", "c@x", {"id": "c"})
+
+    assert cache.get("alumni", "b@x") is None
+    assert cache.get("alumni", "a@x") == {"id": "a"}
+    assert len(cache) == 2
+
+
+def test_zero_ttl_disables_caching():
+    cache = PrincipalCache(ttl_seconds=0, max_size=10)
+    cache.put("alumni", "a@x", {"id": "a"})
+    assert cache.get("alumni", "a@x") is None
@@ -3,6 +3,7 @@ import pytest
 
 from app.api.routes.profile.get_profiles import get_profiles
 from app.api.routes.profile.profile import update_profile
+from app.core.images import save_image
 from app.models.users import Alumni
 from app.schemas.profile import ProfileUpdateRequest
 
@@ -25,9 +26,9 @@ def _alumni(
         biography=None,
         show_location=show_location,
         telegram_alias=None,
-        avatar="avatar-data",
         is_verified=is_verified,
         is_banned=is_banned,
+        **save_image("avatar", "avatar-data"),
     )
 
 
@@ -77,7 +77,6 @@ def _seed_project(
         contributors_ids=list(contributors or []),
         title=title,
         description=description,
-        cover=None,
         approved=approved,
         donation_link=donation_link,
         goal_amount=goal_amount,
@@ -158,7 +157,7 @@ class TestCreateProject:
 
 class TestListPublic:
     @pytest.mark.asyncio
-    async def test_only_approved_projects_visible(self, db_session):
+    async def test_only_approved_projects_visible(self, db_session, async_db_session):
         alice = _alumni("alice")
         db_session.add(alice)
         db_session.commit()
@@ -175,14 +174,14 @@ class TestListPublic:
             search=None,
             cursor=None,
             limit=50,
-            db=db_session,
+            db=async_db_session,
             current_user=bob,
         )
         titles = [p.title for p in page.items]
         assert titles == ["Public"]
 
     @pytest.mark.asyncio
-    async def test_search_filters_by_title(self, db_session):
+    async def test_search_filters_by_title(self, db_session, async_db_session):
         alice = _alumni("alice")
         db_session.add(alice)
         db_session.commit()
@@ -194,7 +193,7 @@ class TestListPublic:
             search="green",
             cursor=None,
             limit=50,
-            db=db_session,
+            db=async_db_session,
             current_user=alice,
         )
         assert [p.title for p in page.items] == ["Greenhouse"]
@@ -0,0 +1,182 @@
+"""In-process pub/sub behind GET /api/v1/stream."""
+
+import asyncio
+from datetime import datetime, timedelta
+import threading
+
+from app.api.routes.stream.stream import _frames
+from app.core.security import get_current_user
+from app.models.email_verification import (
+    EmailVerification,  # noqa: F401 — needed for Alumni relationship resolution
+)
+from app.models.events import Event
+from app.models.users import Admin, Alumni
+from app.services import stream
+
+
+def _event(**kw) -> Event:
+    defaults = {
+        "id": "evt",
+        "owner_id": "host",
+        "participants_ids": ["guest"],
+        "title": "Meetup",
+        "description": "",
+        "location": "Russia, Innopolis",
+        "datetime": datetime(2026, 5, 1, 18, 0),
+        "cost": 0.0,
+        "is_online": False,
+        "approved": True,
+    }
+    return Event(**{**defaults, **kw})
+
+
+def _drain(subscription) -> list[tuple[str, dict]]:
+    out = []
+    while not subscription.queue.empty():
+        envelope = subscription.queue.get_nowait()
+        out.append((envelope.event, envelope.data))
+    return out
+
+
+def test_envelope_json_round_trip():
+    envelope = stream.Envelope(
+        "badge.awarded", {"codes": ["a"]}, alumni_ids=("x",), exclude=("y",)
+    )
+    assert stream.Envelope.from_json(envelope.to_json()) == envelope
+    assert envelope.encode() == b'event: badge.awarded\ndata: {"codes": ["a"]}\n\n'
+
+
+def test_audiences():
+    async def scenario():
+        subs = {
+            name: stream.hub.subscribe(name, key)
+            for name, key in (
+                ("kazan", "innopolis"),
+                ("dubai", "dubai"),
+                ("host", "innopolis"),
+                ("guest", "innopolis"),
+                ("nowhere", None),
+            )
+        }
+        try:
+            stream.event_approved(_event())
+            stream.event_approved(_event(id="online", is_online=True))
+            stream.participant_joined(_event(), "kazan")
+            stream.badges_awarded("dubai", ["pioneer", "pioneer"])
+            await asyncio.sleep(0)
+            return {name: [e for e, _ in _drain(s)] for name, s in subs.items()}
+        finally:
+            for s in subs.values():
+                stream.hub.unsubscribe(s)
+
+    assert asyncio.run(scenario()) == {
+        "kazan": ["notification", "notification"],
+        "dubai": ["notification", "badge.awarded"],
+        "host": ["event.participant_joined"],
+        "guest": [],
+        "nowhere": ["notification"],
+    }
+    assert len(stream.hub) == 0
+
+
+def test_approval_hint_waits_for_the_notice_window():
+    now = datetime(2026, 5, 1, 12, 0)
+
+    async def scenario():
+        sub = stream.hub.subscribe("kazan", "innopolis")
+        try:
+            stream.event_approved(_event(id="soon", datetime=now + timedelta(days=7)), now)
+            stream.event_approved(_event(id="later", datetime=now + timedelta(days=30)), now)
+            await asyncio.sleep(0)
+            return [data["event_id"] for _, data in _drain(sub)]
+        finally:
+            stream.hub.unsubscribe(sub)
+
+    # Same bound as find_nearby_upcoming_events / count_unread.
+    assert asyncio.run(scenario()) == ["soon"]
+
+
+def test_full_queue_drops_oldest(monkeypatch):
+    monkeypatch.setattr(stream, "STREAM_QUEUE_SIZE", 2)
+
+    async def scenario():
+        sub = stream.hub.subscribe("a", None)
+        try:
+            for i in range(3):
+                stream.publish(stream.Envelope("n", {"i": i}, alumni_ids=("a",)))
+            await asyncio.sleep(0)
+            return _drain(sub)
+        finally:
+            stream.hub.unsubscribe(sub)
+
+    assert asyncio.run(scenario()) == [("n", {"i": 1}), ("n", {"i": 2})]
+
+
+def test_publish_from_another_thread():
+    async def scenario():
+        sub = stream.hub.subscribe("a", None)
+        try:
+            worker = threading.Thread(
+                target=stream.badges_awarded, args=("a", ["networker"])
+            )
+            worker.start()
+            worker.join()
+            envelope = await asyncio.wait_for(sub.queue.get(), 1)
+            return envelope.data
+        finally:
+            stream.hub.unsubscribe(sub)
+
+    assert asyncio.run(scenario()) == {"codes": ["networker"]}
+
+
+def test_frames_heartbeat_then_message_then_unsubscribe(monkeypatch):
+    monkeypatch.setattr(stream, "STREAM_HEARTBEAT_SECONDS", 0.01)
+
+    async def scenario():
+        frames = _frames("a", None)
+        first = await frames.__anext__()
+        heartbeat = await frames.__anext__()
+        stream.badges_awarded("a", ["pioneer"])
+        message = await frames.__anext__()
+        subscribed = len(stream.hub)
+        await frames.aclose()
+        return first, heartbeat, message, subscribed
+
+    first, heartbeat, message, subscribed = asyncio.run(scenario())
+    assert first.startswith(b"retry: ")
+    assert heartbeat == b": keep-alive\n\n"
+    assert message == b'event: badge.awarded\ndata: {"codes": ["pioneer"]}\n\n'
+    assert subscribed == 1
+    assert len(stream.hub) == 0
+
+
+def test_join_route_notifies_host(client, db_session):
+    host = Alumni(
+        id="host", email="host@innopolis.university", first_name="H", last_name="H"
+    )
+    guest = Alumni(
+        id="guest", email="guest@innopolis.university", first_name="G", last_name="G"
+    )
+    db_session.add_all([host, guest, _event(participants_ids=[])])
+    db_session.commit()
+    client.app.dependency_overrides[get_current_user] = lambda: guest
+
+    async def scenario():
+        sub = stream.hub.subscribe("host", None)
+        try:
+            response = await asyncio.to_thread(client.post, "/api/v1/events/evt/participants")
+            assert response.status_code == 200
+            envelope = await asyncio.wait_for(sub.queue.get(), 1)
+            return envelope.event, envelope.data
+        finally:
+            stream.hub.unsubscribe(sub)
+
+    assert asyncio.run(scenario()) == (
+        "event.participant_joined",
+        {"event_id": "evt", "alumni_id": "guest"},
+    )
+
+
+def test_stream_is_for_alumni_only(client):
+    client.app.dependency_overrides[get_current_user] = lambda: Admin(id="adm")
+    assert client.get("/api/v1/stream").status_code == 403
@@ -0,0 +1,184 @@
+"""TelegramBotService: shared client, rate limits and retries."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from app.services import telegram_bot
+from app.services.telegram_bot import RateLimiter, TelegramBotService, TokenBucket
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = TelegramBotService()
+    service.limiter = RateLimiter(1000, 1000)
+    sent: list[dict] = []
+    clients: list[httpx.AsyncClient] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        return httpx.Response(200, json={"ok": True, "result": {"message_id": len(sent)}})
+
+    def new_client():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(service, "_new_client", new_client)
+    service.sent, service.clients = sent, clients
+    return service
+
+
+def test_session_reuses_one_client(service):
+    async def scenario():
+        async with service.session():
+            for i in range(3):
+                await service.send_message(chat_id=i, text="hi")
+            assert service.client is service.clients[0]
+        assert service.client is None
+
+    asyncio.run(scenario())
+    assert len(service.clients) == 1
+    assert service.clients[0].is_closed
+    assert [m["chat_id"] for m in service.sent] == [0, 1, 2]
+
+
+def test_without_start_each_call_gets_its_own_client(service):
+    async def scenario():
+        await service.send_message(chat_id=1, text="a")
+        await service.send_poll(chat_id=1, question="q", options=["x", "y"])
+
+    asyncio.run(scenario())
+    assert len(service.clients) == 2
+    assert all(c.is_closed for c in service.clients)
+
+
+def test_api_error_raises(service, monkeypatch):
+    def failing():
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda _r: httpx.Response(400, json={"ok": False, "description": "chat not found"})
+            )
+        )
+
+    monkeypatch.setattr(service, "_new_client", failing)
+    with pytest.raises(RuntimeError, match="chat not found"):
+        asyncio.run(service.send_message(chat_id=1, text="a"))
+
+
+def test_limits_and_timeouts_from_env(monkeypatch):
+    monkeypatch.setenv("TELEGRAM_HTTP_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("TELEGRAM_HTTP_CONNECT_TIMEOUT", "2.5")
+    client = TelegramBotService()._new_client()
+    try:
+        pool = client._transport._pool
+        assert pool._max_connections == 7
+        assert client.timeout.connect == 2.5
+        assert client.timeout.read == 30.0
+    finally:
+        asyncio.run(client.aclose())
+
+
+def _replying(service, monkeypatch, responses):
+    """Answer requests with `responses` in order, then ok=true."""
+    requests: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        if len(requests) <= len(responses):
+            return responses[len(requests) - 1]
+        return httpx.Response(200, json={"ok": True, "result": {}})
+
+    monkeypatch.setattr(
+        service,
+        "_new_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    monkeypatch.setattr(telegram_bot, "TELEGRAM_SEND_BACKOFF", 0)
+    return requests
+
+
+def test_token_bucket_reservations_queue_up():
+    bucket = TokenBucket(rate=2, burst=2, now=0)
+    assert [bucket.reserve(0) for _ in range(4)] == [0, 0, 0.5, 1.0]
+    assert bucket.reserve(10) == 0
+    assert not bucket.idle(10)
+    assert bucket.idle(11)
+
+
+def test_per_chat_limit_spaces_one_chat_only():
+    limiter = RateLimiter(global_rate=1000, chat_rate=20)
+
+    async def scenario():
+        started = time.perf_counter()
+        await asyncio.gather(*(limiter.acquire(c) for c in (1, 2, 3, 4)))
+        other_chats = time.perf_counter() - started
+        started = time.perf_counter()
+        await asyncio.gather(*(limiter.acquire(9) for _ in range(3)))
+        return other_chats, time.perf_counter() - started
+
+    other_chats, same_chat = asyncio.run(scenario())
+    assert other_chats < 0.05
+    assert same_chat >= 0.09
+
+
+def test_429_waits_retry_after_then_succeeds(service, monkeypatch):
+    requests = _replying(
+        service,
+        monkeypatch,
+        [
+            httpx.Response(
+                429,
+                json={
+                    "ok": False,
+                    "error_code": 429,
+                    "description": "Too Many Requests: retry after 0.2",
+                    "parameters": {"retry_after": 0.2},
+                },
+            )
+        ],
+    )
+    started = time.perf_counter()
+    asyncio.run(service.send_message(chat_id=1, text="a"))
+    assert time.perf_counter() - started >= 0.2
+    assert len(requests) == 2
+
+
+def test_transient_failures_are_retried_until_attempts_run_out(service, monkeypatch):
+    monkeypatch.setattr(telegram_bot, "TELEGRAM_SEND_MAX_ATTEMPTS", 3)
+    requests = _replying(
+        service, monkeypatch, [httpx.Response(502, text="Bad Gateway")] * 2
+    )
+    asyncio.run(service.send_message(chat_id=1, text="a"))
+    assert len(requests) == 3
+
+    requests = _replying(
+        service, monkeypatch, [httpx.Response(502, text="Bad Gateway")] * 3
+    )
+    with pytest.raises(RuntimeError, match="HTTP 502"):
+        asyncio.run(service.send_message(chat_id=1, text="a"))
+    assert len(requests) == 3
+
+
+def test_max_attempts_limits_one_call(service, monkeypatch):
+    requests = _replying(
+        service, monkeypatch, [httpx.Response(502, text="Bad Gateway")] * 2
+    )
+    with pytest.raises(RuntimeError, match="HTTP 502"):
+        asyncio.run(service.send_message(chat_id=1, text="a", max_attempts=1))
+    assert len(requests) == 1
+    assert "max_attempts" not in requests[0]
+
+
+def test_client_errors_are_not_retried(service, monkeypatch):
+    requests = _replying(
+        service,
+        monkeypatch,
+        [httpx.Response(403, json={"ok": False, "error_code": 403, "description": "blocked"})],
+    )
+    with pytest.raises(RuntimeError, match="blocked"):
+        asyncio.run(service.send_message(chat_id=1, text="a"))
+    assert len(requests) == 1
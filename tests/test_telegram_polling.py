@@ -0,0 +1,129 @@
+"""Concurrent, per-chat ordered update dispatch in the long-polling loop."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
+
+from app.services import telegram_polling
+from app.services.telegram_bot import telegram_service
+from app.services.telegram_polling import UpdateDispatcher
+
+
+def _message(update_id: int, chat_id: int, text: str = "/start") -> dict:
+    return {
+        "update_id": update_id,
+        "message": {"text": text, "chat": {"id": chat_id}, "from": {"username": f"u{chat_id}"}},
+    }
+
+
+class _Recorder:
+    """A handler that logs start/end per update and can be slowed per chat."""
+
+    def __init__(self, delays: dict[int, float] | None = None):
+        self.delays = delays or {}
+        self.log: list[tuple[str, int]] = []
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, update, _db):
+        """Handle one update."""
+        chat = update["message"]["chat"]["id"]
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        self.log.append(("start", update["update_id"]))
+        await asyncio.sleep(self.delays.get(chat, 0.01))
+        self.log.append(("end", update["update_id"]))
+        self.running -= 1
+
+
+def _dispatch(updates, recorder, **kwargs) -> list[MagicMock]:
+    sessions: list[MagicMock] = []
+
+    def session_factory():
+        sessions.append(MagicMock())
+        return sessions[-1]
+
+    async def scenario():
+        dispatcher = UpdateDispatcher(recorder, session_factory, **kwargs)
+        for update in updates:
+            await dispatcher.submit(update)
+        await dispatcher.drain()
+        assert len(dispatcher) == 0
+
+    asyncio.run(scenario())
+    return sessions
+
+
+def test_slow_chat_does_not_block_others():
+    recorder = _Recorder(delays={1: 0.2})
+    _dispatch([_message(1, chat_id=1), _message(2, chat_id=2), _message(3, chat_id=3)], recorder)
+    ends = [u for event, u in recorder.log if event == "end"]
+    assert ends == [2, 3, 1]
+    assert recorder.peak == 3
+
+
+def test_same_chat_runs_in_order():
+    recorder = _Recorder()
+    _dispatch([_message(i, chat_id=7) for i in range(1, 5)], recorder)
+    assert recorder.log == [
+        (event, i) for i in range(1, 5) for event in ("start", "end")
+    ]
+
+
+def test_concurrency_is_bounded_and_each_update_gets_a_session():
+    recorder = _Recorder()
+    sessions = _dispatch(
+        [_message(i, chat_id=i) for i in range(10)], recorder, concurrency=3
+    )
+    assert recorder.peak == 3
+    assert len(sessions) == 10
+    assert all(s.close.called for s in sessions)
+
+
+def test_handler_errors_are_contained():
+    handled = []
+
+    async def handler(update, _db):
+        if update["update_id"] == 1:
+            raise RuntimeError("boom")
+        handled.append(update["update_id"])
+
+    async def scenario():
+        dispatcher = UpdateDispatcher(handler, MagicMock)
+        await dispatcher.submit(_message(1, chat_id=5))
+        await dispatcher.submit(_message(2, chat_id=5))
+        await dispatcher.drain()
+
+    asyncio.run(scenario())
+    assert handled == [2]
+
+
+def test_polling_loop_dispatches_and_drains(monkeypatch):
+    stop = asyncio.Event()
+    batches = [[_message(1, chat_id=1), _message(2, chat_id=2)]]
+    handled = []
+
+    def get_updates(request: httpx.Request) -> httpx.Response:
+        if not batches:
+            stop.set()
+            return httpx.Response(200, json={"ok": True, "result": []})
+        return httpx.Response(200, json={"ok": True, "result": batches.pop(0)})
+
+    async def handler(update, _db):
+        await asyncio.sleep(0.01)
+        handled.append(update["update_id"])
+
+    monkeypatch.setattr(telegram_polling, "_handle_update", handler)
+    monkeypatch.setattr(telegram_polling, "SessionLocal", MagicMock)
+
+    async def scenario():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(get_updates))
+        monkeypatch.setattr(telegram_service, "_client", client)
+        try:
+            await telegram_polling.start_polling(stop)
+        finally:
+            await client.aclose()
+
+    asyncio.run(scenario())
+    assert sorted(handled) == [1, 2]
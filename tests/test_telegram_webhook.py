@@ -0,0 +1,130 @@
+"""Webhook ingestion: secret check, deduplication and backpressure."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models.email_verification import (
+    EmailVerification,  # noqa: F401 — needed for Alumni relationship resolution
+)
+from app.models.users import Alumni  # noqa: F401 — creates the alumni table for `client`
+from app.services import telegram_webhook
+from app.services.telegram_polling import UpdateDispatcher
+from app.services.telegram_webhook import RecentUpdateIds, WebhookIngress
+
+
+URL = "/telegram/webhook"
+SECRET = "s3cret"
+
+
+@pytest.fixture
+def webhook_mode(monkeypatch):
+    monkeypatch.setattr(telegram_webhook, "TELEGRAM_UPDATES_MODE", "webhook")
+    monkeypatch.setattr(telegram_webhook, "TELEGRAM_WEBHOOK_SECRET", SECRET)
+    accept = AsyncMock(return_value=telegram_webhook.ACCEPTED)
+    monkeypatch.setattr(telegram_webhook.ingress, "accept", accept)
+    return accept
+
+
+def _update(update_id: int, chat_id: int = 1) -> dict:
+    return {"update_id": update_id, "message": {"text": "/start", "chat": {"id": chat_id}}}
+
+
+def test_route_is_off_unless_in_webhook_mode(client, monkeypatch):
+    monkeypatch.setattr(telegram_webhook, "TELEGRAM_UPDATES_MODE", "polling")
+    response = client.post(
+        URL, json=_update(1), headers={"X-Telegram-Bot-Api-Secret-Token": SECRET}
+    )
+    assert response.status_code == 404
+
+
+def test_route_checks_the_secret(client, webhook_mode):
+    assert client.post(URL, json=_update(1)).status_code == 403
+    wrong = {"X-Telegram-Bot-Api-Secret-Token": "nope"}
+    assert client.post(URL, json=_update(1), headers=wrong).status_code == 403
+    webhook_mode.assert_not_called()
+
+    right = {"X-Telegram-Bot-Api-Secret-Token": SECRET}
+    response = client.post(URL, json=_update(1), headers=right)
+    assert response.status_code == 200
+    webhook_mode.assert_awaited_once_with(_update(1))
+
+
+def test_route_asks_for_a_retry_when_busy(client, webhook_mode):
+    webhook_mode.return_value = telegram_webhook.BUSY
+    headers = {"X-Telegram-Bot-Api-Secret-Token": SECRET}
+    assert client.post(URL, json=_update(1), headers=headers).status_code == 503
+    assert client.post(URL, content=b"[]", headers=headers).status_code == 400
+
+
+def test_no_secret_configured_never_matches(monkeypatch):
+    monkeypatch.setattr(telegram_webhook, "TELEGRAM_WEBHOOK_SECRET", "")
+    assert not telegram_webhook.secret_matches("")
+    assert not telegram_webhook.secret_matches(None)
+
+
+def test_recent_update_ids_are_bounded():
+    recent = RecentUpdateIds(max_size=2)
+    assert recent.add(1)
+    assert recent.add(2)
+    assert not recent.add(1)
+    assert recent.add(3)
+    assert len(recent) == 2
+    assert recent.add(1)  # evicted, so new again
+
+
+def test_ingress_dedupes_and_runs_handlers():
+    handled = []
+
+    async def handler(update, _db):
+        handled.append(update["update_id"])
+
+    async def scenario():
+        ingress = WebhookIngress()
+        assert await ingress.accept(_update(1)) == telegram_webhook.UNAVAILABLE
+        ingress.dispatcher = UpdateDispatcher(handler, MagicMock)
+        outcomes = [await ingress.accept(_update(i)) for i in (1, 2, 1)]
+        await ingress.stop()
+        return outcomes
+
+    assert asyncio.run(scenario()) == ["accepted", "accepted", "duplicate"]
+    assert handled == [1, 2]
+
+
+def test_ingress_reports_busy_and_accepts_the_retry():
+    release = asyncio.Event()
+
+    async def handler(_update, _db):
+        await release.wait()
+
+    async def scenario():
+        ingress = WebhookIngress()
+        ingress.dispatcher = UpdateDispatcher(handler, MagicMock, backlog=1)
+        first = await ingress.accept(_update(1))
+        busy = await ingress.accept(_update(2, chat_id=2))
+        release.set()
+        await ingress.dispatcher.drain()
+        retried = await ingress.accept(_update(2, chat_id=2))
+        await ingress.stop()
+        return first, busy, retried
+
+    assert asyncio.run(scenario()) == ("accepted", "busy", "accepted")
+
+
+def test_start_registers_the_webhook(monkeypatch):
+    monkeypatch.setattr(telegram_webhook, "TELEGRAM_WEBHOOK_SECRET", SECRET)
+    monkeypatch.setattr(telegram_webhook, "TELEGRAM_WEBHOOK_URL", "https://api.example/telegram/webhook")
+    call = AsyncMock(return_value=True)
+    monkeypatch.setattr(telegram_webhook.telegram_service, "_call", call)
+
+    async def scenario():
+        ingress = WebhookIngress()
+        await ingress.start()
+        await ingress.stop()
+
+    asyncio.run(scenario())
+    method, payload = call.await_args.args
+    assert method == "setWebhook"
+    assert payload["secret_token"] == SECRET
+    assert payload["allowed_updates"] == ["message", "poll_answer"]